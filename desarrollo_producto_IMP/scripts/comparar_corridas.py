@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Script para comparar dos corridas del mismo modelo de plataforma
+Parsea (y consolida, si se indican varios archivos por corrida) la corrida
+anterior y la nueva, alinea los elementos por clave JOINT_MEMBER_GRUP y
+reporta los mayores cambios de daño, los elementos nuevos y los que
+desaparecieron.
+
+Uso:
+    python scripts/comparar_corridas.py --anterior rev0/ftglst*.txt --nueva rev1/ftglst*.txt
+        [--top 20] [--relativo] [--tolerancia 0]
+"""
+
+import argparse
+import os
+import sys
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from aggregator import consolidate
+from ftg_parser import parse_fatigue_file
+from run_diff import diff_runs
+
+
+def cargar(paths: list):
+    """Parsea una corrida; con varios archivos devuelve el consolidado."""
+    results = {path: parse_fatigue_file(path) for path in paths}
+    if len(results) == 1:
+        return next(iter(results.values()))
+    return consolidate(results)
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--anterior', nargs='+', required=True,
+                        help='Listados FTG de la corrida anterior')
+    parser.add_argument('--nueva', nargs='+', required=True,
+                        help='Listados FTG de la corrida nueva')
+    parser.add_argument('--top', type=int, default=20, help='Cambios a mostrar')
+    parser.add_argument('--relativo', action='store_true',
+                        help='Ordenar por cambio relativo en lugar de absoluto')
+    parser.add_argument('--tolerancia', type=float, default=0.0,
+                        help='Cambio absoluto máximo considerado igual')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("COMPARACIÓN DE CORRIDAS")
+    print("=" * 70)
+
+    diff = diff_runs(cargar(args.anterior), cargar(args.nueva))
+    summary = diff.get_summary(args.tolerancia)
+
+    print(f"\n📊 Resumen:")
+    print(f"  - Elementos anterior / nueva:  {summary['old_elements']:,} / "
+          f"{summary['new_elements']:,}")
+    print(f"  - Coincidencias:               {summary['matched']:,}")
+    print(f"  - Con cambio de daño:          {summary['changed']:,}")
+    print(f"  - Nuevos / desaparecidos:      {summary['added']:,} / {summary['removed']:,}")
+
+    criterio = 'relativo' if args.relativo else 'absoluto'
+    print(f"\n🔝 Top {args.top} cambios ({criterio}):")
+    print(f"{'UNIQUE_KEY':<28} {'ANTERIOR':>11} {'NUEVO':>11} {'UBICACIÓN':>10} "
+          f"{'CAMBIO':>11} {'REL':>9}")
+    for row in diff.change_rows(diff.top_changes(args.top, relative=args.relativo)):
+        print(f"{row['UNIQUE_KEY']:<28} {row['OLD_MAX_DAMAGE']:>11.4e} "
+              f"{row['NEW_MAX_DAMAGE']:>11.4e} {row['LOCATION']:>10} "
+              f"{row['CHANGE']:>+11.4e} {row['RELATIVE_CHANGE']:>+9.2%}")
+
+    for titulo, keys in (("➕ Elementos nuevos", diff.added_keys),
+                         ("➖ Elementos desaparecidos", diff.removed_keys)):
+        if keys:
+            print(f"\n{titulo} ({len(keys)}):")
+            for key in keys[:args.top]:
+                print(f"  - {key}")
+            if len(keys) > args.top:
+                print(f"  ... y {len(keys) - args.top} más")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Script para comparar los motores de extracción del parser FTG
+Parsea cada archivo con la máquina de estados y con el motor regex,
+verifica que ambos produzcan los mismos elementos, daños, errores y
+advertencias, y reporta el throughput (MB/s) de cada motor.
+
+Sin argumentos genera un listado sintético de --elementos elementos con
+--cargas casos de carga cada uno. La ventaja del motor regex crece con el
+número de filas de casos de carga por elemento.
+
+Uso:
+    python scripts/comparar_motores.py [archivo ...] [--elementos N] [--cargas N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from ftg_parser import ENGINES, parse_fatigue_file
+
+
+def generar_listado(path: str, n_elementos: int, n_cargas: int = 16):
+    """
+    Escribe un listado FTG sintético (encabezados de página incluidos).
+
+    Args:
+        path: Ruta de salida
+        n_elementos: Número de elementos
+        n_cargas: Casos de carga por elemento
+    """
+    with open(path, 'w', encoding='latin-1') as f:
+        f.write("SACS (2024)                                      FTG PAGE  1\n\n")
+        f.write("                     MEMBER FATIGUE DETAIL REPORT\n\n")
+        f.write(" JOINT   CHD   BRC   GRUP  LOAD   FATG  DAMAGES\n")
+        for i in range(n_elementos):
+            valores = ' '.join(f".{(i * 7 + k) % 90000000 + 10000000:08d}-{k + 1}"
+                               for k in range(8))
+            f.write(f" {100 + i // 3}L  {i % 10000:04d} J{400 + i % 97:<4} 24B    1  {valores}\n")
+            for carga in range(2, n_cargas + 1):
+                f.write(f"{'':<23}{carga:>4}  {valores}\n")
+            if i % 12 == 11:
+                f.write(f"SACS (2024)                                      FTG PAGE  {i}\n")
+            totales = ' '.join(f"{(i + k + 1) * 1e-6:.8E}" for k in range(8))
+            f.write(f"  *** TOTAL DAMAGE ***  {totales}\n")
+
+
+def diferencias(a, b) -> list:
+    """Lista de diferencias entre dos ParseResult (vacía si son idénticos)."""
+    problemas = []
+    if list(a.elements) != list(b.elements):
+        problemas.append("claves u orden de elementos distintos")
+    else:
+        for key, element in a.elements.items():
+            if not (element.damages == b.elements[key].damages).all():
+                problemas.append(f"daños distintos en {key}")
+                break
+    if a.errors != b.errors:
+        problemas.append("errores distintos")
+    if a.warnings != b.warnings:
+        problemas.append("advertencias distintas")
+    return problemas
+
+
+def medir(path: str, engine: str, repeticiones: int) -> tuple:
+    """Parsea el archivo y retorna (resultado, mejor tiempo en segundos)."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        result = parse_fatigue_file(path, engine=engine)
+        tiempos.append(time.perf_counter() - inicio)
+    return result, min(tiempos)
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('archivos', nargs='*', help='Listados FTG a comparar')
+    parser.add_argument('--elementos', type=int, default=20000,
+                        help='Elementos del listado sintético (sin archivos)')
+    parser.add_argument('--cargas', type=int, default=16,
+                        help='Casos de carga por elemento del listado sintético')
+    parser.add_argument('--repeticiones', type=int, default=3,
+                        help='Mediciones por motor (se reporta la mínima)')
+    args = parser.parse_args()
+
+    tmpdir = None
+    archivos = args.archivos
+    if not archivos:
+        tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmpdir.name, 'ftglst_sintetico.txt')
+        generar_listado(path, args.elementos, args.cargas)
+        archivos = [path]
+
+    print("=" * 70)
+    print("COMPARACIÓN DE MOTORES DE EXTRACCIÓN")
+    print("=" * 70)
+
+    distintos = []
+    for path in archivos:
+        mb = os.path.getsize(path) / 1e6
+        print(f"\n📄 {os.path.basename(path)} ({mb:.1f} MB)")
+
+        resultados = {}
+        for engine in ENGINES:
+            result, segundos = medir(path, engine, args.repeticiones)
+            resultados[engine] = result
+            print(f"   {engine:<14} {segundos:7.3f} s  {mb / segundos:7.1f} MB/s  "
+                  f"({result.total_elements} elementos)")
+
+        problemas = diferencias(resultados['regex'], resultados['state_machine'])
+        if problemas:
+            distintos.append(path)
+            print(f"   ❌ Resultados distintos: {'; '.join(problemas)}")
+        else:
+            print("   ✅ Resultados idénticos")
+
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+    if distintos:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
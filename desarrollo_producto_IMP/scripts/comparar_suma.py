@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Script para verificar la suma reproducible de daños en la consolidación
+Consolida el mismo conjunto de archivos sintéticos en distintos órdenes de
+llegada (como los produce el parsing en paralelo con distinto número de
+workers), verifica que el daño consolidado por clave sea idéntico bit a
+bit (en memoria y fuera de memoria) y compara contra la suma directa en
+orden de llegada: variantes distintas, error contra math.fsum y costo de
+la reducción.
+
+Uso:
+    python scripts/comparar_suma.py [--archivos F] [--elementos N] [--ordenes K]
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import sys
+import tempfile
+import time
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import numpy as np
+
+from aggregator import canonical_order, compensated_sum, consolidate, stack_results
+from out_of_core import consolidate_out_of_core
+from tables import ElementTable
+
+
+def generar_tablas(n_archivos: int, n_elementos: int, seed: int = 0) -> dict:
+    """
+    Tablas sintéticas con daños entre 1e-12 y 1 (pequeños junto a grandes).
+
+    Args:
+        n_archivos: Número de archivos (periodos)
+        n_elementos: Elementos por archivo (mismas claves en todos)
+        seed: Semilla
+
+    Returns:
+        dict {nombre: ElementTable}
+    """
+    rng = np.random.default_rng(seed)
+    joints = [f"{100 + i // 3}L" for i in range(n_elementos)]
+    members = [f"{i % 10000:04d} J{400 + i % 97}" for i in range(n_elementos)]
+    grups = [('24B', '16A', 'DL9')[i % 3] for i in range(n_elementos)]
+    tablas = {}
+    for f in range(n_archivos):
+        escala = 10.0 ** rng.integers(-12, 1, size=(n_elementos, 1))
+        tablas[f"ftglstE{f + 1:02d}.txt"] = ElementTable.from_columns(
+            joints, members, grups, rng.random((n_elementos, 8)) * escala)
+    return tablas
+
+
+def huella(table: ElementTable) -> str:
+    """SHA-256 de los daños ordenados por clave (independiente del orden de filas)."""
+    orden = np.argsort(table.unique_keys, kind='stable')
+    return hashlib.sha256(np.ascontiguousarray(table.damages[orden]).tobytes()).hexdigest()[:16]
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--archivos', type=int, default=24, help='Archivos (periodos)')
+    parser.add_argument('--elementos', type=int, default=50000, help='Elementos por archivo')
+    parser.add_argument('--ordenes', type=int, default=6,
+                        help='Órdenes de llegada a comparar')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("SUMA REPRODUCIBLE DE DAÑOS")
+    print("=" * 70)
+    print(f"\n{args.archivos} archivos × {args.elementos:,} elementos, "
+          f"{args.ordenes} órdenes de llegada")
+
+    tablas = generar_tablas(args.archivos, args.elementos)
+    nombres = list(tablas)
+
+    huellas, huellas_directa = set(), set()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for k in range(args.ordenes):
+            orden = list(nombres)
+            np.random.default_rng(k).shuffle(orden)
+            llegada = {n: tablas[n] for n in orden}
+
+            stack = stack_results(llegada)
+            huellas.add(huella(stack.elements))
+            directa = ElementTable(stack.elements.joint_codes, stack.elements.joint_names,
+                                   stack.elements.members, stack.elements.grup_codes,
+                                   stack.elements.grup_names, stack.damages.sum(axis=0))
+            huellas_directa.add(huella(directa))
+
+            disco = consolidate_out_of_core(llegada, os.path.join(tmpdir, f"acc{k}.dmg"))
+            huellas.add(huella(disco))
+            del disco
+
+    print(f"\n🔁 Variantes del consolidado entre órdenes:")
+    print(f"   Suma directa (orden de llegada):    {len(huellas_directa)}")
+    print(f"   Compensada, orden canónico (RAM y disco): {len(huellas)}")
+
+    # Costo de la reducción sobre la matriz (F, N, 8)
+    stack = stack_results(tablas)
+    orden = canonical_order(stack.source_files)
+    inicio = time.perf_counter()
+    directa = stack.damages.sum(axis=0)
+    t_directa = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    compensada = compensated_sum(stack.damages, orden)
+    t_compensada = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    consolidate(tablas)
+    t_total = time.perf_counter() - inicio
+
+    # Error contra math.fsum (exacta) en una muestra de posiciones
+    muestra = np.random.default_rng(0).choice(directa.size, size=min(2000, directa.size),
+                                              replace=False)
+    planos = stack.damages.reshape(len(stack.source_files), -1)
+    exacta = np.array([math.fsum(planos[:, i]) for i in muestra])
+    error_directa = np.max(np.abs(directa.ravel()[muestra] - exacta) / exacta)
+    error_compensada = np.max(np.abs(compensada.ravel()[muestra] - exacta) / exacta)
+
+    print(f"\n⏱️  Reducción sobre ({len(stack.source_files)}, {len(stack.elements):,}, 8):")
+    print(f"   Suma directa:      {t_directa:7.3f} s  (error rel. máx. {error_directa:.2e})")
+    print(f"   Suma compensada:   {t_compensada:7.3f} s  (error rel. máx. {error_compensada:.2e})")
+    print(f"   consolidate total: {t_total:7.3f} s")
+
+    if len(huellas) != 1:
+        print("\n❌ El consolidado depende del orden de llegada")
+        sys.exit(1)
+    print("\n✅ Consolidado idéntico bit a bit en todos los órdenes")
+
+
+if __name__ == '__main__':
+    main()
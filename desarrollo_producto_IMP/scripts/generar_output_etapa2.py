@@ -3,20 +3,33 @@
 Script para generar output provisional de Etapa 2
 Parsea archivos SACS FTG y extrae elementos estructurados
 Guarda resultado en output_provisional/ftglstE1_etapa2.csv
+
+Uso:
+    python scripts/generar_output_etapa2.py [--memoria] [--graficos]
 """
 
+import argparse
 import sys
 import os
-import pandas as pd
 
 # Agregar src al path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from ftg_parser import parse_fatigue_file
+from memory_profile import RunMetrics
 
 
 def main():
     """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--memoria', action='store_true',
+                        help='Medir memoria por etapa (tracemalloc + RSS; más lento). '
+                             'El RSS requiere Linux (/proc) o psutil; en macOS '
+                             'sin psutil solo se reporta el pico')
+    parser.add_argument('--graficos', action='store_true',
+                        help='Generar gráficos del reporte (requiere matplotlib)')
+    args = parser.parse_args()
+    metrics = RunMetrics() if args.memoria else None
     
     # Rutas
     input_file = '../data/ftglstE1.txt'
@@ -36,34 +49,50 @@ def main():
     
     try:
         # Parsear archivo
-        result = parse_fatigue_file(input_path)
+        result = parse_fatigue_file(input_path, metrics=metrics)
         
         print(f"\n✅ Parsing completado!")
         print(f"\nEstadísticas:")
         print(f"  - Elementos extraídos:    {result.total_elements:,}")
-        print(f"  - Errores:                {len(result.errors)}")
-        print(f"  - Advertencias:           {len(result.warnings)}")
+        print(f"  - Errores:                {result.error_count}")
+        print(f"  - Advertencias:           {result.warning_count}")
         
         if result.total_elements == 0:
             print("\n⚠️  No se extrajeron elementos. Verificar formato del archivo.")
             sys.exit(1)
         
-        # Convertir a DataFrame
-        print("\nGenerando DataFrame...")
-        data = []
-        for element in result.elements.values():
-            data.append(element.to_dict())
-        
-        df = pd.DataFrame(data)
+        # Guardar a CSV ordenado por daño máximo (descendente); numpy se
+        # importa solo en este punto
+        from csv_export import damage_order, write_elements_csv
         
-        # Ordenar por daño máximo (descendente)
-        df = df.sort_values('MAX_DAMAGE', ascending=False)
+        table = result.to_table()
+        charts = None
+        if args.graficos:
+            # Los gráficos se dibujan en otro proceso mientras se escribe el
+            # CSV; si fallan se avisa y el reporte sigue
+            try:
+                from report_charts import chart_data, render_charts_async
+                
+                charts_dir = os.path.join(os.path.dirname(output_path), 'graficos_etapa2')
+                charts = render_charts_async(chart_data(table), charts_dir)
+            except Exception as e:
+                print(f"⚠️  Gráficos omitidos: {type(e).__name__}: {e}")
         
-        # Guardar a CSV
-        df.to_csv(output_path, index=False)
+        write_elements_csv(table, output_path, metrics=metrics)
         
         print(f"\n✅ Archivo CSV generado: {output_path}")
         
+        if charts is not None:
+            # ImportError (sin matplotlib), error de dibujo o proceso caído
+            # (BrokenProcessPool)
+            try:
+                chart_paths = charts.result()
+            except Exception as e:
+                print(f"⚠️  Gráficos omitidos: {type(e).__name__}: {e}")
+            else:
+                for path in chart_paths.values():
+                    print(f"✅ Gráfico generado: {path}")
+        
         # Mostrar resumen
         summary = result.get_summary()
         print(f"\n📊 Resumen:")
@@ -73,7 +102,15 @@ def main():
         
         # Mostrar top 10 elementos
         print(f"\n🔝 Top 10 elementos con mayor daño:")
-        print(df[['JOINT', 'MEMBER', 'GRUP', 'MAX_DAMAGE', 'CRITICAL_LOCATION']].head(10).to_string(index=False))
+        top = table.take(damage_order(table, top_k=10))
+        print(f"{'JOINT':>6} {'MEMBER':>12} {'GRUP':>5} {'MAX_DAMAGE':>12} {'CRITICAL_LOCATION':>17}")
+        for joint, member, grup, damage, location in zip(top.joints, top.members, top.grups,
+                                                         top.max_damage, top.critical_location):
+            print(f"{joint:>6} {member:>12} {grup:>5} {damage:>12.6g} {location:>17}")
+        
+        if metrics is not None:
+            print(f"\n🧠 Memoria por etapa:")
+            print(metrics.format_report())
         
         # Si hay errores, mostrarlos
         if result.errors:
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Script para medir el costo de arranque (imports) de los puntos de entrada
+Ejecuta `python -X importtime` en un proceso limpio por punto de entrada,
+reporta el tiempo de import y las dependencias pesadas cargadas, y
+termina con código 1 si algún punto de entrada excede su presupuesto.
+
+Uso:
+    python scripts/medir_arranque.py [--repeticiones N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Punto de entrada → (statement de import, presupuesto en ms)
+# 'gui' corresponde a lo que importará gui_main.py (Etapa 4/7) antes de
+# mostrar la ventana.
+ENTRY_POINTS = {
+    'cli': ('import ftg_parser', 80.0),
+    'gui': ('import tkinter, tkinter.ttk, tkinter.filedialog, ftg_parser', 150.0),
+}
+
+# Dependencias que no deben cargarse al arrancar
+HEAVY_MODULES = ('numpy', 'pandas', 'chardet', 'matplotlib', 'openpyxl')
+
+
+def medir(statement: str) -> tuple:
+    """
+    Mide el tiempo de import de un statement en un proceso nuevo.
+
+    Args:
+        statement: Código a ejecutar (ej: 'import ftg_parser')
+
+    Returns:
+        tuple (ms_totales, modulos_pesados_cargados)
+    """
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True, text=True, env=env, check=True
+    )
+
+    total_us = 0
+    pesados = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        module = name.rstrip()
+        # Solo se suman módulos de primer nivel (sin sangría)
+        if not module.startswith('  '):
+            total_us += int(cumulative)
+        if module.strip().split('.')[0] in HEAVY_MODULES:
+            pesados.add(module.strip().split('.')[0])
+    return total_us / 1000.0, sorted(pesados)
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeticiones', type=int, default=5,
+                        help='Mediciones por punto de entrada (se reporta la mínima)')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("COSTO DE ARRANQUE POR PUNTO DE ENTRADA")
+    print("=" * 70)
+
+    excedidos = []
+    for nombre, (statement, presupuesto) in ENTRY_POINTS.items():
+        mediciones = [medir(statement) for _ in range(args.repeticiones)]
+        ms = min(m[0] for m in mediciones)
+        pesados = mediciones[0][1]
+        estado = '✅' if ms <= presupuesto and not pesados else '❌'
+        print(f"\n{estado} {nombre}: {ms:.1f} ms (presupuesto {presupuesto:.0f} ms)")
+        print(f"   {statement}")
+        if pesados:
+            print(f"   Dependencias pesadas cargadas: {', '.join(pesados)}")
+        if estado == '❌':
+            excedidos.append(nombre)
+
+    if excedidos:
+        print(f"\n⚠️  Presupuesto excedido en: {', '.join(excedidos)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Script para iniciar el servicio local de parsing FTG
+Mantiene un pool de workers y un cache de resultados en memoria y atiende
+peticiones de parsing y consolidación en localhost (ver parse_service).
+
+Uso:
+    python scripts/servicio_parseo.py [--puerto 8765] [--workers N] [--cache 64]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Agregar src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parse_service import DEFAULT_CACHE_ENTRIES, DEFAULT_HOST, DEFAULT_PORT, ParseService
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--puerto', type=int, default=DEFAULT_PORT, help='Puerto en localhost')
+    parser.add_argument('--workers', type=int, help='Procesos worker (default: núcleos)')
+    parser.add_argument('--cache', type=int, default=DEFAULT_CACHE_ENTRIES,
+                        help='Resultados por archivo retenidos en memoria')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    with ParseService(DEFAULT_HOST, args.puerto, args.workers, args.cache) as service:
+        host, port = service.address
+        print(f"🚀 Servicio de parsing en http://{host}:{port} (Ctrl+C para terminar)")
+        service.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
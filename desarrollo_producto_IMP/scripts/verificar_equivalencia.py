@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Script para verificar la equivalencia de los caminos rápidos del parser
+Genera listados FTG y tokens Fortran aleatorios, ejecuta cada modo
+registrado (motor regex, parsing en memoria, extractores, conversores de
+tokens candidatos) contra la implementación de referencia y reporta las
+divergencias junto con el throughput de cada modo.
+
+Con --historial cada corrida se agrega como una línea JSON (fecha, semilla,
+divergencias y throughput por modo) para seguir correctitud y velocidad
+juntas entre versiones.
+
+Uso:
+    python scripts/verificar_equivalencia.py [--semilla N] [--listados N]
+        [--elementos N] [--tokens N] [--historial equivalencia.jsonl]
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from equivalence import run_equivalence
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--semilla', type=int, default=0,
+                        help='Semilla base de los generadores')
+    parser.add_argument('--listados', type=int, default=5,
+                        help='Listados aleatorios a generar')
+    parser.add_argument('--elementos', type=int, default=2000,
+                        help='Elementos por listado')
+    parser.add_argument('--tokens', type=int, default=50000,
+                        help='Tokens Fortran aleatorios a convertir')
+    parser.add_argument('--historial',
+                        help='Archivo JSONL donde agregar el resultado de la corrida')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("VERIFICACIÓN DE EQUIVALENCIA DIFERENCIAL")
+    print("=" * 70)
+    print(f"\n🎲 Semilla {args.semilla}: {args.listados} listados × {args.elementos} "
+          f"elementos, {args.tokens:,} tokens")
+
+    report = run_equivalence(seed=args.semilla, n_listings=args.listados,
+                             n_elements=args.elementos, n_tokens=args.tokens)
+
+    for kind, title in (('token', 'CONVERSIÓN DE TOKENS'), ('parse', 'PARSING DE LISTADOS')):
+        print(f"\n📊 {title}")
+        for mode in (m for m in report.modes if m.kind == kind):
+            status = '✅' if mode.divergences == 0 else '❌'
+            print(f"   {status} {mode.name:<18} {mode.throughput:>12,.1f} {mode.unit:<9} "
+                  f"{mode.divergences}/{mode.cases} divergentes")
+            for example in mode.examples[:5]:
+                print(f"        - {example}")
+
+    if args.historial:
+        record = {'fecha': datetime.now().isoformat(timespec='seconds'), **report.get_summary()}
+        with open(args.historial, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        print(f"\n💾 Resultado agregado a {args.historial}")
+
+    if not report.ok:
+        print("\n❌ Hay caminos que no coinciden con la referencia")
+        sys.exit(1)
+    print("\n✅ Todos los modos coinciden con la referencia")
+
+
+if __name__ == '__main__':
+    main()
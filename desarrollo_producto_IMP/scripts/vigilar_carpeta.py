@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Script para vigilar una carpeta de proyecto y consolidar listados FTG
+Procesa cada ftglst*.txt nuevo o modificado cuando termina de escribirse
+y actualiza el CSV consolidado de la plataforma sin re-parsear los
+archivos ya procesados (estado en <carpeta>/.fatiga_watch/).
+
+Uso:
+    python scripts/vigilar_carpeta.py CARPETA [--patron ftglst*.txt] [--espera 10]
+    python scripts/vigilar_carpeta.py CARPETA --una-vez
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Agregar src al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from folder_watch import (
+    DEFAULT_PATTERNS, DEFAULT_POLL_INTERVAL, DEFAULT_SETTLE_SECONDS, FolderWatcher
+)
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('carpeta', help='Carpeta de la plataforma')
+    parser.add_argument('--patron', action='append',
+                        help=f"Patrón de archivos (repetible, default: {DEFAULT_PATTERNS[0]})")
+    parser.add_argument('--salida', help='CSV consolidado (default: <carpeta>/consolidado_fatiga.csv)')
+    parser.add_argument('--espera', type=float, default=DEFAULT_SETTLE_SECONDS,
+                        help='Segundos sin cambios antes de procesar un archivo')
+    parser.add_argument('--intervalo', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help='Segundos entre revisiones de la carpeta')
+    parser.add_argument('--motor', choices=('state_machine', 'regex'), default='state_machine',
+                        help='Motor de extracción del parser')
+    parser.add_argument('--una-vez', action='store_true',
+                        help='Procesar lo pendiente y terminar (sin esperar estabilidad)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    if not os.path.isdir(args.carpeta):
+        print(f"❌ ERROR: No existe la carpeta {args.carpeta}")
+        sys.exit(1)
+
+    watcher = FolderWatcher(
+        args.carpeta,
+        patterns=tuple(args.patron or DEFAULT_PATTERNS),
+        output_path=args.salida,
+        settle_seconds=0.0 if args.una_vez else args.espera,
+        poll_interval=args.intervalo,
+        engine=args.motor
+    )
+
+    if args.una_vez:
+        # Dos revisiones: la primera registra firmas, la segunda procesa
+        watcher.scan()
+        processed = watcher.poll_once()
+        print(f"✅ {len(processed)} archivos procesados")
+        print(f"📊 {watcher.state.get_summary()}")
+        return
+
+    print(f"👀 Vigilando {args.carpeta} (Ctrl+C para terminar)")
+    watcher.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+"""
+Índice de Adyacencia - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Consultas de vecindad sobre la relación 1:N JOINT → MEMBER/GRUP
+(dificultades técnicas, punto 5): todas las conexiones de una junta, todo
+lo que toca un brace y el peor daño por junta.
+
+MEMBER codifica los dos extremos del miembro (CHD y BRC): "802L 0005",
+"0002-501L", "401L-0002". Los extremos y los JOINT comparten un mismo
+espacio de nodos (dict nombre → código). El índice guarda dos relaciones
+nodo → filas en formato CSR (filas ordenadas por nodo + offsets), igual
+que GroupIndex:
+
+    joint:    filas cuyo JOINT es el nodo
+    endpoint: filas cuyo MEMBER tiene al nodo como extremo
+
+Se construye una vez por tabla (O(N) más un argsort) y se guarda en
+table.cache; cada consulta cuesta una búsqueda en el dict más el tamaño
+del resultado, sin recorrer los elementos.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from member_keys import member_endpoints
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+def _csr(nodes: np.ndarray, rows: np.ndarray, n_nodes: int) -> tuple:
+    """Filas agrupadas por nodo: (filas ordenadas por nodo, offsets (n_nodes + 1,))."""
+    order = np.argsort(nodes, kind='stable')
+    offsets = np.zeros(n_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(nodes, minlength=n_nodes), out=offsets[1:])
+    return rows[order], offsets
+
+
+@dataclass
+class AdjacencyIndex:
+    """
+    Relaciones nodo → filas en formato CSR.
+
+    Attributes:
+        node_names: Lista {código: nombre de nodo} (JOINT primero, luego
+                    extremos que no aparecen como JOINT)
+        node_ids: Diccionario {nombre: código}
+        joint_rows: Array (N,) de filas ordenadas por JOINT
+        joint_offsets: Array (nodos + 1,); filas del nodo v con JOINT = v son
+                       joint_rows[joint_offsets[v]:joint_offsets[v + 1]]
+        endpoint_rows: Array (E,) de filas ordenadas por extremo de MEMBER
+        endpoint_offsets: Array (nodos + 1,) análogo para extremos
+        endpoint_counts: Array (N,) de extremos distintos de cada fila (un
+                         extremo repetido, "0005-0005", cuenta una vez)
+    """
+    node_names: list
+    node_ids: dict
+    joint_rows: np.ndarray
+    joint_offsets: np.ndarray
+    endpoint_rows: np.ndarray
+    endpoint_offsets: np.ndarray
+    endpoint_counts: np.ndarray
+
+    @classmethod
+    def build(cls, table: ElementTable) -> 'AdjacencyIndex':
+        """
+        Construye el índice de una tabla.
+
+        Args:
+            table: Tabla de elementos
+
+        Returns:
+            AdjacencyIndex
+        """
+        # Los códigos de JOINT se conservan como códigos de nodo
+        node_names = list(table.joint_names)
+        node_ids = {name: code for code, name in enumerate(node_names)}
+
+        endpoint_nodes, endpoint_of_member = [], {}
+        counts = np.empty(len(table), dtype=np.int64)
+        for row, member in enumerate(table.members.tolist()):
+            codes = endpoint_of_member.get(member)
+            if codes is None:
+                codes = []
+                for name in dict.fromkeys(member_endpoints(member)):
+                    code = node_ids.get(name)
+                    if code is None:
+                        code = node_ids[name] = len(node_names)
+                        node_names.append(name)
+                    codes.append(code)
+                endpoint_of_member[member] = codes
+            endpoint_nodes.extend(codes)
+            counts[row] = len(codes)
+
+        n_nodes = len(node_names)
+        all_rows = np.arange(len(table), dtype=np.int64)
+        joint_rows, joint_offsets = _csr(np.asarray(table.joint_codes, dtype=np.int64),
+                                         all_rows, n_nodes)
+        endpoint_rows, endpoint_offsets = _csr(np.array(endpoint_nodes, dtype=np.int64),
+                                               np.repeat(all_rows, counts), n_nodes)
+        return cls(node_names, node_ids, joint_rows, joint_offsets,
+                   endpoint_rows, endpoint_offsets, counts)
+
+    def __len__(self) -> int:
+        return len(self.node_names)
+
+    def _slice(self, rows: np.ndarray, offsets: np.ndarray, node: str) -> np.ndarray:
+        code = self.node_ids.get(node)
+        if code is None:
+            return rows[:0]
+        return rows[offsets[code]:offsets[code + 1]]
+
+    def rows_at_joint(self, joint: str) -> np.ndarray:
+        """Filas cuyo JOINT es joint (todas sus conexiones), en orden de fila."""
+        return self._slice(self.joint_rows, self.joint_offsets, joint)
+
+    def rows_touching(self, node: str) -> np.ndarray:
+        """Filas cuyo MEMBER tiene a node como extremo, en orden de fila."""
+        return self._slice(self.endpoint_rows, self.endpoint_offsets, node)
+
+    def neighborhood(self, node: str) -> np.ndarray:
+        """Filas con node como JOINT o como extremo de MEMBER (sin repetir)."""
+        return np.union1d(self.rows_at_joint(node), self.rows_touching(node))
+
+    def member_rows(self, member: str) -> np.ndarray:
+        """
+        Filas del mismo miembro estructural (mismos extremos, en cualquier
+        orden y con cualquier separador: "802L 0005" ≡ "0005-802L").
+
+        Args:
+            member: MEMBER del brace
+
+        Returns:
+            Array de filas en orden de fila
+        """
+        endpoints = tuple(dict.fromkeys(member_endpoints(member)))
+        if not endpoints:
+            return self.joint_rows[:0]
+        rows = self.rows_touching(endpoints[0])
+        for node in endpoints[1:]:
+            rows = np.intersect1d(rows, self.rows_touching(node), assume_unique=True)
+        # Sin extremos de más: "0005-0005" no es el brace "0005 0006"
+        return rows[self.endpoint_counts[rows] == len(endpoints)]
+
+    def worst_by_node(self, values: np.ndarray, relation: str = 'joint') -> tuple:
+        """
+        Peor valor por nodo y fila donde ocurre.
+
+        Args:
+            values: Array (N,) por fila (ej: table.max_damage)
+            relation: 'joint' (filas del JOINT) o 'endpoint' (extremos de MEMBER)
+
+        Returns:
+            tuple (max, argmax): arrays (nodos,); nan y -1 en nodos sin filas.
+            Con empates se reporta la primera fila.
+        """
+        if relation not in ('joint', 'endpoint'):
+            raise ValueError(f"Relación no soportada: {relation}")
+        rows, offsets = ((self.joint_rows, self.joint_offsets) if relation == 'joint'
+                         else (self.endpoint_rows, self.endpoint_offsets))
+
+        worst = np.full(len(self), np.nan)
+        worst_row = np.full(len(self), -1, dtype=np.int64)
+        nonempty = np.flatnonzero(np.diff(offsets))
+        if len(nonempty) == 0:
+            return worst, worst_row
+
+        sorted_values = np.asarray(values)[rows]
+        worst[nonempty] = np.maximum.reduceat(sorted_values, offsets[nonempty])
+
+        # Primera posición de cada nodo que alcanza su máximo
+        node_of = np.repeat(np.arange(len(self)), np.diff(offsets))
+        hits = np.flatnonzero(sorted_values == worst[node_of])
+        first = np.ones(len(hits), dtype=bool)
+        first[1:] = node_of[hits[1:]] != node_of[hits[:-1]]
+        worst_row[node_of[hits[first]]] = rows[hits[first]]
+        return worst, worst_row
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen del índice.
+
+        Returns:
+            dict: Nodos, filas y conexiones por JOINT
+        """
+        per_joint = np.diff(self.joint_offsets)
+        return {
+            'nodes': len(self),
+            'rows': len(self.joint_rows),
+            'endpoint_entries': len(self.endpoint_rows),
+            'max_rows_per_joint': int(per_joint.max()) if len(per_joint) else 0
+        }
+
+    def __repr__(self) -> str:
+        return f"AdjacencyIndex(nodes={len(self)}, rows={len(self.joint_rows)})"
+
+
+def adjacency_index(table: ElementTable) -> AdjacencyIndex:
+    """
+    Índice de adyacencia de la tabla (se construye una vez y se guarda en cache).
+
+    Args:
+        table: Tabla de elementos
+
+    Returns:
+        AdjacencyIndex
+    """
+    if 'adjacency' not in table.cache:
+        table.cache['adjacency'] = AdjacencyIndex.build(table)
+        logger.debug(f"Índice de adyacencia: {table.cache['adjacency']!r}")
+    return table.cache['adjacency']
+
+
+def worst_at_joint(table: ElementTable, joint: str) -> Optional[tuple]:
+    """
+    Peor daño entre las conexiones de una junta (agregados en cache).
+
+    Args:
+        table: Tabla de elementos
+        joint: Nombre del JOINT
+
+    Returns:
+        tuple (MAX_DAMAGE, fila) o None si el JOINT no tiene filas
+    """
+    index = adjacency_index(table)
+    if 'joint_worst' not in table.cache:
+        table.cache['joint_worst'] = index.worst_by_node(table.max_damage)
+    code = index.node_ids.get(joint)
+    if code is None:
+        return None
+    worst, worst_row = table.cache['joint_worst']
+    if worst_row[code] < 0:
+        return None
+    return float(worst[code]), int(worst_row[code])
@@ -0,0 +1,298 @@
+"""
+Consolidación de Daño - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Alinea los elementos de varios archivos FTG (periodos de operación) por su
+clave JOINT_MEMBER_GRUP y suma aritméticamente sus daños. La clave se
+compara en forma canónica (ver member_keys): el mismo miembro escrito como
+"802L 0005" en un archivo y "0005-802L" en otro es un solo elemento.
+
+La suma sobre el eje de archivos es reproducible: se recorre en orden
+canónico (nombre de archivo), no en el orden en que llegaron los
+resultados (que con parsing en paralelo depende de los workers), y usa
+suma compensada de Neumaier para no perder daños pequeños (~1e-10) junto a
+daños grandes. El daño consolidado de cada clave es idéntico bit a bit
+para el mismo conjunto de archivos, cualquiera sea su orden.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+import numpy as np
+
+from memory_profile import RunMetrics, track
+from models import ParseResult
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Valores por bloque de compensated_sum
+SUM_BLOCK = 8192
+
+
+@dataclass
+class DamageStack:
+    """
+    Daños de F archivos alineados sobre N elementos (unión de claves).
+
+    Attributes:
+        source_files: Nombres de los archivos en el orden del eje 0
+        elements: ElementTable con los identificadores de los N elementos
+                  (daños = suma consolidada)
+        damages: Array float64 (F, N, 8); 0.0 donde el elemento no existe
+        present: Array bool (F, N), True si el elemento aparece en el archivo
+        duplicates: {archivo: filas reemplazadas} para archivos con la misma
+                    clave canónica en varias filas (gana la última)
+    """
+    source_files: list
+    elements: ElementTable
+    damages: np.ndarray
+    present: np.ndarray
+    duplicates: dict = field(default_factory=dict)
+
+    @property
+    def file_count(self) -> np.ndarray:
+        """Número de archivos en que aparece cada elemento (N,)."""
+        return self.present.sum(axis=0)
+
+    def __repr__(self) -> str:
+        """Representación string del stack."""
+        return (f"DamageStack(files={len(self.source_files)}, "
+                f"elements={len(self.elements)})")
+
+
+def canonical_order(names: list) -> list:
+    """
+    Orden de suma independiente del orden de entrada.
+
+    Args:
+        names: Nombres de los archivos (eje 0 de la matriz de daños)
+
+    Returns:
+        Índices de los archivos ordenados por nombre
+    """
+    return sorted(range(len(names)), key=lambda f: names[f])
+
+
+def neumaier_add(total: np.ndarray, compensation: np.ndarray, values: np.ndarray):
+    """
+    Suma values a total en el lugar, acumulando el error de redondeo.
+
+    Paso de la suma de Neumaier: el resultado final es total + compensation.
+
+    Args:
+        total: Suma parcial (se modifica)
+        compensation: Error de redondeo acumulado (se modifica)
+        values: Sumando con la forma de total
+    """
+    partial = total + values
+    compensation += np.where(np.abs(total) >= np.abs(values),
+                             (total - partial) + values,
+                             (values - partial) + total)
+    total[...] = partial
+
+
+def compensated_sum(values: np.ndarray, order=None) -> np.ndarray:
+    """
+    Suma compensada (Neumaier) sobre el eje 0 en un orden fijo.
+
+    Misma secuencia de operaciones que neumaier_add, pero por bloques de
+    SUM_BLOCK valores con buffers reutilizados para que el acumulador quede
+    en cache mientras se recorren los archivos.
+
+    Args:
+        values: Array (F, ...) a reducir
+        order: Orden de los índices del eje 0 (default: 0..F-1)
+
+    Returns:
+        Array con la forma values.shape[1:]
+
+    Examples:
+        >>> compensated_sum(stack.damages, canonical_order(stack.source_files))
+    """
+    order = range(len(values)) if order is None else order
+    size = int(np.prod(values.shape[1:]))
+    flat = np.asarray(values, dtype=np.float64).reshape(len(values), size)
+    result = np.empty(size, dtype=np.float64)
+
+    buffers = [np.empty(min(size, SUM_BLOCK)) for _ in range(4)]
+    keep = np.empty(min(size, SUM_BLOCK), dtype=bool)
+    for start in range(0, size, SUM_BLOCK):
+        stop = min(start + SUM_BLOCK, size)
+        n = stop - start
+        total, partial, error, other = (b[:n] for b in buffers)
+        big = keep[:n]
+        total[:] = 0.0
+        compensation = np.zeros(n)
+        for f in order:
+            x = flat[f, start:stop]
+            np.add(total, x, out=partial)
+            np.greater_equal(np.abs(total, out=error), np.abs(x, out=other), out=big)
+            np.subtract(total, partial, out=error)
+            error += x                      # |total| >= |x|
+            np.subtract(x, partial, out=other)
+            other += total                  # |x| > |total|
+            np.copyto(error, other, where=~big)
+            compensation += error
+            total, partial = partial, total
+        np.add(total, compensation, out=result[start:stop])
+    return result.reshape(values.shape[1:])
+
+
+def as_table(result: Union[ParseResult, ElementTable]) -> ElementTable:
+    """
+    Convierte un ParseResult a ElementTable (las tablas pasan sin cambio).
+
+    Args:
+        result: ParseResult o ElementTable
+
+    Returns:
+        ElementTable
+    """
+    if isinstance(result, ElementTable):
+        return result
+    return result.to_table()
+
+
+def last_occurrence(ids: np.ndarray) -> tuple:
+    """
+    Última fila de cada ID (regla de claves repetidas: gana la última).
+
+    Args:
+        ids: Array (M,) de IDs de elemento de las filas de un archivo
+
+    Returns:
+        tuple (rows, unique_ids): fila de la última aparición de cada ID y
+        el ID correspondiente, en orden creciente de ID
+    """
+    order = np.argsort(ids, kind='stable')
+    sorted_ids = ids[order]
+    last = np.ones(len(order), dtype=bool)
+    last[:-1] = sorted_ids[:-1] != sorted_ids[1:]
+    return order[last], sorted_ids[last]
+
+
+def warn_duplicates(name: str, replaced: int):
+    """Advierte filas reemplazadas por claves canónicas repetidas en un archivo."""
+    if replaced:
+        logger.warning(f"{name}: {replaced} filas con una clave canónica repetida "
+                       f"(ej: '802L 0005' y '0005-802L'); gana la última")
+
+
+def _align_keys(hashes: np.ndarray) -> tuple:
+    """
+    Agrupa filas con la misma clave canónica a partir de sus digests.
+
+    Empareja por el hash (columna 0) con un np.unique sobre int64 y
+    verifica que las filas de cada grupo compartan también la columna 1.
+    Si no (colisión del hash de 64 bits), repite con el digest completo.
+
+    Args:
+        hashes: Array int64 (M, 2) de todas las filas de todos los archivos
+
+    Returns:
+        tuple (first, inverse): fila de la primera aparición de cada clave
+        (en orden de aparición) y clave de cada fila (M,)
+    """
+    _, first, inverse = np.unique(hashes[:, 0], return_index=True, return_inverse=True)
+    if not np.array_equal(hashes[first[inverse], 1], hashes[:, 1]):
+        collisions = int((hashes[first[inverse], 1] != hashes[:, 1]).sum())
+        logger.warning(f"Colisión de hash en {collisions} filas; se usa el digest completo")
+        digests = np.ascontiguousarray(hashes).view(np.dtype((np.void, hashes.itemsize * 2)))
+        _, first, inverse = np.unique(digests.ravel(), return_index=True, return_inverse=True)
+
+    # Claves numeradas por primera aparición (archivo y fila)
+    order = np.argsort(first, kind='stable')
+    rank = np.empty(len(first), dtype=np.int64)
+    rank[order] = np.arange(len(first))
+    return first[order], rank[inverse.ravel()]
+
+
+def stack_results(results: dict) -> DamageStack:
+    """
+    Alinea los daños de varios archivos por clave única.
+
+    Las filas se emparejan por la clave canónica (MEMBER con los extremos
+    ordenados: "802L 0005" ≡ "0005-802L"), comparando digests de 64 bits
+    con verificación de colisiones en lugar de strings. Los elementos se
+    ordenan por primera aparición (archivo y fila) y conservan el MEMBER de
+    esa aparición; la suma consolidada se calcula en orden canónico (ver
+    compensated_sum). Si un archivo tiene la misma clave canónica en varias
+    filas (ej: "802L 0005" y "0005-802L"), gana la última, como con las
+    claves repetidas en el parser; las filas reemplazadas se cuentan en
+    DamageStack.duplicates y se advierten en el log.
+
+    Args:
+        results: Diccionario {nombre_archivo: ParseResult | ElementTable}
+
+    Returns:
+        DamageStack con la matriz (F, N, 8) y la suma consolidada
+    """
+    tables = {name: as_table(result) for name, result in results.items()}
+
+    sizes = [len(table) for table in tables.values()]
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    hashes = np.concatenate([np.empty((0, 2), dtype=np.int64)]
+                            + [table.key_hashes for table in tables.values()])
+    first, key_of_row = _align_keys(hashes)
+
+    n_files, n_elements = len(tables), len(first)
+    damages = np.zeros((n_files, n_elements, 8), dtype=np.float64)
+    present = np.zeros((n_files, n_elements), dtype=bool)
+    joints, members, grups = [], [], []
+    duplicates = {}
+    for f, (name, table) in enumerate(tables.items()):
+        ids = key_of_row[offsets[f]:offsets[f + 1]]
+        # Asignación (no suma): con claves repetidas gana la última fila
+        rows, ids_once = last_occurrence(ids)
+        if len(rows) < len(ids):
+            duplicates[name] = len(ids) - len(rows)
+            warn_duplicates(name, duplicates[name])
+        damages[f, ids_once] = table.damages[rows]
+        present[f, ids_once] = True
+
+        # Identificadores de las claves que aparecen por primera vez aquí
+        # (first está en orden creciente de fila global)
+        lo, hi = np.searchsorted(first, offsets[f:f + 2])
+        local = (first[lo:hi] - offsets[f]).tolist()
+        joint_names, grup_names = table.joint_names, table.grup_names
+        joints.extend(joint_names[c] for c in table.joint_codes[local].tolist())
+        members.extend(table.members[local].tolist())
+        grups.extend(grup_names[c] for c in table.grup_codes[local].tolist())
+
+    elements = ElementTable.from_columns(
+        joints, members, grups,
+        compensated_sum(damages, canonical_order(list(tables)))
+    )
+    elements.cache['key_hashes'] = hashes[first]
+
+    logger.info(f"Consolidados {n_files} archivos: {n_elements} elementos únicos")
+    return DamageStack(
+        source_files=list(tables),
+        elements=elements,
+        damages=damages,
+        present=present,
+        duplicates=duplicates
+    )
+
+
+def consolidate(results: dict, metrics: Optional[RunMetrics] = None) -> ElementTable:
+    """
+    Suma los daños de varios archivos por clave JOINT_MEMBER_GRUP.
+
+    Args:
+        results: Diccionario {nombre_archivo: ParseResult | ElementTable}
+        metrics: RunMetrics donde registrar la etapa 'consolidation'
+
+    Returns:
+        ElementTable con el daño consolidado de cada elemento
+    """
+    with track(metrics, 'consolidation') as stage:
+        table = stack_results(results).elements
+        if stage is not None:
+            stage.elements = len(table)
+    return table
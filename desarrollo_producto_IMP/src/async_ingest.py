@@ -0,0 +1,264 @@
+"""
+Ingesta Asíncrona - Etapa 2: Parsing Multiproceso
+Procesador de Fatiga SACS v1.0
+
+Los listados de una corrida suelen estar en un recurso de red o en un
+almacenamiento lento: parse_files_shared deja que cada worker lea su
+archivo, de modo que los procesos esperan la red en lugar de parsear.
+
+Este módulo separa la E/S del cómputo con un pipeline asyncio:
+
+    lectores (hilos de E/S)  →  cola acotada  →  pool de procesos (parsing)
+
+- Los lectores leen cada archivo por bloques en un pool de hilos y
+  entregan el contenido completo a una cola acotada; mientras un archivo
+  se parsea, la lectura de los siguientes ya está en curso.
+- Cada archivo reserva su tamaño en un presupuesto de bytes antes de
+  leerse y lo devuelve al terminar su parsing: los bytes leídos y aún no
+  parseados nunca superan memory_budget (backpressure sobre la red).
+- Los workers descomprimen, detectan el encoding y parsean el contenido
+  recibido (parse_text), y devuelven el resultado por memoria compartida
+  como en shared_results (por pickle donde no está disponible).
+- Los resultados se adjuntan a medida que terminan (on_result permite
+  reportar avance); la consolidación final sigue el orden canónico de
+  archivos, así que la suma no depende del orden de llegada.
+
+    results = ingest_files(paths, memory_budget=512 * 1024 * 1024)
+    with results:
+        table = consolidate(results.tables)
+
+El archivo completo es la unidad de trabajo: el estado del parser
+(sección, elemento en curso) no se puede repartir entre bloques.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Optional
+
+from aggregator import consolidate
+from data_cleaner import detect_bytes_encoding
+from ftg_io import DEFAULT_BLOCK_SIZE, decompress_bytes
+from ftg_parser import FTGParser
+import shared_results
+from shared_results import (
+    SharedParseResult, SharedResultSet, SharedTableHandle, create_worker_pool,
+    export_result, release_unattached
+)
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Hilos de E/S (archivos leídos a la vez)
+DEFAULT_IO_WORKERS = 2
+
+# Archivos leídos completos a la espera de un worker
+DEFAULT_PREFETCH = 2
+
+# Bytes leídos y aún no parseados (todos los archivos en vuelo)
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+
+def parse_payload(source: str, data: bytes, engine: str = 'state_machine',
+                  shared: Optional[bool] = None) -> SharedTableHandle:
+    """
+    Tarea del worker: parsea el contenido crudo de un archivo y lo exporta.
+
+    Args:
+        source: Ruta de origen (define la descompresión y el nombre del resultado)
+        data: Bytes leídos del archivo (comprimidos o no)
+        engine: Motor de extracción del parser
+        shared: Usar memoria compartida (ver export_result)
+
+    Returns:
+        SharedTableHandle del resultado
+    """
+    data = decompress_bytes(source, data)
+    try:
+        encoding = detect_bytes_encoding(data)
+    except Exception as e:
+        logger.warning(f"Error detectando encoding, usando latin-1: {e}")
+        encoding = 'latin-1'
+    result = FTGParser(engine=engine).parse_text(data, encoding)
+    return export_result(result, source=source, shared=shared)
+
+
+class _ByteBudget:
+    """
+    Semáforo de bytes: limita la memoria de los archivos en vuelo.
+
+    Un archivo mayor que el presupuesto se admite solo cuando no hay otro
+    en vuelo, para no bloquear el pipeline.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, size: int):
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self.used == 0 or self.used + size <= self.limit)
+            self.used += size
+
+    async def release(self, size: int):
+        async with self._condition:
+            self.used -= size
+            self._condition.notify_all()
+
+
+async def _read_file(path: str, io_pool: Executor, block_size: int) -> bytes:
+    """Lee un archivo completo por bloques sin bloquear el event loop."""
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(io_pool, open, path, 'rb')
+    try:
+        blocks = []
+        while True:
+            block = await loop.run_in_executor(io_pool, f.read, block_size)
+            if not block:
+                break
+            blocks.append(block)
+    finally:
+        await loop.run_in_executor(io_pool, f.close)
+    return b''.join(blocks)
+
+
+async def ingest_files_async(filepaths: Iterable[str],
+                             executor: Optional[Executor] = None,
+                             max_workers: Optional[int] = None,
+                             io_workers: int = DEFAULT_IO_WORKERS,
+                             prefetch: int = DEFAULT_PREFETCH,
+                             memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                             block_size: int = DEFAULT_BLOCK_SIZE,
+                             engine: str = 'state_machine',
+                             on_result: Optional[Callable[[SharedParseResult], None]] = None
+                             ) -> SharedResultSet:
+    """
+    Lee y parsea varios archivos FTG solapando la E/S con el parsing.
+
+    Args:
+        filepaths: Rutas de los archivos (sin repetir)
+        executor: Executor del parsing (default: create_worker_pool(max_workers),
+                  cerrado al terminar; uno propio debe compartir el resource
+                  tracker, ver create_worker_pool)
+        max_workers: Procesos worker si no se pasa executor
+        io_workers: Archivos leídos a la vez
+        prefetch: Archivos leídos completos en espera de un worker
+        memory_budget: Bytes leídos y aún no parseados como máximo
+        block_size: Tamaño de cada lectura
+        engine: Motor de extracción del parser
+        on_result: Callback con cada SharedParseResult al terminar su parsing
+                   (en orden de llegada)
+
+    Returns:
+        SharedResultSet en el orden de filepaths
+
+    Raises:
+        ValueError: Si hay rutas repetidas
+        Exception: El primer error de lectura o parsing; los segmentos ya
+                   creados se liberan antes de propagarlo
+    """
+    filepaths = list(filepaths)
+    if len(set(filepaths)) != len(filepaths):
+        raise ValueError("Rutas de archivo repetidas")
+
+    loop = asyncio.get_running_loop()
+    own_executor = executor is None
+    if own_executor:
+        executor = create_worker_pool(max_workers)
+    io_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix='ftg-io')
+
+    budget = _ByteBudget(memory_budget)
+    ready = asyncio.Queue(maxsize=prefetch)
+    pending = iter(filepaths)
+    submitted = []
+    parse_tasks = []
+    attached = {}
+
+    async def reader():
+        for path in pending:
+            size = (await loop.run_in_executor(io_pool, os.stat, path)).st_size
+            await budget.acquire(size)
+            try:
+                data = await _read_file(path, io_pool, block_size)
+            except BaseException:
+                await budget.release(size)
+                raise
+            await ready.put((path, data, size))
+
+    async def parse(path: str, data: bytes, size: int):
+        future = executor.submit(parse_payload, path, data, engine,
+                                 shared_results.SHARED_MEMORY)
+        submitted.append(future)
+        try:
+            handle = await asyncio.wrap_future(future)
+        finally:
+            await budget.release(size)
+        shared = SharedParseResult(handle)
+        attached[path] = shared
+        if on_result is not None:
+            on_result(shared)
+
+    async def dispatcher():
+        for _ in filepaths:
+            path, data, size = await ready.get()
+            parse_tasks.append(asyncio.create_task(parse(path, data, size)))
+            data = None
+        await asyncio.gather(*parse_tasks)
+
+    workers = [asyncio.create_task(reader()) for _ in range(io_workers)]
+    workers.append(asyncio.create_task(dispatcher()))
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        tasks = workers + parse_tasks
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Los parsings ya iniciados terminan; sus segmentos se eliminan abajo
+        for future in submitted:
+            future.cancel()
+        wait(submitted)
+        for shared in attached.values():
+            shared.release()
+        release_unattached(submitted, attached.values())
+        raise
+    finally:
+        io_pool.shutdown(wait=True)
+        if own_executor:
+            executor.shutdown()
+
+    results = SharedResultSet((path, attached[path]) for path in filepaths)
+    logger.info(f"Ingesta asíncrona: {len(results)} archivos, "
+                f"{sum(len(r.table) for r in results.values())} elementos")
+    return results
+
+
+def ingest_files(filepaths: Iterable[str], **kwargs) -> SharedResultSet:
+    """
+    Versión síncrona de ingest_files_async (crea su propio event loop).
+
+    Examples:
+        >>> with ingest_files(paths, memory_budget=512 * 1024 * 1024) as results:
+        ...     table = consolidate(results.tables)
+    """
+    return asyncio.run(ingest_files_async(filepaths, **kwargs))
+
+
+def ingest_and_consolidate(filepaths: Iterable[str], **kwargs) -> ElementTable:
+    """
+    Lee, parsea y consolida varios archivos con el pipeline asíncrono.
+
+    Args:
+        filepaths: Rutas de los archivos
+        **kwargs: Opciones de ingest_files_async
+
+    Returns:
+        ElementTable consolidado (memoria propia; los segmentos se liberan)
+    """
+    with ingest_files(filepaths, **kwargs) as results:
+        return consolidate(results.tables)
@@ -0,0 +1,138 @@
+"""
+Exportación CSV - Etapa 2: Parsing y Extracción
+Procesador de Fatiga SACS v1.0
+
+Escritura de resultados por elemento a CSV directamente desde un
+ElementTable (matriz de daños + columnas categóricas), sin pasar por
+pandas ni por una lista de dicts.
+
+Las filas se escriben en bloques: por cada bloque se decodifican solo sus
+JOINT/GRUP y se calculan sus MAX_DAMAGE/CRITICAL_LOCATION/UNIQUE_KEY, de
+modo que la memoria adicional no crece con el número de elementos (salvo
+el array de orden cuando se ordena). El orden por MAX_DAMAGE se obtiene con
+argsort (completo) o argpartition (top-K).
+
+Formato (mismo layout que la salida de Etapa 2):
+    JOINT, MEMBER, GRUP, TOP, ..., TOP-RIGHT, MAX_DAMAGE, CRITICAL_LOCATION, UNIQUE_KEY
+"""
+
+import csv
+import logging
+from typing import Optional
+
+import numpy as np
+
+from memory_profile import RunMetrics, track
+from models import LOCATIONS
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+CSV_COLUMNS = ('JOINT', 'MEMBER', 'GRUP', *LOCATIONS,
+               'MAX_DAMAGE', 'CRITICAL_LOCATION', 'UNIQUE_KEY')
+
+# Filas formateadas por bloque
+DEFAULT_BLOCK_ROWS = 65536
+
+
+def damage_order(table: ElementTable, top_k: Optional[int] = None) -> np.ndarray:
+    """
+    Filas ordenadas por MAX_DAMAGE descendente.
+
+    Args:
+        table: Tabla de elementos
+        top_k: Solo las k filas de mayor daño (argpartition + argsort de k)
+
+    Returns:
+        Array de índices de fila (empates en orden de fila)
+    """
+    values = table.max_damage
+    if top_k is None or top_k >= len(values):
+        return np.argsort(-values, kind='stable')
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    candidates = np.argpartition(-values, top_k - 1)[:top_k]
+    candidates.sort()
+    return candidates[np.argsort(-values[candidates], kind='stable')]
+
+
+def row_tuples(table: ElementTable, rows) -> list:
+    """
+    Filas de salida (orden de CSV_COLUMNS) para un subconjunto de la tabla.
+
+    Solo se decodifican JOINT/GRUP y se calculan MAX_DAMAGE,
+    CRITICAL_LOCATION y UNIQUE_KEY de las filas pedidas.
+
+    Args:
+        table: Tabla de elementos
+        rows: Índices de fila o slice
+
+    Returns:
+        Lista de tuplas (JOINT, MEMBER, GRUP, 8 daños, MAX_DAMAGE,
+        CRITICAL_LOCATION, UNIQUE_KEY)
+    """
+    damages = table.damages[rows]
+    critical = damages.argmax(axis=1)
+    joint_names, grup_names = table.joint_names, table.grup_names
+    joints = [joint_names[c] for c in table.joint_codes[rows].tolist()]
+    members = table.members[rows].tolist()
+    grups = [grup_names[c] for c in table.grup_codes[rows].tolist()]
+    keys = [f"{j}_{m}_{g}" for j, m, g in zip(joints, members, grups)]
+
+    return list(zip(joints, members, grups, *damages.T.tolist(),
+                    damages[np.arange(len(damages)), critical].tolist(),
+                    np.asarray(LOCATIONS, dtype=object)[critical].tolist(), keys))
+
+
+def write_elements_csv(table: ElementTable, output, sort: bool = True,
+                       top_k: Optional[int] = None,
+                       block_rows: int = DEFAULT_BLOCK_ROWS,
+                       metrics: Optional[RunMetrics] = None) -> int:
+    """
+    Escribe los elementos de una tabla a CSV en bloques.
+
+    Args:
+        table: Tabla de elementos (individual o consolidada)
+        output: Ruta del CSV o stream de texto abierto
+        sort: Ordenar por MAX_DAMAGE descendente (si False, orden de la tabla)
+        top_k: Escribir solo los k elementos de mayor daño (implica sort)
+        block_rows: Filas formateadas por bloque
+        metrics: RunMetrics donde registrar la etapa 'export'
+
+    Returns:
+        Número de filas escritas
+
+    Examples:
+        >>> write_elements_csv(result.to_table(), 'ftglstE1_etapa2.csv')
+        >>> write_elements_csv(consolidated, 'top100.csv', top_k=100)
+    """
+    if isinstance(output, str):
+        with open(output, 'w', encoding='utf-8', newline='') as f:
+            return write_elements_csv(table, f, sort, top_k, block_rows, metrics)
+
+    with track(metrics, 'export', len(table)):
+        return _write_rows(table, output, sort, top_k, block_rows)
+
+
+def _write_rows(table: ElementTable, output, sort: bool, top_k: Optional[int],
+                block_rows: int) -> int:
+    """Escribe encabezado y filas a un stream (ver write_elements_csv)."""
+    if sort or top_k is not None:
+        order = damage_order(table, top_k)
+        n_rows = len(order)
+    else:
+        order = None
+        n_rows = len(table)
+
+    writer = csv.writer(output, lineterminator='\n')
+    writer.writerow(CSV_COLUMNS)
+    for start in range(0, n_rows, block_rows):
+        stop = min(start + block_rows, n_rows)
+        rows = order[start:stop] if order is not None else slice(start, stop)
+        writer.writerows(row_tuples(table, rows))
+
+    logger.info(f"CSV escrito: {n_rows} filas")
+    return n_rows
@@ -8,7 +8,9 @@ crudos extraídos de archivos de reporte de fatiga SACS.
 
 import re
 import logging
-from typing import Optional
+from typing import Callable, Optional
+
+from ftg_io import open_ftg_text, read_head
 
 # Configurar logging
 logger = logging.getLogger(__name__)
@@ -85,7 +87,7 @@ def normalize_fortran_scientific(value_str: str) -> float:
         raise ValueError(f"Formato inválido: '{original}'") from e
 
 
-def detect_file_encoding(filepath: str) -> str:
+def detect_file_encoding(filepath: str, member: Optional[str] = None) -> str:
     """
     Detecta el encoding de un archivo SACS.
     
@@ -97,8 +99,12 @@ def detect_file_encoding(filepath: str) -> str:
     Este método utiliza la librería chardet para detección automática,
     con fallback a encodings comunes si la detección falla.
     
+    Acepta también archivos comprimidos (.gz, .bz2, .xz, .zip); se analiza
+    el contenido descomprimido.
+    
     Args:
         filepath: Ruta al archivo .txt de SACS
+        member: Miembro a analizar si filepath es .zip
         
     Returns:
         str: Nombre del encoding detectado ('utf-8', 'latin-1', 'windows-1252', etc.)
@@ -111,48 +117,77 @@ def detect_file_encoding(filepath: str) -> str:
         >>> print(encoding)
         'utf-8'
     """
+    def decodes(encoding: str) -> bool:
+        """Verifica que el archivo completo decodifique con encoding."""
+        try:
+            with open_ftg_text(filepath, encoding, member) as f:
+                while f.read(1024 * 1024):
+                    pass
+            return True
+        except (UnicodeDecodeError, UnicodeError):
+            return False
+    
+    # Leer primeros 10KB para análisis; el archivo completo se lee solo
+    # si hay que verificar encodings alternativos
+    return detect_bytes_encoding(read_head(filepath, 10000, member), decodes)
+
+
+def detect_bytes_encoding(data: bytes,
+                          decodes: Optional[Callable[[str], bool]] = None) -> str:
+    """
+    Detecta el encoding de un listado SACS ya cargado en memoria.
+
+    chardet analiza los primeros 10KB; si la confianza es baja (o chardet
+    no está disponible) se prueban encodings comunes sobre el contenido
+    completo.
+
+    Args:
+        data: Contenido descomprimido del listado (o su comienzo, si se
+              pasa decodes)
+        decodes: Función que indica si el contenido completo decodifica con
+                 un encoding (default: decodificar data)
+
+    Returns:
+        str: Nombre del encoding detectado
+
+    Examples:
+        >>> detect_bytes_encoding('JOINT 0001'.encode('utf-8'))
+        'ascii'
+    """
+    if decodes is None:
+        def decodes(encoding: str) -> bool:
+            try:
+                data.decode(encoding)
+                return True
+            except (UnicodeDecodeError, UnicodeError):
+                return False
+
     try:
         import chardet
-        
-        # Leer primeros 10KB para análisis
-        with open(filepath, 'rb') as f:
-            raw_data = f.read(10000)
-        
+
         # Detectar encoding
-        result = chardet.detect(raw_data)
+        result = chardet.detect(data[:10000])
         encoding = result['encoding']
         confidence = result['confidence']
-        
+
         logger.debug(f"Encoding detectado: {encoding} (confianza: {confidence:.2%})")
-        
+
         # Si la confianza es baja, intentar encodings comunes
         if confidence < 0.7:
             logger.warning(f"Baja confianza en detección ({confidence:.2%}), probando encodings comunes")
-            encodings = ['utf-8', 'latin-1', 'windows-1252', 'ascii']
-            
-            for enc in encodings:
-                try:
-                    with open(filepath, 'r', encoding=enc) as f:
-                        f.read()
+            for enc in ['utf-8', 'latin-1', 'windows-1252', 'ascii']:
+                if decodes(enc):
                     logger.info(f"Encoding válido encontrado: {enc}")
                     return enc
-                except (UnicodeDecodeError, UnicodeError):
-                    continue
-        
+
         return encoding if encoding else 'utf-8'
-        
+
     except ImportError:
         # Si chardet no está disponible, usar método simple
         logger.warning("chardet no disponible, usando detección simple")
-        
-        # Intentar UTF-8 primero
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                f.read()
-            return 'utf-8'
-        except UnicodeDecodeError:
-            # Fallback a Latin-1 (acepta todos los bytes)
-            return 'latin-1'
+
+        # Intentar UTF-8 primero; Latin-1 acepta todos los bytes
+        return 'utf-8' if decodes('utf-8') else 'latin-1'
 
 
 def is_valid_data_line(line: str, context: Optional[str] = None) -> bool:
@@ -0,0 +1,222 @@
+"""
+Diagnósticos del Parsing - Etapa 2: Parsing y Extracción
+Procesador de Fatiga SACS v1.0
+
+Colector acotado de diagnósticos (errores y advertencias) del parser.
+
+Un archivo mal formado o de otro tipo de reporte SACS puede generar cientos
+de miles de mensajes. En lugar de una lista ilimitada de f-strings, cada
+diagnóstico se registra como una entrada estructurada (código, línea,
+offset, clave de elemento) en arrays compactos (array.array, ~20 bytes por
+entrada); se llevan conteos por código y solo los primeros N mensajes de
+cada código se formatean (y se registran en el log). Opcionalmente el
+parsing se aborta al superar un umbral, para que los archivos sin remedio
+fallen rápido.
+
+Solo usa la biblioteca estándar: lo importa ftg_parser al arrancar.
+"""
+
+import logging
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# Mensajes formateados por código (el resto solo se cuenta)
+DEFAULT_MAX_EXAMPLES = 100
+
+
+@dataclass(frozen=True)
+class DiagnosticCode:
+    """
+    Tipo de diagnóstico.
+
+    Attributes:
+        id: Identificador numérico (se guarda en los arrays)
+        name: Nombre estable del código
+        severity: ERROR o WARNING
+        text: Texto del mensaje (el detalle se agrega tras ': ')
+    """
+    id: int
+    name: str
+    severity: str
+    text: str
+
+
+FILE_READ = DiagnosticCode(1, 'ARCHIVO_ILEGIBLE', ERROR, "Error crítico leyendo archivo")
+TOTAL_WITHOUT_ELEMENT = DiagnosticCode(2, 'TOTAL_SIN_ELEMENTO', WARNING,
+                                       "*** TOTAL DAMAGE *** sin elemento previo")
+TOTAL_INVALID = DiagnosticCode(3, 'TOTAL_INVALIDO', ERROR, "Error procesando TOTAL DAMAGE")
+ABORTED = DiagnosticCode(4, 'PARSING_ABORTADO', ERROR, "Parsing abortado")
+ELEMENT_WITHOUT_TOTAL = DiagnosticCode(5, 'ELEMENTO_SIN_TOTAL', WARNING,
+                                       "Elemento sin *** TOTAL DAMAGE *** antes de otra sección")
+
+CODES = {code.id: code for code in (FILE_READ, TOTAL_WITHOUT_ELEMENT, TOTAL_INVALID, ABORTED,
+                                    ELEMENT_WITHOUT_TOTAL)}
+
+
+class DiagnosticsLimitExceeded(RuntimeError):
+    """Se superó el umbral de diagnósticos (abort_after)."""
+
+
+class DiagnosticsCollector:
+    """
+    Registro acotado de diagnósticos de un parsing.
+
+    Attributes:
+        errors: Mensajes de error formateados (primeros max_examples por código)
+        warnings: Mensajes de advertencia formateados (ídem)
+        counts: Diccionario {id de código: ocurrencias totales}
+        aborted: True si el parsing se detuvo por abort_after
+
+    Examples:
+        >>> diagnostics = DiagnosticsCollector(max_examples=10, abort_after=10000)
+        >>> diagnostics.add(TOTAL_WITHOUT_ELEMENT, line=120, offset=8841)
+        >>> diagnostics.count('TOTAL_SIN_ELEMENTO')
+        1
+    """
+
+    def __init__(self, max_examples: int = DEFAULT_MAX_EXAMPLES,
+                 abort_after: Optional[int] = None):
+        """
+        Args:
+            max_examples: Mensajes formateados por código
+            abort_after: Diagnósticos tras los cuales se aborta (None = nunca)
+        """
+        self.max_examples = max_examples
+        self.abort_after = abort_after
+        self.errors = []
+        self.warnings = []
+        self.counts = {}
+        self.aborted = False
+
+        # Entradas estructuradas (una posición por diagnóstico)
+        self._codes = array('B')
+        self._lines = array('q')
+        self._offsets = array('q')
+        self._keys = array('i')       # índice en self._key_names o -1
+        self._key_ids = {}
+        self._key_names = []
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def add(self, code: DiagnosticCode, line: int = 0, offset: int = -1,
+            key: Optional[str] = None, detail: str = ''):
+        """
+        Registra un diagnóstico.
+
+        Args:
+            code: Tipo de diagnóstico
+            line: Número de línea (0 = no aplica)
+            offset: Offset en bytes del inicio de la línea, -1 si no aplica
+            key: Clave JOINT_MEMBER_GRUP del elemento afectado
+            detail: Detalle para el mensaje formateado
+
+        Raises:
+            DiagnosticsLimitExceeded: Si se alcanza abort_after
+        """
+        count = self.counts.get(code.id, 0) + 1
+        self.counts[code.id] = count
+
+        self._codes.append(code.id)
+        self._lines.append(line)
+        self._offsets.append(offset)
+        if key is None:
+            self._keys.append(-1)
+        else:
+            key_id = self._key_ids.get(key)
+            if key_id is None:
+                key_id = self._key_ids[key] = len(self._key_names)
+                self._key_names.append(key)
+            self._keys.append(key_id)
+
+        if count <= self.max_examples:
+            message = f"{code.text}: {detail}" if detail else code.text
+            if line:
+                message = f"Línea {line}: {message}"
+            if code.severity == ERROR:
+                self.errors.append(message)
+                logger.error(message)
+            else:
+                self.warnings.append(message)
+            if count == self.max_examples:
+                logger.warning(f"{code.name}: se alcanzaron {count} mensajes; "
+                               f"las siguientes ocurrencias solo se cuentan")
+
+        if self.abort_after is not None and len(self._codes) >= self.abort_after:
+            raise DiagnosticsLimitExceeded(
+                f"{len(self._codes)} diagnósticos (límite {self.abort_after})")
+
+    def abort(self, reason: str, line: int = 0):
+        """Marca el parsing como abortado (sin volver a verificar el umbral)."""
+        self.aborted = True
+        limit, self.abort_after = self.abort_after, None
+        self.add(ABORTED, line=line, detail=reason)
+        self.abort_after = limit
+
+    def count(self, name: str) -> int:
+        """Ocurrencias de un código por nombre."""
+        return next((self.counts.get(c.id, 0) for c in CODES.values() if c.name == name), 0)
+
+    def _severity_count(self, severity: str) -> int:
+        return sum(n for code_id, n in self.counts.items()
+                   if CODES[code_id].severity == severity)
+
+    @property
+    def error_count(self) -> int:
+        """Errores totales (incluye los no formateados)."""
+        return self._severity_count(ERROR)
+
+    @property
+    def warning_count(self) -> int:
+        """Advertencias totales (incluye las no formateadas)."""
+        return self._severity_count(WARNING)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por los arrays de entradas."""
+        return sum(a.itemsize * len(a) for a in (self._codes, self._lines,
+                                                 self._offsets, self._keys))
+
+    def entries(self, name: Optional[str] = None):
+        """
+        Itera las entradas estructuradas.
+
+        Args:
+            name: Filtrar por nombre de código
+
+        Yields:
+            tuple (nombre de código, línea, offset, clave o None)
+        """
+        for code_id, line, offset, key_id in zip(self._codes, self._lines,
+                                                  self._offsets, self._keys):
+            code = CODES[code_id]
+            if name is None or code.name == name:
+                yield (code.name, line, offset,
+                       self._key_names[key_id] if key_id >= 0 else None)
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen de los diagnósticos.
+
+        Returns:
+            dict: Conteos por código y totales
+        """
+        return {
+            'total': len(self),
+            'errors_count': self.error_count,
+            'warnings_count': self.warning_count,
+            'by_code': {CODES[code_id].name: n for code_id, n in sorted(self.counts.items())},
+            'aborted': self.aborted
+        }
+
+    def __repr__(self) -> str:
+        return (f"DiagnosticsCollector(errors={self.error_count}, "
+                f"warnings={self.warning_count}, aborted={self.aborted})")
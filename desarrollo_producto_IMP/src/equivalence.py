@@ -0,0 +1,531 @@
+"""
+Equivalencia Diferencial - Etapa 2: Parsing y Extracción
+Procesador de Fatiga SACS v1.0
+
+Todo camino rápido (motor regex, parsing en memoria, extractores de
+secciones, conversores de tokens candidatos) debe dar exactamente el
+mismo resultado que la implementación de referencia:
+
+    tokens:   normalize_fortran_scientific
+    listados: FTGParser (máquina de estados) sobre el archivo, con el
+              filtro is_valid_data_line
+
+El arnés genera listados tipo SACS aleatorios (encabezados de página,
+títulos repetidos, formatos de MEMBER, claves duplicadas, TOTAL DAMAGE
+sin elemento o con valores inválidos) y tokens Fortran con sus casos
+borde ('.48430268-9', '1.23-4', '123-4', '0.8173E-05', tokens mal
+formados), ejecuta cada modo contra la referencia y reporta cualquier
+divergencia junto con el throughput de cada modo:
+
+    report = run_equivalence(seed=7, n_listings=5)
+    print(report.get_summary())
+
+Se compara bit a bit: claves y su orden, identificadores, daños (bytes
+del float64), mensajes de error y advertencia, y los diagnósticos
+estructurados (código, línea, offset, clave). Un conversor de tokens
+diverge si el valor difiere o si lanza otra excepción que la referencia.
+
+Modos nuevos: register_mode('token' | 'parse', nombre, función).
+"""
+
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+
+from data_cleaner import detect_bytes_encoding, normalize_fortran_scientific
+from ftg_parser import FTGParser, parse_fatigue_file
+from models import ParseResult
+from section_extractors import EXTRACTORS
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Divergencias guardadas por modo (el resto solo se cuenta)
+MAX_REPORTED = 20
+
+# Tokens que la referencia rechaza (ValueError)
+MALFORMED_TOKENS = ('1.2.3-4', '--5', 'E-5', '1.23-', '.-4', 'abc', '1,23',
+                    '+-1', '.', '0x1F', '1.23-4.5', '')
+
+# Formatos de MEMBER que produce SACS según la versión
+_MEMBER_FORMATS = ('{chd} {brc}', '{chd}-{brc}', '{brc}-{chd}')
+
+_GRUP_CHARS = np.array(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'))
+
+
+def random_fortran_token(rng: np.random.Generator, malformed_rate: float = 0.0) -> str:
+    """
+    Token numérico aleatorio en uno de los formatos de SACS.
+
+    Formatos: fracción Fortran ('.48430268-9'), decimal Fortran ('1.23-4'),
+    entero Fortran ('123-4'), notación E ya normalizada ('0.8173E-05') y
+    decimal simple ('0.000123'); con probabilidad malformed_rate, un token
+    de MALFORMED_TOKENS.
+
+    Args:
+        rng: Generador aleatorio
+        malformed_rate: Probabilidad de un token inválido
+
+    Returns:
+        str
+    """
+    if malformed_rate and rng.random() < malformed_rate:
+        return str(rng.choice(MALFORMED_TOKENS))
+
+    sign = '-' if rng.random() < 0.85 else '+'
+    exponent = int(rng.integers(0, 13))
+    style = int(rng.integers(0, 5))
+    if style == 0:
+        return f".{int(rng.integers(0, 10 ** 8)):08d}{sign}{exponent}"
+    if style == 1:
+        digits = int(rng.integers(1, 5))
+        fraction = f"{int(rng.integers(0, 10 ** digits)):0{digits}d}"
+        return f"{int(rng.integers(0, 10))}.{fraction}{sign}{exponent}"
+    if style == 2:
+        return f"{int(rng.integers(1, 1000))}{sign}{exponent}"
+    if style == 3:
+        return f"{rng.uniform(0.1, 1.0):.{int(rng.integers(4, 9))}f}E{sign}{exponent:02d}"
+    return f"{rng.uniform(0, 10) * 10.0 ** -exponent:.{int(rng.integers(1, 12))}f}"
+
+
+def random_tokens(n: int, seed: int = 0, malformed_rate: float = 0.05) -> list:
+    """Lista de n tokens de random_fortran_token (reproducible por seed)."""
+    rng = np.random.default_rng(seed)
+    return [random_fortran_token(rng, malformed_rate) for _ in range(n)]
+
+
+def _random_name(rng: np.random.Generator, low: int, high: int) -> str:
+    """Identificador alfanumérico en mayúsculas de low a high caracteres."""
+    return ''.join(rng.choice(_GRUP_CHARS, size=int(rng.integers(low, high + 1))))
+
+
+def random_listing(n_elements: int, seed: int = 0, max_loads: int = 4,
+                   duplicate_rate: float = 0.05, invalid_rate: float = 0.02,
+                   ambiguous_rate: float = 0.02, page_every: int = 50,
+                   crlf: bool = False) -> str:
+    """
+    Genera un listado FTG aleatorio con los casos borde del formato SACS.
+
+    Incluye: ruido antes de la sección, título normal o espaciado,
+    encabezados de página y títulos repetidos dentro de los bloques, los
+    tres formatos de MEMBER (y MEMBER ambiguos que la referencia
+    descarta), claves repetidas (gana la última), TOTAL DAMAGE inválidos
+    (token mal formado o menos de 8 valores) y TOTAL DAMAGE sin elemento.
+
+    Args:
+        n_elements: Elementos (bloques con TOTAL DAMAGE)
+        seed: Semilla (mismo seed → mismo texto)
+        max_loads: Máximo de casos de carga por elemento
+        duplicate_rate: Probabilidad de repetir una clave anterior
+        invalid_rate: Probabilidad de TOTAL DAMAGE inválido o huérfano
+        ambiguous_rate: Probabilidad de un MEMBER que la referencia descarta
+                        (CHD alfanumérico seguido de BRC numérico)
+        page_every: Líneas promedio entre encabezados de página
+        crlf: Usar fin de línea CRLF
+
+    Returns:
+        str con el listado
+    """
+    rng = np.random.default_rng(seed)
+    title = ('MEMBER FATIGUE DETAIL REPORT' if rng.random() < 0.5
+             else 'M E M B E R  F A T I G U E  D E T A I L  R E P O R T')
+    page = [1]
+
+    def page_header() -> list:
+        page[0] += 1
+        return [f"SACS (2024)                                      FTG PAGE {page[0]:>3}",
+                f"                     {title}", "",
+                " JOINT   CHD   BRC   GRUP  LOAD   FATG  DAMAGES"]
+
+    lines = ["SACS (2024)                                      FTG PAGE   1",
+             " ENGINEERING DYNAMICS INC.   DATE 01-JAN-2024",
+             " 0001  NOISE BEFORE SECTION  16A  1  .1-1",
+             "", f"                     {title}", "",
+             " JOINT   CHD   BRC   GRUP  LOAD   FATG  DAMAGES"]
+    keys = []
+    for _ in range(n_elements):
+        if keys and rng.random() < duplicate_rate:
+            joint, member, grup = keys[int(rng.integers(0, len(keys)))]
+        else:
+            joint = f"{int(rng.integers(1, 10000)):04d}" + ('L' if rng.random() < 0.3 else '')
+            chd = f"{int(rng.integers(0, 10000)):04d}"
+            brc = str(rng.choice(_GRUP_CHARS[:26])) + _random_name(rng, 3, 3)
+            if rng.random() < ambiguous_rate:
+                # "802L 0005": _extract_identifiers toma 802L como GRUP y
+                # descarta la línea; todos los motores deben descartarla igual
+                chd, brc = brc, chd
+            member = str(rng.choice(_MEMBER_FORMATS)).format(chd=chd, brc=brc)
+            grup = _random_name(rng, 2, 4)
+            keys.append((joint, member, grup))
+
+        for load in range(1, int(rng.integers(1, max_loads + 1)) + 1):
+            values = ' '.join(random_fortran_token(rng) for _ in range(8))
+            if load == 1:
+                lines.append(f" {joint:<6}{member:<11}{grup:<5}{load:>4}  {values}")
+            else:
+                lines.append(f"{'':<23}{load:>4}  {values}")
+            if rng.random() < 1 / page_every:
+                lines.extend(page_header())
+
+        totals = [random_fortran_token(rng) for _ in range(8)]
+        if rng.random() < invalid_rate:
+            case = int(rng.integers(0, 3))
+            if case == 0:
+                totals[int(rng.integers(0, 8))] = str(rng.choice(MALFORMED_TOKENS[:-1]))
+            elif case == 1:
+                totals = totals[:int(rng.integers(0, 8))]
+            else:
+                # TOTAL DAMAGE sin elemento inmediatamente después del válido
+                lines.append(f"  *** TOTAL DAMAGE ***  {' '.join(totals)}")
+        lines.append(f"  *** TOTAL DAMAGE ***  {' '.join(totals)}")
+        if rng.random() < 1 / page_every:
+            lines.extend(page_header())
+
+    newline = '\r\n' if crlf else '\n'
+    text = newline.join(lines)
+    # Algunos listados terminan sin salto de línea
+    return text + newline if rng.random() < 0.8 else text
+
+
+def _float_first(token: str) -> float:
+    """
+    Candidato: float() directo y normalize_fortran_scientific solo si falla.
+
+    Los tokens ya normalizados se convierten sin las sustituciones regex.
+    """
+    try:
+        return float(token)
+    except (TypeError, ValueError):
+        return normalize_fortran_scientific(token)
+
+
+def _parse_in_memory(path: str, engine: str = 'state_machine') -> ParseResult:
+    """Camino de async_ingest/parse_service: bytes ya leídos + parse_text."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return FTGParser(engine=engine).parse_text(data, detect_bytes_encoding(data))
+
+
+# Modos comparados contra la referencia {tipo: {nombre: función}}
+MODES = {
+    'token': {
+        'float_first': _float_first,
+    },
+    'parse': {
+        'regex': lambda path: parse_fatigue_file(path, engine='regex'),
+        'in_memory': _parse_in_memory,
+        'regex_in_memory': lambda path: _parse_in_memory(path, engine='regex'),
+        'extractors': lambda path: FTGParser(extractors=list(EXTRACTORS)).parse_file(path),
+    },
+}
+
+# Implementaciones de referencia
+REFERENCE = {
+    'token': normalize_fortran_scientific,
+    'parse': parse_fatigue_file,
+}
+
+
+def register_mode(kind: str, name: str, function: Callable):
+    """
+    Registra un camino alternativo para compararlo con la referencia.
+
+    Args:
+        kind: 'token' (función str → float) o 'parse' (función ruta → ParseResult)
+        name: Nombre del modo en el reporte
+        function: Implementación a verificar
+
+    Raises:
+        ValueError: Si kind no es 'token' ni 'parse'
+
+    Examples:
+        >>> register_mode('token', 'tabla', convertir_con_tabla)
+    """
+    if kind not in MODES:
+        raise ValueError(f"Tipo de modo desconocido '{kind}', opciones: {tuple(MODES)}")
+    MODES[kind][name] = function
+
+
+def _token_outcome(function: Callable, token: str) -> tuple:
+    """('ok', bytes del float64) o ('error', tipo de excepción)."""
+    try:
+        return 'ok', np.float64(function(token)).tobytes()
+    except Exception as e:
+        return 'error', type(e).__name__
+
+
+def _describe(outcome: tuple) -> str:
+    kind, value = outcome
+    return repr(np.frombuffer(value, dtype=np.float64)[0]) if kind == 'ok' else value
+
+
+def result_differences(reference: ParseResult, candidate: ParseResult) -> list:
+    """
+    Diferencias entre dos ParseResult (vacía si son idénticos bit a bit).
+
+    Compara claves y su orden, JOINT/MEMBER/GRUP, bytes de los daños,
+    mensajes de error y advertencia y las entradas de diagnostics.
+
+    Returns:
+        Lista de mensajes
+    """
+    differences = []
+    ref_keys, cand_keys = list(reference.elements), list(candidate.elements)
+    if ref_keys != cand_keys:
+        missing = [k for k in ref_keys if k not in candidate.elements]
+        extra = [k for k in cand_keys if k not in reference.elements]
+        differences.append(f"claves distintas: faltan {missing[:5]}, sobran {extra[:5]}"
+                           if missing or extra else "claves en otro orden")
+    for key in ref_keys:
+        element = candidate.elements.get(key)
+        if element is None:
+            continue
+        expected = reference.elements[key]
+        if (element.joint, element.member, element.grup) != \
+                (expected.joint, expected.member, expected.grup):
+            differences.append(f"identificadores distintos en {key}")
+        if np.asarray(element.damages, dtype=np.float64).tobytes() != \
+                np.asarray(expected.damages, dtype=np.float64).tobytes():
+            differences.append(f"daños distintos en {key}")
+
+    if reference.errors != candidate.errors:
+        differences.append(f"errores distintos: {reference.errors[:3]} vs {candidate.errors[:3]}")
+    if reference.warnings != candidate.warnings:
+        differences.append(f"advertencias distintas: {reference.warnings[:3]} vs "
+                           f"{candidate.warnings[:3]}")
+    if reference.diagnostics is not None and candidate.diagnostics is not None:
+        ref_entries = list(reference.diagnostics.entries())
+        cand_entries = list(candidate.diagnostics.entries())
+        if ref_entries != cand_entries:
+            first = next((i for i, (a, b) in enumerate(zip(ref_entries, cand_entries)) if a != b),
+                         min(len(ref_entries), len(cand_entries)))
+            differences.append(
+                f"diagnósticos distintos desde la entrada {first}: "
+                f"{ref_entries[first:first + 1]} vs {cand_entries[first:first + 1]}")
+    return differences
+
+
+@dataclass
+class ModeResult:
+    """
+    Resultado de un modo en el arnés.
+
+    Attributes:
+        kind: 'token' o 'parse'
+        name: Nombre del modo ('referencia' para la implementación de referencia)
+        cases: Tokens o listados verificados
+        divergences: Casos divergentes
+        examples: Primeros mensajes de divergencia (hasta MAX_REPORTED)
+        seconds: Tiempo total de ejecución del modo
+        volume: Tokens convertidos o MB parseados
+        unit: Unidad del throughput ('tokens/s' o 'MB/s')
+    """
+    kind: str
+    name: str
+    cases: int = 0
+    divergences: int = 0
+    examples: list = field(default_factory=list)
+    seconds: float = 0.0
+    volume: float = 0.0
+    unit: str = ''
+
+    @property
+    def throughput(self) -> float:
+        """Volumen por segundo (0 si no se midió tiempo)."""
+        return self.volume / self.seconds if self.seconds > 0 else 0.0
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen del modo.
+
+        Returns:
+            dict: Casos, divergencias y throughput
+        """
+        return {
+            'kind': self.kind,
+            'name': self.name,
+            'cases': self.cases,
+            'divergences': self.divergences,
+            'examples': list(self.examples),
+            'seconds': round(self.seconds, 4),
+            'throughput': round(self.throughput, 2),
+            'unit': self.unit
+        }
+
+    def __repr__(self) -> str:
+        return (f"ModeResult({self.kind}:{self.name}, cases={self.cases}, "
+                f"divergences={self.divergences}, {self.throughput:.1f} {self.unit})")
+
+
+@dataclass
+class EquivalenceReport:
+    """
+    Reporte del arnés: correctitud y throughput de cada modo.
+
+    Attributes:
+        seed: Semilla de la corrida
+        modes: ModeResult de la referencia y de cada modo, por tipo
+    """
+    seed: int
+    modes: list
+
+    @property
+    def ok(self) -> bool:
+        """True si ningún modo diverge de la referencia."""
+        return all(mode.divergences == 0 for mode in self.modes)
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen del reporte (apto para JSON).
+
+        Returns:
+            dict: Semilla, resultado global y resumen de cada modo
+        """
+        return {
+            'seed': self.seed,
+            'ok': self.ok,
+            'modes': [mode.get_summary() for mode in self.modes]
+        }
+
+    def __repr__(self) -> str:
+        divergent = [mode.name for mode in self.modes if mode.divergences]
+        return f"EquivalenceReport(seed={self.seed}, modes={len(self.modes)}, divergent={divergent})"
+
+
+@contextmanager
+def _quiet_logging():
+    """Silencia los logs de error esperados (tokens y TOTAL inválidos)."""
+    previous = logging.root.manager.disable
+    logging.disable(logging.ERROR)
+    try:
+        yield
+    finally:
+        logging.disable(previous)
+
+
+def _timed(function: Callable, *args) -> tuple:
+    """(resultado, segundos) de una llamada."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def check_tokens(tokens: list, modes: Optional[dict] = None) -> list:
+    """
+    Verifica los conversores de tokens y mide su throughput.
+
+    Args:
+        tokens: Tokens a convertir
+        modes: {nombre: conversor} (default: MODES['token'])
+
+    Returns:
+        Lista de ModeResult (referencia primero)
+    """
+    modes = MODES['token'] if modes is None else modes
+    reference = REFERENCE['token']
+
+    def convert_all(function):
+        return [_token_outcome(function, token) for token in tokens]
+
+    expected, seconds = _timed(convert_all, reference)
+    results = [ModeResult('token', 'referencia', len(tokens), 0, [], seconds,
+                          len(tokens), 'tokens/s')]
+    for name, function in modes.items():
+        got, seconds = _timed(convert_all, function)
+        mode = ModeResult('token', name, len(tokens), 0, [], seconds, len(tokens), 'tokens/s')
+        for token, a, b in zip(tokens, expected, got):
+            if a != b:
+                mode.divergences += 1
+                if len(mode.examples) < MAX_REPORTED:
+                    mode.examples.append(f"token {token!r}: referencia {_describe(a)}, "
+                                         f"obtenido {_describe(b)}")
+        results.append(mode)
+    return results
+
+
+def check_listings(paths: list, modes: Optional[dict] = None) -> list:
+    """
+    Verifica los modos de parsing sobre listados en disco y mide su throughput.
+
+    Args:
+        paths: Rutas de los listados
+        modes: {nombre: función ruta → ParseResult} (default: MODES['parse'])
+
+    Returns:
+        Lista de ModeResult (referencia primero)
+    """
+    modes = MODES['parse'] if modes is None else modes
+    mb = sum(os.path.getsize(path) for path in paths) / 1e6
+
+    expected = []
+    reference = ModeResult('parse', 'referencia', len(paths), 0, [], 0.0, mb, 'MB/s')
+    for path in paths:
+        result, seconds = _timed(REFERENCE['parse'], path)
+        expected.append(result)
+        reference.seconds += seconds
+
+    results = [reference]
+    for name, function in modes.items():
+        mode = ModeResult('parse', name, len(paths), 0, [], 0.0, mb, 'MB/s')
+        for path, ref_result in zip(paths, expected):
+            try:
+                result, seconds = _timed(function, path)
+            except Exception as e:
+                differences = [f"excepción {type(e).__name__}: {e}"]
+            else:
+                mode.seconds += seconds
+                differences = result_differences(ref_result, result)
+            if differences:
+                mode.divergences += 1
+                remaining = MAX_REPORTED - len(mode.examples)
+                mode.examples.extend(f"{os.path.basename(path)}: {d}"
+                                     for d in differences[:max(remaining, 0)])
+        results.append(mode)
+    return results
+
+
+def run_equivalence(seed: int = 0, n_listings: int = 5, n_elements: int = 500,
+                    n_tokens: int = 20000, token_modes: Optional[dict] = None,
+                    parse_modes: Optional[dict] = None,
+                    workdir: Optional[str] = None) -> EquivalenceReport:
+    """
+    Ejecuta el arnés diferencial completo.
+
+    Args:
+        seed: Semilla base (el listado i usa seed + i)
+        n_listings: Listados aleatorios a generar
+        n_elements: Elementos por listado
+        n_tokens: Tokens aleatorios a convertir
+        token_modes: Conversores a verificar (default: MODES['token'])
+        parse_modes: Modos de parsing a verificar (default: MODES['parse'])
+        workdir: Carpeta donde escribir los listados (default: temporal,
+                 se elimina al terminar)
+
+    Returns:
+        EquivalenceReport
+    """
+    with _quiet_logging(), tempfile.TemporaryDirectory() as tmpdir:
+        folder = workdir or tmpdir
+        paths = []
+        for i in range(n_listings):
+            path = os.path.join(folder, f"ftglst_aleatorio_{seed + i}.txt")
+            with open(path, 'w', encoding='latin-1', newline='') as f:
+                f.write(random_listing(n_elements, seed=seed + i, crlf=(i % 4 == 3)))
+            paths.append(path)
+
+        modes = check_tokens(random_tokens(n_tokens, seed), token_modes)
+        modes += check_listings(paths, parse_modes)
+
+    report = EquivalenceReport(seed=seed, modes=modes)
+    for mode in report.modes:
+        if mode.divergences:
+            logger.warning(f"{mode.kind}:{mode.name} diverge en {mode.divergences} casos")
+    logger.info(repr(report))
+    return report
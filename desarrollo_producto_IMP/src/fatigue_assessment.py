@@ -0,0 +1,202 @@
+"""
+Evaluación de Vida a Fatiga - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Calcula vida a fatiga, utilización contra el límite escalado por DFF
+(Design Fatigue Factor, API RP-2A / DNV) y banderas de aceptación para las
+8 ubicaciones de cada elemento, de forma vectorizada sobre la matriz (N, 8)
+de daños de un ElementTable (individual o consolidado).
+"""
+
+import logging
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from models import LOCATIONS
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# DFF típicos: 2 (accesible/no crítico), 5 (no inspeccionable), 10 (crítico)
+DEFAULT_DFF = 2.0
+
+
+@dataclass
+class DesignFactors:
+    """
+    Tabla de factores de diseño a fatiga (DFF).
+
+    El DFF de cada elemento se obtiene de su GRUP (o default). Si se definen
+    factores por ubicación, en cada ubicación se usa el más restrictivo
+    (máximo) entre el factor del GRUP y el de la ubicación.
+
+    Attributes:
+        default: DFF para GRUPs sin entrada en by_grup
+        by_grup: Diccionario {GRUP: DFF} (ej: {'16A': 5.0, 'DL9': 10.0})
+        by_location: Diccionario {ubicación: DFF} (ej: {'TOP': 5.0})
+    """
+    default: float = DEFAULT_DFF
+    by_grup: dict = field(default_factory=dict)
+    by_location: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Validación después de inicialización."""
+        factors = [self.default, *self.by_grup.values(), *self.by_location.values()]
+        if any(f <= 0 for f in factors):
+            raise ValueError("Los factores DFF deben ser positivos")
+
+        unknown = set(self.by_location) - set(LOCATIONS)
+        if unknown:
+            raise ValueError(f"Ubicaciones desconocidas: {sorted(unknown)}")
+
+    def resolve(self, table: ElementTable) -> np.ndarray:
+        """
+        Calcula el DFF aplicable a cada fila y ubicación.
+
+        La búsqueda por GRUP se hace una sola vez sobre las categorías
+        (grup_names) y se expande con grup_codes, sin recorrer las filas.
+
+        Args:
+            table: Tabla de elementos
+
+        Returns:
+            np.ndarray (N, 8) o (N, 1) si no hay factores por ubicación
+            (broadcast contra la matriz de daños)
+        """
+        per_grup = np.array([self.by_grup.get(g, self.default) for g in table.grup_names],
+                            dtype=np.float64)
+        dff = per_grup[table.grup_codes][:, np.newaxis]
+
+        if self.by_location:
+            per_location = np.array([self.by_location.get(loc, 0.0) for loc in LOCATIONS],
+                                    dtype=np.float64)
+            dff = np.maximum(dff, per_location[np.newaxis, :])
+
+        return dff
+
+
+@dataclass
+class FatigueAssessment:
+    """
+    Resultado de la evaluación a fatiga (arrays completos, sin objetos por fila).
+
+    Attributes:
+        design_life: Vida de diseño usada (años)
+        fatigue_life: Array (N, 8) con vida a fatiga = design_life / daño
+                      (inf donde el daño es 0)
+        utilization: Array (N, 8) con daño × DFF (1.0 = límite)
+        passes: Array bool (N, 8), True si utilization <= 1.0
+    """
+    design_life: float
+    fatigue_life: np.ndarray
+    utilization: np.ndarray
+    passes: np.ndarray
+
+    @property
+    def min_life(self) -> np.ndarray:
+        """Vida a fatiga mínima de cada elemento (N,)."""
+        return self.fatigue_life.min(axis=1)
+
+    @property
+    def max_utilization(self) -> np.ndarray:
+        """Utilización máxima de cada elemento (N,)."""
+        return self.utilization.max(axis=1)
+
+    @property
+    def critical_index(self) -> np.ndarray:
+        """Índice (0-7) de la ubicación con mayor utilización (N,)."""
+        return self.utilization.argmax(axis=1)
+
+    @property
+    def element_passes(self) -> np.ndarray:
+        """True si las 8 ubicaciones del elemento cumplen (N,)."""
+        return self.passes.all(axis=1)
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen de la evaluación.
+
+        Returns:
+            dict: Resumen con conteos y peores valores
+        """
+        if len(self.utilization) == 0:
+            return {
+                'total_elements': 0,
+                'failing_elements': 0,
+                'failing_hot_spots': 0,
+                'max_utilization': 0.0,
+                'min_fatigue_life': float('inf')
+            }
+
+        return {
+            'total_elements': len(self.utilization),
+            'failing_elements': int((~self.element_passes).sum()),
+            'failing_hot_spots': int((~self.passes).sum()),
+            'max_utilization': float(self.utilization.max()),
+            'min_fatigue_life': float(self.fatigue_life.min())
+        }
+
+
+def assess_damages(damages: np.ndarray, design_life: float, dff) -> FatigueAssessment:
+    """
+    Evalúa una matriz de daños con un DFF ya resuelto.
+
+    Args:
+        damages: Array (N, 8) de daños acumulados
+        design_life: Vida de diseño en años (> 0)
+        dff: Escalar o array broadcastable a (N, 8)
+
+    Returns:
+        FatigueAssessment
+
+    Raises:
+        ValueError: Si design_life no es positiva o la matriz no es (N, 8)
+    """
+    if design_life <= 0:
+        raise ValueError(f"La vida de diseño debe ser positiva, se recibió {design_life}")
+
+    damages = np.asarray(damages, dtype=np.float64)
+    if damages.ndim != 2 or damages.shape[1] != 8:
+        raise ValueError(f"Se espera una matriz (N, 8), se recibió {damages.shape}")
+
+    fatigue_life = np.full(damages.shape, np.inf)
+    np.divide(design_life, damages, out=fatigue_life, where=damages > 0)
+
+    utilization = damages * dff
+    passes = utilization <= 1.0
+
+    return FatigueAssessment(
+        design_life=float(design_life),
+        fatigue_life=fatigue_life,
+        utilization=utilization,
+        passes=passes
+    )
+
+
+def assess_fatigue(table: ElementTable, design_life: float,
+                   factors: DesignFactors = None) -> FatigueAssessment:
+    """
+    Evalúa todos los elementos de una tabla (individual o consolidada).
+
+    Args:
+        table: Tabla de elementos con matriz de daños (N, 8)
+        design_life: Vida de diseño en años
+        factors: Tabla de DFF (default: DFF=2 para todos)
+
+    Returns:
+        FatigueAssessment
+
+    Examples:
+        >>> factors = DesignFactors(default=2.0, by_grup={'DL9': 10.0})
+        >>> assessment = assess_fatigue(result.to_table(), 20.0, factors)
+        >>> assessment.get_summary()['failing_elements']
+    """
+    factors = factors or DesignFactors()
+    dff = factors.resolve(table)
+    assessment = assess_damages(table.damages, design_life, dff)
+    logger.info(f"Evaluación a fatiga: {len(table)} elementos, "
+                f"{int((~assessment.element_passes).sum())} no cumplen")
+    return assessment
@@ -0,0 +1,329 @@
+"""
+Vigilancia de Carpeta - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Modo de vigilancia para carpetas de proyecto donde los servidores de
+análisis depositan listados ftglst*.txt al terminar cada corrida de SACS.
+Detecta archivos nuevos o modificados, espera a que terminen de escribirse
+(tamaño y fecha de modificación estables durante settle_seconds), parsea
+solo esos archivos y regenera la salida consolidada de la plataforma a
+partir de las tablas ya parseadas de los demás archivos, sin re-parsearlos.
+
+Estado persistente en <carpeta>/.fatiga_watch/:
+    state.json      Archivos procesados (tamaño, mtime, elementos, errores)
+    cache/*.npz     ElementTable de cada archivo procesado
+
+El estado se escribe de forma atómica (archivo temporal + os.replace) para
+que una interrupción no deje un state.json corrupto.
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from tables import ElementTable
+from aggregator import consolidate
+from csv_export import write_elements_csv
+from diagnostics import FILE_READ
+from ftg_parser import parse_fatigue_file
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Archivos vigilados por defecto
+DEFAULT_PATTERNS = ('ftglst*.txt',)
+
+# Segundos sin cambios de tamaño/mtime para considerar un archivo completo
+DEFAULT_SETTLE_SECONDS = 10.0
+
+# Intervalo entre revisiones de la carpeta
+DEFAULT_POLL_INTERVAL = 2.0
+
+STATE_DIR = '.fatiga_watch'
+STATE_VERSION = 1
+
+
+def _signature(path: str) -> Optional[tuple]:
+    """(tamaño, mtime_ns) del archivo o None si ya no existe."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def _write_atomic(path: str, write):
+    """Escribe path mediante write(f) sobre un temporal y os.replace."""
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8', newline='') as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def write_consolidated_csv(table: ElementTable, path: str):
+    """
+    Escribe la tabla consolidada ordenada por daño máximo (descendente).
+
+    Args:
+        table: Tabla consolidada
+        path: Ruta del CSV (se reemplaza de forma atómica)
+    """
+    _write_atomic(path, lambda f: write_elements_csv(table, f))
+
+
+@dataclass
+class WatchState:
+    """
+    Registro persistente de archivos procesados.
+
+    Attributes:
+        path: Ruta de state.json
+        files: Diccionario {nombre: {size, mtime_ns, elements, errors,
+               warnings, processed_at}}
+    """
+    path: str
+    files: dict = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> 'WatchState':
+        """Carga el estado (vacío si no existe o es de otra versión)."""
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Estado ilegible en {path}, se reprocesa todo: {e}")
+            return cls(path)
+        if data.get('version') != STATE_VERSION:
+            logger.warning(f"Versión de estado distinta en {path}, se reprocesa todo")
+            return cls(path)
+        return cls(path, data.get('files', {}))
+
+    def save(self):
+        """Guarda el estado de forma atómica."""
+        payload = {'version': STATE_VERSION, 'files': self.files}
+        _write_atomic(self.path, lambda f: json.dump(payload, f, indent=2))
+
+    def is_current(self, name: str, signature: tuple) -> bool:
+        """True si el archivo ya se procesó con esa firma (tamaño, mtime)."""
+        entry = self.files.get(name)
+        return entry is not None and (entry['size'], entry['mtime_ns']) == tuple(signature)
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen del estado.
+
+        Returns:
+            dict: Archivos procesados y totales
+        """
+        return {
+            'processed_files': len(self.files),
+            'total_elements': sum(e['elements'] for e in self.files.values()),
+            'total_errors': sum(e['errors'] for e in self.files.values())
+        }
+
+
+class FolderWatcher:
+    """
+    Vigila una carpeta y mantiene actualizada su salida consolidada.
+
+    Examples:
+        >>> watcher = FolderWatcher('/proyectos/IMP-A')
+        >>> watcher.run()                  # hasta Ctrl+C
+        >>> watcher.poll_once()            # una revisión (tareas programadas)
+    """
+
+    def __init__(self, folder: str, patterns: tuple = DEFAULT_PATTERNS,
+                 output_path: Optional[str] = None,
+                 settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 engine: str = 'state_machine'):
+        """
+        Args:
+            folder: Carpeta de la plataforma
+            patterns: Patrones glob de los listados
+            output_path: CSV consolidado (default: <carpeta>/consolidado_fatiga.csv)
+            settle_seconds: Segundos con tamaño/mtime estables antes de procesar
+            poll_interval: Segundos entre revisiones en run()
+            engine: Motor de extracción del parser
+        """
+        self.folder = folder
+        self.patterns = tuple(patterns)
+        self.output_path = output_path or os.path.join(folder, 'consolidado_fatiga.csv')
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+        self.engine = engine
+
+        self.state_dir = os.path.join(folder, STATE_DIR)
+        self.cache_dir = os.path.join(self.state_dir, 'cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.state = WatchState.load(os.path.join(self.state_dir, 'state.json'))
+
+        # nombre → (firma, instante desde el que la firma no cambia)
+        self._pending = {}
+
+    def _cache_path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}.npz")
+
+    def _list_files(self) -> list:
+        """Listados de la carpeta que cumplen algún patrón (orden alfabético)."""
+        names = [entry.name for entry in os.scandir(self.folder) if entry.is_file()]
+        return sorted(n for n in names if any(fnmatch.fnmatch(n, p) for p in self.patterns))
+
+    def scan(self, now: Optional[float] = None) -> tuple:
+        """
+        Revisa la carpeta sin procesar nada.
+
+        Args:
+            now: Instante actual (time.monotonic() por defecto)
+
+        Returns:
+            tuple (listos, eliminados): archivos nuevos/modificados cuya firma
+            lleva settle_seconds sin cambiar, y archivos procesados que ya no
+            están en la carpeta
+        """
+        now = time.monotonic() if now is None else now
+        present = self._list_files()
+        ready = []
+        for name in present:
+            signature = _signature(os.path.join(self.folder, name))
+            if signature is None or self.state.is_current(name, signature):
+                self._pending.pop(name, None)
+                continue
+            previous = self._pending.get(name)
+            if previous is None or previous[0] != signature:
+                # Nuevo o todavía escribiéndose: reiniciar la espera
+                self._pending[name] = (signature, now)
+            elif now - previous[1] >= self.settle_seconds:
+                ready.append(name)
+
+        removed = sorted(set(self.state.files) - set(present))
+        for name in set(self._pending) - set(present):
+            del self._pending[name]
+        return ready, removed
+
+    def process(self, names: list) -> list:
+        """
+        Parsea los archivos indicados y actualiza el estado (sin consolidar).
+
+        Args:
+            names: Nombres de archivo dentro de la carpeta
+
+        Returns:
+            Lista de nombres procesados (se omiten los que cambiaron
+            mientras se parseaban o no se pudieron leer completos, que
+            se reintentan en la próxima revisión, y los que ya no existen)
+        """
+        processed = []
+        for name in names:
+            path = os.path.join(self.folder, name)
+            signature = _signature(path)
+            if signature is None:
+                # Eliminado entre scan() y process(): la próxima revisión
+                # lo reporta como eliminado si ya estaba consolidado
+                logger.info(f"{name} ya no existe; se omite")
+                self._pending.pop(name, None)
+                continue
+            result = parse_fatigue_file(path, engine=self.engine)
+            if _signature(path) != signature:
+                logger.info(f"{name} cambió durante el parsing; se reintentará")
+                continue
+            if result.diagnostics.count(FILE_READ.name) or result.diagnostics.aborted:
+                # Lectura fallida o parsing abortado: no guardar una tabla
+                # parcial como si el archivo estuviera procesado
+                logger.warning(f"{name} no se pudo parsear completo "
+                               f"({result.diagnostics!r}); se reintentará")
+                continue
+
+            result.to_table().save(self._cache_path(name))
+            self.state.files[name] = {
+                'size': signature[0],
+                'mtime_ns': signature[1],
+                'elements': result.total_elements,
+                'errors': result.error_count,
+                'warnings': result.warning_count,
+                'processed_at': datetime.now().isoformat(timespec='seconds')
+            }
+            self._pending.pop(name, None)
+            processed.append(name)
+            logger.info(f"Procesado {name}: {result.total_elements} elementos, "
+                        f"{result.error_count} errores")
+        return processed
+
+    def forget(self, names: list):
+        """Elimina archivos del estado y su tabla en cache."""
+        for name in names:
+            self.state.files.pop(name, None)
+            try:
+                os.remove(self._cache_path(name))
+            except FileNotFoundError:
+                pass
+            logger.info(f"{name} ya no está en la carpeta; se excluye de la consolidación")
+
+    def consolidate(self) -> ElementTable:
+        """
+        Regenera la salida consolidada a partir de las tablas en cache.
+
+        Returns:
+            ElementTable consolidado
+        """
+        tables = {name: ElementTable.load(self._cache_path(name))
+                  for name in sorted(self.state.files)}
+        table = consolidate(tables)
+        write_consolidated_csv(table, self.output_path)
+        logger.info(f"Consolidado actualizado: {len(tables)} archivos, "
+                    f"{len(table)} elementos → {self.output_path}")
+        return table
+
+    def poll_once(self, now: Optional[float] = None) -> list:
+        """
+        Una revisión completa: detectar, procesar, consolidar y guardar estado.
+
+        Args:
+            now: Instante actual (time.monotonic() por defecto)
+
+        Returns:
+            Lista de archivos procesados en esta revisión
+        """
+        ready, removed = self.scan(now)
+        processed = self.process(ready)
+        self.forget(removed)
+        if processed or removed:
+            self.consolidate()
+            self.state.save()
+        return processed
+
+    def run(self, stop_event: Optional[threading.Event] = None):
+        """
+        Vigila la carpeta hasta Ctrl+C o hasta que se active stop_event.
+
+        Un error en una revisión se registra y la vigilancia continúa con
+        la siguiente.
+
+        Args:
+            stop_event: Evento para detener el ciclo desde otro hilo
+        """
+        stop_event = stop_event or threading.Event()
+        logger.info(f"Vigilando {self.folder} ({', '.join(self.patterns)}), "
+                    f"{len(self.state.files)} archivos ya procesados")
+        try:
+            while not stop_event.is_set():
+                try:
+                    self.poll_once()
+                except Exception:
+                    logger.exception(f"Error revisando {self.folder}; se reintentará")
+                stop_event.wait(self.poll_interval)
+        except KeyboardInterrupt:
+            logger.info("Vigilancia detenida por el usuario")
+
+    def __repr__(self) -> str:
+        return (f"FolderWatcher(folder={self.folder!r}, "
+                f"processed={len(self.state.files)}, pending={len(self._pending)})")
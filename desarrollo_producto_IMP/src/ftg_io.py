@@ -0,0 +1,263 @@
+"""
+Lectura de Archivos FTG - Entrada comprimida y streaming
+Procesador de Fatiga SACS v1.0
+
+Los listados SACS se archivan comprimidos (.gz, .bz2, .xz o .zip con
+varios periodos) porque son texto muy repetitivo. Este módulo abre esas
+entradas como streams de texto sin descomprimir a disco; la
+descompresión corre en un hilo aparte (zlib, bz2 y lzma liberan el GIL)
+y se solapa con el parsing mediante una cola acotada de bloques.
+
+Los módulos de compresión se importan solo al abrir una entrada que los
+requiere, para no encarecer el arranque.
+"""
+
+import importlib
+import io
+import logging
+import os
+import queue
+import threading
+from typing import Optional
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Extensiones con compresión de un solo stream → módulo con open()
+COMPRESSED_OPENERS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'lzma',
+}
+
+# Tamaño de bloque leído por el hilo de descompresión
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+
+# Bloques en vuelo entre el hilo de descompresión y el parser
+DEFAULT_QUEUE_DEPTH = 8
+
+
+def is_zip_archive(filepath: str) -> bool:
+    """True si la ruta es un archivo .zip."""
+    return os.path.splitext(filepath)[1].lower() == '.zip'
+
+
+def is_compressed(filepath: str) -> bool:
+    """True si la ruta requiere descompresión (.gz, .bz2, .xz o .zip)."""
+    ext = os.path.splitext(filepath)[1].lower()
+    return ext in COMPRESSED_OPENERS or ext == '.zip'
+
+
+def list_archive_members(filepath: str) -> list:
+    """
+    Lista los archivos contenidos en un .zip (sin directorios).
+
+    Args:
+        filepath: Ruta al .zip
+
+    Returns:
+        Lista de nombres de miembros en el orden del archivo
+    """
+    import zipfile
+
+    with zipfile.ZipFile(filepath) as zf:
+        return [info.filename for info in zf.infolist() if not info.is_dir()]
+
+
+def open_binary(filepath: str, member: Optional[str] = None):
+    """
+    Abre una entrada FTG como stream binario descomprimido.
+
+    Args:
+        filepath: Ruta al archivo (.txt, .gz, .bz2, .xz o .zip)
+        member: Miembro a leer si filepath es .zip (default: el único miembro)
+
+    Returns:
+        Stream binario (se debe cerrar)
+
+    Raises:
+        ValueError: Si un .zip tiene varios miembros y no se indica member
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext in COMPRESSED_OPENERS:
+        module = importlib.import_module(COMPRESSED_OPENERS[ext])
+        return module.open(filepath, 'rb')
+
+    if ext == '.zip':
+        import zipfile
+        
+        zf = zipfile.ZipFile(filepath)
+        try:
+            if member is None:
+                members = [i.filename for i in zf.infolist() if not i.is_dir()]
+                if len(members) != 1:
+                    raise ValueError(f"{filepath} contiene {len(members)} archivos; indique member")
+                member = members[0]
+            # El miembro mantiene abierto el archivo aunque se cierre el ZipFile
+            return zf.open(member)
+        finally:
+            zf.close()
+
+    return open(filepath, 'rb')
+
+
+def decompress_bytes(filepath: str, data: bytes, member: Optional[str] = None) -> bytes:
+    """
+    Descomprime en memoria el contenido de una entrada FTG ya leída.
+
+    La extensión de filepath indica el formato, igual que en open_binary();
+    los archivos planos se devuelven sin cambios.
+
+    Args:
+        filepath: Ruta de la que se leyeron los bytes
+        data: Contenido crudo del archivo
+        member: Miembro a extraer si filepath es .zip (default: el único miembro)
+
+    Returns:
+        bytes descomprimidos
+
+    Raises:
+        ValueError: Si un .zip tiene varios miembros y no se indica member
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext in COMPRESSED_OPENERS:
+        module = importlib.import_module(COMPRESSED_OPENERS[ext])
+        return module.decompress(data)
+
+    if ext == '.zip':
+        import zipfile
+
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            if member is None:
+                members = [i.filename for i in zf.infolist() if not i.is_dir()]
+                if len(members) != 1:
+                    raise ValueError(f"{filepath} contiene {len(members)} archivos; indique member")
+                member = members[0]
+            return zf.read(member)
+
+    return data
+
+
+class PrefetchReader(io.RawIOBase):
+    """
+    Stream binario que lee bloques de otro stream en un hilo aparte.
+
+    El hilo productor llena una cola acotada (backpressure) y el consumidor
+    (el parser) toma bloques de ella. Al cerrar se detiene el hilo y se
+    cierra el stream de origen, también si el consumo termina antes de EOF.
+    """
+
+    def __init__(self, raw, block_size: int = DEFAULT_BLOCK_SIZE,
+                 queue_depth: int = DEFAULT_QUEUE_DEPTH):
+        super().__init__()
+        self._raw = raw
+        self._block_size = block_size
+        self._queue = queue.Queue(maxsize=queue_depth)
+        self._stop = threading.Event()
+        self._pending = memoryview(b'')
+        self._eof = False
+        self._thread = threading.Thread(target=self._produce, name='ftg-prefetch', daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        """Encola un bloque; False si el lector se cerró mientras esperaba."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self):
+        """Hilo productor: lee (y descomprime) bloques hasta EOF o cierre."""
+        try:
+            while not self._stop.is_set():
+                block = self._raw.read(self._block_size)
+                if not self._put(block) or not block:
+                    return
+        except BaseException as e:  # se re-lanza en el hilo consumidor
+            self._put(e)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Copia bytes del bloque actual (o del siguiente en la cola)."""
+        if not self._pending:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            if not item:
+                self._eof = True
+                return 0
+            self._pending = memoryview(item)
+
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self):
+        """Detiene el hilo productor y cierra el stream de origen."""
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._raw.close()
+        super().close()
+
+
+def open_ftg_text(filepath: str, encoding: str, member: Optional[str] = None,
+                  threaded: bool = True, errors: str = 'strict',
+                  newline: Optional[str] = None):
+    """
+    Abre una entrada FTG (plana o comprimida) como stream de texto.
+
+    Los archivos .txt se abren directamente. Las entradas comprimidas se
+    descomprimen en streaming; con threaded=True la descompresión corre en
+    un hilo aparte solapada con el consumo.
+
+    Args:
+        filepath: Ruta al archivo
+        encoding: Encoding del texto
+        member: Miembro a leer si filepath es .zip
+        threaded: Descomprimir en un hilo aparte
+        errors: Manejo de errores de decodificación (como en open())
+        newline: Traducción de fines de línea (como en open(); '' los
+                 entrega sin traducir)
+
+    Returns:
+        Stream de texto (usar con 'with')
+    """
+    if not is_compressed(filepath):
+        return open(filepath, 'r', encoding=encoding, errors=errors, newline=newline)
+
+    raw = open_binary(filepath, member)
+    if threaded:
+        raw = io.BufferedReader(PrefetchReader(raw), buffer_size=DEFAULT_BLOCK_SIZE)
+    return io.TextIOWrapper(raw, encoding=encoding, errors=errors, newline=newline)
+
+
+def read_head(filepath: str, size: int, member: Optional[str] = None) -> bytes:
+    """
+    Lee los primeros bytes (descomprimidos) de una entrada FTG.
+
+    Args:
+        filepath: Ruta al archivo
+        size: Número de bytes a leer
+        member: Miembro a leer si filepath es .zip
+
+    Returns:
+        bytes (menos de size si la entrada es más corta)
+    """
+    with open_binary(filepath, member) as f:
+        return f.read(size)
+
+
+def display_name(filepath: str, member: Optional[str] = None) -> str:
+    """Nombre legible de una entrada ('archivo.zip:miembro' para zips)."""
+    return f"{filepath}:{member}" if member else filepath
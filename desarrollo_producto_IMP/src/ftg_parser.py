@@ -3,27 +3,107 @@ Parser de Archivos SACS FTG - Etapa 2: Parsing y Extracción
 Procesador de Fatiga SACS v1.0
 
 Parser con máquina de estados para extraer datos estructurados de archivos SACS.
+
+Dos motores de extracción con el mismo resultado:
+- 'state_machine': procesa línea por línea (filtro + estado + identificadores)
+- 'regex': recorre bloques grandes de texto con patrones multilínea
+  precompilados; el motor de regex (en C) localiza directamente las líneas
+  de encabezado de elemento y *** TOTAL DAMAGE *** y solo esas se procesan
+  en Python
 """
 
+import codecs
+import io
 import re
 import logging
+from array import array
 from enum import Enum
-from typing import Optional, List
-import numpy as np
+from itertools import accumulate
+from typing import Callable, Optional, List, Sequence, Union, TYPE_CHECKING
 
 from data_cleaner import normalize_fortran_scientific, is_valid_data_line, detect_file_encoding
+from diagnostics import (
+    DEFAULT_MAX_EXAMPLES, ELEMENT_WITHOUT_TOTAL, FILE_READ, TOTAL_INVALID,
+    TOTAL_WITHOUT_ELEMENT, DiagnosticsCollector, DiagnosticsLimitExceeded
+)
+from ftg_io import open_ftg_text, is_zip_archive, list_archive_members, display_name
+from memory_profile import RunMetrics, track
 from models import FatigueElement, ParseResult
+from section_extractors import SectionExtractor, create_extractor
+
+if TYPE_CHECKING:
+    import numpy as np
+    from tables import LoadCaseDetails
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
 
+# Motores de extracción disponibles
+ENGINES = ('state_machine', 'regex')
+
+# Caracteres por bloque leído por el motor regex
+REGEX_BLOCK_CHARS = 4 * 1024 * 1024
+
+# Encodings de un byte por carácter: el offset en bytes es el de caracteres
+_SINGLE_BYTE_CODECS = {'ascii', 'iso8859-1', 'iso8859-15', 'cp1252', 'cp850', 'cp437'}
+
+# Línea del texto sin traducir, con su fin de línea (\r\n, \r o \n)
+_RAW_LINE = re.compile(r'[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+\Z')
+
+# Títulos de la sección MEMBER FATIGUE DETAIL REPORT (normal y espaciado)
+DETAIL_REPORT_TITLES = ('MEMBER FATIGUE DETAIL REPORT',
+                        'M E M B E R  F A T I G U E  D E T A I L  R E P O R T')
+
+# Patrones del motor regex (multilínea, una coincidencia = una línea)
+_SECTION_PATTERN = re.compile(
+    r'^.*(?:' + '|'.join(re.escape(t) for t in DETAIL_REPORT_TITLES) + r').*$',
+    re.M)
+_COLUMN_HEADER_PATTERN = re.compile(r'^(?=.*JOINT)(?=.*GRUP)(?=.*DAMAGES).*$', re.M)
+
+# Token numérico según _extract_identifiers: solo [0-9.+-E] con al menos un dígito
+_NUMERIC_TOKEN = r'[.+\-E]*\d[\d.+\-E]*'
+_GRUP_THEN_LOAD = rf'[^\S\n]+[A-Z0-9]{{2,4}}[^\S\n]+{_NUMERIC_TOKEN}(?:[^\S\n]|$)'
+
+# Línea TOTAL DAMAGE, o encabezado de elemento: JOINT (empieza con dígito),
+# 1-4 tokens de MEMBER, GRUP y LOAD numérico. El primer token tras JOINT no
+# puede ser ya GRUP+LOAD (en ese caso _extract_identifiers descarta la línea).
+_ELEMENT_PATTERN = re.compile(
+    r'^(?P<total>.*\*\*\* TOTAL DAMAGE \*\*\*.*)$'
+    r'|^(?P<header>[^\S\n]*\d\S*'
+    rf'(?!{_GRUP_THEN_LOAD})'
+    rf'(?:[^\S\n]+\S+){{1,4}}?{_GRUP_THEN_LOAD}.*)$',
+    re.M)
+
+
+
+def _byte_width(encoding: Optional[str]) -> Callable[[str], int]:
+    """
+    Función que mide en bytes un tramo de texto codificado con encoding.
+    
+    Los tramos deben medirse en orden (el encoder incremental cuenta una
+    sola vez el BOM de encodings como utf-8-sig). Sin encoding (texto ya
+    decodificado) el ancho se cuenta en caracteres.
+    
+    Args:
+        encoding: Encoding del archivo o None
+        
+    Returns:
+        Callable texto -> bytes
+    """
+    if encoding is None or codecs.lookup(encoding).name in _SINGLE_BYTE_CODECS:
+        return len
+    encode = codecs.getincrementalencoder(encoding)().encode
+    return lambda text: len(encode(text))
+
+
 class ParserState(Enum):
     """Estados de la máquina de parsing."""
     SEARCHING = 1        # Buscando sección MEMBER FATIGUE DETAIL REPORT
     READING_HEADER = 2   # Leyendo encabezado de columnas
     READING_ELEMENT = 3  # Leyendo datos de un elemento
     READING_TOTAL = 4    # Leyendo línea *** TOTAL DAMAGE ***
+    READING_SECTION = 5  # Alimentando un extractor de otro reporte
 
 
 class FTGParser:
@@ -31,32 +111,95 @@ class FTGParser:
     Parser de archivos SACS FTG con máquina de estados.
     
     Extrae elementos estructurales con sus valores de daño de fatiga.
+    
+    Con capture_details=True también conserva las filas por caso de carga
+    (entre el encabezado del elemento y *** TOTAL DAMAGE ***) en buffers
+    columnares, sin crear un objeto Python por fila.
+    
+    Errores y advertencias se registran en un DiagnosticsCollector acotado:
+    errors/warnings contienen solo los primeros max_examples mensajes de
+    cada código y el parsing se detiene tras abort_after diagnósticos.
+    
+    Con metrics se mide la memoria de las etapas 'parse_file' (lectura y
+    extracción) y 'parse_result' (construcción del ParseResult).
+    
+    Con extractors, las secciones de otros reportes del listado (resúmenes
+    por junta o por miembro, ver section_extractors) se extraen en la misma
+    lectura: al encontrar el título de una sección registrada la máquina
+    pasa a READING_SECTION y le entrega sus líneas al extractor, hasta el
+    título de otra sección. Cada extractor deja su resultado en
+    ParseResult.reports.
     """
     
-    def __init__(self):
-        """Inicializa el parser."""
-        self.state = ParserState.SEARCHING
-        self.current_element = None
-        self.elements = {}
-        self.errors = []
-        self.warnings = []
-        self.line_number = 0
+    def __init__(self, capture_details: bool = False, engine: str = 'state_machine',
+                 max_examples: int = DEFAULT_MAX_EXAMPLES, abort_after: Optional[int] = None,
+                 metrics: Optional[RunMetrics] = None,
+                 extractors: Optional[Sequence[Union[str, SectionExtractor]]] = None):
+        """
+        Inicializa el parser.
+        
+        Args:
+            capture_details: Si True, captura las filas de detalle por caso
+                             de carga en ParseResult.load_details
+            engine: Motor de extracción ('state_machine' o 'regex')
+            max_examples: Mensajes formateados por código de diagnóstico
+            abort_after: Diagnósticos tras los cuales se aborta el archivo
+                         (None = nunca)
+            metrics: RunMetrics donde registrar la memoria por etapa
+                     (None = sin medición)
+            extractors: Extractores de otros reportes (nombres registrados
+                        o instancias de SectionExtractor)
+            
+        Raises:
+            ValueError: Si el motor no existe, si se pide capture_details o
+                        extractors con el motor regex (no visita las filas
+                        intermedias) o si un extractor no está registrado
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Motor desconocido '{engine}', opciones: {ENGINES}")
+        if capture_details and engine != 'state_machine':
+            raise ValueError("capture_details requiere engine='state_machine'")
+        if extractors and engine != 'state_machine':
+            raise ValueError("extractors requiere engine='state_machine'")
+        
+        self.capture_details = capture_details
+        self.engine = engine
+        self.max_examples = max_examples
+        self.abort_after = abort_after
+        self.metrics = metrics
+        self.extractors = [create_extractor(spec) for spec in extractors or ()]
+        
+        # Título → extractor (None = MEMBER FATIGUE DETAIL REPORT); el patrón
+        # solo existe si hay extractores, sin costo por línea en otro caso
+        self._section_titles = {}
+        self._title_pattern = None
+        if self.extractors:
+            self._section_titles = {title: None for title in DETAIL_REPORT_TITLES}
+            for extractor in self.extractors:
+                self._section_titles.update({title: extractor for title in extractor.titles})
+            titles = sorted(self._section_titles, key=len, reverse=True)
+            self._title_pattern = re.compile('|'.join(re.escape(t) for t in titles))
+        self._reset()
     
-    def parse_file(self, filepath: str) -> ParseResult:
+    def parse_file(self, filepath: str, member: Optional[str] = None) -> ParseResult:
         """
         Parsea un archivo SACS FTG completo.
         
+        Acepta archivos de texto o comprimidos (.gz, .bz2, .xz, .zip); los
+        comprimidos se leen en streaming sin extraerlos a disco.
+        
         Args:
             filepath: Ruta al archivo .txt de SACS
+            member: Miembro a parsear si filepath es .zip
             
         Returns:
             ParseResult: Resultado del parsing con elementos extraídos
         """
-        logger.info(f"Iniciando parsing de: {filepath}")
+        logger.info(f"Iniciando parsing de: {display_name(filepath, member)}")
         
         # Detectar encoding
         try:
-            encoding = detect_file_encoding(filepath)
+            encoding = detect_file_encoding(filepath, member)
             logger.debug(f"Encoding detectado: {encoding}")
         except Exception as e:
             logger.warning(f"Error detectando encoding, usando latin-1: {e}")
@@ -65,36 +208,230 @@ class FTGParser:
         # Reiniciar estado
         self._reset()
         
-        # Procesar archivo línea por línea
-        try:
-            with open(filepath, 'r', encoding=encoding) as f:
-                for line in f:
-                    self.line_number += 1
-                    self._process_line(line)
-            
-            logger.info(f"Parsing completado: {len(self.elements)} elementos extraídos")
+        with track(self.metrics, 'parse_file', lambda: len(self.elements)):
+            try:
+                with open_ftg_text(filepath, encoding, member, newline='') as f:
+                    self._parse_stream(f, encoding)
+                
+                logger.info(f"Parsing completado: {len(self.elements)} elementos extraídos")
+                
+            except DiagnosticsLimitExceeded as e:
+                self.diagnostics.abort(str(e), self.line_number)
+            except Exception as e:
+                self.diagnostics.add(FILE_READ, detail=str(e))
+        
+        return self._build_result()
+    
+    def parse_text(self, data, encoding: str = 'latin-1') -> ParseResult:
+        """
+        Parsea el contenido de un listado FTG ya cargado en memoria.
+        
+        Con data en bytes los offsets de los diagnósticos son offsets en
+        bytes; con texto ya decodificado se cuentan en caracteres.
+        
+        Args:
+            data: Texto (str) o bytes del listado
+            encoding: Encoding para decodificar si data es bytes
             
+        Returns:
+            ParseResult: Resultado del parsing con elementos extraídos
+        """
+        self._reset()
+        
+        # Mismo manejo de saltos de línea que al leer un archivo
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            stream = io.TextIOWrapper(io.BytesIO(data), encoding=encoding, newline='')
+        else:
+            stream = io.StringIO(data, newline='')
+            encoding = None
+        
+        try:
+            with stream:
+                self._parse_stream(stream, encoding)
+        except DiagnosticsLimitExceeded as e:
+            self.diagnostics.abort(str(e), self.line_number)
         except Exception as e:
-            error_msg = f"Error crítico leyendo archivo: {e}"
-            logger.error(error_msg)
-            self.errors.append(error_msg)
-        
-        # Retornar resultado
-        return ParseResult(
-            elements=self.elements,
-            total_elements=len(self.elements),
-            errors=self.errors,
-            warnings=self.warnings
-        )
+            self.diagnostics.add(FILE_READ, detail=str(e))
+        
+        return self._build_result()
+    
+    def _parse_stream(self, f, encoding: Optional[str] = None):
+        """
+        Procesa un stream de texto con el motor configurado.
+        
+        El stream entrega los fines de línea sin traducir (newline=''): el
+        offset de cada línea se mide sobre el texto original y los fines
+        \r\n y \r se normalizan a \n antes de procesarla.
+        
+        Args:
+            f: Stream de texto abierto con newline=''
+            encoding: Encoding del archivo (None: offsets en caracteres)
+        """
+        self._byte_width = _byte_width(encoding)
+        if self.engine == 'regex':
+            self._scan_stream(f)
+            return
+        
+        # Procesar archivo línea por línea
+        width = self._byte_width
+        offset = 0
+        for line in f:
+            self.line_number += 1
+            self.line_offset = offset
+            offset += width(line)
+            if '\r' in line:
+                line = line.rstrip('\r\n') + '\n'
+            self._process_line(line)
+    
+    def _build_result(self) -> ParseResult:
+        """Construye el ParseResult con el estado actual del parser."""
+        with track(self.metrics, 'parse_result', len(self.elements)):
+            return ParseResult(
+                elements=self.elements,
+                total_elements=len(self.elements),
+                errors=self.errors,
+                warnings=self.warnings,
+                load_details=self._build_load_details() if self.capture_details else None,
+                diagnostics=self.diagnostics,
+                reports=({extractor.name: extractor.result() for extractor in self.extractors}
+                         if self.extractors else None)
+            )
     
     def _reset(self):
         """Reinicia el estado del parser."""
         self.state = ParserState.SEARCHING
         self.current_element = None
         self.elements = {}
-        self.errors = []
-        self.warnings = []
+        self.diagnostics = DiagnosticsCollector(self.max_examples, self.abort_after)
+        self.errors = self.diagnostics.errors
+        self.warnings = self.diagnostics.warnings
         self.line_number = 0
+        self.line_offset = 0      # offset (bytes) del inicio de la línea actual
+        self._byte_offset = 0     # bytes ya escaneados por el motor regex
+        self._byte_width = len    # ancho en bytes de un tramo de texto
+        self._active_extractor = None
+        for extractor in self.extractors:
+            extractor.reset()
+        
+        # Buffers columnares de detalle (solo se llenan con capture_details)
+        self._detail_block = array('i')    # bloque (encabezado) de cada fila
+        self._detail_load = array('i')     # código del caso de carga
+        self._detail_values = array('d')   # 8 valores por fila, aplanados
+        self._load_codes = {}              # {id de carga: código}
+        self._block_element = array('i')   # {bloque: fila de elemento} o -1
+        self._element_rows = {}            # {unique_key: fila de elemento}
+        self._element_last_block = array('i')  # último bloque de cada fila
+        self._current_block = -1
+    
+    def _scan_stream(self, f):
+        """
+        Motor regex: lee bloques grandes de líneas completas y los escanea.
+        
+        Args:
+            f: Stream de texto
+        """
+        carry = ''
+        while True:
+            block = f.read(REGEX_BLOCK_CHARS)
+            if not block:
+                break
+            block = carry + block
+            cut = block.rfind('\n') + 1
+            if cut == 0:
+                # Fines de línea \r: un \r final puede ser parte de un \r\n
+                cut = block.rfind('\r', 0, len(block) - 1) + 1
+            if cut == 0:
+                carry = block
+                continue
+            self._scan_text(block[:cut])
+            carry = block[cut:]
+        
+        if carry:
+            self._scan_text(carry)
+    
+    def _scan_text(self, raw: str):
+        """
+        Motor regex: procesa un bloque de líneas completas.
+        
+        Reproduce las transiciones de la máquina de estados: sección →
+        encabezado de columnas → pares encabezado de elemento / TOTAL DAMAGE.
+        Solo las líneas localizadas por los patrones pasan por
+        is_valid_data_line y los manejadores de la máquina de estados.
+        
+        Los patrones recorren el bloque con fines de línea \n; si el bloque
+        trae \r\n o \r, los offsets salen del ancho de cada línea original.
+        
+        Args:
+            raw: Bloque de texto sin traducir que termina en fin de línea
+                 (o de archivo)
+        """
+        base = self.line_number
+        counted_pos, counted_lines = 0, base
+        width = self._byte_width
+        if '\r' in raw:
+            line_starts = list(accumulate(map(width, _RAW_LINE.findall(raw)),
+                                          initial=self._byte_offset))
+            text = raw.replace('\r\n', '\n').replace('\r', '\n')
+        else:
+            line_starts = None
+            text = raw
+        measured_pos, measured_offset = 0, self._byte_offset
+        
+        def line_at(pos: int) -> int:
+            """Número de línea (1-based) de la posición pos del bloque."""
+            nonlocal counted_pos, counted_lines
+            counted_lines += text.count('\n', counted_pos, pos)
+            counted_pos = pos
+            return counted_lines + 1
+        
+        def offset_at(pos: int, line: int) -> int:
+            """Offset en bytes de la línea que empieza en la posición pos."""
+            nonlocal measured_pos, measured_offset
+            if line_starts is not None:
+                return line_starts[line - base - 1]
+            if width is len:
+                return self._byte_offset + pos
+            measured_offset += width(text[measured_pos:pos])
+            measured_pos = pos
+            return measured_offset
+        
+        pos = 0
+        while self.state in (ParserState.SEARCHING, ParserState.READING_HEADER):
+            pattern = (_SECTION_PATTERN if self.state == ParserState.SEARCHING
+                       else _COLUMN_HEADER_PATTERN)
+            match = next((m for m in pattern.finditer(text, pos)
+                          if is_valid_data_line(m.group())), None)
+            if match is None:
+                pos = len(text)
+                break
+            self.line_number = line_at(match.start())
+            self.line_offset = offset_at(match.start(), self.line_number)
+            logger.debug(f"Transición desde {self.state.name} en línea {self.line_number}")
+            self.state = (ParserState.READING_HEADER if self.state == ParserState.SEARCHING
+                          else ParserState.READING_ELEMENT)
+            pos = match.end()
+        
+        for match in _ELEMENT_PATTERN.finditer(text, pos):
+            line = match.group()
+            if not is_valid_data_line(line):
+                continue
+            self.line_number = line_at(match.start())
+            self.line_offset = offset_at(match.start(), self.line_number)
+            if match.group('total') is not None:
+                self.state = ParserState.READING_TOTAL
+                self._handle_reading_total(line)
+            else:
+                identifiers = self._extract_identifiers(line)
+                if identifiers:
+                    self.current_element = identifiers
+        
+        self.line_number = base + text.count('\n') + (0 if text.endswith('\n') else 1)
+        if line_starts is not None:
+            self._byte_offset = line_starts[-1]
+        elif width is len:
+            self._byte_offset += len(text)
+        else:
+            self._byte_offset = measured_offset + width(text[measured_pos:])
     
     def _process_line(self, line: str):
         """
@@ -103,6 +440,11 @@ class FTGParser:
         Args:
             line: Línea del archivo
         """
+        # Títulos de secciones registradas (antes del filtro: los títulos
+        # con formato * * T I T L E * * se filtran)
+        if self._title_pattern is not None and self._enter_section(line):
+            return
+        
         # Filtrar líneas irrelevantes
         if not is_valid_data_line(line):
             return
@@ -116,6 +458,43 @@ class FTGParser:
             self._handle_reading_element(line)
         elif self.state == ParserState.READING_TOTAL:
             self._handle_reading_total(line)
+        elif self.state == ParserState.READING_SECTION:
+            self._active_extractor.feed(line, self.line_number)
+    
+    def _enter_section(self, line: str) -> bool:
+        """
+        Cambia de sección si la línea es el título de una sección registrada.
+        
+        Args:
+            line: Línea del archivo
+            
+        Returns:
+            True si la línea fue consumida como título
+        """
+        match = self._title_pattern.search(line)
+        if match is None:
+            return False
+        
+        extractor = self._section_titles[match.group()]
+        if extractor is None:
+            # MEMBER FATIGUE DETAIL REPORT: desde otra sección se vuelve a
+            # esperar el encabezado de columnas; en los demás estados (título
+            # repetido en cada página) sigue el flujo normal
+            if self.state != ParserState.READING_SECTION:
+                return False
+            self._active_extractor = None
+            self.state = ParserState.READING_HEADER
+        elif extractor is not self._active_extractor:
+            logger.debug(f"Sección '{extractor.name}' en línea {self.line_number}")
+            if self.current_element:
+                # El encabezado pendiente no llegó a su TOTAL DAMAGE
+                self.diagnostics.add(ELEMENT_WITHOUT_TOTAL, self.line_number,
+                                     self.line_offset, key=self._current_key())
+            self._active_extractor = extractor
+            self.current_element = None
+            self._current_block = -1
+            self.state = ParserState.READING_SECTION
+        return True
     
     def _handle_searching(self, line: str):
         """Busca la sección MEMBER FATIGUE DETAIL REPORT."""
@@ -143,6 +522,14 @@ class FTGParser:
         if identifiers:
             self.current_element = identifiers
             logger.debug(f"Elemento encontrado: {identifiers}")
+            if self.capture_details:
+                self._current_block = len(self._block_element)
+                self._block_element.append(-1)
+                # La línea de encabezado también trae el primer caso de carga
+                tokens = line.split()
+                self._capture_load_row(tokens[2 + len(identifiers['member'].split()):])
+        elif self.capture_details and self.current_element:
+            self._capture_load_row(line.split())
     
     def _handle_reading_total(self, line: str):
         """Lee línea *** TOTAL DAMAGE *** y crea el elemento."""
@@ -152,7 +539,7 @@ class FTGParser:
             return
         
         if not self.current_element:
-            self.warnings.append(f"Línea {self.line_number}: *** TOTAL DAMAGE *** sin elemento previo")
+            self.diagnostics.add(TOTAL_WITHOUT_ELEMENT, self.line_number, self.line_offset)
             self.state = ParserState.READING_ELEMENT
             return
         
@@ -172,15 +559,92 @@ class FTGParser:
             self.elements[element.unique_key] = element
             logger.debug(f"Elemento guardado: {element.unique_key}")
             
+            if self.capture_details and self._current_block >= 0:
+                self._link_block(element.unique_key)
+            
         except Exception as e:
-            error_msg = f"Línea {self.line_number}: Error procesando TOTAL DAMAGE: {e}"
-            logger.error(error_msg)
-            self.errors.append(error_msg)
+            self.diagnostics.add(TOTAL_INVALID, self.line_number, self.line_offset,
+                                 key=self._current_key(), detail=str(e))
         
         # Volver a buscar elementos
         self.current_element = None
+        self._current_block = -1
         self.state = ParserState.READING_ELEMENT
     
+    def _current_key(self) -> str:
+        """Clave JOINT_MEMBER_GRUP del elemento en curso."""
+        return '_'.join((self.current_element['joint'], self.current_element['member'],
+                         self.current_element['grup']))
+    
+    def _capture_load_row(self, tokens: List[str]):
+        """
+        Agrega una fila de caso de carga a los buffers columnares.
+        
+        Args:
+            tokens: [LOAD, d1, ..., d8, ...] ya separados por espacios
+        """
+        if self._current_block < 0 or len(tokens) < 9:
+            return
+        
+        try:
+            values = [normalize_fortran_scientific(tok) for tok in tokens[1:9]]
+        except ValueError:
+            logger.debug(f"Línea {self.line_number}: fila de detalle no numérica, se ignora")
+            return
+        
+        load_code = self._load_codes.setdefault(tokens[0], len(self._load_codes))
+        self._detail_block.append(self._current_block)
+        self._detail_load.append(load_code)
+        self._detail_values.extend(values)
+    
+    def _link_block(self, key: str):
+        """Asocia el bloque actual de filas de detalle al elemento guardado."""
+        row = self._element_rows.get(key)
+        if row is None:
+            row = len(self._element_rows)
+            self._element_rows[key] = row
+            self._element_last_block.append(self._current_block)
+        else:
+            # Clave duplicada: el último bloque reemplaza al anterior
+            self._element_last_block[row] = self._current_block
+        self._block_element[self._current_block] = row
+    
+    def _build_load_details(self) -> 'LoadCaseDetails':
+        """
+        Construye LoadCaseDetails a partir de los buffers columnares.
+        
+        Descarta filas de bloques sin *** TOTAL DAMAGE *** válido y filas de
+        ocurrencias anteriores de claves duplicadas (gana la última).
+        
+        Returns:
+            LoadCaseDetails ordenado por element_index
+        """
+        import numpy as np
+        from tables import LoadCaseDetails
+        
+        blocks = np.frombuffer(self._detail_block, dtype=np.intc)
+        loads = np.frombuffer(self._detail_load, dtype=np.intc)
+        values = np.frombuffer(self._detail_values, dtype=np.float64).reshape(-1, 8)
+        block_element = np.frombuffer(self._block_element, dtype=np.intc)
+        last_block = np.frombuffer(self._element_last_block, dtype=np.intc)
+        
+        element_index = block_element[blocks]
+        keep = element_index >= 0
+        keep[keep] = last_block[element_index[keep]] == blocks[keep]
+        order = np.argsort(element_index[keep], kind='stable')
+        
+        load_names = [None] * len(self._load_codes)
+        for name, code in self._load_codes.items():
+            load_names[code] = name
+        
+        # La indexación con máscara copia: los buffers de array no se retienen
+        return LoadCaseDetails(
+            element_index=element_index[keep][order].astype(np.int32),
+            load_code=loads[keep][order].astype(np.int32),
+            load_names=load_names,
+            damages=values[keep][order]
+        )
+    
     def _extract_identifiers(self, line: str) -> Optional[dict]:
         """
         Extrae JOINT, MEMBER (CHD+BRC), GRUP de una línea.
@@ -240,7 +704,7 @@ class FTGParser:
             logger.debug(f"Línea {self.line_number}: No se pudo extraer identificadores: {e}")
             return None
     
-    def _extract_damages(self, line: str) -> np.ndarray:
+    def _extract_damages(self, line: str) -> List[float]:
         """
         Extrae 8 valores de daño de línea *** TOTAL DAMAGE ***.
         
@@ -248,7 +712,7 @@ class FTGParser:
             line: Línea con *** TOTAL DAMAGE ***
             
         Returns:
-            np.ndarray de 8 valores float
+            Lista de 8 valores float (FatigueElement los convierte a np.ndarray)
             
         Raises:
             ValueError: Si no se pueden extraer 8 valores
@@ -274,18 +738,52 @@ class FTGParser:
             except Exception as e:
                 raise ValueError(f"Error convirtiendo '{val_str}': {e}")
         
-        return np.array(damages, dtype=np.float64)
+        return damages
 
 
-def parse_fatigue_file(filepath: str) -> ParseResult:
+def parse_fatigue_file(filepath: str, capture_details: bool = False,
+                       engine: str = 'state_machine',
+                       abort_after: Optional[int] = None,
+                       metrics: Optional[RunMetrics] = None,
+                       extractors: Optional[Sequence[Union[str, SectionExtractor]]] = None
+                       ) -> ParseResult:
     """
     Función helper para parsear un archivo SACS FTG.
     
     Args:
         filepath: Ruta al archivo .txt de SACS
+        capture_details: Si True, incluye las filas por caso de carga
+        engine: Motor de extracción ('state_machine' o 'regex')
+        abort_after: Diagnósticos tras los cuales se aborta (None = nunca)
+        metrics: RunMetrics donde registrar la memoria por etapa
+        extractors: Extractores de otros reportes (resultados en
+                    ParseResult.reports)
         
     Returns:
         ParseResult: Resultado del parsing
     """
-    parser = FTGParser()
+    parser = FTGParser(capture_details=capture_details, engine=engine,
+                       abort_after=abort_after, metrics=metrics, extractors=extractors)
     return parser.parse_file(filepath)
+
+
+def parse_fatigue_archive(filepath: str, capture_details: bool = False) -> dict:
+    """
+    Parsea todos los archivos FTG contenidos en un .zip, miembro por miembro.
+    
+    Args:
+        filepath: Ruta al .zip con uno o varios periodos
+        capture_details: Si True, incluye las filas por caso de carga
+        
+    Returns:
+        dict {nombre_miembro: ParseResult} en el orden del archivo
+        
+    Raises:
+        ValueError: Si filepath no es un .zip
+    """
+    if not is_zip_archive(filepath):
+        raise ValueError(f"No es un archivo .zip: {filepath}")
+    
+    parser = FTGParser(capture_details=capture_details)
+    return {member: parser.parse_file(filepath, member)
+            for member in list_archive_members(filepath)}
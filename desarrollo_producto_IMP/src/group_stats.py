@@ -0,0 +1,335 @@
+"""
+Estadísticas por Grupo - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Estadísticas del análisis de fatiga (compute_statistics del plan de
+etapas): totales, elementos sobre umbral, distribución por rango de daño
+y estadísticas por GRUP y por JOINT.
+
+Un GroupIndex se construye una sola vez a partir de los códigos
+categóricos de ElementTable (orden estable por código + offsets) y permite
+calcular suma, máximo, argmax, conteo e histograma logarítmico por grupo
+con kernels de numpy (bincount / maximum.reduceat), sin recorrer elementos
+en Python ni repetir groupbys. Los resultados se guardan en table.cache
+para que la GUI y las hojas de resumen de Excel los reutilicen.
+"""
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Rango de décadas del histograma: [1e-10, 1e1) más desborde inferior/superior
+DEFAULT_DECADES = (-10, 1)
+
+# Umbral de daño para conteo de elementos críticos (plan de etapas)
+DEFAULT_THRESHOLD = 0.1
+
+
+@dataclass
+class GroupIndex:
+    """
+    Índice de filas por grupo en formato CSR.
+
+    Attributes:
+        names: Lista {código: nombre de grupo}
+        codes: Array int32 (N,) con el código de grupo de cada fila
+        order: Array (N,) de filas ordenadas por código (orden estable)
+        offsets: Array (G + 1,); las filas del grupo g son
+                 order[offsets[g]:offsets[g + 1]]
+    """
+    names: list
+    codes: np.ndarray
+    order: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def build(cls, codes: np.ndarray, names: list) -> 'GroupIndex':
+        """
+        Construye el índice a partir de códigos categóricos.
+
+        Args:
+            codes: Array de códigos 0..G-1 por fila
+            names: Nombre de cada código
+
+        Returns:
+            GroupIndex
+        """
+        codes = np.asarray(codes)
+        order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes, minlength=len(names))
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(names=list(names), codes=codes, order=order, offsets=offsets)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Número de filas de cada grupo (G,)."""
+        return np.diff(self.offsets)
+
+    def rows(self, group: int) -> np.ndarray:
+        """Filas del grupo (tiempo proporcional al tamaño del grupo)."""
+        return self.order[self.offsets[group]:self.offsets[group + 1]]
+
+    def sum(self, values: np.ndarray) -> np.ndarray:
+        """Suma de values por grupo (G,)."""
+        return np.bincount(self.codes, weights=values, minlength=len(self.names))
+
+    def max(self, values: np.ndarray) -> tuple:
+        """
+        Máximo de values por grupo y fila donde ocurre.
+
+        Args:
+            values: Array (N,)
+
+        Returns:
+            tuple (max, argmax): arrays (G,); para grupos vacíos max=nan y
+            argmax=-1. Con empates se reporta la primera fila del grupo.
+        """
+        n_groups = len(self.names)
+        group_max = np.full(n_groups, np.nan)
+        group_argmax = np.full(n_groups, -1, dtype=np.int64)
+
+        nonempty = np.flatnonzero(self.counts)
+        if len(nonempty) == 0:
+            return group_max, group_argmax
+
+        sorted_values = values[self.order]
+        group_max[nonempty] = np.maximum.reduceat(sorted_values, self.offsets[nonempty])
+
+        # Primera posición (en orden estable) que alcanza el máximo de su grupo
+        sorted_codes = self.codes[self.order]
+        hits = np.flatnonzero(sorted_values == group_max[sorted_codes])
+        hit_codes = sorted_codes[hits]
+        first = np.ones(len(hits), dtype=bool)
+        first[1:] = hit_codes[1:] != hit_codes[:-1]
+        group_argmax[hit_codes[first]] = self.order[hits[first]]
+        return group_max, group_argmax
+
+
+@dataclass
+class DamageHistogram:
+    """
+    Histograma de daño en escala logarítmica (una barra por década).
+
+    Attributes:
+        labels: Etiqueta de cada barra (ej: "1e-05 a 1e-04")
+        counts: Array (B,) con el número de elementos por barra
+    """
+    labels: list
+    counts: np.ndarray
+
+    def to_dict(self) -> dict:
+        """Distribución {rango: conteo}."""
+        return dict(zip(self.labels, self.counts.tolist()))
+
+
+@dataclass
+class GroupStatistics:
+    """
+    Estadísticas por grupo sobre el daño máximo de cada elemento.
+
+    Attributes:
+        by: Columna de agrupación ('grup' o 'joint')
+        names: Nombre de cada grupo
+        count: Elementos por grupo (G,)
+        sum: Suma del daño máximo por grupo (G,)
+        max: Daño máximo por grupo (G,)
+        argmax: Fila del elemento con mayor daño en cada grupo (G,)
+        histogram: Conteos (G, B) por década de daño
+        labels: Etiquetas de las B barras del histograma
+    """
+    by: str
+    names: list
+    count: np.ndarray
+    sum: np.ndarray
+    max: np.ndarray
+    argmax: np.ndarray
+    histogram: np.ndarray
+    labels: list
+
+    @property
+    def mean(self) -> np.ndarray:
+        """Daño máximo promedio por grupo (G,)."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.sum / self.count
+
+    def top(self, k: int = 10) -> list:
+        """Nombres de los k grupos con mayor daño máximo."""
+        order = np.argsort(-np.nan_to_num(self.max, nan=-np.inf), kind='stable')[:k]
+        return [self.names[g] for g in order]
+
+    def to_dict(self) -> dict:
+        """
+        Estadísticas {grupo: {...}} para reportes.
+
+        Returns:
+            dict por grupo con count, sum, mean, max y argmax
+        """
+        mean = self.mean
+        return {
+            name: {
+                'count': int(self.count[g]),
+                'sum': float(self.sum[g]),
+                'mean': float(mean[g]) if self.count[g] else 0.0,
+                'max': float(self.max[g]) if self.count[g] else 0.0,
+                'argmax': int(self.argmax[g])
+            }
+            for g, name in enumerate(self.names)
+        }
+
+
+def _histogram_labels(decades: tuple) -> list:
+    """Etiquetas de las décadas [lo, hi) más desbordes."""
+    lo, hi = decades
+    labels = [f"< 1e{lo:+03d}"]
+    labels += [f"1e{k:+03d} a 1e{k + 1:+03d}" for k in range(lo, hi)]
+    labels.append(f">= 1e{hi:+03d}")
+    return labels
+
+
+def damage_bins(values: np.ndarray, decades: tuple = DEFAULT_DECADES) -> np.ndarray:
+    """
+    Índice de barra logarítmica de cada valor.
+
+    Args:
+        values: Array (N,) de daños (>= 0)
+        decades: (lo, hi) exponentes del rango cubierto
+
+    Returns:
+        Array int64 (N,) en 0..(hi - lo + 1); 0 = desborde inferior (incluye 0)
+    """
+    lo, hi = decades
+    with np.errstate(divide='ignore'):
+        exponents = np.floor(np.log10(values))
+    exponents = np.nan_to_num(exponents, nan=lo - 1, neginf=lo - 1)
+    return (np.clip(exponents, lo - 1, hi) - (lo - 1)).astype(np.int64)
+
+
+def group_index(table: ElementTable, by: str = 'grup') -> GroupIndex:
+    """
+    Índice de grupos de la tabla (se construye una vez y se guarda en cache).
+
+    Args:
+        table: Tabla de elementos
+        by: 'grup' o 'joint'
+
+    Returns:
+        GroupIndex
+    """
+    if by not in ('grup', 'joint'):
+        raise ValueError(f"Agrupación no soportada: {by}")
+
+    cache_key = ('group_index', by)
+    if cache_key not in table.cache:
+        codes = table.grup_codes if by == 'grup' else table.joint_codes
+        names = table.grup_names if by == 'grup' else table.joint_names
+        table.cache[cache_key] = GroupIndex.build(codes, names)
+    return table.cache[cache_key]
+
+
+def group_statistics(table: ElementTable, by: str = 'grup',
+                     decades: tuple = DEFAULT_DECADES) -> GroupStatistics:
+    """
+    Suma, máximo, argmax, conteo e histograma por grupo en una pasada.
+
+    El histograma global y los histogramas por grupo salen del mismo
+    bincount sobre (código de grupo × barras + barra).
+
+    Args:
+        table: Tabla de elementos
+        by: 'grup' o 'joint'
+        decades: Rango de décadas del histograma
+
+    Returns:
+        GroupStatistics (guardado en table.cache)
+    """
+    cache_key = ('group_statistics', by, tuple(decades))
+    if cache_key in table.cache:
+        return table.cache[cache_key]
+
+    index = group_index(table, by)
+    values = table.max_damage
+    labels = _histogram_labels(decades)
+    n_bins = len(labels)
+
+    bins = damage_bins(values, decades)
+    histogram = np.bincount(index.codes * n_bins + bins,
+                            minlength=len(index) * n_bins).reshape(len(index), n_bins)
+    group_max, group_argmax = index.max(values)
+
+    stats = GroupStatistics(
+        by=by,
+        names=index.names,
+        count=index.counts,
+        sum=index.sum(values),
+        max=group_max,
+        argmax=group_argmax,
+        histogram=histogram,
+        labels=labels
+    )
+    table.cache[cache_key] = stats
+    return stats
+
+
+def compute_statistics(table: ElementTable, threshold: float = DEFAULT_THRESHOLD,
+                       decades: tuple = DEFAULT_DECADES) -> dict:
+    """
+    Calcula estadísticas del análisis de fatiga.
+
+    Args:
+        table: Tabla de elementos (individual o consolidada)
+        threshold: Umbral de daño para elementos críticos
+        decades: Rango de décadas de la distribución
+
+    Returns:
+        Dict con:
+        - total_elements: int
+        - max_damage_overall: float
+        - critical_element: str (JOINT_MEMBER_GRUP)
+        - elements_above_threshold: int (damage > threshold)
+        - damage_distribution: Dict[str, int]  # Por década
+        - group_statistics: Dict[str, dict]  # Por GRUP
+        - joint_statistics: Dict[str, dict]  # Por JOINT
+    """
+    cache_key = ('statistics', threshold, tuple(decades))
+    if cache_key in table.cache:
+        return table.cache[cache_key]
+
+    grup_stats = group_statistics(table, 'grup', decades)
+    joint_stats = group_statistics(table, 'joint', decades)
+    values = table.max_damage
+
+    if len(table):
+        critical_row = int(values.argmax())
+        critical_element = (f"{table.joint_names[table.joint_codes[critical_row]]}_"
+                            f"{table.members[critical_row]}_"
+                            f"{table.grup_names[table.grup_codes[critical_row]]}")
+        max_damage = float(values[critical_row])
+    else:
+        critical_element, max_damage = None, 0.0
+
+    histogram = DamageHistogram(labels=grup_stats.labels,
+                                counts=grup_stats.histogram.sum(axis=0))
+    statistics = {
+        'total_elements': len(table),
+        'max_damage_overall': max_damage,
+        'critical_element': critical_element,
+        'elements_above_threshold': int((values > threshold).sum()),
+        'damage_distribution': histogram.to_dict(),
+        'group_statistics': grup_stats.to_dict(),
+        'joint_statistics': joint_stats.to_dict()
+    }
+    table.cache[cache_key] = statistics
+    logger.info(f"Estadísticas: {len(table)} elementos, "
+                f"{statistics['elements_above_threshold']} sobre umbral {threshold}")
+    return statistics
@@ -0,0 +1,85 @@
+"""
+Claves Canónicas de Miembro - Etapa 2: Parsing y Extracción
+Procesador de Fatiga SACS v1.0
+
+_extract_identifiers une con espacios los tokens entre JOINT y GRUP, así
+que el mismo miembro físico aparece como "802L 0005", "802L-0005" o
+"0005-802L" según el archivo y la versión de SACS. Para alinear archivos
+al consolidar, la clave canónica usa los extremos del miembro ordenados
+("0005-802L") y se resume en un digest blake2b de 128 bits:
+
+    primeros 64 bits: hash con el que se emparejan las filas
+    últimos 64 bits:  verificación de colisiones del hash
+
+El digest es estable entre procesos y ejecuciones (a diferencia de hash()
+de Python), de modo que los workers pueden calcularlo al parsear.
+
+Solo usa la biblioteca estándar: se importa junto con el parser.
+"""
+
+import hashlib
+
+# Separador de los campos del digest (no aparece en identificadores SACS)
+_FIELD_SEPARATOR = '\x1f'
+
+# Bytes del digest (dos enteros de 64 bits)
+DIGEST_SIZE = 16
+
+
+def member_endpoints(member: str) -> tuple:
+    """
+    Extremos (CHD, BRC) codificados en un MEMBER.
+
+    Args:
+        member: MEMBER tal como sale del parser
+
+    Returns:
+        tuple de nombres de nodo (normalmente 2)
+
+    Examples:
+        >>> member_endpoints('802L 0005')
+        ('802L', '0005')
+        >>> member_endpoints('0002-501L')
+        ('0002', '501L')
+    """
+    return tuple(member.replace('-', ' ').split())
+
+
+def canonical_member(member: str) -> str:
+    """
+    Forma canónica de un MEMBER: extremos ordenados unidos por guión.
+
+    Args:
+        member: MEMBER en cualquier formato
+
+    Returns:
+        str canónico
+
+    Examples:
+        >>> canonical_member('802L 0005')
+        '0005-802L'
+        >>> canonical_member('0005-802L')
+        '0005-802L'
+    """
+    return '-'.join(sorted(member_endpoints(member)))
+
+
+def canonical_key(joint: str, member: str, grup: str) -> str:
+    """Clave "JOINT_MEMBER_GRUP" con el MEMBER en forma canónica."""
+    return f"{joint}_{canonical_member(member)}_{grup}"
+
+
+def key_digest(joint: str, member: str, grup: str) -> bytes:
+    """
+    Digest de 128 bits de la clave canónica.
+
+    Args:
+        joint: JOINT
+        member: MEMBER en cualquier formato
+        grup: GRUP
+
+    Returns:
+        bytes de longitud DIGEST_SIZE (hash + verificación, little-endian)
+    """
+    text = _FIELD_SEPARATOR.join((joint, canonical_member(member), grup))
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=DIGEST_SIZE).digest()
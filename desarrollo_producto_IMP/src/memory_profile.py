@@ -0,0 +1,294 @@
+"""
+Métricas de Memoria - Etapa 2: Parsing y Extracción
+Procesador de Fatiga SACS v1.0
+
+Contabilidad de memoria opcional por etapa del procesamiento (parsing del
+archivo, construcción del ParseResult, consolidación y exportación).
+
+Por cada etapa se registra:
+- Pico de tracemalloc (bytes asignados por Python sobre el nivel al
+  iniciar la etapa) y la memoria que queda retenida al terminar
+- RSS del proceso antes/después (delta) y el pico de RSS del proceso
+- Bytes por elemento (pico de tracemalloc / elementos de la etapa)
+
+Con esto se dimensiona el número de workers y el tamaño de lote para un
+servidor a partir de mediciones reales. tracemalloc hace el parsing
+~2x más lento, por eso todo es opcional: sin RunMetrics no se mide nada y
+con RunMetrics(trace=False) solo se toma el RSS (sin costo apreciable).
+
+Solo usa la biblioteca estándar (tracemalloc se importa al medir): lo
+importa ftg_parser al arrancar. El RSS actual se lee de /proc (Linux); en
+otras plataformas se usa psutil si está instalado y, si no, se reporta
+como no disponible (macOS sin psutil solo tiene el pico, vía resource).
+"""
+
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import resource
+except ImportError:     # Windows
+    resource = None
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+def _psutil_memory():
+    """memory_info() del proceso vía psutil, o None si no está instalado."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info()
+
+
+def rss_bytes() -> Optional[int]:
+    """
+    RSS actual del proceso.
+
+    Lee /proc/self/statm (Linux); en otras plataformas usa psutil si está
+    instalado.
+
+    Returns:
+        Bytes residentes, o None si la plataforma no lo expone
+    """
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    info = _psutil_memory()
+    return info.rss if info is not None else None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Pico de RSS del proceso desde su inicio.
+
+    Usa resource (Linux, macOS); en Windows, psutil si está instalado.
+
+    Returns:
+        Bytes, o None si la plataforma no lo expone
+    """
+    if resource is None:
+        info = _psutil_memory()
+        return getattr(info, 'peak_wset', None)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KiB, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+@dataclass
+class StageMemory:
+    """
+    Memoria usada por una etapa.
+
+    Attributes:
+        stage: Nombre de la etapa ('parse_file', 'parse_result', ...)
+        elements: Elementos procesados/producidos por la etapa
+        seconds: Duración
+        traced_peak: Pico de tracemalloc sobre el nivel inicial (None sin trace)
+        traced_retained: Bytes de tracemalloc retenidos al terminar
+        rss_before: RSS al iniciar (None si no disponible)
+        rss_after: RSS al terminar
+        peak_rss: Pico de RSS del proceso al terminar
+    """
+    stage: str
+    elements: int = 0
+    seconds: float = 0.0
+    traced_peak: Optional[int] = None
+    traced_retained: Optional[int] = None
+    rss_before: Optional[int] = None
+    rss_after: Optional[int] = None
+    peak_rss: Optional[int] = None
+
+    @property
+    def rss_delta(self) -> Optional[int]:
+        """Variación de RSS durante la etapa."""
+        if self.rss_before is None or self.rss_after is None:
+            return None
+        return self.rss_after - self.rss_before
+
+    @property
+    def bytes_per_element(self) -> Optional[float]:
+        """Pico de tracemalloc por elemento (None sin trace o sin elementos)."""
+        if self.traced_peak is None or not self.elements:
+            return None
+        return self.traced_peak / self.elements
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen de la etapa.
+
+        Returns:
+            dict: Mediciones y valores derivados
+        """
+        return {
+            'stage': self.stage,
+            'elements': self.elements,
+            'seconds': round(self.seconds, 4),
+            'traced_peak': self.traced_peak,
+            'traced_retained': self.traced_retained,
+            'rss_delta': self.rss_delta,
+            'peak_rss': self.peak_rss,
+            'bytes_per_element': (None if self.bytes_per_element is None
+                                  else round(self.bytes_per_element, 1))
+        }
+
+    def __repr__(self) -> str:
+        return (f"StageMemory(stage={self.stage!r}, elements={self.elements}, "
+                f"traced_peak={self.traced_peak}, rss_delta={self.rss_delta})")
+
+
+class RunMetrics:
+    """
+    Métricas de memoria de una corrida, una entrada por etapa medida.
+
+    Las etapas pueden anidarse: el pico de una etapa externa incluye los de
+    sus etapas internas.
+
+    Attributes:
+        trace: Si True usa tracemalloc (picos y bytes por elemento)
+        stages: Lista de StageMemory en orden de finalización
+
+    Examples:
+        >>> metrics = RunMetrics()
+        >>> result = parse_fatigue_file('ftglstE1.txt', metrics=metrics)
+        >>> write_elements_csv(result.to_table(), 'salida.csv', metrics=metrics)
+        >>> print(metrics.format_report())
+    """
+
+    def __init__(self, trace: bool = True):
+        """
+        Args:
+            trace: Medir con tracemalloc además de RSS
+        """
+        self.trace = trace
+        self.stages = []
+        self._active = []     # [StageMemory, nivel inicial, pico absoluto]
+
+    @contextmanager
+    def stage(self, name: str, elements=None):
+        """
+        Mide una etapa.
+
+        Args:
+            name: Nombre de la etapa
+            elements: Número de elementos, o callable que lo devuelve al
+                      terminar la etapa (también puede asignarse
+                      record.elements dentro del bloque)
+
+        Yields:
+            StageMemory (se completa y agrega a stages al salir)
+        """
+        record = StageMemory(name)
+        started_tracing = False
+        if self.trace:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            current, peak = tracemalloc.get_traced_memory()
+            if self._active:
+                # Conservar el pico de la etapa externa antes de reiniciarlo
+                outer = self._active[-1]
+                outer[2] = max(outer[2], peak)
+            tracemalloc.reset_peak()
+        else:
+            current = 0
+        frame = [record, current, current]
+        self._active.append(frame)
+
+        record.rss_before = rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            self._active.pop()
+            if self.trace:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(frame[2], peak)
+                record.traced_peak = peak - frame[1]
+                record.traced_retained = current - frame[1]
+                if self._active:
+                    outer = self._active[-1]
+                    outer[2] = max(outer[2], peak)
+                if started_tracing:
+                    tracemalloc.stop()
+            record.rss_after = rss_bytes()
+            record.peak_rss = peak_rss_bytes()
+            if callable(elements):
+                elements = elements()
+            if elements is not None:
+                record.elements = elements
+            self.stages.append(record)
+            logger.debug(f"Memoria {record!r}")
+
+    def get(self, name: str) -> Optional[StageMemory]:
+        """Última medición de una etapa por nombre (None si no se midió)."""
+        return next((s for s in reversed(self.stages) if s.stage == name), None)
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen de la corrida.
+
+        Returns:
+            dict: Etapas medidas, mayor pico de tracemalloc y pico de RSS
+        """
+        peaks = [s.traced_peak for s in self.stages if s.traced_peak is not None]
+        rss = [s.peak_rss for s in self.stages if s.peak_rss is not None]
+        return {
+            'stages': [s.get_summary() for s in self.stages],
+            'max_traced_peak': max(peaks) if peaks else None,
+            'peak_rss': max(rss) if rss else None
+        }
+
+    def format_report(self) -> str:
+        """
+        Tabla de texto con una fila por etapa (MB y bytes/elemento).
+
+        Returns:
+            Reporte listo para imprimir
+        """
+        def mb(value):
+            return '-' if value is None else f"{value / 1e6:.1f}"
+
+        lines = [f"{'ETAPA':<14} {'ELEMENTOS':>10} {'SEG':>7} {'PICO MB':>8} "
+                 f"{'RET MB':>7} {'ΔRSS MB':>8} {'B/ELEM':>8}"]
+        for s in self.stages:
+            per_element = '-' if s.bytes_per_element is None else f"{s.bytes_per_element:.0f}"
+            lines.append(f"{s.stage:<14} {s.elements:>10,} {s.seconds:>7.2f} "
+                         f"{mb(s.traced_peak):>8} {mb(s.traced_retained):>7} "
+                         f"{mb(s.rss_delta):>8} {per_element:>8}")
+        peak = self.get_summary()['peak_rss']
+        if peak is not None:
+            lines.append(f"Pico de RSS del proceso: {peak / 1e6:.1f} MB")
+        return '\n'.join(lines)
+
+    def __repr__(self) -> str:
+        return f"RunMetrics(trace={self.trace}, stages={[s.stage for s in self.stages]})"
+
+
+def track(metrics: Optional[RunMetrics], name: str, elements=None):
+    """
+    Contexto de medición opcional.
+
+    Args:
+        metrics: RunMetrics donde registrar la etapa, o None (no mide)
+        name: Nombre de la etapa
+        elements: Número de elementos o callable (ver RunMetrics.stage)
+
+    Returns:
+        Context manager (nullcontext si metrics es None)
+    """
+    if metrics is None:
+        return nullcontext()
+    return metrics.stage(name, elements)
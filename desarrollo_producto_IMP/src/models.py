@@ -3,11 +3,37 @@ Modelos de Datos - Etapa 2: Parsing y Extracción
 Procesador de Fatiga SACS v1.0
 
 Define las estructuras de datos para elementos de fatiga.
+
+numpy se importa solo al crear elementos; las tablas columnares están en
+tables.py para que importar este módulo no cargue dependencias pesadas.
 """
 
 from dataclasses import dataclass
-from typing import Optional
-import numpy as np
+from functools import cached_property
+from typing import Optional, TYPE_CHECKING
+
+from member_keys import canonical_key, key_digest
+
+if TYPE_CHECKING:
+    import numpy as np
+    from tables import ElementTable, LoadCaseDetails
+    from diagnostics import DiagnosticsCollector
+
+
+# Ubicaciones circunferenciales en el orden de las columnas de SACS
+LOCATIONS = ['TOP', 'TOP-LEFT', 'LEFT', 'BOT-LEFT',
+             'BOT', 'BOT-RIGHT', 'RIGHT', 'TOP-RIGHT']
+
+# Módulo numpy, cargado al crear el primer elemento
+_np = None
+
+
+def _load_numpy():
+    """Importa numpy una sola vez (fuera del camino de cada elemento)."""
+    global _np
+    import numpy
+    _np = numpy
+    return numpy
 
 
 @dataclass
@@ -25,10 +51,12 @@ class FatigueElement:
     joint: str
     member: str
     grup: str
-    damages: np.ndarray
+    damages: 'np.ndarray'
     
     def __post_init__(self):
         """Validación después de inicialización."""
+        np = _np or _load_numpy()
+        
         if not isinstance(self.damages, np.ndarray):
             self.damages = np.array(self.damages, dtype=np.float64)
         
@@ -45,6 +73,21 @@ class FatigueElement:
         """
         return f"{self.joint}_{self.member}_{self.grup}"
     
+    @property
+    def canonical_key(self) -> str:
+        """
+        Clave con el MEMBER en forma canónica (ver member_keys).
+        
+        Returns:
+            String "JOINT_MEMBER_GRUP" (ej: "0003_0005-802L_16A")
+        """
+        return canonical_key(self.joint, self.member, self.grup)
+    
+    @cached_property
+    def key_digest(self) -> bytes:
+        """Digest de 128 bits de la clave canónica (se calcula una vez)."""
+        return key_digest(self.joint, self.member, self.grup)
+    
     @property
     def max_damage(self) -> float:
         """
@@ -63,9 +106,7 @@ class FatigueElement:
         Returns:
             str: Ubicación con mayor daño (TOP, TOP-LEFT, etc.)
         """
-        locations = ['TOP', 'TOP-LEFT', 'LEFT', 'BOT-LEFT', 
-                     'BOT', 'BOT-RIGHT', 'RIGHT', 'TOP-RIGHT']
-        return locations[int(self.damages.argmax())]
+        return LOCATIONS[int(self.damages.argmax())]
     
     def to_dict(self) -> dict:
         """
@@ -105,14 +146,36 @@ class ParseResult:
     Attributes:
         elements: Diccionario de elementos {unique_key: FatigueElement}
         total_elements: Número total de elementos parseados
-        errors: Lista de errores encontrados durante el parsing
-        warnings: Lista de advertencias
+        errors: Lista de errores encontrados durante el parsing (acotada a
+                los primeros mensajes de cada código si hay diagnostics)
+        warnings: Lista de advertencias (ídem)
+        load_details: Filas de detalle por caso de carga (solo si el parser
+                      se creó con capture_details=True)
+        diagnostics: Diagnósticos estructurados con conteos completos
+        reports: Resultados de los extractores de otros reportes
+                 {nombre: SectionTable} (solo si el parser se creó con
+                 extractors)
     """
     elements: dict
     total_elements: int
     errors: list
     warnings: list
     
+    load_details: Optional['LoadCaseDetails'] = None
+    diagnostics: Optional['DiagnosticsCollector'] = None
+    reports: Optional[dict] = None
+    
+    @property
+    def error_count(self) -> int:
+        """Errores totales (incluye los que no se formatearon en errors)."""
+        return self.diagnostics.error_count if self.diagnostics is not None else len(self.errors)
+    
+    @property
+    def warning_count(self) -> int:
+        """Advertencias totales (incluye las que no se formatearon en warnings)."""
+        return (self.diagnostics.warning_count if self.diagnostics is not None
+                else len(self.warnings))
+    
     def get_element(self, key: str) -> Optional[FatigueElement]:
         """
         Obtiene un elemento por su clave única.
@@ -125,6 +188,17 @@ class ParseResult:
         """
         return self.elements.get(key)
     
+    def to_table(self) -> 'ElementTable':
+        """
+        Convierte los elementos a representación columnar.
+        
+        Returns:
+            ElementTable con las filas en el orden de self.elements
+        """
+        from tables import ElementTable
+        
+        return ElementTable.from_elements(self.elements.values())
+    
     def get_summary(self) -> dict:
         """
         Genera resumen del resultado del parsing.
@@ -136,8 +210,8 @@ class ParseResult:
             return {
                 'total_elements': 0,
                 'max_damage_overall': 0.0,
-                'errors_count': len(self.errors),
-                'warnings_count': len(self.warnings)
+                'errors_count': self.error_count,
+                'warnings_count': self.warning_count
             }
         
         # Encontrar elemento con mayor daño
@@ -148,11 +222,12 @@ class ParseResult:
             'max_damage_overall': max_elem.max_damage,
             'critical_element': max_elem.unique_key,
             'critical_location': max_elem.critical_location,
-            'errors_count': len(self.errors),
-            'warnings_count': len(self.warnings)
+            'errors_count': self.error_count,
+            'warnings_count': self.warning_count
         }
     
     def __repr__(self) -> str:
         """Representación string del resultado."""
         return (f"ParseResult(elements={self.total_elements}, "
-                f"errors={len(self.errors)}, warnings={len(self.warnings)})")
+                f"errors={self.error_count}, warnings={self.warning_count})")
+
@@ -0,0 +1,283 @@
+"""
+Consolidación Fuera de Memoria - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Consolidación para estudios de extensión de vida con muchos periodos y
+plataformas grandes, donde el stack (F, N, 8) de aggregator.stack_results
+no cabe en la RAM de la máquina.
+
+Cada elemento recibe un ID entero en orden de primera aparición,
+recorriendo los archivos por nombre (no en el orden del diccionario de
+entrada como stack_results; ver consolidate_out_of_core). El daño
+acumulado vive en un archivo en disco (N, 8) float64, con la compensación
+de Neumaier en un segundo archivo (<ruta>.comp), y los archivos se
+procesan de a uno en orden canónico (nombre): las filas de cada
+archivo se ordenan por ID y se suman por ventanas contiguas del
+acumulador, mapeando solo la ventana activa con np.memmap. El tamaño de
+ventana sale de memory_budget, de modo que la memoria de trabajo de la
+suma no depende del número de archivos ni de elementos. Cada elemento
+recibe la misma secuencia de pasos de suma que en
+aggregator.compensated_sum, así que el daño consolidado es idéntico bit a
+bit al de consolidate.
+
+Lo que sí queda en RAM: la tabla del archivo en proceso y los
+identificadores (JOINT/MEMBER/GRUP y el diccionario clave → ID), unos
+~150 bytes por elemento único, frente a F × 64 bytes del stack en memoria.
+"""
+
+import logging
+from array import array
+from typing import Optional, Union
+
+import numpy as np
+
+from aggregator import as_table, last_occurrence, neumaier_add, warn_duplicates
+from ftg_parser import parse_fatigue_file
+from memory_profile import RunMetrics, track
+from models import ParseResult
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Memoria de trabajo por defecto para la suma por ventanas
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+# Bytes por fila de ventana: suma y compensación mapeadas y reunidas,
+# filas del archivo, temporales del paso de Neumaier + ID
+WINDOW_ROW_BYTES = 8 * 8 * 8 + 8
+
+ROW_BYTES = 8 * 8
+
+
+class DamageAccumulator:
+    """
+    Acumulador de daño (N, 8) en disco indexado por ID entero de elemento.
+
+    La suma es compensada (Neumaier); para un resultado reproducible los
+    archivos deben agregarse en orden canónico (consolidate_out_of_core
+    los ordena por nombre).
+
+    Examples:
+        >>> acc = DamageAccumulator('/scratch/IMP-A.dmg', memory_budget=32 * 2**20)
+        >>> for path in periodos:
+        ...     acc.add_table(parse_fatigue_file(path).to_table())
+        >>> table = acc.to_table()     # daños respaldados por el archivo
+    """
+
+    def __init__(self, path: str, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        """
+        Args:
+            path: Archivo del acumulador (se crea vacío; debe existir mientras
+                  se use la tabla devuelta por to_table). La compensación
+                  se guarda en path + '.comp'
+            memory_budget: Bytes de memoria de trabajo por ventana
+
+        Raises:
+            ValueError: Si memory_budget no alcanza para una fila
+        """
+        if memory_budget < WINDOW_ROW_BYTES:
+            raise ValueError(f"memory_budget debe ser al menos {WINDOW_ROW_BYTES} bytes")
+
+        self.path = path
+        self.compensation_path = f"{path}.comp"
+        self.window_rows = memory_budget // WINDOW_ROW_BYTES
+        self.file_count = 0
+        self.duplicate_rows = 0
+
+        self._ids = {}                 # (hash, verificación) de la clave canónica → ID
+        self._joint_codes = array('i')
+        self._joint_ids = {}
+        self._grup_codes = array('i')
+        self._grup_ids = {}
+        self._members = []
+
+        for p in (path, self.compensation_path):
+            with open(p, 'wb'):
+                pass
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _assign_ids(self, table: ElementTable) -> np.ndarray:
+        """
+        IDs de las filas de la tabla; las claves nuevas se registran.
+
+        Las filas se identifican por el digest de 128 bits de su clave
+        canónica (ver member_keys), igual que en stack_results.
+        """
+        ids = np.empty(len(table), dtype=np.int64)
+        joints, grups = table.joints, table.grups
+        for i, key in enumerate(map(tuple, table.key_hashes.tolist())):
+            element_id = self._ids.get(key)
+            if element_id is None:
+                element_id = self._ids[key] = len(self._members)
+                self._joint_codes.append(
+                    self._joint_ids.setdefault(joints[i], len(self._joint_ids)))
+                self._grup_codes.append(
+                    self._grup_ids.setdefault(grups[i], len(self._grup_ids)))
+                self._members.append(table.members[i])
+            ids[i] = element_id
+        return ids
+
+    def add_table(self, table: ElementTable, name: str = ''):
+        """
+        Suma los daños de un archivo al acumulador.
+
+        Con claves canónicas repetidas dentro del archivo gana la última
+        fila (igual que stack_results); las reemplazadas se cuentan en
+        duplicate_rows y se advierten en el log.
+
+        Args:
+            table: Tabla de un archivo
+            name: Nombre del archivo para la advertencia de repetidas
+        """
+        ids = self._assign_ids(table)
+        self.file_count += 1
+        if not len(ids):
+            return
+
+        # Una fila por ID (la última), en orden de ID para recorrer el
+        # acumulador por ventanas contiguas
+        rows, ids_once = last_occurrence(ids)
+        replaced = len(ids) - len(rows)
+        self.duplicate_rows += replaced
+        warn_duplicates(name or f"archivo {self.file_count}", replaced)
+        ids = ids_once
+
+        for p in (self.path, self.compensation_path):
+            with open(p, 'r+b') as f:
+                f.truncate(len(self) * ROW_BYTES)     # filas nuevas en cero
+
+        start = 0
+        while start < len(ids):
+            low = int(ids[start])
+            stop = int(np.searchsorted(ids, low + self.window_rows))
+            high = int(ids[stop - 1]) + 1
+            total, compensation = self._windows(low, high, 'r+')
+            index = ids[start:stop] - low
+            partial, error = total[index], compensation[index]
+            neumaier_add(partial, error, table.damages[rows[start:stop]])
+            total[index], compensation[index] = partial, error
+            total.flush()
+            compensation.flush()
+            del total, compensation     # liberar el mapeo antes de la siguiente ventana
+            start = stop
+
+    def _windows(self, low: int, high: int, mode: str) -> tuple:
+        """Ventanas [low, high) de la suma y de la compensación."""
+        return tuple(np.memmap(p, dtype=np.float64, mode=mode,
+                               offset=low * ROW_BYTES, shape=(high - low, 8))
+                     for p in (self.path, self.compensation_path))
+
+    def add(self, result: Union[str, ParseResult, ElementTable],
+            engine: str = 'state_machine', name: str = ''):
+        """
+        Suma un archivo dado como ruta, ParseResult o ElementTable.
+
+        Args:
+            result: Ruta del listado (se parsea y se descarta), ParseResult
+                    o ElementTable
+            engine: Motor de extracción si result es una ruta
+            name: Nombre del archivo para los avisos (default: la ruta)
+        """
+        if isinstance(result, str):
+            name = name or result
+            result = parse_fatigue_file(result, engine=engine)
+        self.add_table(as_table(result), name)
+
+    def to_table(self) -> ElementTable:
+        """
+        Tabla consolidada con los daños respaldados por el archivo.
+
+        Incorpora la compensación acumulada a la suma (por ventanas) y la
+        reinicia en cero.
+
+        Returns:
+            ElementTable cuyo damages es una vista de solo lectura de un
+            np.memmap del archivo
+        """
+        n = len(self)
+        for low in range(0, n, self.window_rows):
+            total, compensation = self._windows(low, min(low + self.window_rows, n), 'r+')
+            total += compensation
+            compensation[:] = 0.0
+            total.flush()
+            compensation.flush()
+            del total, compensation
+        if n:
+            damages = np.memmap(self.path, dtype=np.float64, mode='r', shape=(n, 8))
+        else:
+            damages = np.zeros((0, 8), dtype=np.float64)
+        members = np.empty(n, dtype=object)
+        members[:] = self._members
+        return ElementTable(np.frombuffer(self._joint_codes, dtype=np.int32).copy(),
+                            list(self._joint_ids), members,
+                            np.frombuffer(self._grup_codes, dtype=np.int32).copy(),
+                            list(self._grup_ids), damages)
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen del acumulador.
+
+        Returns:
+            dict: Archivos sumados, elementos, tamaño en disco (suma y
+            compensación) y filas reemplazadas por claves repetidas
+        """
+        return {
+            'path': self.path,
+            'files': self.file_count,
+            'elements': len(self),
+            'disk_bytes': 2 * len(self) * ROW_BYTES,
+            'window_rows': self.window_rows,
+            'duplicate_rows': self.duplicate_rows
+        }
+
+    def __repr__(self) -> str:
+        return (f"DamageAccumulator(path={self.path!r}, files={self.file_count}, "
+                f"elements={len(self)})")
+
+
+def consolidate_out_of_core(results: dict, path: str,
+                            memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                            engine: str = 'state_machine',
+                            metrics: Optional[RunMetrics] = None) -> ElementTable:
+    """
+    Suma los daños de varios archivos por clave con el acumulador en disco.
+
+    Los archivos se suman en orden canónico (nombre), igual que
+    aggregator.consolidate, así que el daño de cada clave es idéntico bit
+    a bit. El orden de filas es el de primera aparición recorriendo los
+    nombres ordenados; consolidate numera por el orden del diccionario,
+    así que las filas solo coinciden en posición si results ya está
+    ordenado por nombre.
+
+    Args:
+        results: Diccionario {nombre_archivo: ruta | ParseResult | ElementTable};
+                 las rutas se parsean de a una
+        path: Archivo del acumulador (debe existir mientras se use la tabla)
+        memory_budget: Bytes de memoria de trabajo por ventana
+        engine: Motor de extracción para las rutas
+        metrics: RunMetrics donde registrar la etapa 'consolidation'
+
+    Returns:
+        ElementTable consolidado (damages respaldado por path)
+
+    Examples:
+        >>> periodos = {os.path.basename(p): p for p in rutas}
+        >>> table = consolidate_out_of_core(periodos, '/scratch/IMP-A.dmg')
+        >>> write_elements_csv(table, 'consolidado.csv')
+    """
+    with track(metrics, 'consolidation') as stage:
+        accumulator = DamageAccumulator(path, memory_budget)
+        for name in sorted(results):
+            accumulator.add(results[name], engine, name)
+            logger.debug(f"Acumulado {name}: {len(accumulator)} elementos únicos")
+        table = accumulator.to_table()
+        if stage is not None:
+            stage.elements = len(table)
+
+    logger.info(f"Consolidados {accumulator.file_count} archivos fuera de memoria: "
+                f"{len(table)} elementos únicos → {path}")
+    return table
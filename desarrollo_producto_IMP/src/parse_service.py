@@ -0,0 +1,409 @@
+"""
+Servicio Local de Parsing - Etapa 2: Parsing Multiproceso
+Procesador de Fatiga SACS v1.0
+
+Servicio HTTP opcional en localhost que mantiene en memoria un pool de
+workers ya inicializados (numpy y el parser importados) y un cache de
+resultados por archivo. Las herramientas internas que piden un archivo a
+la vez evitan así arrancar un intérprete, re-importar dependencias y
+re-parsear archivos sin cambios: la latencia por petición queda cerca del
+tiempo de parsing puro (o del costo de copiar el resultado si está en cache).
+
+Endpoints:
+    GET  /health         Estado del servicio (JSON)
+    POST /parse          {"path": ..., "engine": ...} → tabla binaria
+    POST /consolidate    {"paths": [...], "engine": ...} → tabla binaria
+
+Formato binario de las respuestas (little-endian):
+    b'FTGT' | uint32 largo del encabezado | encabezado JSON | relleno a
+    8 bytes | cuerpo con el layout de shared_results (daños, códigos,
+    MEMBER); el cliente lo decodifica con vistas numpy sin copiar.
+
+Los workers devuelven sus resultados por memoria compartida
+(shared_results; por pickle donde no está disponible, como en Windows),
+de modo que ni el servidor ni el cliente manejan objetos FatigueElement.
+"""
+
+import http.client
+import json
+import logging
+import os
+import struct
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import numpy as np
+
+from ftg_parser import ENGINES
+from tables import ElementTable
+from aggregator import consolidate
+import shared_results
+from shared_results import (
+    ROW_BYTES, SharedParseResult, create_worker_pool, parse_to_shared, table_views
+)
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Resultados por archivo retenidos en memoria (LRU)
+DEFAULT_CACHE_ENTRIES = 64
+
+MAGIC = b'FTGT'
+
+
+def encode_table(table: ElementTable, meta: Optional[dict] = None) -> bytes:
+    """
+    Serializa una tabla al formato binario del servicio.
+
+    Args:
+        table: Tabla a serializar
+        meta: Datos adicionales para el encabezado (deben ser JSON)
+
+    Returns:
+        bytes
+    """
+    members = '\n'.join(table.members.tolist()).encode('utf-8')
+    rows = len(table)
+    header = dict(meta or {}, rows=rows, member_bytes=len(members),
+                  joint_names=list(table.joint_names), grup_names=list(table.grup_names))
+    header_bytes = json.dumps(header).encode('utf-8')
+    prefix_len = len(MAGIC) + 4 + len(header_bytes)
+    padding = -prefix_len % 8
+
+    data = bytearray(prefix_len + padding + rows * ROW_BYTES + len(members))
+    data[:prefix_len] = MAGIC + struct.pack('<I', len(header_bytes)) + header_bytes
+    damages, joint_codes, grup_codes, key_hashes, member_buf = table_views(
+        memoryview(data)[prefix_len + padding:], rows, len(members))
+    damages[:] = table.damages
+    joint_codes[:] = table.joint_codes
+    grup_codes[:] = table.grup_codes
+    key_hashes[:] = table.key_hashes
+    member_buf[:] = np.frombuffer(members, dtype=np.uint8)
+    del damages, joint_codes, grup_codes, key_hashes, member_buf
+    return bytes(data)
+
+
+def decode_table(data: bytes) -> tuple:
+    """
+    Decodifica el formato binario del servicio.
+
+    Los arrays numéricos son vistas de solo lectura sobre data.
+
+    Args:
+        data: Respuesta binaria
+
+    Returns:
+        tuple (ElementTable, encabezado dict)
+
+    Raises:
+        ValueError: Si data no tiene el formato esperado
+    """
+    if data[:4] != MAGIC:
+        raise ValueError("Respuesta sin formato FTGT")
+    (header_len,) = struct.unpack_from('<I', data, 4)
+    prefix_len = 8 + header_len
+    header = json.loads(data[8:prefix_len].decode('utf-8'))
+    body = memoryview(data)[prefix_len + (-prefix_len % 8):]
+
+    rows, member_bytes = header['rows'], header['member_bytes']
+    damages, joint_codes, grup_codes, key_hashes, member_buf = table_views(body, rows,
+                                                                           member_bytes)
+    members = np.empty(rows, dtype=object)
+    members[:] = member_buf.tobytes().decode('utf-8').split('\n') if rows else []
+    table = ElementTable(joint_codes, header['joint_names'], members,
+                         grup_codes, header['grup_names'], damages)
+    table.cache['key_hashes'] = key_hashes
+    return table, header
+
+
+def _warm_worker() -> int:
+    """Tarea vacía que fuerza el arranque de un worker."""
+    return os.getpid()
+
+
+class ParseService:
+    """
+    Servicio de parsing con pool de workers y cache en memoria.
+
+    Examples:
+        >>> with ParseService(port=0) as service:
+        ...     service.start()
+        ...     client = ParseClient(*service.address)
+        ...     table, meta = client.parse('ftglstE1.txt')
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 workers: Optional[int] = None, cache_entries: int = DEFAULT_CACHE_ENTRIES):
+        """
+        Args:
+            host: Interfaz (solo localhost por defecto)
+            port: Puerto (0 = cualquiera libre)
+            workers: Procesos worker (default: os.cpu_count())
+            cache_entries: Resultados por archivo retenidos en memoria
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_entries = cache_entries
+        self.stats = {'requests': 0, 'cache_hits': 0, 'parsed': 0}
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._thread = None
+
+        self.pool = create_worker_pool(self.workers)
+        # Arrancar todos los workers antes de aceptar peticiones
+        pids = {f.result() for f in [self.pool.submit(_warm_worker)
+                                     for _ in range(self.workers)]}
+        logger.info(f"Pool de parsing listo: {len(pids)} workers")
+
+        handler = type('Handler', (_ServiceHandler,), {'service': self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+
+    @property
+    def address(self) -> tuple:
+        """(host, puerto) en el que escucha el servicio."""
+        return self.httpd.server_address[:2]
+
+    def _cache_key(self, path: str, engine: str) -> tuple:
+        """Clave de cache: el archivo cambia si cambia tamaño o mtime."""
+        st = os.stat(path)
+        return (os.path.realpath(path), st.st_size, st.st_mtime_ns, engine)
+
+    def parse_many(self, paths: list, engine: str = 'state_machine') -> list:
+        """
+        Parsea archivos usando el cache; los faltantes se parsean en paralelo.
+
+        Args:
+            paths: Rutas de los archivos
+            engine: Motor de extracción
+
+        Returns:
+            Lista de (ElementTable, meta) en el orden de paths
+
+        Raises:
+            FileNotFoundError: Si algún archivo no existe
+            ValueError: Si el motor no existe
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Motor desconocido: {engine}")
+        keys = [self._cache_key(path, engine) for path in paths]
+
+        entries, futures = {}, {}
+        with self._lock:
+            for key in keys:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    entries[key] = self._cache[key]
+                    self.stats['cache_hits'] += 1
+        for key in keys:
+            if key not in entries and key not in futures:
+                futures[key] = self.pool.submit(parse_to_shared, key[0], engine,
+                                                shared_results.SHARED_MEMORY)
+
+        pending = dict(futures)
+        try:
+            for key, future in futures.items():
+                handle = future.result()
+                del pending[key]
+                with SharedParseResult(handle) as shared:
+                    entries[key] = (shared.copy_table(), {
+                        'source': key[0],
+                        'total_elements': shared.total_elements,
+                        'errors': shared.errors,
+                        'warnings': shared.warnings
+                    })
+        except BaseException:
+            # Liberar los segmentos de las tareas que sí terminaron
+            for future in pending.values():
+                if not future.cancel() and future.exception() is None:
+                    SharedParseResult(future.result()).release()
+            raise
+
+        with self._lock:
+            self.stats['parsed'] += len(futures)
+            for key in futures:
+                self._cache[key] = entries[key]
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+
+        return [entries[key] for key in keys]
+
+    def health(self) -> dict:
+        """Estado del servicio."""
+        with self._lock:
+            return dict(self.stats, workers=self.workers, cached=len(self._cache))
+
+    def start(self):
+        """Atiende peticiones en un hilo de fondo."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever,
+                                        name='ftg-parse-service', daemon=True)
+        self._thread.start()
+
+    def serve_forever(self):
+        """Atiende peticiones en el hilo actual hasta Ctrl+C o close()."""
+        try:
+            self.httpd.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Servicio detenido por el usuario")
+
+    def close(self):
+        """Detiene el servidor y el pool de workers."""
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+        self.pool.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> 'ParseService':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _ServiceHandler(BaseHTTPRequestHandler):
+    """Manejador HTTP (conexiones persistentes HTTP/1.1)."""
+
+    protocol_version = 'HTTP/1.1'
+    service: ParseService = None
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: dict):
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, self.service.health())
+        else:
+            self._send_json(404, {'error': f"Ruta desconocida: {self.path}"})
+
+    def do_POST(self):
+        with self.service._lock:
+            self.service.stats['requests'] += 1
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            engine = request.get('engine', 'state_machine')
+
+            if self.path == '/parse':
+                (table, meta), = self.service.parse_many([request['path']], engine)
+            elif self.path == '/consolidate':
+                parsed = self.service.parse_many(list(request['paths']), engine)
+                table = consolidate({meta['source']: t for t, meta in parsed})
+                meta = {
+                    'sources': [meta['source'] for _, meta in parsed],
+                    'total_elements': len(table),
+                    'errors': [f"{os.path.basename(m['source'])}: {e}"
+                               for _, m in parsed for e in m['errors']],
+                    'warnings': [f"{os.path.basename(m['source'])}: {w}"
+                                 for _, m in parsed for w in m['warnings']]
+                }
+            else:
+                self._send_json(404, {'error': f"Ruta desconocida: {self.path}"})
+                return
+        except FileNotFoundError as e:
+            self._send_json(404, {'error': str(e)})
+            return
+        except (KeyError, ValueError, TypeError) as e:
+            self._send_json(400, {'error': f"Petición inválida: {e!r}"})
+            return
+        except Exception as e:
+            logger.exception("Error atendiendo petición")
+            self._send_json(500, {'error': str(e)})
+            return
+
+        self._send(200, encode_table(table, meta), 'application/octet-stream')
+
+
+class ParseClient:
+    """
+    Cliente del servicio local (una conexión persistente).
+
+    Examples:
+        >>> with ParseClient() as client:
+        ...     table, meta = client.consolidate(['ftglstE1.txt', 'ftglstE2.txt'])
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 timeout: float = 600.0):
+        self._conn = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def _request(self, method: str, path: str, payload: Optional[dict] = None) -> bytes:
+        """
+        Envía una petición y retorna el cuerpo de la respuesta.
+
+        Raises:
+            FileNotFoundError: Respuesta 404 por archivo inexistente
+            ValueError: Respuesta 400
+            RuntimeError: Cualquier otro error del servicio
+        """
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        self._conn.request(method, path, body=body, headers=headers)
+        response = self._conn.getresponse()
+        data = response.read()
+        if response.status == 200:
+            return data
+
+        message = json.loads(data).get('error', '') if data else response.reason
+        if response.status == 404:
+            raise FileNotFoundError(message)
+        if response.status == 400:
+            raise ValueError(message)
+        raise RuntimeError(f"Error del servicio ({response.status}): {message}")
+
+    def health(self) -> dict:
+        """Estado del servicio."""
+        return json.loads(self._request('GET', '/health'))
+
+    def parse(self, path: str, engine: str = 'state_machine') -> tuple:
+        """
+        Parsea un archivo en el servicio.
+
+        Args:
+            path: Ruta del archivo (relativa al directorio del cliente)
+            engine: Motor de extracción
+
+        Returns:
+            tuple (ElementTable, meta con total_elements, errors, warnings)
+        """
+        return decode_table(self._request('POST', '/parse', {
+            'path': os.path.abspath(path), 'engine': engine}))
+
+    def consolidate(self, paths: list, engine: str = 'state_machine') -> tuple:
+        """
+        Parsea y consolida varios archivos en el servicio.
+
+        Args:
+            paths: Rutas de los archivos
+            engine: Motor de extracción
+
+        Returns:
+            tuple (ElementTable consolidado, meta)
+        """
+        return decode_table(self._request('POST', '/consolidate', {
+            'paths': [os.path.abspath(p) for p in paths], 'engine': engine}))
+
+    def close(self):
+        """Cierra la conexión."""
+        self._conn.close()
+
+    def __enter__(self) -> 'ParseClient':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
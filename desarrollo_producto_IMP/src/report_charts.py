@@ -0,0 +1,248 @@
+"""
+Gráficos del Reporte - Etapa 5: Exportación y Reportes
+Procesador de Fatiga SACS v1.0
+
+Gráficos integrados del reporte Excel/PDF (opción "Incluir gráficos"):
+distribución de daño, top de elementos críticos y daño máximo por GRUP.
+
+Los gráficos no dibujan un punto o barra por elemento: se construyen a
+partir de agregados de tamaño fijo calculados sobre la matriz de daño
+(histograma por década, top-K por argpartition, máximo por grupo de
+group_statistics). Calcular los agregados es O(N) una vez (quedan en
+table.cache); dibujarlos cuesta lo mismo con 2.000 o con 2 millones de
+elementos.
+
+El dibujo es offscreen (Figure + FigureCanvasAgg, sin pyplot ni ventanas)
+y puede correr en un proceso aparte mientras se escribe el Excel:
+ChartData es pequeño y se envía al worker por pickle. matplotlib es
+opcional y se importa solo al dibujar.
+"""
+
+import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from csv_export import damage_order
+from group_stats import DEFAULT_DECADES, DEFAULT_THRESHOLD, group_statistics
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Elementos del gráfico de críticos (plan de etapas: top 10)
+DEFAULT_TOP_K = 10
+
+# Grupos mostrados en el gráfico por GRUP (los de mayor daño)
+DEFAULT_MAX_GROUPS = 30
+
+# Archivos generados por render_charts (sin extensión)
+CHART_NAMES = ('distribucion_dano', 'top_criticos', 'maximo_por_grup')
+
+
+@dataclass
+class ChartData:
+    """
+    Agregados de tamaño fijo para los gráficos del reporte.
+
+    Attributes:
+        histogram_labels: Etiqueta de cada década de daño
+        histogram_counts: Elementos por década (B,)
+        top_keys: UNIQUE_KEY de los elementos más críticos (K,)
+        top_damage: MAX_DAMAGE de esos elementos (K,)
+        group_names: GRUP con mayor daño máximo (G,)
+        group_max: Daño máximo de cada uno (G,)
+        other_groups: Grupos restantes no mostrados
+        total_elements: Elementos de la tabla de origen
+        threshold: Umbral de daño marcado en los gráficos
+    """
+    histogram_labels: list
+    histogram_counts: np.ndarray
+    top_keys: list
+    top_damage: np.ndarray
+    group_names: list
+    group_max: np.ndarray
+    other_groups: int
+    total_elements: int
+    threshold: float
+
+    @property
+    def n_points(self) -> int:
+        """Barras dibujadas en total (no depende del número de elementos)."""
+        return len(self.histogram_counts) + len(self.top_damage) + len(self.group_max)
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen de los agregados.
+
+        Returns:
+            dict: Elementos de origen, barras por gráfico y grupos omitidos
+        """
+        return {
+            'total_elements': self.total_elements,
+            'histogram_bins': len(self.histogram_counts),
+            'top_elements': len(self.top_damage),
+            'groups_shown': len(self.group_max),
+            'other_groups': self.other_groups
+        }
+
+    def __repr__(self) -> str:
+        return f"ChartData(elements={self.total_elements}, points={self.n_points})"
+
+
+def chart_data(table: ElementTable, top_k: int = DEFAULT_TOP_K,
+               max_groups: int = DEFAULT_MAX_GROUPS,
+               threshold: float = DEFAULT_THRESHOLD,
+               decades: tuple = DEFAULT_DECADES) -> ChartData:
+    """
+    Calcula los agregados de los gráficos (se guardan en table.cache).
+
+    Args:
+        table: Tabla de elementos (individual o consolidada)
+        top_k: Elementos del gráfico de críticos
+        max_groups: GRUP mostrados (los de mayor daño máximo)
+        threshold: Umbral de daño marcado en los gráficos
+        decades: Rango de décadas del histograma
+
+    Returns:
+        ChartData
+    """
+    cache_key = ('chart_data', top_k, max_groups, threshold, tuple(decades))
+    if cache_key in table.cache:
+        return table.cache[cache_key]
+
+    stats = group_statistics(table, 'grup', decades)
+    top_rows = damage_order(table, top_k=top_k)
+    top = table.take(top_rows)
+
+    nonempty = np.flatnonzero(stats.count)
+    by_max = nonempty[np.argsort(-stats.max[nonempty], kind='stable')]
+    shown = by_max[:max_groups]
+
+    data = ChartData(
+        histogram_labels=list(stats.labels),
+        histogram_counts=stats.histogram.sum(axis=0),
+        top_keys=top.unique_keys.tolist(),
+        top_damage=table.max_damage[top_rows],
+        group_names=[stats.names[g] for g in shown],
+        group_max=stats.max[shown],
+        other_groups=len(by_max) - len(shown),
+        total_elements=len(table),
+        threshold=threshold
+    )
+    table.cache[cache_key] = data
+    return data
+
+
+def _figure(figsize: tuple):
+    """Figura offscreen con canvas Agg (no usa pyplot ni el backend global)."""
+    try:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+    except ImportError as e:
+        raise ImportError("matplotlib es necesario para generar gráficos "
+                          "(conda install matplotlib)") from e
+
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _bar_chart(labels: list, values: np.ndarray, title: str, ylabel: str,
+               threshold: Optional[float] = None, log: bool = False,
+               figsize: tuple = (10, 5)):
+    """Gráfico de barras con etiquetas rotadas y umbral opcional."""
+    figure = _figure(figsize)
+    ax = figure.add_subplot()
+    positions = np.arange(len(values))
+    ax.bar(positions, values, color='#366092')
+    ax.set_xticks(positions)
+    ax.set_xticklabels(labels, rotation=60, ha='right', fontsize=8)
+    ax.set_title(title)
+    ax.set_ylabel(ylabel)
+    if log and len(values) and (np.asarray(values) > 0).all():
+        ax.set_yscale('log')
+    if threshold is not None:
+        ax.axhline(threshold, color='#C00000', linestyle='--', linewidth=1,
+                   label=f"Umbral {threshold:g}")
+        ax.legend()
+    figure.tight_layout()
+    return figure
+
+
+def render_charts(data: ChartData, output_dir: str, fmt: str = 'png',
+                  dpi: int = 100) -> dict:
+    """
+    Dibuja los gráficos del reporte a archivos.
+
+    Args:
+        data: Agregados de chart_data()
+        output_dir: Carpeta de salida (se crea si no existe)
+        fmt: Formato de imagen ('png' para Excel, 'pdf'/'svg' para el PDF)
+        dpi: Resolución
+
+    Returns:
+        dict {nombre de gráfico: ruta}
+
+    Raises:
+        ImportError: Si matplotlib no está instalado
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    figures = {
+        'distribucion_dano': _bar_chart(
+            data.histogram_labels, data.histogram_counts,
+            f"Distribución de daño ({data.total_elements:,} elementos)",
+            'Elementos'),
+        'top_criticos': _bar_chart(
+            data.top_keys, data.top_damage,
+            f"Top {len(data.top_keys)} elementos críticos", 'Daño acumulado',
+            threshold=data.threshold),
+        'maximo_por_grup': _bar_chart(
+            data.group_names, data.group_max,
+            "Daño máximo por GRUP" + (f" (+{data.other_groups} grupos)"
+                                      if data.other_groups else ""),
+            'Daño máximo', threshold=data.threshold, log=True),
+    }
+
+    paths = {}
+    for name in CHART_NAMES:
+        paths[name] = os.path.join(output_dir, f"{name}.{fmt}")
+        figures[name].savefig(paths[name], dpi=dpi)
+    logger.info(f"Gráficos generados en {output_dir}: {len(paths)} ({data!r})")
+    return paths
+
+
+def render_charts_async(data: ChartData, output_dir: str, fmt: str = 'png',
+                        dpi: int = 100, executor=None) -> Future:
+    """
+    Dibuja los gráficos en otro proceso mientras el llamador escribe el Excel.
+
+    Args:
+        data: Agregados de chart_data()
+        output_dir: Carpeta de salida
+        fmt: Formato de imagen
+        dpi: Resolución
+        executor: Executor a usar (default: un proceso dedicado que termina
+                  al completar la tarea)
+
+    Returns:
+        Future con el dict {nombre: ruta} de render_charts
+
+    Examples:
+        >>> future = render_charts_async(chart_data(table), 'reporte/graficos')
+        >>> write_elements_csv(table, 'reporte/fatiga_consolidada.csv')
+        >>> charts = future.result()
+    """
+    if executor is not None:
+        return executor.submit(render_charts, data, output_dir, fmt, dpi)
+
+    executor = ProcessPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(render_charts, data, output_dir, fmt, dpi)
+    finally:
+        # La tarea enviada se completa; el proceso termina después
+        executor.shutdown(wait=False)
@@ -0,0 +1,239 @@
+"""
+Visor de Resultados - Etapa 4: Interfaz Gráfica (GUI)
+Procesador de Fatiga SACS v1.0
+
+Backend paginado para la pantalla "Ver Resultados".
+
+Insertar todos los elementos de un consolidado grande en un ttk.Treeview
+congela la interfaz. ResultView sirve en cambio ventanas de filas
+ordenadas y filtradas a partir del ElementTable: la GUI solo materializa
+la página visible (row_tuples de csv_export) y pide la siguiente al
+desplazarse.
+
+Para cada columna se calcula una sola vez la permutación de orden
+ascendente (argsort estable; JOINT/GRUP por rango de su categoría) y se
+guarda en table.cache. Cambiar de columna o de sentido reutiliza la
+permutación (el descendente es la vista invertida); con un filtro activo
+la vista se obtiene recorriendo la permutación con la máscara, O(N) en
+numpy. No importa tkinter: la GUI lo envuelve.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+
+from csv_export import CSV_COLUMNS, row_tuples
+from models import LOCATIONS
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Columnas de daño (permutaciones que conviene precalcular)
+DAMAGE_COLUMNS = (*LOCATIONS, 'MAX_DAMAGE')
+
+# Filas por página por defecto (alto típico del Treeview)
+DEFAULT_PAGE_ROWS = 50
+
+
+def _category_ranks(names: list) -> np.ndarray:
+    """Posición de cada código de categoría en el orden alfabético de nombres."""
+    ranks = np.empty(len(names), dtype=np.int64)
+    ranks[np.argsort(np.array(names, dtype=str), kind='stable')] = np.arange(len(names))
+    return ranks
+
+
+def sort_order(table: ElementTable, column: str) -> np.ndarray:
+    """
+    Permutación ascendente (estable) de las filas por una columna.
+
+    Se calcula una vez por tabla y columna y se guarda en table.cache.
+
+    Args:
+        table: Tabla de elementos
+        column: Nombre de columna de CSV_COLUMNS
+
+    Returns:
+        Array int64 (N,) de índices de fila
+
+    Raises:
+        ValueError: Si la columna no existe
+    """
+    if column not in CSV_COLUMNS:
+        raise ValueError(f"Columna desconocida '{column}', opciones: {CSV_COLUMNS}")
+
+    cache_key = ('sort_order', column)
+    if cache_key not in table.cache:
+        if column in LOCATIONS:
+            values = table.damages[:, LOCATIONS.index(column)]
+        elif column == 'MAX_DAMAGE':
+            values = table.max_damage
+        elif column == 'CRITICAL_LOCATION':
+            values = table.critical_index
+        elif column == 'JOINT':
+            values = _category_ranks(table.joint_names)[table.joint_codes]
+        elif column == 'GRUP':
+            values = _category_ranks(table.grup_names)[table.grup_codes]
+        elif column == 'MEMBER':
+            values = np.array(table.members.tolist(), dtype=str)
+        else:
+            values = np.array(table.unique_keys.tolist(), dtype=str)
+        table.cache[cache_key] = np.argsort(values, kind='stable').astype(np.int64)
+    return table.cache[cache_key]
+
+
+class ResultView:
+    """
+    Vista ordenada y filtrada de un ElementTable, servida por páginas.
+
+    Attributes:
+        table: Tabla de elementos (individual o consolidada)
+        sort_column: Columna de orden actual
+        descending: Sentido del orden
+
+    Examples:
+        >>> view = ResultView(consolidated, precompute=True)
+        >>> view.sort('MAX_DAMAGE', descending=True)
+        >>> view.set_filter(grups=['24B'], min_damage=0.1)
+        >>> len(view)                      # filas que cumplen el filtro
+        >>> view.page(0, 50)               # primeras 50 tuplas para el Treeview
+    """
+
+    def __init__(self, table: ElementTable, sort_column: str = 'MAX_DAMAGE',
+                 descending: bool = True, precompute: bool = False):
+        """
+        Args:
+            table: Tabla de elementos
+            sort_column: Columna de orden inicial
+            descending: Orden descendente inicial
+            precompute: Calcular ya las permutaciones de las columnas de daño
+                        (al abrir la ventana, para que ordenar sea inmediato)
+        """
+        self.table = table
+        self.sort_column = sort_column
+        self.descending = descending
+        self._mask = None      # filtro activo (bool (N,)) o None
+        self._order = None     # filas de la vista actual (se calcula al pedirla)
+        if precompute:
+            for column in DAMAGE_COLUMNS:
+                sort_order(table, column)
+        sort_order(table, sort_column)
+
+    def sort(self, column: str, descending: bool = False):
+        """
+        Cambia el orden de la vista.
+
+        Args:
+            column: Columna de CSV_COLUMNS
+            descending: True para mayor a menor
+
+        Raises:
+            ValueError: Si la columna no existe
+        """
+        sort_order(self.table, column)
+        self.sort_column = column
+        self.descending = descending
+        self._order = None
+
+    def set_filter(self, grups: Optional[list] = None, joints: Optional[list] = None,
+                   min_damage: Optional[float] = None, member: Optional[str] = None):
+        """
+        Filtra las filas de la vista (sin argumentos quita el filtro).
+
+        Args:
+            grups: GRUP permitidos
+            joints: JOINT permitidos
+            min_damage: MAX_DAMAGE mínimo (inclusive)
+            member: Texto contenido en MEMBER
+        """
+        table = self.table
+        mask = None
+
+        def combine(condition):
+            return condition if mask is None else mask & condition
+
+        if grups is not None:
+            allowed = set(grups)
+            codes = [i for i, name in enumerate(table.grup_names) if name in allowed]
+            mask = combine(np.isin(table.grup_codes, codes))
+        if joints is not None:
+            allowed = set(joints)
+            codes = [i for i, name in enumerate(table.joint_names) if name in allowed]
+            mask = combine(np.isin(table.joint_codes, codes))
+        if min_damage is not None:
+            mask = combine(table.max_damage >= min_damage)
+        if member:
+            mask = combine(np.fromiter((member in m for m in table.members.tolist()),
+                                       dtype=bool, count=len(table)))
+        self._mask = mask
+        self._order = None
+
+    @property
+    def order(self) -> np.ndarray:
+        """Filas de la tabla en el orden de la vista (filtro aplicado)."""
+        if self._order is None:
+            order = sort_order(self.table, self.sort_column)
+            if self.descending:
+                order = order[::-1]
+            if self._mask is not None:
+                order = order[self._mask[order]]
+            self._order = order
+        return self._order
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def rows(self, start: int, count: int = DEFAULT_PAGE_ROWS) -> np.ndarray:
+        """Índices de fila de la tabla para las posiciones [start, start + count)."""
+        start = max(0, start)
+        return self.order[start:start + max(0, count)]
+
+    def page(self, start: int, count: int = DEFAULT_PAGE_ROWS) -> list:
+        """
+        Tuplas de la página (orden de CSV_COLUMNS); solo se materializan esas filas.
+
+        Args:
+            start: Posición de la primera fila en la vista
+            count: Filas de la página
+
+        Returns:
+            Lista de tuplas (vacía fuera de rango)
+        """
+        return row_tuples(self.table, self.rows(start, count))
+
+    def position_of(self, unique_key: str) -> Optional[int]:
+        """
+        Posición de un elemento en la vista (para "ir a" un elemento).
+
+        Args:
+            unique_key: Clave JOINT_MEMBER_GRUP
+
+        Returns:
+            Posición en la vista o None si no está (o está filtrado)
+        """
+        matches = np.flatnonzero(self.table.unique_keys == unique_key)
+        if len(matches) == 0:
+            return None
+        positions = np.flatnonzero(self.order == matches[0])
+        return int(positions[0]) if len(positions) else None
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen de la vista.
+
+        Returns:
+            dict: Filas totales y visibles, orden y filtro
+        """
+        return {
+            'total_rows': len(self.table),
+            'view_rows': len(self),
+            'sort_column': self.sort_column,
+            'descending': self.descending,
+            'filtered': self._mask is not None
+        }
+
+    def __repr__(self) -> str:
+        return (f"ResultView(rows={len(self)}/{len(self.table)}, "
+                f"sort={self.sort_column!r}, descending={self.descending})")
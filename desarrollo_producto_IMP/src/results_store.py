@@ -0,0 +1,326 @@
+"""
+Almacén de Resultados SQLite - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Almacén local opcional de corridas consolidadas en un archivo SQLite:
+corridas, archivos de origen (periodos), elementos, daño por periodo y
+daño consolidado. Permite consultar varias corridas y plataformas (top de
+elementos, filtros por GRUP/JOINT, historial de un elemento) sin volver a
+parsear los listados ni recargar CSVs.
+
+Cada corrida se escribe con un executemany por tabla dentro de una sola
+transacción; los índices sobre GRUP, JOINT, clave y daño máximo hacen que
+las consultas típicas no recorran la tabla completa. Cada elemento guarda
+además su clave canónica (member_keys), de modo que el historial encuentra
+"802L 0005" y "0005-802L" como el mismo elemento.
+"""
+
+import logging
+import sqlite3
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from models import LOCATIONS, ParseResult
+from tables import ElementTable
+from aggregator import DamageStack, stack_results
+from member_keys import canonical_key
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Versión del esquema (PRAGMA user_version)
+SCHEMA_VERSION = 2
+
+# Columnas de daño: TOP → dmg_top, TOP-LEFT → dmg_top_left, ...
+DAMAGE_COLUMNS = tuple('dmg_' + loc.lower().replace('-', '_') for loc in LOCATIONS)
+
+_DAMAGE_DDL = ',\n    '.join(f"{col} REAL NOT NULL" for col in DAMAGE_COLUMNS)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    platform TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS source_files (
+    file_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    total_elements INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    warnings INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS elements (
+    element_id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    joint TEXT NOT NULL,
+    member TEXT NOT NULL,
+    grup TEXT NOT NULL,
+    unique_key TEXT NOT NULL,
+    canonical_key TEXT NOT NULL,
+    UNIQUE (run_id, unique_key)
+);
+CREATE TABLE IF NOT EXISTS period_damage (
+    file_id INTEGER NOT NULL REFERENCES source_files(file_id) ON DELETE CASCADE,
+    element_id INTEGER NOT NULL REFERENCES elements(element_id) ON DELETE CASCADE,
+    {_DAMAGE_DDL},
+    max_damage REAL NOT NULL,
+    PRIMARY KEY (file_id, element_id)
+);
+CREATE TABLE IF NOT EXISTS consolidated_damage (
+    element_id INTEGER PRIMARY KEY REFERENCES elements(element_id) ON DELETE CASCADE,
+    {_DAMAGE_DDL},
+    max_damage REAL NOT NULL,
+    critical_location TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_elements_grup ON elements (grup);
+CREATE INDEX IF NOT EXISTS idx_elements_joint ON elements (joint);
+CREATE INDEX IF NOT EXISTS idx_elements_key ON elements (unique_key);
+CREATE INDEX IF NOT EXISTS idx_elements_canonical ON elements (canonical_key);
+CREATE INDEX IF NOT EXISTS idx_period_element ON period_damage (element_id);
+CREATE INDEX IF NOT EXISTS idx_consolidated_max ON consolidated_damage (max_damage);
+"""
+
+
+def _migrate_v1(conn: sqlite3.Connection):
+    """Versión 1 → 2: agrega la clave canónica a los elementos existentes."""
+    conn.execute("ALTER TABLE elements ADD COLUMN canonical_key TEXT NOT NULL DEFAULT ''")
+    rows = conn.execute("SELECT element_id, joint, member, grup FROM elements").fetchall()
+    conn.executemany("UPDATE elements SET canonical_key = ? WHERE element_id = ?",
+                     ((canonical_key(joint, member, grup), element_id)
+                      for element_id, joint, member, grup in rows))
+
+
+def _damage_rows(keys: tuple, damages: np.ndarray, extra: tuple) -> zip:
+    """Tuplas (*keys, 8 daños, *extra) para executemany (columnas como listas)."""
+    return zip(*keys, *damages.T.tolist(), *extra)
+
+
+class ResultsStore:
+    """
+    Almacén de corridas consolidadas en un archivo SQLite.
+
+    Examples:
+        >>> with ResultsStore('resultados.db') as store:
+        ...     run_id = store.add_run(results, 'Operación 2024', platform='IMP-A')
+        ...     store.top_elements(run_id, k=10, grup='24B')
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre (o crea) el almacén.
+
+        Args:
+            path: Ruta del archivo SQLite (':memory:' para pruebas)
+
+        Raises:
+            ValueError: Si el archivo tiene una versión de esquema más nueva
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            self.conn.close()
+            raise ValueError(f"{path}: versión de esquema {version} no soportada")
+        with self.conn:
+            if version == 1:
+                _migrate_v1(self.conn)
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def add_run(self, results: dict, name: str, platform: str = '',
+                stack: Optional[DamageStack] = None) -> int:
+        """
+        Guarda una corrida consolidada en una sola transacción.
+
+        Args:
+            results: Diccionario {archivo: ParseResult | ElementTable}
+            name: Nombre de la corrida
+            platform: Plataforma analizada
+            stack: DamageStack ya calculado a partir de results (opcional)
+
+        Returns:
+            run_id de la corrida
+        """
+        stack = stack if stack is not None else stack_results(results)
+        table = stack.elements
+        n = len(table)
+
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (name, platform, created_at) VALUES (?, ?, ?)",
+                (name, platform, datetime.now().isoformat(timespec='seconds')))
+            run_id = cursor.lastrowid
+
+            # Ids explícitos y contiguos: evitan releer los ids generados
+            first_id = self.conn.execute(
+                "SELECT COALESCE(MAX(element_id), 0) + 1 FROM elements").fetchone()[0]
+            element_ids = np.arange(first_id, first_id + n, dtype=np.int64)
+
+            joints, members, grups = (table.joints.tolist(), table.members.tolist(),
+                                      table.grups.tolist())
+            self.conn.executemany(
+                "INSERT INTO elements (element_id, run_id, joint, member, grup, unique_key, "
+                "canonical_key) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                zip(element_ids.tolist(), [run_id] * n, joints, members, grups,
+                    table.unique_keys.tolist(), map(canonical_key, joints, members, grups)))
+
+            self.conn.executemany(
+                f"INSERT INTO consolidated_damage (element_id, {', '.join(DAMAGE_COLUMNS)}, "
+                f"max_damage, critical_location) VALUES ({', '.join('?' * 11)})",
+                _damage_rows((element_ids.tolist(),), table.damages,
+                             (table.max_damage.tolist(), table.critical_location.tolist())))
+
+            for position, source in enumerate(stack.source_files):
+                result = results.get(source)
+                if isinstance(result, ParseResult):
+                    meta = (result.total_elements, result.error_count, result.warning_count)
+                else:
+                    meta = (int(stack.present[position].sum()), 0, 0)
+                file_id = self.conn.execute(
+                    "INSERT INTO source_files (run_id, position, path, total_elements, "
+                    "errors, warnings) VALUES (?, ?, ?, ?, ?, ?)",
+                    (run_id, position, source, *meta)).lastrowid
+
+                rows = np.flatnonzero(stack.present[position])
+                damages = stack.damages[position, rows]
+                self.conn.executemany(
+                    f"INSERT INTO period_damage (file_id, element_id, "
+                    f"{', '.join(DAMAGE_COLUMNS)}, max_damage) "
+                    f"VALUES ({', '.join('?' * 11)})",
+                    _damage_rows(([file_id] * len(rows), element_ids[rows].tolist()), damages,
+                                 (damages.max(axis=1).tolist(),)))
+
+        logger.info(f"Corrida '{name}' guardada en {self.path}: {n} elementos, "
+                    f"{len(stack.source_files)} archivos")
+        return run_id
+
+    def query(self, sql: str, params: tuple = ()) -> list:
+        """
+        Ejecuta una consulta de lectura.
+
+        Args:
+            sql: Sentencia SQL
+            params: Parámetros de la sentencia
+
+        Returns:
+            Lista de dicts (una por fila)
+        """
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def runs(self) -> list:
+        """Corridas guardadas con su número de elementos y archivos."""
+        return self.query(
+            "SELECT r.run_id, r.name, r.platform, r.created_at, "
+            "(SELECT COUNT(*) FROM elements e WHERE e.run_id = r.run_id) AS elements, "
+            "(SELECT COUNT(*) FROM source_files s WHERE s.run_id = r.run_id) AS files "
+            "FROM runs r ORDER BY r.run_id")
+
+    def top_elements(self, run_id: Optional[int] = None, k: int = 10,
+                     grup: Optional[str] = None, joint: Optional[str] = None) -> list:
+        """
+        Elementos con mayor daño consolidado.
+
+        Args:
+            run_id: Corrida (default: todas)
+            k: Número de elementos
+            grup: Filtrar por GRUP
+            joint: Filtrar por JOINT
+
+        Returns:
+            Lista de dicts con run_id, joint, member, grup, max_damage y
+            critical_location, en orden descendente de daño
+        """
+        conditions, params = [], []
+        for column, value in (('e.run_id', run_id), ('e.grup', grup), ('e.joint', joint)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ''
+        return self.query(
+            "SELECT e.run_id, e.joint, e.member, e.grup, e.unique_key, "
+            "c.max_damage, c.critical_location "
+            "FROM consolidated_damage c JOIN elements e USING (element_id) "
+            f"{where}ORDER BY c.max_damage DESC LIMIT ?", (*params, k))
+
+    def element_history(self, unique_key: str) -> list:
+        """
+        Daño consolidado de un elemento en todas las corridas.
+
+        La búsqueda es por clave canónica: el MEMBER puede venir en
+        cualquier formato ("802L 0005" o "0005-802L").
+
+        Args:
+            unique_key: Clave JOINT_MEMBER_GRUP
+
+        Returns:
+            Lista de dicts por corrida (orden de run_id)
+        """
+        joint, rest = unique_key.split('_', 1)
+        member, grup = rest.rsplit('_', 1)
+        return self.query(
+            "SELECT r.run_id, r.name, r.platform, c.max_damage, c.critical_location "
+            "FROM elements e JOIN consolidated_damage c USING (element_id) "
+            "JOIN runs r USING (run_id) WHERE e.canonical_key = ? ORDER BY r.run_id",
+            (canonical_key(joint, member, grup),))
+
+    def to_table(self, run_id: int) -> ElementTable:
+        """
+        Reconstruye la tabla consolidada de una corrida.
+
+        Args:
+            run_id: Corrida
+
+        Returns:
+            ElementTable en el orden original de la corrida
+        """
+        rows = self.conn.execute(
+            f"SELECT e.joint, e.member, e.grup, {', '.join('c.' + c for c in DAMAGE_COLUMNS)} "
+            "FROM elements e JOIN consolidated_damage c USING (element_id) "
+            "WHERE e.run_id = ? ORDER BY e.element_id", (run_id,)).fetchall()
+        damages = np.array([tuple(row)[3:] for row in rows], dtype=np.float64).reshape(-1, 8)
+        return ElementTable.from_columns((r[0] for r in rows), (r[1] for r in rows),
+                                         (r[2] for r in rows), damages)
+
+    def delete_run(self, run_id: int):
+        """Elimina una corrida con sus archivos, elementos y daños."""
+        with self.conn:
+            self.conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+
+    def close(self):
+        """Cierra la conexión."""
+        self.conn.close()
+
+    def __enter__(self) -> 'ResultsStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ResultsStore(path={self.path!r})"
+
+
+def store_results(path: str, results: dict, name: str, platform: str = '') -> int:
+    """
+    Consolida y guarda una corrida en el almacén.
+
+    Args:
+        path: Ruta del archivo SQLite
+        results: Diccionario {archivo: ParseResult | ElementTable}
+        name: Nombre de la corrida
+        platform: Plataforma analizada
+
+    Returns:
+        run_id de la corrida
+    """
+    with ResultsStore(path) as store:
+        return store.add_run(results, name, platform)
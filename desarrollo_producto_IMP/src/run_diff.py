@@ -0,0 +1,244 @@
+"""
+Comparación de Corridas - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Diferencias entre dos corridas del mismo modelo de plataforma (por
+ejemplo antes y después de una revisión del modelo SACS): qué elementos
+cambiaron de daño y cuánto, y qué elementos aparecieron o desaparecieron.
+
+La alineación es un join por clave ordenada sobre los digests de la clave
+canónica (key_hashes, ver member_keys), igual que la consolidación: "802L
+0005" y "0005-802L" son el mismo elemento. Las filas de las dos tablas se
+ordenan juntas por digest (orden estable) y cada par de filas consecutivas
+con el mismo digest (una de cada corrida) es una coincidencia. Los cambios
+absolutos y relativos de las 8 ubicaciones se calculan sobre matrices
+(M, 8) alineadas, sin diccionarios por elemento.
+
+Un archivo puede contener la misma clave canónica con dos grafías
+("802L 0005" y "0005-802L"); antes del join cada tabla se reduce a una
+fila por clave con la misma regla que consolidate (gana la última).
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+
+from aggregator import as_table, last_occurrence, warn_duplicates
+from models import LOCATIONS, ParseResult
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RunDiff:
+    """
+    Diferencias entre dos corridas alineadas por clave canónica JOINT_MEMBER_GRUP.
+
+    Attributes:
+        old: Tabla de la corrida anterior
+        new: Tabla de la corrida nueva
+        old_rows: Array (M,) de filas de old con coincidencia
+        new_rows: Array (M,) de filas de new (alineadas con old_rows)
+        removed: Filas de old sin coincidencia (elementos desaparecidos)
+        added: Filas de new sin coincidencia (elementos nuevos)
+        change: Array (M, 8) con new - old por ubicación
+        relative: Array (M, 8) con change / old (inf si old es 0 y cambió,
+                  0 si ambos son 0)
+    """
+    old: ElementTable
+    new: ElementTable
+    old_rows: np.ndarray
+    new_rows: np.ndarray
+    removed: np.ndarray
+    added: np.ndarray
+    change: np.ndarray
+    relative: np.ndarray
+
+    @property
+    def max_abs_change(self) -> np.ndarray:
+        """Mayor |cambio| entre las 8 ubicaciones de cada coincidencia (M,)."""
+        return np.abs(self.change).max(axis=1)
+
+    @property
+    def max_relative_change(self) -> np.ndarray:
+        """Mayor |cambio relativo| entre las 8 ubicaciones (M,)."""
+        return np.abs(self.relative).max(axis=1)
+
+    def changed(self, tolerance: float = 0.0) -> np.ndarray:
+        """
+        Coincidencias cuyo daño cambió más que tolerance en alguna ubicación.
+
+        Args:
+            tolerance: Cambio absoluto máximo considerado igual
+
+        Returns:
+            Array de índices de coincidencia (0..M-1)
+        """
+        return np.flatnonzero(self.max_abs_change > tolerance)
+
+    def top_changes(self, k: int = 20, relative: bool = False) -> np.ndarray:
+        """
+        Las k coincidencias con mayor cambio, de mayor a menor.
+
+        Args:
+            k: Número de coincidencias
+            relative: Ordenar por cambio relativo en lugar de absoluto
+
+        Returns:
+            Array de índices de coincidencia (0..M-1)
+        """
+        score = self.max_relative_change if relative else self.max_abs_change
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        if k < len(score):
+            candidates = np.argpartition(-score, k - 1)[:k]
+        else:
+            candidates = np.arange(len(score))
+        candidates.sort()
+        return candidates[np.argsort(-score[candidates], kind='stable')]
+
+    def change_rows(self, matches) -> list:
+        """
+        Detalle de coincidencias para reportes.
+
+        Args:
+            matches: Índices de coincidencia (ej: top_changes())
+
+        Returns:
+            Lista de dicts con UNIQUE_KEY, MAX_DAMAGE anterior y nuevo, y la
+            ubicación, cambio y cambio relativo de la mayor diferencia
+        """
+        matches = np.asarray(matches, dtype=np.int64)
+        old_rows, new_rows = self.old_rows[matches], self.new_rows[matches]
+        keys = self.new.take(new_rows).unique_keys.tolist()
+        location = np.abs(self.change[matches]).argmax(axis=1)
+        rows = []
+        for i, key in enumerate(keys):
+            loc = location[i]
+            rows.append({
+                'UNIQUE_KEY': key,
+                'OLD_MAX_DAMAGE': float(self.old.damages[old_rows[i]].max()),
+                'NEW_MAX_DAMAGE': float(self.new.damages[new_rows[i]].max()),
+                'LOCATION': LOCATIONS[loc],
+                'CHANGE': float(self.change[matches[i], loc]),
+                'RELATIVE_CHANGE': float(self.relative[matches[i], loc])
+            })
+        return rows
+
+    @property
+    def added_keys(self) -> list:
+        """Claves de los elementos nuevos."""
+        return self.new.take(self.added).unique_keys.tolist()
+
+    @property
+    def removed_keys(self) -> list:
+        """Claves de los elementos desaparecidos."""
+        return self.old.take(self.removed).unique_keys.tolist()
+
+    def get_summary(self, tolerance: float = 0.0) -> dict:
+        """
+        Genera resumen de la comparación.
+
+        Args:
+            tolerance: Cambio absoluto máximo considerado igual
+
+        Returns:
+            dict: Conteos de coincidencias, cambios, altas y bajas
+        """
+        return {
+            'old_elements': len(self.old),
+            'new_elements': len(self.new),
+            'matched': len(self.old_rows),
+            'changed': len(self.changed(tolerance)),
+            'added': len(self.added),
+            'removed': len(self.removed),
+            'max_abs_change': float(self.max_abs_change.max()) if len(self.old_rows) else 0.0
+        }
+
+    def __repr__(self) -> str:
+        return (f"RunDiff(matched={len(self.old_rows)}, added={len(self.added)}, "
+                f"removed={len(self.removed)})")
+
+
+def _one_row_per_key(table: ElementTable, name: str) -> ElementTable:
+    """
+    Reduce una tabla a la última fila de cada clave canónica.
+
+    Args:
+        table: Tabla de una corrida
+        name: Nombre de la corrida para la advertencia de repetidas
+
+    Returns:
+        La misma tabla si no hay claves repetidas; si no, la tabla con la
+        última aparición de cada clave, en el orden original de filas
+    """
+    # Vista de cada digest (2 x int64) como un único valor comparable
+    digests = np.ascontiguousarray(table.key_hashes).view([('hi', '<i8'), ('lo', '<i8')])
+    rows, _ = last_occurrence(digests.ravel())
+    replaced = len(table) - len(rows)
+    if not replaced:
+        return table
+    warn_duplicates(name, replaced)
+    rows.sort()
+    return table.take(rows)
+
+
+def diff_runs(old: Union[ParseResult, ElementTable],
+              new: Union[ParseResult, ElementTable]) -> RunDiff:
+    """
+    Compara dos corridas (parseadas o consolidadas) por clave.
+
+    Args:
+        old: Corrida anterior (ParseResult o ElementTable)
+        new: Corrida nueva
+
+    Returns:
+        RunDiff
+
+    Examples:
+        >>> diff = diff_runs(parse_fatigue_file('rev0/ftglstE1.txt'),
+        ...                  parse_fatigue_file('rev1/ftglstE1.txt'))
+        >>> diff.change_rows(diff.top_changes(10))
+        >>> with ResultsStore('fatiga.db') as store:
+        ...     diff = diff_runs(store.to_table(3), store.to_table(4))
+    """
+    old = _one_row_per_key(as_table(old), 'corrida anterior')
+    new = _one_row_per_key(as_table(new), 'corrida nueva')
+    n_old = len(old)
+
+    # Join por digest ordenado (lexsort es estable: a igual clave la fila
+    # de old precede a la de new); se comparan los 128 bits del digest
+    hashes = np.concatenate([old.key_hashes, new.key_hashes])
+    order = np.lexsort((hashes[:, 1], hashes[:, 0]))
+    sorted_hashes = hashes[order]
+    same_as_next = (sorted_hashes[1:] == sorted_hashes[:-1]).all(axis=1)
+    from_old = order < n_old
+    pair = np.flatnonzero(same_as_next & from_old[:-1] & ~from_old[1:])
+
+    old_rows = order[pair]
+    new_rows = order[pair + 1] - n_old
+    matched_old = np.zeros(n_old, dtype=bool)
+    matched_old[old_rows] = True
+    matched_new = np.zeros(len(new), dtype=bool)
+    matched_new[new_rows] = True
+
+    # Filas en orden de la tabla nueva (y de la anterior para las bajas)
+    by_new = np.argsort(new_rows, kind='stable')
+    old_rows, new_rows = old_rows[by_new], new_rows[by_new]
+
+    before = old.damages[old_rows]
+    change = new.damages[new_rows] - before
+    relative = np.zeros_like(change)
+    np.divide(change, before, out=relative, where=before != 0)
+    appeared = (before == 0) & (change != 0)
+    relative[appeared] = np.copysign(np.inf, change[appeared])
+
+    diff = RunDiff(old=old, new=new, old_rows=old_rows, new_rows=new_rows,
+                   removed=np.flatnonzero(~matched_old), added=np.flatnonzero(~matched_new),
+                   change=change, relative=relative)
+    logger.info(f"Comparación: {diff!r}")
+    return diff
@@ -0,0 +1,173 @@
+"""
+Motor de Escenarios - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Evalúa combinaciones ponderadas de los archivos consolidados ("qué pasa
+si": extender la vida de servicio, reponderar un periodo, excluir un modelo).
+Cada escenario es un vector de pesos sobre los archivos; todos se evalúan
+con un producto matricial (escenarios × archivos) @ (archivos × elementos·8).
+"""
+
+import logging
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from aggregator import DamageStack
+from models import LOCATIONS
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Tamaño máximo del bloque intermedio (escenarios × elementos × 8) en bytes
+DEFAULT_BLOCK_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class Scenario:
+    """
+    Escenario de consolidación ponderada.
+
+    Attributes:
+        name: Nombre del escenario (ej: "Extensión 10 años")
+        weights: Diccionario {nombre_archivo: peso}
+        default_weight: Peso de los archivos no listados en weights
+                        (1.0 = suma simple, 0.0 = excluir)
+
+    Examples:
+        >>> Scenario('Base')
+        >>> Scenario('Sin modelo E3', {'ftglstE3.txt': 0.0})
+        >>> Scenario('Vida x1.5', default_weight=1.5)
+    """
+    name: str
+    weights: dict = field(default_factory=dict)
+    default_weight: float = 1.0
+
+    def vector(self, source_files: list) -> np.ndarray:
+        """
+        Vector de pesos en el orden de source_files.
+
+        Raises:
+            KeyError: Si weights menciona un archivo que no está en el stack
+        """
+        unknown = set(self.weights) - set(source_files)
+        if unknown:
+            raise KeyError(f"Archivos desconocidos en escenario '{self.name}': {sorted(unknown)}")
+        return np.array([self.weights.get(f, self.default_weight) for f in source_files],
+                        dtype=np.float64)
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Resultado de evaluar S escenarios sobre N elementos.
+
+    Solo se conservan el máximo y la ubicación crítica por escenario y
+    elemento; la matriz (N, 8) completa de un escenario se recalcula bajo
+    demanda con scenario_damages().
+
+    Attributes:
+        names: Nombres de los escenarios
+        weights: Array (S, F) de pesos
+        max_damage: Array float64 (S, N)
+        critical_index: Array int8 (S, N) con el índice de ubicación (0-7)
+    """
+    names: list
+    weights: np.ndarray
+    max_damage: np.ndarray
+    critical_index: np.ndarray
+    stack: DamageStack = field(repr=False)
+
+    def critical_location(self, scenario: int) -> np.ndarray:
+        """Nombres de la ubicación crítica de cada elemento en un escenario."""
+        return np.asarray(LOCATIONS, dtype=object)[self.critical_index[scenario]]
+
+    def scenario_damages(self, scenario: int) -> np.ndarray:
+        """
+        Matriz de daños (N, 8) de un escenario.
+
+        Args:
+            scenario: Índice del escenario
+
+        Returns:
+            np.ndarray (N, 8)
+        """
+        return np.tensordot(self.weights[scenario], self.stack.damages, axes=1)
+
+    def get_summary(self) -> list:
+        """
+        Resumen por escenario: daño máximo global y elemento crítico.
+
+        Returns:
+            Lista de dicts, uno por escenario
+        """
+        summary = []
+        keys = self.stack.elements.unique_keys if self.max_damage.shape[1] else []
+        for s, name in enumerate(self.names):
+            row = self.max_damage[s]
+            if len(row) == 0:
+                summary.append({'scenario': name, 'max_damage_overall': 0.0})
+                continue
+            i = int(row.argmax())
+            summary.append({
+                'scenario': name,
+                'max_damage_overall': float(row[i]),
+                'critical_element': keys[i],
+                'critical_location': LOCATIONS[int(self.critical_index[s, i])],
+                'elements_above_1': int((row > 1.0).sum())
+            })
+        return summary
+
+
+def evaluate_scenarios(stack: DamageStack, scenarios: list,
+                       block_bytes: int = DEFAULT_BLOCK_BYTES) -> ScenarioResult:
+    """
+    Evalúa todos los escenarios con un producto matricial por bloques.
+
+    El producto W (S, F) @ D (F, N·8) se calcula en bloques de elementos para
+    que el intermedio (S, bloque, 8) no supere block_bytes; de cada bloque se
+    conservan solo el máximo y el argmax por elemento.
+
+    Args:
+        stack: Daños alineados por archivo (ver aggregator.stack_results)
+        scenarios: Lista de Scenario o array (S, F) de pesos
+        block_bytes: Límite de memoria del bloque intermedio
+
+    Returns:
+        ScenarioResult
+    """
+    n_files, n_elements, _ = stack.damages.shape
+
+    if isinstance(scenarios, np.ndarray):
+        weights = np.asarray(scenarios, dtype=np.float64)
+        names = [f"Escenario {i + 1}" for i in range(len(weights))]
+    else:
+        weights = np.array([s.vector(stack.source_files) for s in scenarios],
+                           dtype=np.float64).reshape(len(scenarios), n_files)
+        names = [s.name for s in scenarios]
+
+    if weights.ndim != 2 or weights.shape[1] != n_files:
+        raise ValueError(f"Se esperan pesos (S, {n_files}), se recibió {weights.shape}")
+
+    n_scenarios = len(weights)
+    max_damage = np.empty((n_scenarios, n_elements), dtype=np.float64)
+    critical_index = np.empty((n_scenarios, n_elements), dtype=np.int8)
+
+    flat = stack.damages.reshape(n_files, n_elements * 8)
+    block = max(1, block_bytes // max(1, n_scenarios * 8 * 8))
+    for start in range(0, n_elements, block):
+        stop = min(start + block, n_elements)
+        combined = (weights @ flat[:, start * 8:stop * 8]).reshape(n_scenarios, stop - start, 8)
+        critical = combined.argmax(axis=2)
+        critical_index[:, start:stop] = critical
+        max_damage[:, start:stop] = np.take_along_axis(combined, critical[..., np.newaxis], axis=2)[..., 0]
+
+    logger.info(f"Evaluados {n_scenarios} escenarios sobre {n_elements} elementos")
+    return ScenarioResult(
+        names=names,
+        weights=weights,
+        max_damage=max_damage,
+        critical_index=critical_index,
+        stack=stack
+    )
@@ -0,0 +1,237 @@
+"""
+Extractores de Secciones - Etapa 2: Parsing y Extracción
+Procesador de Fatiga SACS v1.0
+
+Un listado FTG contiene, además de MEMBER FATIGUE DETAIL REPORT, otros
+reportes (resúmenes por junta y por miembro) que hasta ahora se extraían
+con herramientas separadas, releyendo el archivo cada vez.
+
+Un SectionExtractor declara los títulos de la sección que le corresponde y
+recibe, de la máquina de estados de FTGParser, las líneas de esa sección.
+Se registran varios extractores en el parser y todos se alimentan de una
+sola lectura del archivo; cada uno produce su propio resultado columnar
+en ParseResult.reports.
+
+    parser = FTGParser(extractors=['joint_summary', 'member_summary'])
+    result = parser.parse_file('ftglstE1.txt')
+    result.reports['joint_summary'].column('DAMAGE')
+
+Extractores nuevos: subclase de SectionExtractor (o una instancia de
+TabularSectionExtractor con otros títulos/columnas) registrada con
+register_extractor().
+
+Este módulo se importa junto con el parser: no carga numpy hasta construir
+los resultados.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Union
+
+from data_cleaner import normalize_fortran_scientific
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Primer carácter posible de un valor numérico (estándar o Fortran)
+_NUMBER_START = frozenset('0123456789.+-')
+
+
+class SectionExtractor(ABC):
+    """
+    Base abstracta de los extractores de secciones de un listado FTG.
+
+    Attributes:
+        name: Nombre del reporte (clave en ParseResult.reports)
+        titles: Textos que identifican el título de la sección (formato
+                normal y espaciado "J O I N T ...")
+    """
+    name = ''
+    titles = ()
+
+    def reset(self):
+        """Descarta lo extraído (se llama al inicio de cada archivo)."""
+
+    @abstractmethod
+    def feed(self, line: str, line_number: int):
+        """
+        Procesa una línea de la sección (ya filtrada por is_valid_data_line).
+
+        Args:
+            line: Línea del archivo
+            line_number: Número de línea (1-based)
+        """
+
+    @abstractmethod
+    def result(self):
+        """Resultado columnar de lo extraído."""
+
+
+@dataclass
+class SectionTable:
+    """
+    Filas de una sección tabular: identificadores + valores numéricos.
+
+    Attributes:
+        name: Nombre del reporte
+        columns: Nombres de las columnas numéricas
+        labels: Lista (N,) con los identificadores de cada fila (tokens
+                anteriores a los valores, unidos por espacio)
+        values: Array (N, V) de valores
+        line_numbers: Array (N,) con la línea de origen de cada fila
+        skipped: Líneas de la sección que no tenían la forma de una fila
+    """
+    name: str
+    columns: tuple
+    labels: list
+    values: 'np.ndarray'
+    line_numbers: 'np.ndarray'
+    skipped: int = 0
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def column(self, name: str) -> 'np.ndarray':
+        """
+        Columna numérica por nombre.
+
+        Raises:
+            KeyError: Si la columna no existe
+        """
+        if name not in self.columns:
+            raise KeyError(f"Columna desconocida '{name}', opciones: {self.columns}")
+        return self.values[:, self.columns.index(name)]
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen de la sección.
+
+        Returns:
+            dict: Filas, columnas y líneas descartadas
+        """
+        return {
+            'name': self.name,
+            'rows': len(self),
+            'columns': list(self.columns),
+            'skipped': self.skipped
+        }
+
+    def __repr__(self) -> str:
+        return f"SectionTable(name={self.name!r}, rows={len(self)}, columns={self.columns})"
+
+
+class TabularSectionExtractor(SectionExtractor):
+    """
+    Extractor de secciones con una fila por línea: identificadores seguidos
+    de len(columns) valores numéricos (notación estándar o Fortran).
+
+    Las líneas que no terminan en esos valores (encabezados de columnas,
+    unidades, notas) se cuentan en skipped y se ignoran. Las filas se
+    guardan en buffers array, sin un objeto Python por fila.
+    """
+
+    def __init__(self, name: str, titles: tuple, columns: tuple):
+        """
+        Inicializa el extractor.
+
+        Args:
+            name: Nombre del reporte
+            titles: Textos que identifican el título de la sección
+            columns: Nombres de los valores numéricos al final de cada fila
+        """
+        self.name = name
+        self.titles = tuple(titles)
+        self.columns = tuple(columns)
+        self.reset()
+
+    def reset(self):
+        self._labels = []
+        self._values = array('d')
+        self._line_numbers = array('q')
+        self._skipped = 0
+
+    def feed(self, line: str, line_number: int):
+        n_values = len(self.columns)
+        tokens = line.split()
+        if len(tokens) <= n_values:
+            self._skipped += 1
+            return
+        tail = tokens[-n_values:]
+        # Encabezados y unidades se descartan sin intentar la conversión
+        if not all(tok[0] in _NUMBER_START for tok in tail):
+            self._skipped += 1
+            return
+        try:
+            values = [normalize_fortran_scientific(tok) for tok in tail]
+        except ValueError:
+            self._skipped += 1
+            return
+        self._labels.append(' '.join(tokens[:-n_values]))
+        self._values.extend(values)
+        self._line_numbers.append(line_number)
+
+    def result(self) -> SectionTable:
+        import numpy as np
+
+        # np.array copia: los buffers de array no se retienen
+        return SectionTable(
+            name=self.name,
+            columns=self.columns,
+            labels=self._labels,
+            values=np.array(self._values, dtype=np.float64).reshape(-1, len(self.columns)),
+            line_numbers=np.array(self._line_numbers, dtype=np.int64),
+            skipped=self._skipped
+        )
+
+    def __repr__(self) -> str:
+        return f"TabularSectionExtractor(name={self.name!r}, titles={self.titles})"
+
+
+# Registro {nombre: fábrica sin argumentos}; cada parser crea sus instancias
+EXTRACTORS = {}
+
+
+def register_extractor(name: str, factory: Callable[[], SectionExtractor]):
+    """
+    Registra un extractor para usarlo por nombre en FTGParser(extractors=...).
+
+    Args:
+        name: Nombre del reporte
+        factory: Callable sin argumentos que crea el extractor
+
+    Examples:
+        >>> register_extractor('scf_report', lambda: TabularSectionExtractor(
+        ...     'scf_report', ('STRESS CONCENTRATION FACTORS',), ('SCF_AX', 'SCF_IP')))
+    """
+    EXTRACTORS[name] = factory
+
+
+def create_extractor(spec: Union[str, SectionExtractor]) -> SectionExtractor:
+    """
+    Resuelve un extractor por nombre registrado o lo acepta ya instanciado.
+
+    Raises:
+        ValueError: Si el nombre no está registrado
+    """
+    if isinstance(spec, SectionExtractor):
+        return spec
+    if spec not in EXTRACTORS:
+        raise ValueError(f"Extractor desconocido '{spec}', opciones: {tuple(EXTRACTORS)}")
+    return EXTRACTORS[spec]()
+
+
+register_extractor('joint_summary', lambda: TabularSectionExtractor(
+    'joint_summary',
+    ('JOINT FATIGUE SUMMARY', 'J O I N T  F A T I G U E  S U M M A R Y'),
+    ('DAMAGE', 'SERVICE_LIFE')))
+
+register_extractor('member_summary', lambda: TabularSectionExtractor(
+    'member_summary',
+    ('MEMBER FATIGUE REPORT', 'M E M B E R  F A T I G U E  R E P O R T'),
+    ('DAMAGE', 'SERVICE_LIFE')))
@@ -0,0 +1,409 @@
+"""
+Resultados en Memoria Compartida - Etapa 2: Parsing Multiproceso
+Procesador de Fatiga SACS v1.0
+
+Parsing de varios archivos FTG en procesos worker con transporte de
+resultados sin copia. Cada worker escribe la tabla columnar de su archivo
+(matriz de daños (N, 8), códigos de JOINT/GRUP y los MEMBER concatenados)
+en un segmento de multiprocessing.shared_memory y devuelve solo un handle
+pequeño; el proceso principal se adjunta al segmento y construye un
+ElementTable cuyos arrays son vistas sobre esa memoria, sin serializar un
+FatigueElement por fila.
+
+Ciclo de vida: cada segmento pertenece al SharedParseResult que lo adjunta
+y se libera (close + unlink) con release() o al salir del bloque 'with'.
+Si el parsing falla o se cancela, parse_files_shared libera los segmentos
+ya creados antes de propagar la excepción.
+
+Layout de un segmento con N filas y L bytes de MEMBER:
+    [0, 64N)            float64 (N, 8)  damages
+    [64N, 68N)          int32 (N,)      joint_codes
+    [68N, 72N)          int32 (N,)      grup_codes
+    [72N, 88N)          int64 (N, 2)    key_hashes (digest de la clave canónica)
+    [88N, 88N + L)      utf-8           MEMBER separados por '\\n'
+
+Los digests de clave los calcula el worker al exportar su tabla; la
+consolidación en el proceso principal los usa sin recalcularlos.
+
+El transporte por memoria compartida es solo POSIX (SHARED_MEMORY). En
+Windows el resource tracker no existe y un segmento con nombre se destruye
+al cerrarse el último handle, es decir cuando el worker lo cierra antes de
+que el proceso principal se adjunte: ahí el handle lleva la tabla por
+pickle y SharedParseResult la expone igual, sin segmento que liberar.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable, Optional
+
+import numpy as np
+
+from models import ParseResult
+from tables import ElementTable
+from ftg_parser import parse_fatigue_file
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+# Bytes por fila: 8 daños float64 + códigos int32 de JOINT y GRUP + digest
+ROW_BYTES = 8 * 8 + 4 + 4 + 16
+
+# Transporte por memoria compartida disponible (si no, la tabla va por pickle)
+SHARED_MEMORY = os.name == 'posix'
+
+
+@dataclass
+class SharedTableHandle:
+    """
+    Referencia serializable a una tabla escrita en memoria compartida.
+
+    Es lo único que viaja por pickle desde el worker: nombres de segmento,
+    categorías y mensajes, nunca las filas (salvo sin SHARED_MEMORY, donde
+    table lleva la tabla completa y no hay segmento).
+
+    Attributes:
+        name: Nombre del segmento de memoria compartida ('' sin segmento)
+        source: Archivo de origen
+        rows: Número de filas (N)
+        member_bytes: Bytes del bloque de MEMBER (L)
+        joint_names: Categorías de JOINT (código → nombre)
+        grup_names: Categorías de GRUP (código → nombre)
+        total_elements: Elementos reportados por el parser
+        errors: Errores del parsing
+        warnings: Advertencias del parsing
+        table: Tabla transportada por pickle (None si está en el segmento)
+    """
+    name: str
+    source: str
+    rows: int
+    member_bytes: int
+    joint_names: list
+    grup_names: list
+    total_elements: int = 0
+    errors: list = field(default_factory=list)
+    warnings: list = field(default_factory=list)
+    table: Optional[ElementTable] = None
+
+    @property
+    def size(self) -> int:
+        """Tamaño del segmento en bytes (mínimo 1)."""
+        return max(self.rows * ROW_BYTES + self.member_bytes, 1)
+
+
+def table_views(buf, rows: int, member_bytes: int) -> tuple:
+    """
+    Arrays (damages, joint_codes, grup_codes, key_hashes, members) sobre un
+    buffer con el layout del segmento (también usado por el formato binario
+    de parse_service).
+    """
+    damages = np.ndarray((rows, 8), dtype=np.float64, buffer=buf, offset=0)
+    joint_codes = np.ndarray((rows,), dtype=np.int32, buffer=buf, offset=64 * rows)
+    grup_codes = np.ndarray((rows,), dtype=np.int32, buffer=buf, offset=68 * rows)
+    key_hashes = np.ndarray((rows, 2), dtype=np.int64, buffer=buf, offset=72 * rows)
+    members = np.ndarray((member_bytes,), dtype=np.uint8, buffer=buf, offset=88 * rows)
+    return damages, joint_codes, grup_codes, key_hashes, members
+
+
+def unlink_segment(name: str):
+    """Elimina un segmento por nombre (ignora si ya no existe o no hay segmento)."""
+    if not name:
+        return
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+def release_unattached(futures: Iterable, attached: Iterable['SharedParseResult']):
+    """
+    Elimina los segmentos de tareas terminadas que nadie llegó a adjuntar.
+
+    Se usa al abortar un parsing multiproceso, tras liberar los resultados
+    ya adjuntos.
+
+    Args:
+        futures: Futures de tareas que devuelven SharedTableHandle
+        attached: SharedParseResult ya creados (sus segmentos no se tocan)
+    """
+    attached_names = {shared.name for shared in attached}
+    for future in futures:
+        if future.done() and not future.cancelled() and future.exception() is None:
+            if future.result().name not in attached_names:
+                unlink_segment(future.result().name)
+
+
+def export_result(result: ParseResult, source: str = '',
+                  shared: Optional[bool] = None) -> SharedTableHandle:
+    """
+    Escribe un ParseResult en un segmento nuevo de memoria compartida.
+
+    El segmento queda sin adjuntar en este proceso; quien reciba el handle
+    es responsable de liberarlo (SharedParseResult.release).
+
+    Args:
+        result: Resultado del parsing
+        source: Nombre del archivo de origen
+        shared: Usar memoria compartida (default: SHARED_MEMORY); con False
+                la tabla viaja en el handle
+
+    Returns:
+        SharedTableHandle
+    """
+    table = result.to_table()
+    if not (SHARED_MEMORY if shared is None else shared):
+        return SharedTableHandle(
+            name='',
+            source=source,
+            rows=len(table),
+            member_bytes=0,
+            joint_names=list(table.joint_names),
+            grup_names=list(table.grup_names),
+            total_elements=result.total_elements,
+            errors=list(result.errors),
+            warnings=list(result.warnings),
+            table=table
+        )
+    members = '\n'.join(table.members.tolist()).encode('utf-8')
+    handle = SharedTableHandle(
+        name='',
+        source=source,
+        rows=len(table),
+        member_bytes=len(members),
+        joint_names=list(table.joint_names),
+        grup_names=list(table.grup_names),
+        total_elements=result.total_elements,
+        errors=list(result.errors),
+        warnings=list(result.warnings)
+    )
+
+    shm = shared_memory.SharedMemory(create=True, size=handle.size)
+    handle.name = shm.name
+    try:
+        damages, joint_codes, grup_codes, key_hashes, member_buf = table_views(
+            shm.buf, handle.rows, handle.member_bytes)
+        damages[:] = table.damages
+        joint_codes[:] = table.joint_codes
+        grup_codes[:] = table.grup_codes
+        key_hashes[:] = table.key_hashes
+        member_buf[:] = np.frombuffer(members, dtype=np.uint8)
+        del damages, joint_codes, grup_codes, key_hashes, member_buf
+        shm.close()
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return handle
+
+
+class SharedParseResult:
+    """
+    Resultado de un archivo adjunto a su segmento de memoria compartida.
+
+    table.damages, table.joint_codes y table.grup_codes son vistas sobre el
+    segmento (sin copia); solo los MEMBER se decodifican a strings. Las
+    vistas dejan de ser válidas tras release(); use copy_table() para
+    conservar los datos.
+
+    Attributes:
+        source: Archivo de origen
+        table: ElementTable sobre la memoria compartida (None tras release)
+        total_elements: Elementos reportados por el parser
+        errors: Errores del parsing
+        warnings: Advertencias del parsing
+
+    Examples:
+        >>> with SharedParseResult(handle) as shared:
+        ...     max_damage = shared.table.max_damage.max()
+    """
+
+    def __init__(self, handle: SharedTableHandle):
+        self.name = handle.name
+        self.source = handle.source
+        self.total_elements = handle.total_elements
+        self.errors = handle.errors
+        self.warnings = handle.warnings
+        if handle.table is not None:
+            # Transporte por pickle: memoria propia, sin segmento
+            self._shm = None
+            t = handle.table
+            self.table = ElementTable(t.joint_codes, t.joint_names, t.members,
+                                      t.grup_codes, t.grup_names, t.damages)
+            if 'key_hashes' in t.cache:
+                self.table.cache['key_hashes'] = t.cache['key_hashes']
+            return
+
+        self._shm = shared_memory.SharedMemory(name=handle.name)
+        try:
+            damages, joint_codes, grup_codes, key_hashes, member_buf = table_views(
+                self._shm.buf, handle.rows, handle.member_bytes)
+            member_list = member_buf.tobytes().decode('utf-8').split('\n') if handle.rows else []
+            members = np.empty(handle.rows, dtype=object)
+            members[:] = member_list
+            self.table = ElementTable(joint_codes, handle.joint_names, members,
+                                      grup_codes, handle.grup_names, damages)
+            self.table.cache['key_hashes'] = key_hashes
+        except BaseException:
+            self.table = None
+            self._release_segment()
+            raise
+
+    @property
+    def released(self) -> bool:
+        """True si el resultado ya fue liberado."""
+        return self.table is None
+
+    def copy_table(self) -> ElementTable:
+        """
+        Copia la tabla a memoria propia del proceso.
+
+        Returns:
+            ElementTable independiente del segmento
+
+        Raises:
+            RuntimeError: Si el resultado ya fue liberado
+        """
+        if self.table is None:
+            raise RuntimeError(f"Resultado de {self.source} ya liberado")
+        t = self.table
+        table = ElementTable(t.joint_codes.copy(), list(t.joint_names), t.members.copy(),
+                             t.grup_codes.copy(), list(t.grup_names), t.damages.copy())
+        table.cache['key_hashes'] = t.key_hashes.copy()
+        return table
+
+    def _release_segment(self):
+        """Cierra y elimina el segmento (idempotente)."""
+        shm, self._shm = self._shm, None
+        if shm is None:
+            return
+        try:
+            shm.close()
+        except BufferError:
+            # Quedan vistas vivas fuera de este objeto: la memoria se
+            # devuelve al sistema cuando se destruyan
+            logger.warning(f"Segmento de {self.source} con vistas en uso; "
+                           f"se libera al destruirlas")
+        finally:
+            shm.unlink()
+
+    def release(self):
+        """Libera el segmento de memoria compartida (idempotente)."""
+        self.table = None
+        self._release_segment()
+
+    def __enter__(self) -> 'SharedParseResult':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def __del__(self):
+        if getattr(self, '_shm', None) is not None:
+            self.release()
+
+    def __repr__(self) -> str:
+        rows = len(self.table) if self.table is not None else 0
+        state = 'liberado' if self.released else (self.name or 'pickle')
+        return f"SharedParseResult(source={self.source!r}, rows={rows}, segment={state})"
+
+
+class SharedResultSet(dict):
+    """
+    Diccionario {archivo: SharedParseResult} que libera todos sus segmentos.
+
+    Examples:
+        >>> with parse_files_shared(files) as results:
+        ...     stack = stack_results({f: r.table for f, r in results.items()})
+    """
+
+    @property
+    def tables(self) -> dict:
+        """Diccionario {archivo: ElementTable} (vistas sobre memoria compartida)."""
+        return {source: shared.table for source, shared in self.items()}
+
+    def release(self):
+        """Libera todos los segmentos."""
+        for shared in self.values():
+            shared.release()
+
+    def __enter__(self) -> 'SharedResultSet':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def parse_to_shared(filepath: str, engine: str = 'state_machine',
+                    shared: Optional[bool] = None) -> SharedTableHandle:
+    """Tarea del worker: parsea un archivo y exporta el resultado (ver export_result)."""
+    return export_result(parse_fatigue_file(filepath, engine=engine), source=filepath,
+                         shared=shared)
+
+
+def create_worker_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Crea un pool de procesos apto para exportar resultados compartidos.
+
+    Con memoria compartida (POSIX) los workers deben compartir el resource
+    tracker del proceso principal: si no, cada worker eliminaría sus
+    segmentos al terminar. Sin SHARED_MEMORY no hay tracker que iniciar.
+
+    Args:
+        max_workers: Procesos worker (default: os.cpu_count())
+
+    Returns:
+        ProcessPoolExecutor
+    """
+    if SHARED_MEMORY:
+        resource_tracker.ensure_running()
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+def parse_files_shared(filepaths: Iterable[str], max_workers: Optional[int] = None,
+                       engine: str = 'state_machine') -> SharedResultSet:
+    """
+    Parsea varios archivos FTG en paralelo con transporte por memoria compartida.
+
+    Args:
+        filepaths: Rutas de los archivos (sin repetir)
+        max_workers: Procesos worker (default: os.cpu_count())
+        engine: Motor de extracción del parser
+
+    Returns:
+        SharedResultSet en el orden de filepaths (liberar con release()
+        o usar como context manager)
+
+    Raises:
+        ValueError: Si hay rutas repetidas
+        Exception: La primera excepción de un worker; los segmentos ya
+                   creados se liberan antes de propagarla
+    """
+    filepaths = list(filepaths)
+    if len(set(filepaths)) != len(filepaths):
+        raise ValueError("Rutas de archivo repetidas")
+
+    executor = create_worker_pool(max_workers)
+    futures = [executor.submit(parse_to_shared, path, engine, SHARED_MEMORY)
+               for path in filepaths]
+    results = SharedResultSet()
+    try:
+        for future in as_completed(futures):
+            future.result()
+        for future in futures:
+            handle = future.result()
+            results[handle.source] = SharedParseResult(handle)
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        results.release()
+        release_unattached(futures, results.values())
+        raise
+    executor.shutdown()
+
+    logger.info(f"Parsing multiproceso: {len(results)} archivos, "
+                f"{sum(len(r.table) for r in results.values())} elementos")
+    return results
@@ -0,0 +1,353 @@
+"""
+Tablas Columnares - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Representaciones columnares basadas en numpy (matriz de daños (N, 8),
+códigos categóricos, filas por caso de carga). Viven separadas de models.py
+para que importar el parser no cargue numpy hasta que un flujo lo necesite.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+
+from member_keys import DIGEST_SIZE, key_digest
+from models import FatigueElement, LOCATIONS
+
+
+@dataclass
+class LoadCaseDetails:
+    """
+    Filas de detalle por caso de carga (estado de mar) en formato columnar.
+    
+    Cada fila corresponde a una línea entre el encabezado de un elemento y su
+    línea *** TOTAL DAMAGE ***. Las filas están ordenadas por element_index
+    (orden estable), de modo que las filas de un elemento son contiguas.
+    
+    Attributes:
+        element_index: Array int32 (M,) con la posición del elemento en
+                       ParseResult.elements (orden de inserción)
+        load_code: Array int32 (M,) con el código del caso de carga
+        load_names: Lista {código: id de carga} (ej: ['1', '2', ..., '16'])
+        damages: Array float64 (M, 8) con el daño de cada caso de carga
+    """
+    element_index: np.ndarray
+    load_code: np.ndarray
+    load_names: list
+    damages: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.element_index)
+    
+    @property
+    def load_ids(self) -> np.ndarray:
+        """
+        Ids de carga de cada fila (decodificados desde load_code).
+        
+        Returns:
+            np.ndarray de strings (dtype object)
+        """
+        return np.asarray(self.load_names, dtype=object)[self.load_code]
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por los arrays numéricos."""
+        return int(self.element_index.nbytes + self.load_code.nbytes + self.damages.nbytes)
+    
+    def rows_for(self, element_index: int) -> slice:
+        """
+        Rango de filas de un elemento.
+        
+        Args:
+            element_index: Posición del elemento en ParseResult.elements
+            
+        Returns:
+            slice aplicable a load_code, damages, etc.
+        """
+        start = int(np.searchsorted(self.element_index, element_index, side='left'))
+        stop = int(np.searchsorted(self.element_index, element_index, side='right'))
+        return slice(start, stop)
+    
+    def __repr__(self) -> str:
+        """Representación string de las filas de detalle."""
+        return (f"LoadCaseDetails(rows={len(self)}, loads={len(self.load_names)}, "
+                f"nbytes={self.nbytes})")
+
+
+def _encode_categories(values: Iterable[str]) -> tuple:
+    """
+    Codifica strings como categorías enteras en orden de aparición.
+    
+    Args:
+        values: Secuencia de strings
+        
+    Returns:
+        tuple (codes int32, names list)
+    """
+    mapping = {}
+    codes = [mapping.setdefault(v, len(mapping)) for v in values]
+    return np.array(codes, dtype=np.int32), list(mapping)
+
+
+def _digest_array(digests: list) -> np.ndarray:
+    """Digests de DIGEST_SIZE bytes → array int64 (N, 2) [hash, verificación]."""
+    return np.frombuffer(b''.join(digests), dtype='<i8').reshape(-1, DIGEST_SIZE // 8).copy()
+
+
+def _read_only(value):
+    """Marca como de solo lectura los arrays de un resultado derivado."""
+    if isinstance(value, tuple):
+        arrays = value
+    elif hasattr(value, '__dataclass_fields__'):
+        arrays = vars(value).values()
+    else:
+        arrays = (value,)
+    for array in arrays:
+        if isinstance(array, np.ndarray):
+            array.setflags(write=False)
+
+
+class TableCache(dict):
+    """
+    Cache de resultados derivados de una ElementTable.
+    
+    Los arrays guardados (directamente, en una tupla o como campos de un
+    dataclass) quedan de solo lectura: se comparten entre todas las
+    consultas a la tabla.
+    """
+    
+    def __setitem__(self, key, value):
+        _read_only(value)
+        super().__setitem__(key, value)
+
+
+@dataclass
+class ElementTable:
+    """
+    Representación columnar de un conjunto de elementos de fatiga.
+    
+    JOINT y GRUP se guardan como códigos categóricos (int32) porque se repiten
+    mucho; MEMBER como array de strings. Los daños forman una matriz (N, 8)
+    contigua, apta para operaciones vectorizadas sobre todos los elementos.
+    
+    La tabla es inmutable tras construirse: las columnas son vistas de solo
+    lectura y los resultados en cache no se invalidan. Para modificar datos
+    se construye una tabla nueva (from_columns, take).
+    
+    Attributes:
+        joint_codes: Array int32 (N,) con el código de JOINT de cada fila
+        joint_names: Lista {código: JOINT}
+        members: Array object (N,) con el MEMBER de cada fila
+        grup_codes: Array int32 (N,) con el código de GRUP de cada fila
+        grup_names: Lista {código: GRUP}
+        damages: Array float64 (N, 8) [TOP, TOP-LEFT, ..., TOP-RIGHT]
+        cache: Resultados derivados reutilizables (estadísticas, índices),
+               con arrays de solo lectura (ver TableCache)
+    """
+    joint_codes: np.ndarray
+    joint_names: list
+    members: np.ndarray
+    grup_codes: np.ndarray
+    grup_names: list
+    damages: np.ndarray
+    cache: dict = field(default_factory=TableCache, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Validación después de inicialización."""
+        self.damages = np.asarray(self.damages, dtype=np.float64)
+        # Vistas: los arrays del llamador conservan sus permisos
+        for name in ('joint_codes', 'members', 'grup_codes', 'damages'):
+            column = getattr(self, name)
+            if isinstance(column, np.ndarray) and column.flags.writeable:
+                column = column.view()
+                column.setflags(write=False)
+                setattr(self, name, column)
+        if self.damages.ndim != 2 or self.damages.shape[1] != 8:
+            raise ValueError(f"Se espera una matriz (N, 8), se recibió {self.damages.shape}")
+        
+        n = len(self.damages)
+        if not (len(self.joint_codes) == len(self.members) == len(self.grup_codes) == n):
+            raise ValueError("Las columnas JOINT, MEMBER, GRUP y damages deben tener la misma longitud")
+    
+    @classmethod
+    def from_columns(cls, joints: Iterable[str], members: Iterable[str],
+                     grups: Iterable[str], damages) -> 'ElementTable':
+        """
+        Construye la tabla a partir de columnas de strings y la matriz de daños.
+        
+        Args:
+            joints: JOINT de cada fila
+            members: MEMBER de cada fila
+            grups: GRUP de cada fila
+            damages: Matriz (N, 8)
+            
+        Returns:
+            ElementTable
+        """
+        joint_codes, joint_names = _encode_categories(joints)
+        grup_codes, grup_names = _encode_categories(grups)
+        member_list = list(members)
+        members_arr = np.empty(len(member_list), dtype=object)
+        members_arr[:] = member_list
+        return cls(joint_codes, joint_names, members_arr,
+                   grup_codes, grup_names, damages)
+    
+    @classmethod
+    def from_elements(cls, elements: Iterable[FatigueElement]) -> 'ElementTable':
+        """
+        Construye la tabla a partir de objetos FatigueElement.
+        
+        Args:
+            elements: Iterable de FatigueElement
+            
+        Returns:
+            ElementTable con las filas en el orden recibido
+        """
+        elements = list(elements)
+        damages = np.empty((len(elements), 8), dtype=np.float64)
+        for i, element in enumerate(elements):
+            damages[i] = element.damages
+        return cls.from_columns(
+            (e.joint for e in elements),
+            (e.member for e in elements),
+            (e.grup for e in elements),
+            damages
+        )
+    
+    def __len__(self) -> int:
+        return len(self.damages)
+    
+    @property
+    def joints(self) -> np.ndarray:
+        """JOINT de cada fila (decodificado)."""
+        return np.asarray(self.joint_names, dtype=object)[self.joint_codes]
+    
+    @property
+    def grups(self) -> np.ndarray:
+        """GRUP de cada fila (decodificado)."""
+        return np.asarray(self.grup_names, dtype=object)[self.grup_codes]
+    
+    @property
+    def unique_keys(self) -> np.ndarray:
+        """
+        Claves "JOINT_MEMBER_GRUP" de cada fila.
+        
+        Returns:
+            np.ndarray de strings (dtype object)
+        """
+        keys = np.empty(len(self), dtype=object)
+        keys[:] = [f"{j}_{m}_{g}" for j, m, g in zip(self.joints, self.members, self.grups)]
+        return keys
+    
+    @property
+    def key_hashes(self) -> np.ndarray:
+        """
+        Digest de la clave canónica de cada fila (ver member_keys).
+        
+        Se calcula al primer uso (un parsing sin consolidación no lo paga) y
+        se guarda en cache; en el parsing paralelo lo calcula el worker al
+        exportar la tabla. La consolidación empareja filas por la columna 0
+        y verifica colisiones con la columna 1.
+        
+        Returns:
+            Array int64 (N, 2) [hash, verificación]
+        """
+        if 'key_hashes' not in self.cache:
+            joint_names, grup_names = self.joint_names, self.grup_names
+            self.cache['key_hashes'] = _digest_array([
+                key_digest(joint_names[j], m, grup_names[g])
+                for j, m, g in zip(self.joint_codes.tolist(), self.members.tolist(),
+                                   self.grup_codes.tolist())])
+        return self.cache['key_hashes']
+    
+    @property
+    def max_damage(self) -> np.ndarray:
+        """Daño máximo de cada fila (N,)."""
+        return self.damages.max(axis=1)
+    
+    @property
+    def critical_index(self) -> np.ndarray:
+        """Índice (0-7) de la ubicación crítica de cada fila (N,)."""
+        return self.damages.argmax(axis=1)
+    
+    @property
+    def critical_location(self) -> np.ndarray:
+        """Nombre de la ubicación crítica de cada fila (N,)."""
+        return np.asarray(LOCATIONS, dtype=object)[self.critical_index]
+    
+    def take(self, indices) -> 'ElementTable':
+        """
+        Subconjunto de filas (índices o máscara booleana).
+        
+        Args:
+            indices: Array de índices enteros o máscara booleana
+            
+        Returns:
+            ElementTable nueva que comparte los diccionarios de categorías
+        """
+        table = ElementTable(self.joint_codes[indices], self.joint_names,
+                             self.members[indices], self.grup_codes[indices],
+                             self.grup_names, self.damages[indices])
+        if 'key_hashes' in self.cache:
+            table.cache['key_hashes'] = self.cache['key_hashes'][indices]
+        return table
+
+    def save(self, path: str):
+        """
+        Guarda la tabla en un archivo .npz (sin pickle), con los digests de
+        clave si ya están calculados.
+
+        Args:
+            path: Ruta de salida
+        """
+        extra = {}
+        if 'key_hashes' in self.cache:
+            extra['key_hashes'] = self.cache['key_hashes']
+        np.savez(path,
+                 joint_codes=self.joint_codes,
+                 joint_names=np.array(self.joint_names, dtype=str),
+                 members=np.array(self.members.tolist(), dtype=str),
+                 grup_codes=self.grup_codes,
+                 grup_names=np.array(self.grup_names, dtype=str),
+                 damages=self.damages,
+                 **extra)
+
+    @classmethod
+    def load(cls, path: str) -> 'ElementTable':
+        """
+        Carga una tabla guardada con save().
+
+        Args:
+            path: Ruta del archivo .npz
+
+        Returns:
+            ElementTable
+        """
+        with np.load(path, allow_pickle=False) as data:
+            members = np.empty(len(data['members']), dtype=object)
+            members[:] = data['members'].tolist()
+            table = cls(data['joint_codes'], data['joint_names'].tolist(), members,
+                        data['grup_codes'], data['grup_names'].tolist(), data['damages'])
+            if 'key_hashes' in data.files:
+                table.cache['key_hashes'] = data['key_hashes']
+            return table
+
+    def to_elements(self) -> dict:
+        """
+        Convierte la tabla a diccionario de FatigueElement.
+        
+        Returns:
+            dict {unique_key: FatigueElement}
+        """
+        elements = {}
+        for joint, member, grup, damages in zip(self.joints, self.members,
+                                                self.grups, self.damages):
+            element = FatigueElement(joint, member, grup, damages.copy())
+            elements[element.unique_key] = element
+        return elements
+    
+    def __repr__(self) -> str:
+        """Representación string de la tabla."""
+        return (f"ElementTable(rows={len(self)}, joints={len(self.joint_names)}, "
+                f"grups={len(self.grup_names)})")
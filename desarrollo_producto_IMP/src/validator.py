@@ -0,0 +1,284 @@
+"""
+Validación de Integridad - Etapa 3: Consolidación y Suma
+Procesador de Fatiga SACS v1.0
+
+Verifica la consistencia de elementos entre archivos FTG: elementos que
+aparecen en todos los archivos, elementos que faltan en alguno y elementos
+huérfanos (presentes en un solo archivo).
+
+Las claves se codifican como enteros una sola vez; cada archivo queda como
+un array ordenado de códigos y la comparación entre N archivos se resuelve
+con un mapa de presencia (archivos × elementos) en tiempo casi lineal.
+"""
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+from models import ParseResult
+from tables import ElementTable
+
+# Configurar logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ValidationReport:
+    """
+    Reporte de consistencia entre archivos.
+
+    Attributes:
+        source_files: Nombres de los archivos (filas de presence)
+        keys: Array (N,) con la clave de cada columna de presence, en orden
+              de código (hash de la clave canónica, o código del vocabulario
+              para claves string); no es orden lexicográfico
+        presence: Array bool (F, N), True si la clave aparece en el archivo
+        duplicates: Diccionario {archivo: número de claves repetidas}
+    """
+    source_files: list
+    keys: np.ndarray
+    presence: np.ndarray
+    duplicates: dict
+
+    @property
+    def total_elements(self) -> int:
+        """Número de claves distintas entre todos los archivos."""
+        return self.presence.shape[1]
+
+    @property
+    def file_count(self) -> np.ndarray:
+        """Número de archivos en que aparece cada clave (N,)."""
+        return self.presence.sum(axis=0)
+
+    @property
+    def consistent_mask(self) -> np.ndarray:
+        """True para claves presentes en todos los archivos (N,)."""
+        return self.presence.all(axis=0)
+
+    @property
+    def consistent_elements(self) -> list:
+        """Claves presentes en todos los archivos."""
+        return self.keys[self.consistent_mask].tolist()
+
+    @property
+    def inconsistent_elements(self) -> dict:
+        """Claves que faltan en cada archivo: {archivo: [claves]}."""
+        return {name: self.keys[~self.presence[f]].tolist()
+                for f, name in enumerate(self.source_files)}
+
+    @property
+    def orphan_elements(self) -> dict:
+        """Claves que solo aparecen en cada archivo: {archivo: [claves]}."""
+        if len(self.source_files) < 2:
+            return {name: [] for name in self.source_files}
+        only_one = self.file_count == 1
+        return {name: self.keys[only_one & self.presence[f]].tolist()
+                for f, name in enumerate(self.source_files)}
+
+    @property
+    def coverage_matrix(self) -> np.ndarray:
+        """
+        Claves compartidas entre cada par de archivos.
+
+        Returns:
+            Array int64 (F, F); la diagonal es el total de claves por archivo
+        """
+        # float32 usa BLAS y es exacto para conteos < 2**24
+        p = self.presence.astype(np.float32)
+        if self.total_elements < 2 ** 24:
+            return np.rint(p @ p.T).astype(np.int64)
+        return self.presence.astype(np.int64) @ self.presence.T.astype(np.int64)
+
+    @property
+    def is_consistent(self) -> bool:
+        """True si todos los archivos tienen exactamente las mismas claves."""
+        return bool(self.consistent_mask.all())
+
+    def get_summary(self) -> dict:
+        """
+        Genera resumen del reporte.
+
+        Returns:
+            dict: Conteos globales y por archivo
+        """
+        missing = (~self.presence).sum(axis=1)
+        orphan = (self.presence & (self.file_count == 1)).sum(axis=1) \
+            if len(self.source_files) > 1 else np.zeros(len(self.source_files), dtype=int)
+        return {
+            'total_elements': self.total_elements,
+            'consistent_elements': int(self.consistent_mask.sum()),
+            'files': {
+                name: {
+                    'elements': int(self.presence[f].sum()),
+                    'missing': int(missing[f]),
+                    'orphan': int(orphan[f]),
+                    'duplicates': self.duplicates.get(name, 0)
+                }
+                for f, name in enumerate(self.source_files)
+            }
+        }
+
+    def __repr__(self) -> str:
+        """Representación string del reporte."""
+        return (f"ValidationReport(files={len(self.source_files)}, "
+                f"elements={self.total_elements}, "
+                f"consistent={int(self.consistent_mask.sum())})")
+
+
+def _file_keys(result) -> object:
+    """
+    Extrae las claves de un archivo.
+
+    ParseResult y ElementTable se comparan por el hash de la clave canónica
+    (key_hashes[:, 0]), igual que stack_results: "802L 0005" y "0005-802L"
+    son el mismo elemento. Otras entradas (iterables de claves o arrays
+    enteros) se usan tal cual.
+    """
+    if isinstance(result, ParseResult):
+        result = result.to_table()
+    if isinstance(result, ElementTable):
+        return result.key_hashes[:, 0]
+    return result
+
+
+def _key_labels(tables: dict, universe: np.ndarray) -> np.ndarray:
+    """
+    UNIQUE_KEY de la primera aparición de cada hash de universe.
+
+    Los hashes que no aparecen en tables (claves enteras dadas
+    directamente) conservan su valor.
+    """
+    labels = np.empty(len(universe), dtype=object)
+    labels[:] = universe.tolist()
+    pending = np.ones(len(universe), dtype=bool)
+    for table in tables.values():
+        positions = np.searchsorted(universe, table.key_hashes[:, 0])
+        rows = np.flatnonzero(pending[positions])
+        _, first = np.unique(positions[rows], return_index=True)
+        rows = rows[first]
+        labels[positions[rows]] = table.take(rows).unique_keys
+        pending[positions[rows]] = False
+    return labels
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    """Valores únicos ordenados (ordenamiento + comparación con el vecino)."""
+    values = np.sort(values)
+    if len(values) == 0:
+        return values
+    keep = np.empty(len(values), dtype=bool)
+    keep[0] = True
+    np.not_equal(values[1:], values[:-1], out=keep[1:])
+    return values[keep]
+
+
+def encode_keys(key_sets: dict) -> tuple:
+    """
+    Codifica las claves de cada archivo como arrays enteros ordenados.
+
+    Las claves string se codifican con un diccionario compartido (una sola
+    pasada); las claves enteras (ej: hashes de MEMBER) se usan tal cual.
+
+    Args:
+        key_sets: Diccionario {archivo: iterable de claves}
+
+    Returns:
+        tuple (codes, vocabulary, duplicates):
+            codes: {archivo: array int64 ordenado y sin repetidos}
+            vocabulary: Array con la clave original de cada código, o None
+                        si las claves ya eran enteras
+            duplicates: {archivo: número de claves repetidas}
+    """
+    vocabulary = {}
+    codes, duplicates = {}, {}
+    integer_keys = None
+    for name, keys in key_sets.items():
+        if isinstance(keys, np.ndarray) and keys.dtype.kind in 'iu':
+            raw = keys.astype(np.int64, copy=False)
+            is_int = True
+        else:
+            keys = list(keys)
+            # Claves nuevas en orden lexicográfico: códigos reproducibles
+            new_keys = sorted(set(keys) - vocabulary.keys())
+            vocabulary.update(zip(new_keys, range(len(vocabulary), len(vocabulary) + len(new_keys))))
+            raw = np.fromiter(map(vocabulary.__getitem__, keys), dtype=np.int64, count=len(keys))
+            is_int = False
+        if integer_keys is not None and integer_keys != is_int:
+            raise TypeError("No se pueden mezclar claves string y enteras")
+        integer_keys = is_int
+
+        unique = _sorted_unique(raw)
+        codes[name] = unique
+        duplicates[name] = int(len(raw) - len(unique))
+
+    if integer_keys:
+        return codes, None, duplicates
+
+    names = np.empty(len(vocabulary), dtype=object)
+    names[:] = list(vocabulary)
+    return codes, names, duplicates
+
+
+def build_presence(codes: dict) -> tuple:
+    """
+    Construye el mapa de presencia a partir de arrays de códigos ordenados.
+
+    Args:
+        codes: {archivo: array int64 ordenado y sin repetidos}
+
+    Returns:
+        tuple (universe, presence): universe es el array ordenado de todos los
+        códigos y presence el array bool (F, len(universe))
+    """
+    arrays = list(codes.values())
+    universe = _sorted_unique(np.concatenate(arrays)) if arrays else np.zeros(0, dtype=np.int64)
+    presence = np.zeros((len(arrays), len(universe)), dtype=bool)
+    for f, file_codes in enumerate(arrays):
+        presence[f, np.searchsorted(universe, file_codes)] = True
+    return universe, presence
+
+
+def validate_consistency(results: dict) -> ValidationReport:
+    """
+    Valida consistencia de elementos entre archivos.
+
+    Los elementos de ParseResult/ElementTable se emparejan por clave
+    canónica (como al consolidar); cada clave se reporta con el UNIQUE_KEY
+    de su primera aparición. Un archivo con el mismo elemento en dos
+    formatos de MEMBER cuenta en duplicates.
+
+    Args:
+        results: Diccionario {archivo: ParseResult | ElementTable | claves}
+
+    Returns:
+        ValidationReport con claves ordenadas por su código
+
+    Examples:
+        >>> report = validate_consistency({'E1': r1, 'E2': r2, 'E3': r3})
+        >>> report.get_summary()['consistent_elements']
+        >>> report.orphan_elements['E2']
+    """
+    tables = {name: result.to_table() if isinstance(result, ParseResult) else result
+              for name, result in results.items()
+              if isinstance(result, (ParseResult, ElementTable))}
+    codes, vocabulary, duplicates = encode_keys(
+        {name: _file_keys(tables.get(name, result)) for name, result in results.items()})
+    universe, presence = build_presence(codes)
+    if vocabulary is not None:
+        keys = vocabulary[universe]
+    elif tables:
+        keys = _key_labels(tables, universe)
+    else:
+        keys = universe
+
+    report = ValidationReport(
+        source_files=list(results),
+        keys=keys,
+        presence=presence,
+        duplicates=duplicates
+    )
+    logger.info(f"Validación: {report.total_elements} claves, "
+                f"{int(report.consistent_mask.sum())} en todos los archivos")
+    return report
+
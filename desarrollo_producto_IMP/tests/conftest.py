@@ -0,0 +1,152 @@
+"""
+Fixtures compartidas - Procesador de Fatiga SACS v1.0
+
+Genera listados FTG sintéticos con el formato de SACS (encabezados de
+página, bloques de casos de carga y líneas *** TOTAL DAMAGE ***) para
+probar el parser sin depender de data/ftglstE1.txt.
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+PAGE_HEADER = "SACS (2024)                                      FTG PAGE  {page}\n"
+SECTION_TITLE = "                     MEMBER FATIGUE DETAIL REPORT\n"
+COLUMN_HEADER = " JOINT   CHD   BRC   GRUP  LOAD   FATG  DAMAGES\n"
+
+
+def fortran(value: float) -> str:
+    """Formatea un valor en notación Fortran sin 'E' (ej: .48430268-9)."""
+    if value == 0:
+        return '.00000000+0'
+    exponent = math.floor(math.log10(abs(value))) + 1
+    mantissa = f"{value / 10 ** exponent:.8f}"
+    if mantissa.startswith('1.'):
+        exponent += 1
+        mantissa = f"{value / 10 ** exponent:.8f}"
+    return f"{mantissa[1:]}{exponent:+d}"
+
+
+def build_ftg_listing(elements, page_every: int = 40) -> str:
+    """
+    Construye el texto de un listado FTG.
+
+    Args:
+        elements: Lista de tuplas (joint, member, grup, totals, loads) donde
+                  loads es una lista de (load_id, [8 valores])
+        page_every: Cada cuántas líneas insertar un encabezado de página
+
+    Returns:
+        str con el contenido del archivo
+    """
+    lines = [PAGE_HEADER.format(page=1), "\n", SECTION_TITLE, "\n", COLUMN_HEADER]
+    for joint, member, grup, totals, loads in elements:
+        for i, (load_id, values) in enumerate(loads):
+            data = ' '.join(fortran(v) for v in values)
+            if i == 0:
+                lines.append(f" {joint:<6}{member:<11}{grup:<5}{load_id:>4}  {data}\n")
+            else:
+                lines.append(f"{'':<23}{load_id:>4}  {data}\n")
+        totals_str = ' '.join(f"{v:.8E}" for v in totals)
+        lines.append(f"  *** TOTAL DAMAGE ***  {totals_str}\n")
+
+    # Insertar encabezados de página dentro de los bloques
+    out = []
+    for n, line in enumerate(lines, start=1):
+        out.append(line)
+        if n % page_every == 0:
+            out.append(PAGE_HEADER.format(page=n // page_every + 1))
+    return ''.join(out)
+
+
+def make_elements(n: int, n_loads: int = 3, scale: float = 1.0, seed: int = 0):
+    """
+    Genera n elementos sintéticos con daños deterministas.
+
+    Returns:
+        Lista de tuplas aptas para build_ftg_listing
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    elements = []
+    for i in range(n):
+        joint = f"{100 + i // 3}L"
+        member = f"{i:04d} J{400 + i}"
+        grup = ['16A', '24B', 'DL9'][i % 3]
+        load_values = rng.uniform(1e-9, 1e-3, size=(n_loads, 8)) * scale
+        loads = [(str(k + 1), list(load_values[k])) for k in range(n_loads)]
+        totals = list(load_values.sum(axis=0))
+        elements.append((joint, member, grup, totals, loads))
+    return elements
+
+
+def shm_segment_names() -> set:
+    """Segmentos de memoria compartida presentes en /dev/shm."""
+    return {name for name in os.listdir('/dev/shm') if name.startswith('psm_')}
+
+
+def check_same_table(actual, expected):
+    """Verifica mismas claves, en el mismo orden, y mismos daños."""
+    assert actual.unique_keys.tolist() == expected.unique_keys.tolist()
+    np.testing.assert_array_equal(np.asarray(actual.damages), expected.damages)
+
+
+@pytest.fixture
+def ftg_file(tmp_path):
+    """
+    Fábrica de archivos FTG sintéticos.
+
+    Uso: path = ftg_file('ftglstE1.txt', elements)
+    """
+    def _write(name: str, elements, page_every: int = 40) -> str:
+        path = tmp_path / name
+        path.write_text(build_ftg_listing(elements, page_every), encoding='latin-1')
+        return str(path)
+    return _write
+
+
+@pytest.fixture
+def ftg_elements():
+    """Fábrica de elementos sintéticos (ver make_elements)."""
+    return make_elements
+
+
+@pytest.fixture
+def ftg_listing():
+    """Constructor del texto de un listado FTG (ver build_ftg_listing)."""
+    return build_ftg_listing
+
+
+@pytest.fixture
+def shm_segments():
+    """Listado de segmentos en /dev/shm (ver shm_segment_names)."""
+    return shm_segment_names
+
+
+@pytest.fixture
+def assert_same_table():
+    """Comparación de dos ElementTable (ver check_same_table)."""
+    return check_same_table
+
+
+@pytest.fixture
+def without_shared_memory(monkeypatch):
+    """Plataforma sin memoria compartida (Windows): usar un segmento o el
+    resource tracker falla."""
+    import shared_results
+    from multiprocessing import resource_tracker, shared_memory
+
+    def unsupported(*args, **kwargs):
+        raise OSError("memoria compartida no soportada")
+
+    monkeypatch.setattr(shared_results, 'SHARED_MEMORY', False)
+    monkeypatch.setattr(shared_memory, 'SharedMemory', unsupported)
+    monkeypatch.setattr(resource_tracker, 'ensure_running', unsupported)
@@ -0,0 +1,110 @@
+"""
+Test Suite para Índice de Adyacencia - Etapa 3
+Procesador de Fatiga SACS v1.0
+
+Tests para adjacency.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tables import ElementTable
+from ftg_parser import parse_fatigue_file
+from adjacency import adjacency_index, member_endpoints, worst_at_joint
+
+
+@pytest.fixture
+def table():
+    """Ejemplo de dificultades técnicas: una junta con varias conexiones."""
+    rows = [
+        ('0003', '802L 0005', '16A', 0.10),
+        ('0003', '0003-0005', '16A', 0.40),
+        ('0003', '802L-0003', 'DL9', 0.40),
+        ('0002', '0002-501L', '52A', 0.20),
+        ('0002', '401L-0002', '52A', 0.05),
+        ('0005', '0005 802L', '16A', 0.30),
+    ]
+    damages = np.repeat(np.array([r[3] for r in rows])[:, None], 8, axis=1)
+    return ElementTable.from_columns([r[0] for r in rows], [r[1] for r in rows],
+                                     [r[2] for r in rows], damages)
+
+
+class TestMemberEndpoints:
+    """Tests de los extremos codificados en MEMBER."""
+
+    @pytest.mark.parametrize('member,expected', [
+        ('802L 0005', ('802L', '0005')),
+        ('0002-501L', ('0002', '501L')),
+        ('401L-0002', ('401L', '0002')),
+        ('0426  J491', ('0426', 'J491')),
+    ])
+    def test_formats(self, member, expected):
+        """Caso: Formatos con espacio y con guión."""
+        assert member_endpoints(member) == expected
+
+
+class TestAdjacencyIndex:
+    """Tests de las consultas de vecindad."""
+
+    def test_rows_at_joint_and_touching(self, table):
+        """Caso: Conexiones de una junta y filas que la tienen como extremo."""
+        index = adjacency_index(table)
+
+        assert index.rows_at_joint('0003').tolist() == [0, 1, 2]
+        assert index.rows_touching('0003').tolist() == [1, 2]
+        assert index.rows_touching('802L').tolist() == [0, 2, 5]
+        assert index.neighborhood('0005').tolist() == [0, 1, 5]
+        assert index.rows_at_joint('802L').tolist() == []
+        assert index.rows_touching('9999').tolist() == []
+
+    def test_member_rows_any_format(self, table):
+        """Caso: El mismo brace se encuentra con cualquier orden o separador."""
+        index = adjacency_index(table)
+
+        assert index.member_rows('802L 0005').tolist() == [0, 5]
+        assert index.member_rows('0005-802L').tolist() == [0, 5]
+
+    def test_repeated_endpoint(self):
+        """Caso: Un MEMBER con el mismo nodo en ambos extremos es otro miembro."""
+        members = ['0005-0005', '0005 0006', '0006 0007']
+        table = ElementTable.from_columns(['0005'] * 3, members, ['16A'] * 3,
+                                          np.ones((3, 8)))
+        index = adjacency_index(table)
+
+        assert index.rows_touching('0005').tolist() == [0, 1]
+        assert index.member_rows('0005 0006').tolist() == [1]
+        assert index.member_rows('0005-0005').tolist() == [0]
+        assert index.member_rows('0006-0005').tolist() == [1]
+
+    def test_worst_by_joint(self, table):
+        """Caso: Peor daño por junta; empates reportan la primera fila."""
+        assert worst_at_joint(table, '0003') == (0.40, 1)
+        assert worst_at_joint(table, '0002') == (0.20, 3)
+        assert worst_at_joint(table, '802L') is None
+        assert worst_at_joint(table, 'X') is None
+
+        worst, row = adjacency_index(table).worst_by_node(table.max_damage, 'endpoint')
+        code = adjacency_index(table).node_ids['802L']
+        assert (worst[code], row[code]) == (0.40, 2)
+
+    def test_matches_scan(self, ftg_file, ftg_elements):
+        """Caso: Mismo resultado que recorrer todos los elementos."""
+        table = parse_fatigue_file(ftg_file('ftglstE1.txt', ftg_elements(40))).to_table()
+        index = adjacency_index(table)
+        members = table.members.tolist()
+
+        for node in set(table.joints.tolist()) | {e for m in members for e in member_endpoints(m)}:
+            expected_joint = [i for i, j in enumerate(table.joints) if j == node]
+            expected_touch = [i for i, m in enumerate(members) if node in member_endpoints(m)]
+            assert index.rows_at_joint(node).tolist() == expected_joint
+            assert index.rows_touching(node).tolist() == expected_touch
+        assert adjacency_index(table) is index
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
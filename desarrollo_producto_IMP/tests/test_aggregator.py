@@ -0,0 +1,141 @@
+"""
+Test Suite para Consolidación - Etapa 3
+Procesador de Fatiga SACS v1.0
+
+Tests para aggregator.py
+"""
+
+import pytest
+import math
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tables import ElementTable
+from aggregator import stack_results, consolidate, compensated_sum
+from ftg_parser import parse_fatigue_file
+
+
+def table(keys, values):
+    """Tabla con elementos 'JOINT/MEMBER/GRUP' y daño constante por fila."""
+    parts = [k.split('/') for k in keys]
+    damages = np.repeat(np.asarray(values, dtype=float)[:, None], 8, axis=1)
+    return ElementTable.from_columns([p[0] for p in parts], [p[1] for p in parts],
+                                     [p[2] for p in parts], damages)
+
+
+class TestStackResults:
+    """Tests para la alineación por clave."""
+
+    def test_alignment_and_presence(self):
+        """Caso: Elementos faltantes quedan en cero y marcados como ausentes."""
+        stack = stack_results({
+            'E1': table(['0003/0426 J491/16A', '0005/0002 J403/DL9'], [1.0, 2.0]),
+            'E2': table(['0005/0002 J403/DL9', '0007/0100 J200/24B'], [10.0, 20.0]),
+        })
+
+        assert stack.source_files == ['E1', 'E2']
+        assert stack.damages.shape == (2, 3, 8)
+        assert list(stack.elements.unique_keys) == [
+            '0003_0426 J491_16A', '0005_0002 J403_DL9', '0007_0100 J200_24B']
+        assert stack.present.tolist() == [[True, True, False], [False, True, True]]
+        assert list(stack.file_count) == [1, 2, 1]
+        assert stack.damages[0, 2, 0] == 0.0
+
+    def test_consolidated_sum(self):
+        """Caso: La tabla consolidada suma los daños de todos los archivos."""
+        consolidated = consolidate({
+            'E1': table(['0003/0426 J491/16A', '0005/0002 J403/DL9'], [1.0, 2.0]),
+            'E2': table(['0005/0002 J403/DL9'], [10.0]),
+            'E3': table(['0005/0002 J403/DL9', '0003/0426 J491/16A'], [100.0, 0.5]),
+        })
+
+        np.testing.assert_array_equal(consolidated.max_damage, [1.5, 112.0])
+
+    def test_from_parsed_files(self, ftg_file, ftg_elements):
+        """Caso: Consolidar ParseResult de archivos sintéticos."""
+        elements = ftg_elements(5)
+        r1 = parse_fatigue_file(ftg_file('ftglstE1.txt', elements))
+        r2 = parse_fatigue_file(ftg_file('ftglstE2.txt', elements[::-1]))
+
+        consolidated = consolidate({'E1': r1, 'E2': r2})
+
+        assert len(consolidated) == 5
+        np.testing.assert_allclose(consolidated.damages, 2 * r1.to_table().damages)
+
+    def test_member_formats_align(self):
+        """Caso: "802L 0005", "802L-0005" y "0005-802L" son el mismo miembro."""
+        stack = stack_results({
+            'E1': table(['0003/802L 0005/16A', '0003/802L 0005/DL9'], [1.0, 2.0]),
+            'E2': table(['0003/802L-0005/16A'], [10.0]),
+            'E3': table(['0003/0005-802L/16A', '0005/0005-802L/16A'], [100.0, 5.0]),
+        })
+
+        assert list(stack.elements.unique_keys) == [
+            '0003_802L 0005_16A', '0003_802L 0005_DL9', '0005_0005-802L_16A']
+        np.testing.assert_array_equal(stack.elements.max_damage, [111.0, 2.0, 5.0])
+        assert list(stack.file_count) == [3, 1, 1]
+
+    def test_same_file_canonical_duplicates(self, caplog):
+        """Caso: Mismo miembro en dos formatos en un archivo: gana la última y se reporta."""
+        stack = stack_results({
+            'A': table(['0003/802L 0005/16A', '0003/0005-802L/16A'], [1.0, 2.0]),
+            'B': table(['0003/802L 0005/16A'], [4.0]),
+        })
+
+        np.testing.assert_array_equal(stack.elements.max_damage, [6.0])
+        assert stack.duplicates == {'A': 1}
+        assert 'A: 1 filas con una clave canónica repetida' in caplog.text
+
+    def test_hash_collision_detected(self):
+        """Caso: Claves distintas con el mismo hash de 64 bits no se mezclan."""
+        t1 = table(['0003/0426 J491/16A'], [1.0])
+        t2 = table(['0005/0002 J403/DL9'], [2.0])
+        forged = t1.key_hashes.copy()
+        forged[:, 1] += 1
+        t2.cache['key_hashes'] = forged
+
+        consolidated = consolidate({'E1': t1, 'E2': t2})
+
+        assert list(consolidated.unique_keys) == ['0003_0426 J491_16A', '0005_0002 J403_DL9']
+        np.testing.assert_array_equal(consolidated.max_damage, [1.0, 2.0])
+
+
+class TestDeterministicSum:
+    """Tests de la suma reproducible sobre el eje de archivos."""
+
+    def test_bit_identical_for_any_file_order(self):
+        """Caso: Permutar los archivos no cambia ningún bit del daño por clave."""
+        rng = np.random.default_rng(3)
+        keys = [f'{i}/M{i}/16A' for i in range(30)]
+        results = {f'E{f}': table(keys, rng.random(30) * 10.0 ** rng.integers(-12, 1, size=30))
+                   for f in range(16)}
+        expected = consolidate(results)
+
+        for seed in range(5):
+            names = list(results)
+            np.random.default_rng(seed).shuffle(names)
+            shuffled = consolidate({n: results[n] for n in names})
+
+            order = np.argsort(shuffled.unique_keys)
+            assert shuffled.damages[order].tobytes() == \
+                expected.damages[np.argsort(expected.unique_keys)].tobytes()
+
+    def test_small_damages_are_not_lost(self):
+        """Caso: Daños de 1e-10 junto a uno grande se conservan (como math.fsum)."""
+        values = np.array([1.0] + [1e-10] * 1000 + [-1.0])[:, None]
+
+        assert compensated_sum(values)[0] == math.fsum(values[:, 0])
+        assert values.sum(axis=0)[0] != math.fsum(values[:, 0])
+
+    def test_no_files(self):
+        """Caso: Sin archivos el consolidado está vacío."""
+        assert compensated_sum(np.zeros((0, 3, 8))).tolist() == [[0.0] * 8] * 3
+        assert len(consolidate({})) == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
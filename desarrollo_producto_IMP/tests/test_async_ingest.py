@@ -0,0 +1,106 @@
+"""
+Test Suite para Ingesta Asíncrona - Etapa 2
+Procesador de Fatiga SACS v1.0
+
+Tests para async_ingest.py
+"""
+
+import pytest
+import gzip
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from aggregator import consolidate
+from ftg_parser import parse_fatigue_file
+from async_ingest import ingest_and_consolidate, ingest_files
+
+
+@pytest.mark.skipif(not os.path.isdir('/dev/shm'), reason="Requiere /dev/shm")
+class TestIngestFiles:
+    """Tests del pipeline lectura → parsing."""
+
+    def test_matches_serial_parse(self, ftg_file, ftg_elements, shm_segments):
+        """Caso: Mismas tablas que el parser secuencial, en el orden pedido."""
+        paths = [ftg_file(f'ftglst{i}.txt', ftg_elements(15, seed=i)) for i in range(3)]
+        before = shm_segments()
+
+        with ingest_files(paths, max_workers=1, block_size=512) as results:
+            assert list(results) == paths
+            for path in paths:
+                expected = parse_fatigue_file(path).to_table()
+                assert results[path].table.unique_keys.tolist() == expected.unique_keys.tolist()
+                np.testing.assert_array_equal(results[path].table.damages, expected.damages)
+
+        assert shm_segments() == before
+
+    def test_consolidation_independent_of_arrival(self, ftg_file, ftg_elements):
+        """Caso: El consolidado es bit a bit el de la consolidación secuencial."""
+        paths = [ftg_file(f'ftglst{i}.txt', ftg_elements(10, seed=i)) for i in range(4)]
+        expected = consolidate({p: parse_fatigue_file(p) for p in reversed(paths)})
+
+        table = ingest_and_consolidate(paths, max_workers=2, io_workers=3)
+
+        assert table.unique_keys.tolist() == expected.unique_keys.tolist()
+        np.testing.assert_array_equal(table.damages, expected.damages)
+
+    def test_compressed_and_callback(self, tmp_path, ftg_listing, ftg_elements):
+        """Caso: Entradas comprimidas y aviso de cada resultado al terminar."""
+        listing = ftg_listing(ftg_elements(8))
+        plain = tmp_path / 'ftglstE1.txt'
+        plain.write_text(listing, encoding='latin-1')
+        packed = tmp_path / 'ftglstE2.txt.gz'
+        packed.write_bytes(gzip.compress(listing.encode('latin-1')))
+        arrived = []
+
+        with ingest_files([str(plain), str(packed)], max_workers=1,
+                          on_result=lambda r: arrived.append(r.source)) as results:
+            np.testing.assert_array_equal(results[str(packed)].table.damages,
+                                          results[str(plain)].table.damages)
+
+        assert sorted(arrived) == sorted([str(plain), str(packed)])
+
+    def test_budget_smaller_than_files(self, ftg_file, ftg_elements):
+        """Caso: Un presupuesto menor que los archivos los procesa de a uno."""
+        paths = [ftg_file(f'ftglst{i}.txt', ftg_elements(5, seed=i)) for i in range(3)]
+
+        with ingest_files(paths, max_workers=1, memory_budget=1) as results:
+            assert [r.total_elements for r in results.values()] == [5, 5, 5]
+
+    def test_read_error_releases_segments(self, ftg_file, ftg_elements, tmp_path, shm_segments):
+        """Caso: Un archivo ilegible no deja segmentos huérfanos."""
+        paths = [ftg_file(f'ftglst{i}.txt', ftg_elements(5)) for i in range(2)]
+        paths.append(str(tmp_path / 'no_existe.txt'))
+        before = shm_segments()
+
+        with pytest.raises(FileNotFoundError):
+            ingest_files(paths, max_workers=1)
+
+        assert shm_segments() == before
+
+    def test_duplicate_paths(self, ftg_file, ftg_elements):
+        """Caso: Rutas repetidas se rechazan."""
+        path = ftg_file('ftglstE1.txt', ftg_elements(2))
+        with pytest.raises(ValueError):
+            ingest_files([path, path])
+
+
+class TestWithoutSharedMemory:
+    """Tests del pipeline en plataformas sin memoria compartida (Windows)."""
+
+    def test_matches_serial_parse(self, without_shared_memory, ftg_file, ftg_elements):
+        """Caso: Los resultados llegan por pickle y coinciden con el parser secuencial."""
+        paths = [ftg_file(f'ftglst{i}.txt', ftg_elements(6, seed=i)) for i in range(2)]
+
+        with ingest_files(paths, max_workers=1) as results:
+            for path in paths:
+                expected = parse_fatigue_file(path).to_table()
+                assert results[path].name == ''
+                np.testing.assert_array_equal(results[path].table.damages, expected.damages)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,96 @@
+"""
+Test Suite para Exportación CSV - Etapa 2
+Procesador de Fatiga SACS v1.0
+
+Tests para csv_export.py
+"""
+
+import pytest
+import csv
+import io
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ftg_parser import parse_fatigue_file
+from tables import ElementTable
+from csv_export import CSV_COLUMNS, damage_order, write_elements_csv
+
+
+def to_csv(table, **kwargs) -> str:
+    """CSV en memoria."""
+    out = io.StringIO()
+    write_elements_csv(table, out, **kwargs)
+    return out.getvalue()
+
+
+@pytest.fixture
+def result(ftg_file, ftg_elements):
+    """Resultado con 25 elementos."""
+    return parse_fatigue_file(ftg_file('ftglstE1.txt', ftg_elements(25)))
+
+
+class TestWriteElementsCSV:
+    """Tests del escritor CSV por bloques."""
+
+    def test_matches_element_dicts(self, result):
+        """Caso: Mismas columnas y valores que FatigueElement.to_dict ordenado."""
+        expected_rows = sorted((e.to_dict() for e in result.elements.values()),
+                               key=lambda d: -d['MAX_DAMAGE'])
+        expected = io.StringIO()
+        writer = csv.DictWriter(expected, fieldnames=list(expected_rows[0]),
+                                lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(expected_rows)
+
+        text = to_csv(result.to_table())
+
+        assert tuple(expected_rows[0]) == CSV_COLUMNS
+        assert text == expected.getvalue()
+
+    def test_block_size_does_not_change_output(self, result):
+        """Caso: Bloques pequeños producen el mismo archivo."""
+        table = result.to_table()
+        assert to_csv(table, block_rows=4) == to_csv(table)
+        assert to_csv(table, sort=False, block_rows=3) == to_csv(table, sort=False)
+
+    def test_top_k(self, result):
+        """Caso: top_k escribe los k de mayor daño en orden descendente."""
+        table = result.to_table()
+        rows = list(csv.DictReader(io.StringIO(to_csv(table, top_k=5))))
+
+        assert len(rows) == 5
+        assert [float(r['MAX_DAMAGE']) for r in rows] == \
+            sorted(table.max_damage.tolist(), reverse=True)[:5]
+
+    def test_unsorted_and_file_output(self, result, tmp_path):
+        """Caso: sort=False conserva el orden de la tabla; acepta una ruta."""
+        table = result.to_table()
+        path = str(tmp_path / 'salida.csv')
+
+        assert write_elements_csv(table, path, sort=False) == 25
+        with open(path, encoding='utf-8') as f:
+            keys = [r['UNIQUE_KEY'] for r in csv.DictReader(f)]
+        assert keys == table.unique_keys.tolist()
+
+
+class TestDamageOrder:
+    """Tests del orden por daño máximo."""
+
+    def test_ties_and_edges(self):
+        """Caso: Empates en orden de fila; top_k 0 y mayor que N."""
+        table = ElementTable.from_columns(
+            ['1', '2', '3', '4'], ['A', 'B', 'C', 'D'], ['16A'] * 4,
+            np.repeat(np.array([[1.0], [3.0], [3.0], [2.0]]), 8, axis=1))
+
+        assert damage_order(table).tolist() == [1, 2, 3, 0]
+        assert damage_order(table, top_k=2).tolist() == [1, 2]
+        assert damage_order(table, top_k=0).tolist() == []
+        assert damage_order(table, top_k=10).tolist() == [1, 2, 3, 0]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,100 @@
+"""
+Test Suite para Diagnósticos del Parsing - Etapa 2
+Procesador de Fatiga SACS v1.0
+
+Tests para diagnostics.py
+"""
+
+import pytest
+import os
+import sys
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from diagnostics import (
+    TOTAL_INVALID, TOTAL_WITHOUT_ELEMENT, DiagnosticsCollector, DiagnosticsLimitExceeded
+)
+from ftg_parser import ENGINES, FTGParser
+
+
+HEADER = (
+    "                     MEMBER FATIGUE DETAIL REPORT\n"
+    " JOINT   CHD   BRC   GRUP  LOAD   FATG  DAMAGES\n"
+)
+ORPHAN_TOTAL = "  *** TOTAL DAMAGE ***  .1-1 .1-1 .1-1 .1-1 .1-1 .1-1 .1-1 .1-1\n"
+ELEMENT = " 404L  0426 J491  24B    1  .1-1\n"
+BAD_TOTAL = "  *** TOTAL DAMAGE ***  .1-1 .1-1\n"
+
+
+class TestDiagnosticsCollector:
+    """Tests del colector acotado."""
+
+    def test_examples_are_bounded(self):
+        """Caso: Solo se formatean los primeros N mensajes; los conteos son completos."""
+        diagnostics = DiagnosticsCollector(max_examples=3)
+        for line in range(1, 11):
+            diagnostics.add(TOTAL_WITHOUT_ELEMENT, line=line, offset=line * 80)
+        diagnostics.add(TOTAL_INVALID, line=11, offset=880, key='404L_0426 J491_24B', detail='x')
+
+        assert len(diagnostics.warnings) == 3
+        assert diagnostics.warnings[0] == "Línea 1: *** TOTAL DAMAGE *** sin elemento previo"
+        assert diagnostics.errors == ["Línea 11: Error procesando TOTAL DAMAGE: x"]
+        assert diagnostics.warning_count == 10
+        assert diagnostics.error_count == 1
+        assert diagnostics.get_summary()['by_code'] == {'TOTAL_SIN_ELEMENTO': 10,
+                                                       'TOTAL_INVALIDO': 1}
+        assert list(diagnostics.entries('TOTAL_INVALIDO')) == \
+            [('TOTAL_INVALIDO', 11, 880, '404L_0426 J491_24B')]
+
+    def test_abort_threshold(self):
+        """Caso: Se lanza la excepción al alcanzar abort_after."""
+        diagnostics = DiagnosticsCollector(abort_after=2)
+        diagnostics.add(TOTAL_WITHOUT_ELEMENT, line=1)
+        with pytest.raises(DiagnosticsLimitExceeded):
+            diagnostics.add(TOTAL_WITHOUT_ELEMENT, line=2)
+
+
+class TestParserDiagnostics:
+    """Tests de la integración con FTGParser."""
+
+    @pytest.mark.parametrize('engine', ENGINES)
+    def test_pathological_file_is_bounded(self, engine):
+        """Caso: Miles de líneas problemáticas generan mensajes acotados."""
+        text = HEADER + ORPHAN_TOTAL * 5000
+
+        result = FTGParser(engine=engine, max_examples=10).parse_text(text)
+
+        assert len(result.warnings) == 10
+        assert result.warning_count == 5000
+        assert result.get_summary()['warnings_count'] == 5000
+        assert len(result.diagnostics) == 5000
+
+    @pytest.mark.parametrize('engine', ENGINES)
+    def test_structured_entries(self, engine):
+        """Caso: Línea, offset y clave coinciden entre motores."""
+        text = HEADER + ORPHAN_TOTAL + ELEMENT + BAD_TOTAL
+
+        result = FTGParser(engine=engine).parse_text(text)
+
+        offset = len(HEADER) + len(ORPHAN_TOTAL) + len(ELEMENT)
+        assert list(result.diagnostics.entries()) == [
+            ('TOTAL_SIN_ELEMENTO', 3, len(HEADER), None),
+            ('TOTAL_INVALIDO', 5, offset, '404L_0426 J491_24B'),
+        ]
+
+    @pytest.mark.parametrize('engine', ENGINES)
+    def test_abort_after(self, engine):
+        """Caso: Un archivo sin remedio se aborta temprano conservando lo parseado."""
+        text = HEADER + ELEMENT + ORPHAN_TOTAL + ORPHAN_TOTAL * 1000
+
+        result = FTGParser(engine=engine, abort_after=50).parse_text(text)
+
+        assert result.total_elements == 1
+        assert result.diagnostics.aborted
+        assert result.warning_count == 50
+        assert result.errors[-1].startswith("Línea 54: Parsing abortado")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
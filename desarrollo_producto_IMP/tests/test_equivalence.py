@@ -0,0 +1,99 @@
+"""
+Test Suite para Equivalencia Diferencial - Etapa 2
+Procesador de Fatiga SACS v1.0
+
+Tests para equivalence.py
+"""
+
+import pytest
+import json
+import os
+import sys
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ftg_parser import parse_fatigue_file
+from equivalence import (
+    MODES, check_listings, check_tokens, random_listing, random_tokens,
+    register_mode, run_equivalence
+)
+
+
+class TestGenerators:
+    """Tests de los generadores aleatorios."""
+
+    def test_reproducible(self):
+        """Caso: Mismo seed → mismo texto y tokens."""
+        assert random_listing(50, seed=3) == random_listing(50, seed=3)
+        assert random_listing(50, seed=3) != random_listing(50, seed=4)
+        assert random_tokens(100, seed=1) == random_tokens(100, seed=1)
+
+    def test_listing_edge_cases(self, tmp_path):
+        """Caso: El listado produce elementos, duplicados y diagnósticos."""
+        path = tmp_path / 'ftglst.txt'
+        path.write_text(random_listing(600, seed=5, invalid_rate=0.05), encoding='latin-1')
+
+        result = parse_fatigue_file(str(path))
+
+        assert 0 < result.total_elements < 600
+        assert result.diagnostics.count('TOTAL_INVALIDO') > 0
+        assert result.diagnostics.count('TOTAL_SIN_ELEMENTO') > 0
+
+
+class TestHarness:
+    """Tests del arnés diferencial."""
+
+    def test_registered_modes_equivalent(self):
+        """Caso: Los caminos rápidos actuales coinciden con la referencia."""
+        report = run_equivalence(seed=2, n_listings=2, n_elements=120, n_tokens=2000)
+
+        assert report.ok, report.get_summary()
+        names = [mode.name for mode in report.modes]
+        assert names.count('referencia') == 2
+        assert set(MODES['parse']) <= set(names)
+        assert all(mode.throughput > 0 for mode in report.modes)
+        json.dumps(report.get_summary())
+
+    def test_token_divergence_detected(self):
+        """Caso: Un conversor que ignora la notación Fortran diverge."""
+        tokens = ['.48430268-9', '1.23-4', '123-4', '0.8173E-05', 'abc']
+        modes = check_tokens(tokens, {'solo_float': float})
+
+        assert modes[1].divergences == 3
+        assert "'123-4'" in modes[1].examples[2]
+
+    def test_parse_divergence_detected(self, tmp_path):
+        """Caso: Perder la última clave o cambiar diagnósticos se reporta."""
+        path = tmp_path / 'ftglst.txt'
+        path.write_text(random_listing(100, seed=9, invalid_rate=0.1), encoding='latin-1')
+
+        def drop_last(p):
+            result = parse_fatigue_file(p)
+            result.elements.popitem()
+            result.warnings = result.warnings[1:]
+            return result
+
+        def raises(p):
+            raise RuntimeError('motor roto')
+
+        modes = check_listings([str(path)], {'drop_last': drop_last, 'roto': raises})
+
+        assert modes[1].divergences == 1
+        assert any('claves distintas' in e for e in modes[1].examples)
+        assert any('advertencias distintas' in e for e in modes[1].examples)
+        assert 'RuntimeError' in modes[2].examples[0]
+
+    def test_register_mode(self):
+        """Caso: Registro de modos por tipo."""
+        register_mode('token', 'prueba', float)
+        try:
+            assert MODES['token']['prueba'] is float
+        finally:
+            del MODES['token']['prueba']
+        with pytest.raises(ValueError):
+            register_mode('linea', 'prueba', float)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
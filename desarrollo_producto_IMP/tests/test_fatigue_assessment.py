@@ -0,0 +1,111 @@
+"""
+Test Suite para Evaluación de Vida a Fatiga - Etapa 3
+Procesador de Fatiga SACS v1.0
+
+Tests para fatigue_assessment.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tables import ElementTable
+from fatigue_assessment import DesignFactors, assess_fatigue, assess_damages
+
+
+def make_table():
+    """Tabla con 3 elementos de GRUPs distintos."""
+    damages = np.array([
+        [0.10, 0.20, 0.05, 0.0, 0.0, 0.0, 0.0, 0.40],   # 16A
+        [0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.07, 0.08],  # DL9
+        [0.00, 0.00, 0.00, 0.0, 0.0, 0.0, 0.0, 0.00],   # 24B
+    ])
+    return ElementTable.from_columns(
+        ['0003', '0005', '0007'],
+        ['0426 J491', '0002 J403', '0100 J200'],
+        ['16A', 'DL9', '24B'],
+        damages
+    )
+
+
+class TestDesignFactors:
+    """Tests para la resolución de DFF."""
+
+    def test_resolve_by_grup(self):
+        """Caso: DFF por GRUP con default."""
+        factors = DesignFactors(default=2.0, by_grup={'DL9': 10.0})
+        dff = factors.resolve(make_table())
+
+        np.testing.assert_array_equal(dff[:, 0], [2.0, 10.0, 2.0])
+
+    def test_resolve_by_location_takes_max(self):
+        """Caso: El factor por ubicación aplica si es más restrictivo."""
+        factors = DesignFactors(default=2.0, by_grup={'DL9': 10.0},
+                                by_location={'TOP': 5.0})
+        dff = factors.resolve(make_table())
+
+        assert dff.shape == (3, 8)
+        assert dff[0, 0] == 5.0    # TOP: max(2, 5)
+        assert dff[0, 1] == 2.0
+        assert dff[1, 0] == 10.0   # TOP: max(10, 5)
+
+    def test_invalid_factors(self):
+        """Caso: DFF no positivo o ubicación desconocida fallan."""
+        with pytest.raises(ValueError):
+            DesignFactors(default=0.0)
+        with pytest.raises(ValueError):
+            DesignFactors(by_location={'CENTER': 5.0})
+
+
+class TestAssessFatigue:
+    """Tests para la evaluación vectorizada."""
+
+    def test_fatigue_life(self):
+        """Caso: Vida = vida de diseño / daño, inf para daño cero."""
+        assessment = assess_fatigue(make_table(), design_life=20.0)
+
+        assert assessment.fatigue_life[0, 7] == pytest.approx(50.0)
+        assert assessment.fatigue_life[1, 0] == pytest.approx(2000.0)
+        assert np.isinf(assessment.fatigue_life[2]).all()
+        assert assessment.min_life[0] == pytest.approx(50.0)
+
+    def test_utilization_and_passes(self):
+        """Caso: Utilización = daño × DFF y bandera por ubicación."""
+        factors = DesignFactors(default=2.0, by_grup={'DL9': 10.0})
+        assessment = assess_fatigue(make_table(), 20.0, factors)
+
+        assert assessment.utilization[0, 7] == pytest.approx(0.8)
+        assert assessment.utilization[1, 7] == pytest.approx(0.8)
+        assert assessment.utilization[1, 6] == pytest.approx(0.7)
+        assert assessment.passes.all()
+
+        strict = assess_fatigue(make_table(), 20.0, DesignFactors(default=5.0))
+        assert not strict.passes[0, 7]     # 0.40 × 5 = 2.0
+        assert strict.passes[0, 0]         # 0.10 × 5 = 0.5
+        assert list(strict.element_passes) == [False, True, True]
+        assert strict.critical_index[0] == 7
+
+    def test_summary(self):
+        """Caso: Resumen con conteos de incumplimiento."""
+        assessment = assess_fatigue(make_table(), 20.0, DesignFactors(default=5.0))
+        summary = assessment.get_summary()
+
+        assert summary['total_elements'] == 3
+        assert summary['failing_elements'] == 1
+        assert summary['failing_hot_spots'] == 1   # solo 0.40 × 5 > 1
+        assert summary['max_utilization'] == pytest.approx(2.0)
+
+    def test_invalid_inputs(self):
+        """Caso: Vida de diseño no positiva o matriz con forma incorrecta."""
+        with pytest.raises(ValueError):
+            assess_damages(np.zeros((2, 8)), 0.0, 2.0)
+        with pytest.raises(ValueError):
+            assess_damages(np.zeros((2, 7)), 20.0, 2.0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,175 @@
+"""
+Test Suite para Vigilancia de Carpeta - Etapa 3
+Procesador de Fatiga SACS v1.0
+
+Tests para folder_watch.py
+"""
+
+import pytest
+import csv
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import threading
+from aggregator import consolidate
+from diagnostics import FILE_READ
+from ftg_parser import parse_fatigue_file
+import folder_watch
+from folder_watch import FolderWatcher, WatchState
+
+
+def read_csv(path):
+    """Filas del CSV consolidado como dicts."""
+    with open(path, encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.fixture
+def folder(tmp_path):
+    """Carpeta de plataforma vacía."""
+    path = tmp_path / 'IMP-A'
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def write_listing(folder, ftg_listing, ftg_elements):
+    """Escribe un listado sintético en la carpeta vigilada."""
+    def write(name, n, seed=0):
+        path = folder / name
+        path.write_text(ftg_listing(ftg_elements(n, seed=seed)), encoding='latin-1')
+        return str(path)
+    return write
+
+
+class TestFolderWatcher:
+    """Tests del modo de vigilancia."""
+
+    def test_waits_until_stable(self, folder, write_listing):
+        """Caso: Un archivo se procesa solo tras settle_seconds sin cambios."""
+        watcher = FolderWatcher(str(folder), settle_seconds=5.0)
+        write_listing('ftglstE1.txt', 10)
+
+        assert watcher.poll_once(now=0.0) == []
+        assert watcher.poll_once(now=3.0) == []
+        assert watcher.poll_once(now=5.0) == ['ftglstE1.txt']
+        assert len(read_csv(watcher.output_path)) == 10
+
+    def test_growing_file_restarts_wait(self, folder, write_listing):
+        """Caso: Un archivo que sigue creciendo no se procesa."""
+        watcher = FolderWatcher(str(folder), settle_seconds=5.0)
+        path = write_listing('ftglstE1.txt', 4)
+        watcher.poll_once(now=0.0)
+
+        with open(path, 'a', encoding='latin-1') as f:
+            f.write("SACS (2024)                                      FTG PAGE  9\n")
+
+        assert watcher.poll_once(now=5.0) == []
+        assert watcher.poll_once(now=10.0) == ['ftglstE1.txt']
+
+    def test_incremental_consolidation(self, folder, write_listing):
+        """Caso: Solo se parsean archivos nuevos; el consolidado suma todos."""
+        paths = [write_listing('ftglstE1.txt', 12, seed=1)]
+        watcher = FolderWatcher(str(folder), settle_seconds=0.0)
+        watcher.poll_once(now=0.0)
+        assert watcher.poll_once(now=1.0) == ['ftglstE1.txt']
+
+        # Nueva instancia (reinicio del servicio) retoma el estado persistido
+        paths.append(write_listing('ftglstE2.txt', 8, seed=2))
+        watcher = FolderWatcher(str(folder), settle_seconds=0.0)
+        watcher.poll_once(now=0.0)
+        assert watcher.poll_once(now=1.0) == ['ftglstE2.txt']
+
+        expected = consolidate({p: parse_fatigue_file(p) for p in paths})
+        rows = {r['UNIQUE_KEY']: float(r['MAX_DAMAGE']) for r in read_csv(watcher.output_path)}
+        assert len(rows) == len(expected) == 12
+        np.testing.assert_allclose([rows[k] for k in expected.unique_keys],
+                                   expected.max_damage)
+
+        summary = WatchState.load(watcher.state.path).get_summary()
+        assert summary['processed_files'] == 2
+        assert summary['total_elements'] == 20
+
+    def test_modified_and_removed_files(self, folder, write_listing):
+        """Caso: Archivos modificados se reprocesan y los eliminados se excluyen."""
+        watcher = FolderWatcher(str(folder), settle_seconds=0.0)
+        write_listing('ftglstE1.txt', 6)
+        path = write_listing('ftglstE2.txt', 3)
+        watcher.poll_once(now=0.0)
+        watcher.poll_once(now=1.0)
+
+        write_listing('ftglstE2.txt', 9, seed=5)
+        watcher.poll_once(now=2.0)
+        assert watcher.poll_once(now=3.0) == ['ftglstE2.txt']
+        assert len(read_csv(watcher.output_path)) == 9
+
+        os.remove(path)
+        watcher.poll_once(now=4.0)
+        assert sorted(watcher.state.files) == ['ftglstE1.txt']
+        assert len(read_csv(watcher.output_path)) == 6
+
+    def test_file_removed_before_process(self, folder, write_listing):
+        """Caso: Un archivo eliminado entre scan() y process() se omite."""
+        watcher = FolderWatcher(str(folder), settle_seconds=0.0)
+        path = write_listing('ftglstE1.txt', 4)
+        watcher.scan(now=0.0)
+        ready, _ = watcher.scan(now=1.0)
+        assert ready == ['ftglstE1.txt']
+
+        os.remove(path)
+
+        assert watcher.process(ready) == []
+        assert watcher.scan(now=2.0) == ([], [])
+
+    def test_unreadable_file_stays_pending(self, folder, write_listing, monkeypatch, caplog):
+        """Caso: Un archivo con error de lectura no se guarda y se reintenta."""
+        def unreadable(path, engine):
+            result = parse_fatigue_file(path, engine=engine)
+            result.diagnostics.add(FILE_READ, detail="error de E/S simulado")
+            return result
+
+        watcher = FolderWatcher(str(folder), settle_seconds=0.0)
+        write_listing('ftglstE1.txt', 5)
+        watcher.poll_once(now=0.0)
+        with monkeypatch.context() as patch:
+            patch.setattr(folder_watch, 'parse_fatigue_file', unreadable)
+            assert watcher.poll_once(now=1.0) == []
+
+        assert 'se reintentará' in caplog.text
+        assert watcher.state.files == {}
+        assert not os.path.exists(watcher._cache_path('ftglstE1.txt'))
+        assert watcher.poll_once(now=2.0) == ['ftglstE1.txt']
+
+    def test_run_survives_poll_errors(self, folder, monkeypatch, caplog):
+        """Caso: Un error en una revisión no detiene la vigilancia."""
+        watcher = FolderWatcher(str(folder), settle_seconds=0.0, poll_interval=0.0)
+        stop = threading.Event()
+        polls = []
+
+        def failing_poll():
+            polls.append(1)
+            if len(polls) == 1:
+                raise OSError("carpeta de red no disponible")
+            stop.set()
+
+        monkeypatch.setattr(watcher, 'poll_once', failing_poll)
+        watcher.run(stop)
+
+        assert len(polls) == 2
+        assert 'carpeta de red no disponible' in caplog.text
+
+    def test_ignores_other_files(self, folder, write_listing):
+        """Caso: Archivos que no cumplen el patrón se ignoran."""
+        write_listing('notas.txt', 3)
+        watcher = FolderWatcher(str(folder), settle_seconds=0.0)
+
+        assert watcher.scan(now=0.0) == ([], [])
+        assert watcher.scan(now=1.0) == ([], [])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,138 @@
+"""
+Test Suite para Lectura de Archivos FTG comprimidos
+Procesador de Fatiga SACS v1.0
+
+Tests para ftg_io.py y la lectura comprimida en data_cleaner/ftg_parser
+"""
+
+import pytest
+import os
+import sys
+import bz2
+import gzip
+import io
+import lzma
+import threading
+import zipfile
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ftg_io import (
+    PrefetchReader, decompress_bytes, list_archive_members, open_binary, open_ftg_text
+)
+from data_cleaner import detect_file_encoding
+from ftg_parser import parse_fatigue_file, parse_fatigue_archive
+
+
+@pytest.fixture
+def listing(ftg_listing, ftg_elements):
+    """Texto de un listado FTG sintético con 8 elementos."""
+    return ftg_listing(ftg_elements(8))
+
+
+class TestPrefetchReader:
+    """Tests para el lector con hilo de prefetch."""
+
+    def test_reads_all_bytes(self):
+        """Caso: Bloques pequeños reproducen el contenido completo."""
+        data = bytes(range(256)) * 1000
+        reader = io.BufferedReader(PrefetchReader(io.BytesIO(data), block_size=999, queue_depth=2))
+
+        assert reader.read() == data
+        reader.close()
+
+    def test_early_close_stops_thread(self):
+        """Caso: Cerrar antes de EOF detiene el hilo y cierra el origen."""
+        source = io.BytesIO(b'x' * 10_000_000)
+        reader = PrefetchReader(source, block_size=1000, queue_depth=2)
+        reader.read(10)
+        reader.close()
+
+        assert source.closed
+        assert not any(t.name == 'ftg-prefetch' for t in threading.enumerate())
+
+    def test_producer_error_propagates(self):
+        """Caso: Un error de descompresión se re-lanza al consumidor."""
+        truncated = gzip.compress(b'0003 16A\n' * 10000)[:200]
+        reader = PrefetchReader(gzip.GzipFile(fileobj=io.BytesIO(truncated)))
+
+        with pytest.raises(EOFError):
+            while reader.read(4096):
+                pass
+        reader.close()
+
+
+class TestCompressedParsing:
+    """Tests de parsing directo de entradas comprimidas."""
+
+    @pytest.mark.parametrize('ext,compress', [
+        ('.gz', gzip.compress), ('.bz2', bz2.compress), ('.xz', lzma.compress)])
+    def test_single_stream_formats(self, tmp_path, listing, ext, compress):
+        """Caso: .gz/.bz2/.xz producen el mismo resultado que el texto plano."""
+        plain = tmp_path / 'ftglstE1.txt'
+        plain.write_text(listing, encoding='latin-1')
+        packed = tmp_path / f'ftglstE1.txt{ext}'
+        packed.write_bytes(compress(listing.encode('latin-1')))
+
+        expected = parse_fatigue_file(str(plain))
+        result = parse_fatigue_file(str(packed))
+
+        assert result.errors == []
+        assert list(result.elements) == list(expected.elements)
+        np.testing.assert_array_equal(result.to_table().damages, expected.to_table().damages)
+
+    def test_zip_members(self, tmp_path, ftg_listing, ftg_elements):
+        """Caso: Un .zip con varios periodos se parsea miembro por miembro."""
+        path = tmp_path / 'periodos.zip'
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('E1/ftglstE1.txt', ftg_listing(ftg_elements(3)))
+            zf.writestr('E2/ftglstE2.txt', ftg_listing(ftg_elements(5)))
+
+        results = parse_fatigue_archive(str(path))
+
+        assert list_archive_members(str(path)) == ['E1/ftglstE1.txt', 'E2/ftglstE2.txt']
+        assert [r.total_elements for r in results.values()] == [3, 5]
+
+    def test_zip_requires_member(self, tmp_path):
+        """Caso: .zip con varios miembros exige indicar cuál leer."""
+        path = tmp_path / 'periodos.zip'
+        with zipfile.ZipFile(path, 'w') as zf:
+            zf.writestr('a.txt', 'A')
+            zf.writestr('b.txt', 'B')
+
+        with pytest.raises(ValueError):
+            open_binary(str(path))
+        with open_ftg_text(str(path), 'utf-8', member='b.txt') as f:
+            assert f.read() == 'B'
+
+    def test_decompress_bytes(self):
+        """Caso: Contenido ya leído se descomprime según la extensión."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as zf:
+            zf.writestr('E1/ftglstE1.txt', 'JOINT')
+
+        assert decompress_bytes('a.txt.gz', gzip.compress(b'JOINT')) == b'JOINT'
+        assert decompress_bytes('periodos.zip', buffer.getvalue()) == b'JOINT'
+        assert decompress_bytes('a.txt', b'JOINT') == b'JOINT'
+
+    def test_detect_encoding_compressed(self, tmp_path, listing):
+        """Caso: Detección de encoding sobre el contenido descomprimido."""
+        path = tmp_path / 'ftglstE1.txt.gz'
+        path.write_bytes(gzip.compress(listing.encode('utf-8')))
+
+        assert detect_file_encoding(str(path)).lower() in ('ascii', 'utf-8')
+
+    def test_truncated_archive_reports_error(self, tmp_path, listing):
+        """Caso: Un .gz truncado se reporta como error sin crash."""
+        path = tmp_path / 'ftglstE1.txt.gz'
+        path.write_bytes(gzip.compress(listing.encode('latin-1'))[:-40])
+
+        result = parse_fatigue_file(str(path))
+
+        assert len(result.errors) == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
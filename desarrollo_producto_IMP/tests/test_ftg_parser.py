@@ -14,7 +14,8 @@ import numpy as np
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from models import FatigueElement, ParseResult
-from ftg_parser import FTGParser, ParserState, parse_fatigue_file
+from tables import ElementTable
+from ftg_parser import ENGINES, FTGParser, ParserState, parse_fatigue_file
 
 
 class TestFatigueElement:
@@ -165,6 +166,80 @@ class TestParseResult:
         assert retrieved.joint == "0003"
 
 
+class TestElementTable:
+    """Tests para la representación columnar ElementTable."""
+    
+    def test_from_parse_result(self):
+        """Caso: Convertir ParseResult a tabla columnar."""
+        elem1 = FatigueElement("0003", "802L 0005", "16A", [1e-5] * 8)
+        elem2 = FatigueElement("0003", "91CD 0003", "DL9", [1e-6] * 7 + [5e-5])
+        result = ParseResult(
+            elements={elem1.unique_key: elem1, elem2.unique_key: elem2},
+            total_elements=2,
+            errors=[],
+            warnings=[]
+        )
+        
+        table = result.to_table()
+        
+        assert len(table) == 2
+        assert table.damages.shape == (2, 8)
+        assert table.joint_names == ["0003"]
+        assert list(table.grups) == ["16A", "DL9"]
+        assert list(table.unique_keys) == [elem1.unique_key, elem2.unique_key]
+        assert table.max_damage[1] == 5e-5
+        assert table.critical_location[1] == "TOP-RIGHT"
+    
+    def test_roundtrip_and_take(self):
+        """Caso: take() y to_elements() conservan los datos."""
+        table = ElementTable.from_columns(
+            ["0003", "0005", "0003"],
+            ["802L 0005", "0002-501L", "91CD 0003"],
+            ["16A", "52A", "16A"],
+            np.arange(24, dtype=float).reshape(3, 8)
+        )
+        
+        sub = table.take(np.array([2, 0]))
+        elements = sub.to_elements()
+        
+        assert list(elements) == ["0003_91CD 0003_16A", "0003_802L 0005_16A"]
+        assert elements["0003_91CD 0003_16A"].max_damage == 23.0
+    
+    def test_save_load(self, tmp_path):
+        """Caso: save() y load() conservan claves y daños."""
+        table = ElementTable.from_columns(
+            ["0003", "0005"], ["802L 0005", "0002-501L"], ["16A", "52A"],
+            np.arange(16, dtype=float).reshape(2, 8)
+        )
+        path = str(tmp_path / 'tabla.npz')
+        
+        table.save(path)
+        loaded = ElementTable.load(path)
+        
+        assert list(loaded.unique_keys) == list(table.unique_keys)
+        np.testing.assert_array_equal(loaded.damages, table.damages)
+    
+    def test_read_only(self):
+        """Caso: Columnas y resultados en cache no se pueden modificar."""
+        damages = np.ones((2, 8))
+        table = ElementTable.from_columns(["0003", "0005"], ["802L 0005", "0002-501L"],
+                                          ["16A", "52A"], damages)
+        
+        with pytest.raises(ValueError):
+            table.damages[0, 0] = 2.0
+        with pytest.raises(ValueError):
+            table.key_hashes[0, 0] = 0
+        table.cache['derivado'] = (np.zeros(2), 'texto')
+        with pytest.raises(ValueError):
+            table.cache['derivado'][0][0] = 1.0
+        damages[0, 0] = 3.0     # el array del llamador no cambia de permisos
+    
+    def test_wrong_shape(self):
+        """Caso: Matriz de daños con forma incorrecta debe fallar."""
+        with pytest.raises(ValueError):
+            ElementTable.from_columns(["0003"], ["802L 0005"], ["16A"], np.zeros((1, 7)))
+
+
 class TestFTGParser:
     """Tests para el parser FTG."""
     
@@ -281,5 +356,188 @@ class TestIntegrationParser:
         assert first_elem.max_damage > 0
 
 
+
+class TestLoadCaseDetails:
+    """Tests para la captura columnar de filas por caso de carga."""
+    
+    def test_disabled_by_default(self, ftg_file, ftg_elements):
+        """Caso: Sin capture_details no se generan filas de detalle."""
+        path = ftg_file('ftglstE1.txt', ftg_elements(5))
+        result = FTGParser().parse_file(path)
+        
+        assert result.total_elements == 5
+        assert result.load_details is None
+    
+    def test_capture_rows(self, ftg_file, ftg_elements):
+        """Caso: Se capturan todas las filas de cada elemento."""
+        elements = ftg_elements(6, n_loads=4)
+        path = ftg_file('ftglstE1.txt', elements, page_every=7)
+        result = FTGParser(capture_details=True).parse_file(path)
+        details = result.load_details
+        
+        assert result.total_elements == 6
+        assert len(details) == 24
+        assert details.damages.shape == (24, 8)
+        assert details.damages.dtype == np.float64
+        assert details.element_index.dtype == np.int32
+        assert details.load_names == ['1', '2', '3', '4']
+        
+        # Las filas del elemento 2 coinciden con los valores generados
+        rows = details.rows_for(2)
+        expected = np.array([values for _, values in elements[2][4]])
+        assert list(details.load_ids[rows]) == ['1', '2', '3', '4']
+        np.testing.assert_allclose(details.damages[rows], expected, rtol=1e-7)
+    
+    def test_details_sum_matches_total(self, ftg_file, ftg_elements):
+        """Caso: La suma de casos de carga coincide con TOTAL DAMAGE."""
+        path = ftg_file('ftglstE1.txt', ftg_elements(4))
+        result = parse_fatigue_file(path, capture_details=True)
+        details = result.load_details
+        
+        for row, element in enumerate(result.elements.values()):
+            summed = details.damages[details.rows_for(row)].sum(axis=0)
+            np.testing.assert_allclose(summed, element.damages, rtol=1e-6)
+    
+    def test_duplicate_key_last_wins(self, ftg_file, ftg_elements):
+        """Caso: Con claves duplicadas solo se conservan las filas de la última."""
+        elements = ftg_elements(3)
+        joint, member, grup, _, _ = elements[0]
+        duplicate = ftg_elements(1, n_loads=2, seed=7)[0]
+        elements.append((joint, member, grup, duplicate[3], duplicate[4]))
+        
+        path = ftg_file('ftglstE1.txt', elements)
+        result = FTGParser(capture_details=True).parse_file(path)
+        details = result.load_details
+        
+        assert result.total_elements == 3
+        rows = details.rows_for(0)
+        assert rows.stop - rows.start == 2
+        np.testing.assert_allclose(details.damages[rows],
+                                   np.array([v for _, v in duplicate[4]]), rtol=1e-7)
+    
+    def test_incomplete_block_discarded(self, tmp_path, ftg_listing, ftg_elements):
+        """Caso: Filas de un bloque sin TOTAL DAMAGE se descartan."""
+        text = ftg_listing(ftg_elements(2))
+        # Truncar el último TOTAL DAMAGE
+        text = text[:text.rindex('  *** TOTAL DAMAGE ***')]
+        path = tmp_path / 'ftglstE1.txt'
+        path.write_text(text, encoding='latin-1')
+        
+        result = FTGParser(capture_details=True).parse_file(str(path))
+        
+        assert result.total_elements == 1
+        assert set(result.load_details.element_index.tolist()) == {0}
+
+
+
+def assert_same_result(a, b):
+    """Verifica que dos ParseResult sean idénticos (claves, orden, daños, mensajes)."""
+    assert list(a.elements) == list(b.elements)
+    for key, element in a.elements.items():
+        np.testing.assert_array_equal(element.damages, b.elements[key].damages)
+        assert (element.joint, element.member, element.grup) == \
+            (b.elements[key].joint, b.elements[key].member, b.elements[key].grup)
+    assert a.errors == b.errors
+    assert a.warnings == b.warnings
+
+
+class TestRegexEngine:
+    """Tests de equivalencia entre el motor regex y la máquina de estados."""
+    
+    EDGE_CASES = (
+        "Reporte previo sin sección\n"
+        " 0001  0426 J491  16A    1  .1-1 .1-1 .1-1 .1-1 .1-1 .1-1 .1-1 .1-1\n"
+        "  *** TOTAL DAMAGE ***  .1-1 .1-1 .1-1 .1-1 .1-1 .1-1 .1-1 .1-1\n"
+        "                     MEMBER FATIGUE DETAIL REPORT\n"
+        " JOINT   CHD   BRC   GRUP  LOAD   FATG  DAMAGES\n"
+        "  *** TOTAL DAMAGE ***  .2-1 .2-1 .2-1 .2-1 .2-1 .2-1 .2-1 .2-1\n"
+        " 404L  0426 J491  24B    1  .48430268-9 .3-9 .6-9 .1-8 .4-9 .3-9 .5-9 .1-8\n"
+        "                         2  .48430268-9 .3-9 .6-9 .1-8 .4-9 .3-9 .5-9 .1-8\n"
+        "SACS (2024)                                      FTG PAGE  2\n"
+        "  *** TOTAL DAMAGE ***  .96-9 .6-9 1.2-9 .2-8 .8-9 .6-9 1.0-9 .2-8\n"
+        " 0003\t16A  14  0.99E-02 0.1E-01\n"
+        " 0004  0426 J492  16A    1  .1-1\n"
+        "  *** TOTAL DAMAGE ***  0.1E-05 0.2E-05 0.3E-05\n"
+        " 0002  0002-501L  52A   1  0.48430268-9\f\n"
+        "  *** TOTAL DAMAGE ***  0.817300E-05 0.727264E-05 0.203936E-06 0.385457E-06 "
+        "0.829927E-05 0.731133E-05 0.190128E-06 0.357162E-06\r\n"
+        " 0005  0002 J403 X  DL9  3  .1-2\n"
+        " 0005  0002 J403  DL9  4  .1-2\n"
+        "  *** TOTAL DAMAGE ***  1 2 3 4 5 6 7 8\n"
+        " 404L  0426 J491  24B    1  .1-1\n"
+        "  *** TOTAL DAMAGE ***  1.23-4 1.23-4 1.23-4 1.23-4 1.23-4 1.23-4 1.23-4 9.9-4\n"
+        " 0007  0100 J200  16A    1  .1-1"
+    )
+    
+    def test_invalid_engine(self):
+        """Caso: Motor desconocido o capture_details con regex."""
+        with pytest.raises(ValueError):
+            FTGParser(engine='awk')
+        with pytest.raises(ValueError):
+            FTGParser(capture_details=True, engine='regex')
+    
+    def test_edge_cases_match_state_machine(self):
+        """Caso: Casos borde producen el mismo resultado en ambos motores."""
+        expected = FTGParser().parse_text(self.EDGE_CASES)
+        result = FTGParser(engine='regex').parse_text(self.EDGE_CASES)
+        
+        assert_same_result(result, expected)
+        assert expected.total_elements == 3
+        assert len(expected.errors) == 1      # TOTAL con 3 valores
+        assert len(expected.warnings) == 1    # TOTAL sin elemento previo
+        # Clave duplicada: gana la última ocurrencia
+        assert expected.elements['404L_0426 J491_24B'].damages[7] == pytest.approx(9.9e-4)
+    
+    def test_synthetic_file_matches(self, ftg_file, ftg_elements):
+        """Caso: Archivo sintético con saltos de página dentro de bloques."""
+        path = ftg_file('ftglstE1.txt', ftg_elements(40, n_loads=16), page_every=13)
+        
+        expected = parse_fatigue_file(path)
+        result = parse_fatigue_file(path, engine='regex')
+        
+        assert result.total_elements == 40
+        assert_same_result(result, expected)
+    
+    def test_small_blocks(self, ftg_file, ftg_elements, monkeypatch):
+        """Caso: Bloques pequeños (líneas cortadas entre bloques) no cambian el resultado."""
+        import ftg_parser
+        path = ftg_file('ftglstE1.txt', ftg_elements(10))
+        expected = parse_fatigue_file(path)
+        
+        monkeypatch.setattr(ftg_parser, 'REGEX_BLOCK_CHARS', 97)
+        result = parse_fatigue_file(path, engine='regex')
+        
+        assert_same_result(result, expected)
+    
+    def test_parse_text_bytes(self, ftg_listing, ftg_elements):
+        """Caso: parse_text acepta bytes y str con el mismo resultado."""
+        text = ftg_listing(ftg_elements(5)).replace('\n', '\r\n')
+        
+        from_text = FTGParser(engine='regex').parse_text(text)
+        from_bytes = FTGParser().parse_text(text.encode('latin-1'))
+        
+        assert from_text.total_elements == 5
+        assert_same_result(from_text, from_bytes)
+    
+    @pytest.mark.parametrize('newline', ['\n', '\r\n', '\r'])
+    @pytest.mark.parametrize('engine', ENGINES)
+    def test_diagnostic_byte_offsets(self, tmp_path, monkeypatch, engine, newline):
+        """Caso: El offset de un diagnóstico es el byte de inicio de su línea."""
+        import ftg_parser
+        data = self.EDGE_CASES.replace('\r\n', '\n').replace('\n', newline).encode('utf-8')
+        path = tmp_path / 'ftglst.txt'
+        path.write_bytes(data)
+        line_starts = [0]
+        for line in data.splitlines(keepends=True):
+            line_starts.append(line_starts[-1] + len(line))
+        monkeypatch.setattr(ftg_parser, 'REGEX_BLOCK_CHARS', 97)
+        
+        for result in (FTGParser(engine=engine).parse_file(str(path)),
+                       FTGParser(engine=engine).parse_text(data, 'utf-8')):
+            entries = list(result.diagnostics.entries())
+            assert [e[1] for e in entries] == [6, 13]
+            assert [e[2] for e in entries] == [line_starts[5], line_starts[12]]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
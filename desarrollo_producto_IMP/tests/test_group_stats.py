@@ -0,0 +1,109 @@
+"""
+Test Suite para Estadísticas por Grupo - Etapa 3
+Procesador de Fatiga SACS v1.0
+
+Tests para group_stats.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tables import ElementTable
+from group_stats import (GroupIndex, group_index, group_statistics,
+                         compute_statistics, damage_bins)
+
+
+def make_table():
+    """5 elementos en 3 GRUPs y 2 JOINTs."""
+    max_values = [1e-6, 0.5, 3e-3, 0.2, 0.0]
+    damages = np.zeros((5, 8))
+    damages[:, 2] = max_values
+    return ElementTable.from_columns(
+        ['0003', '0003', '0005', '0005', '0005'],
+        ['0426 J491', '0002 J403', '0100 J200', '0101 J201', '0102 J202'],
+        ['16A', 'DL9', '16A', '16A', '24B'],
+        damages
+    )
+
+
+class TestGroupIndex:
+    """Tests para el índice CSR de grupos."""
+
+    def test_rows_and_counts(self):
+        """Caso: Filas por grupo en orden estable."""
+        index = GroupIndex.build(np.array([1, 0, 1, 2, 1]), ['a', 'b', 'c'])
+
+        assert index.counts.tolist() == [1, 3, 1]
+        assert index.rows(1).tolist() == [0, 2, 4]
+
+    def test_sum_max_argmax(self):
+        """Caso: Kernels de suma y máximo con grupo vacío."""
+        index = GroupIndex.build(np.array([0, 0, 2, 2]), ['a', 'b', 'c'])
+        values = np.array([1.0, 3.0, 5.0, 5.0])
+
+        group_max, group_argmax = index.max(values)
+
+        assert index.sum(values).tolist() == [4.0, 0.0, 10.0]
+        assert group_max[0] == 3.0 and np.isnan(group_max[1])
+        assert group_argmax.tolist() == [1, -1, 2]    # empate: primera fila
+
+
+class TestStatistics:
+    """Tests para estadísticas por grupo y globales."""
+
+    def test_group_statistics(self):
+        """Caso: Estadísticas por GRUP."""
+        stats = group_statistics(make_table(), 'grup')
+        by_name = stats.to_dict()
+
+        assert stats.names == ['16A', 'DL9', '24B']
+        assert by_name['16A']['count'] == 3
+        assert by_name['16A']['max'] == pytest.approx(0.2)
+        assert by_name['16A']['argmax'] == 3
+        assert by_name['16A']['sum'] == pytest.approx(0.2 + 3e-3 + 1e-6)
+        assert stats.top(1) == ['DL9']
+
+    def test_histogram_matches_global(self):
+        """Caso: Histogramas por grupo suman el histograma global."""
+        table = make_table()
+        stats = group_statistics(table, 'joint')
+        bins = damage_bins(table.max_damage)
+
+        assert stats.histogram.sum() == 5
+        np.testing.assert_array_equal(stats.histogram.sum(axis=0),
+                                      np.bincount(bins, minlength=len(stats.labels)))
+        assert bins[4] == 0                     # daño cero → desborde inferior
+        assert stats.labels[bins[0]] == '1e-06 a 1e-05'
+
+    def test_compute_statistics(self):
+        """Caso: Resumen global del plan de etapas."""
+        stats = compute_statistics(make_table(), threshold=0.1)
+
+        assert stats['total_elements'] == 5
+        assert stats['max_damage_overall'] == 0.5
+        assert stats['critical_element'] == '0003_0002 J403_DL9'
+        assert stats['elements_above_threshold'] == 2
+        assert sum(stats['damage_distribution'].values()) == 5
+        assert stats['joint_statistics']['0005']['count'] == 3
+
+    def test_results_are_cached(self):
+        """Caso: Índices y estadísticas se reutilizan desde table.cache."""
+        table = make_table()
+
+        assert group_index(table) is group_index(table)
+        assert compute_statistics(table) is compute_statistics(table)
+        assert ('group_statistics', 'grup', (-10, 1)) in table.cache
+
+    def test_invalid_group(self):
+        """Caso: Columna de agrupación no soportada."""
+        with pytest.raises(ValueError):
+            group_index(make_table(), 'member')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
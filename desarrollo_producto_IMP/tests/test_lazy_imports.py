@@ -0,0 +1,58 @@
+"""
+Test Suite para Arranque Rápido (imports diferidos)
+Procesador de Fatiga SACS v1.0
+
+Verifica que los módulos de entrada no carguen numpy, pandas ni chardet
+hasta que un flujo de trabajo los necesite.
+"""
+
+import pytest
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+HEAVY_MODULES = ('numpy', 'pandas', 'chardet', 'zipfile', 'lzma', 'bz2')
+
+
+def loaded_after(statement: str) -> list:
+    """Módulos pesados presentes en sys.modules tras ejecutar statement."""
+    code = (f"{statement}\n"
+            "import sys\n"
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                          text=True, env=env, check=True)
+    return [m for m in proc.stdout.strip().split(',') if m]
+
+
+class TestLazyImports:
+    """Tests de dependencias cargadas por cada módulo de entrada."""
+
+    @pytest.mark.parametrize('module', ['data_cleaner', 'models', 'ftg_parser', 'ftg_io',
+                                        'memory_profile', 'section_extractors',
+                                        'member_keys'])
+    def test_entry_modules_are_light(self, module):
+        """Caso: Importar el parser no carga dependencias pesadas."""
+        assert loaded_after(f"import {module}") == []
+
+    def test_parsing_loads_numpy_on_demand(self, ftg_file, ftg_elements):
+        """Caso: numpy se carga al parsear, no al importar."""
+        path = ftg_file('ftglstE1.txt', ftg_elements(2))
+        statement = (f"from ftg_parser import parse_fatigue_file\n"
+                     f"assert parse_fatigue_file({path!r}).total_elements == 2")
+
+        assert 'numpy' in loaded_after(statement)
+
+    def test_etapa2_script_import_is_light(self):
+        """Caso: Importar el script de Etapa 2 no carga pandas."""
+        scripts = os.path.join(os.path.dirname(__file__), '..', 'scripts')
+        statement = (f"import sys; sys.path.insert(0, {scripts!r})\n"
+                     f"import generar_output_etapa2")
+
+        assert loaded_after(statement) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
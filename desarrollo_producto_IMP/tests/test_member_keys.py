@@ -0,0 +1,69 @@
+"""
+Test Suite para Claves Canónicas de Miembro - Etapa 2
+Procesador de Fatiga SACS v1.0
+
+Tests para member_keys.py
+"""
+
+import pytest
+import os
+import sys
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from member_keys import DIGEST_SIZE, canonical_key, canonical_member, key_digest
+from models import FatigueElement
+from ftg_parser import parse_fatigue_file
+
+
+class TestCanonicalMember:
+    """Tests de la forma canónica de MEMBER."""
+
+    @pytest.mark.parametrize('member', ['802L 0005', '802L-0005', '0005-802L', '0005  802L'])
+    def test_variants(self, member):
+        """Caso: Formatos de distintos archivos y versiones de SACS."""
+        assert canonical_member(member) == '0005-802L'
+        assert canonical_key('0003', member, '16A') == '0003_0005-802L_16A'
+
+
+class TestKeyDigest:
+    """Tests del digest de la clave canónica."""
+
+    def test_equal_for_same_member(self):
+        """Caso: Mismo digest para el mismo miembro; distinto si cambia JOINT o GRUP."""
+        digest = key_digest('0003', '802L 0005', '16A')
+
+        assert len(digest) == DIGEST_SIZE
+        assert key_digest('0003', '0005-802L', '16A') == digest
+        assert key_digest('0005', '802L 0005', '16A') != digest
+        assert key_digest('0003', '802L 0005', 'DL9') != digest
+
+    def test_stable_value(self):
+        """Caso: El digest no depende del proceso (no usa hash() de Python)."""
+        assert key_digest('0003', '802L 0005', '16A').hex() == \
+            'b62f1fac9d932b52d77631575bc3b25f'
+
+    def test_computed_on_first_use(self, ftg_file, ftg_elements):
+        """Caso: El parsing no calcula digests; la tabla los calcula al primer uso."""
+        result = parse_fatigue_file(ftg_file('ftglstE1.txt', ftg_elements(4)))
+        element = next(iter(result.elements.values()))
+
+        assert 'key_digest' not in vars(element)
+        table = result.to_table()
+        assert 'key_hashes' not in table.cache
+        assert table.key_hashes.shape == (4, 2)
+        assert 'key_hashes' in table.cache
+        assert table.key_hashes[0].tobytes() == element.key_digest
+        assert table.take([2]).key_hashes.tolist() == table.key_hashes[2:3].tolist()
+
+    def test_element_canonical_key(self):
+        """Caso: FatigueElement expone la clave canónica."""
+        element = FatigueElement('0003', '802L 0005', '16A', [0.0] * 8)
+
+        assert element.canonical_key == '0003_0005-802L_16A'
+        assert element.unique_key == '0003_802L 0005_16A'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
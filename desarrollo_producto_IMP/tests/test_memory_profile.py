@@ -0,0 +1,120 @@
+"""
+Test Suite para Métricas de Memoria - Etapa 2
+Procesador de Fatiga SACS v1.0
+
+Tests para memory_profile.py
+"""
+
+import pytest
+import io
+import os
+import sys
+import tracemalloc
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from memory_profile import RunMetrics, track
+from ftg_parser import parse_fatigue_file
+from aggregator import consolidate
+from csv_export import write_elements_csv
+
+
+class TestRunMetrics:
+    """Tests de la medición por etapa."""
+
+    def test_stage_peak_and_retained(self):
+        """Caso: El pico incluye memoria temporal; lo retenido solo lo que sobrevive."""
+        metrics = RunMetrics()
+        with metrics.stage('bloque', elements=10):
+            kept = bytearray(2_000_000)
+            temporary = bytearray(8_000_000)
+            del temporary
+
+        stage = metrics.get('bloque')
+        assert stage.traced_peak >= 10_000_000
+        assert 2_000_000 <= stage.traced_retained < 3_000_000
+        assert stage.bytes_per_element == stage.traced_peak / 10
+        assert not tracemalloc.is_tracing()
+        del kept
+
+    def test_nested_stages_keep_outer_peak(self):
+        """Caso: Una etapa interna no borra el pico de la externa."""
+        metrics = RunMetrics()
+        with metrics.stage('externa'):
+            temporary = bytearray(6_000_000)
+            del temporary
+            with metrics.stage('interna'):
+                pass
+
+        assert [s.stage for s in metrics.stages] == ['interna', 'externa']
+        assert metrics.get('interna').traced_peak < 1_000_000
+        assert metrics.get('externa').traced_peak >= 6_000_000
+
+    def test_rss_only(self):
+        """Caso: trace=False solo mide RSS y tiempo."""
+        metrics = RunMetrics(trace=False)
+        with metrics.stage('rss') as stage:
+            stage.elements = 5
+
+        summary = metrics.get_summary()
+        assert summary['stages'][0]['elements'] == 5
+        assert summary['stages'][0]['traced_peak'] is None
+        assert summary['max_traced_peak'] is None
+        if sys.platform.startswith('linux'):
+            assert metrics.get('rss').rss_delta is not None
+            assert summary['peak_rss'] > 0
+
+    def test_rss_without_proc(self, monkeypatch):
+        """Caso: Sin /proc el RSS sale de psutil, o None si no está instalado."""
+        import builtins
+        import types
+        import memory_profile
+
+        real_open = builtins.open
+
+        def no_proc(path, *args, **kwargs):
+            if str(path).startswith('/proc/'):
+                raise FileNotFoundError(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, 'open', no_proc)
+        monkeypatch.setitem(sys.modules, 'psutil', None)
+        assert memory_profile.rss_bytes() is None
+
+        info = types.SimpleNamespace(rss=123_456, peak_wset=654_321)
+        process = types.SimpleNamespace(memory_info=lambda: info)
+        monkeypatch.setitem(sys.modules, 'psutil',
+                            types.SimpleNamespace(Process=lambda: process))
+        assert memory_profile.rss_bytes() == 123_456
+        monkeypatch.setattr(memory_profile, 'resource', None)
+        assert memory_profile.peak_rss_bytes() == 654_321
+
+    def test_track_without_metrics(self):
+        """Caso: Sin RunMetrics no se mide nada."""
+        with track(None, 'nada') as stage:
+            assert stage is None
+        assert not tracemalloc.is_tracing()
+
+
+class TestPipelineStages:
+    """Tests de las etapas instrumentadas."""
+
+    def test_parse_consolidate_export(self, ftg_file, ftg_elements):
+        """Caso: Cada etapa queda registrada con sus elementos."""
+        metrics = RunMetrics()
+        results = {name: parse_fatigue_file(ftg_file(name, ftg_elements(30)), metrics=metrics)
+                   for name in ('ftglstE1.txt', 'ftglstE2.txt')}
+        table = consolidate(results, metrics=metrics)
+        write_elements_csv(table, io.StringIO(), metrics=metrics)
+
+        assert [s.stage for s in metrics.stages] == [
+            'parse_file', 'parse_result', 'parse_file', 'parse_result',
+            'consolidation', 'export']
+        assert all(s.elements == 30 for s in metrics.stages)
+        assert all(s.traced_peak > 0 for s in metrics.stages)
+        assert 'parse_file' in metrics.format_report()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
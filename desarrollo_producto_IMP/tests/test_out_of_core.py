@@ -0,0 +1,127 @@
+"""
+Test Suite para Consolidación Fuera de Memoria - Etapa 3
+Procesador de Fatiga SACS v1.0
+
+Tests para out_of_core.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from aggregator import consolidate
+from ftg_parser import parse_fatigue_file
+from tables import ElementTable
+from out_of_core import WINDOW_ROW_BYTES, DamageAccumulator, consolidate_out_of_core
+
+
+@pytest.fixture
+def periods(ftg_file, ftg_elements):
+    """Tres periodos con elementos parcialmente compartidos."""
+    return {
+        'ftglstE1.txt': ftg_file('ftglstE1.txt', ftg_elements(40, seed=1)),
+        'ftglstE2.txt': ftg_file('ftglstE2.txt', ftg_elements(60, seed=2)),
+        'ftglstE3.txt': ftg_file('ftglstE3.txt', ftg_elements(25, seed=3)),
+    }
+
+
+class TestConsolidateOutOfCore:
+    """Tests de equivalencia con la consolidación en memoria."""
+
+    def test_matches_in_memory(self, periods, tmp_path, assert_same_table):
+        """Caso: Rutas parseadas de a una dan el mismo consolidado."""
+        expected = consolidate({n: parse_fatigue_file(p) for n, p in periods.items()})
+
+        table = consolidate_out_of_core(periods, str(tmp_path / 'acumulador.dmg'))
+
+        assert isinstance(table.damages.base, np.memmap)
+        assert_same_table(table, expected)
+
+    def test_small_budget_many_windows(self, periods, tmp_path, assert_same_table):
+        """Caso: Un presupuesto de pocas filas no cambia el resultado."""
+        results = {n: parse_fatigue_file(p) for n, p in periods.items()}
+
+        table = consolidate_out_of_core(results, str(tmp_path / 'acumulador.dmg'),
+                                        memory_budget=3 * WINDOW_ROW_BYTES)
+
+        assert_same_table(table, consolidate(results))
+
+    def test_duplicate_keys_last_row_wins(self, tmp_path, assert_same_table):
+        """Caso: Claves repetidas en un archivo se tratan como en stack_results."""
+        repeated = ElementTable.from_columns(
+            ['1', '2', '1'], ['A', 'B', 'A'], ['16A'] * 3,
+            np.array([[1.0] * 8, [2.0] * 8, [5.0] * 8]))
+        other = ElementTable.from_columns(['1'], ['A'], ['16A'], np.ones((1, 8)))
+        results = {'E1': repeated, 'E2': other}
+
+        table = consolidate_out_of_core(results, str(tmp_path / 'acumulador.dmg'))
+
+        assert_same_table(table, consolidate(results))
+        assert table.damages[0, 0] == 6.0
+
+    def test_row_order_follows_sorted_names(self, tmp_path):
+        """Caso: Las filas siguen los nombres ordenados, no el orden de entrada."""
+        results = {name: ElementTable.from_columns([joint], ['A'], ['16A'], np.ones((1, 8)))
+                   for name, joint in (('E2', '2'), ('E1', '1'))}
+
+        table = consolidate_out_of_core(results, str(tmp_path / 'acumulador.dmg'))
+
+        assert table.joints.tolist() == ['1', '2']
+        assert consolidate(results).joints.tolist() == ['2', '1']
+
+    def test_canonical_duplicates_counted(self, tmp_path, caplog):
+        """Caso: Mismo miembro en dos formatos en un archivo: gana la última y se reporta."""
+        acc = DamageAccumulator(str(tmp_path / 'acumulador.dmg'))
+        acc.add(ElementTable.from_columns(['0003', '0003'], ['802L 0005', '0005-802L'],
+                                          ['16A'] * 2, np.array([[1.0] * 8, [2.0] * 8])),
+                name='A')
+        acc.add(ElementTable.from_columns(['0003'], ['802L 0005'], ['16A'], np.full((1, 8), 4.0)))
+
+        assert acc.to_table().damages[0, 0] == 6.0
+        assert acc.get_summary()['duplicate_rows'] == 1
+        assert 'A: 1 filas con una clave canónica repetida' in caplog.text
+
+    def test_bit_identical_any_order(self, tmp_path, assert_same_table):
+        """Caso: El orden de entrada no cambia ningún bit del daño por clave."""
+        rng = np.random.default_rng(7)
+        keys = [f'{i}/M{i}/16A' for i in range(50)]
+        results = {f'E{f:02d}': ElementTable.from_columns(
+            [k.split('/')[0] for k in keys], [k.split('/')[1] for k in keys], ['16A'] * 50,
+            rng.random((50, 8)) * 10.0 ** rng.integers(-12, 1, size=(50, 1)))
+            for f in range(12)}
+        expected = consolidate(results)
+
+        shuffled = dict(reversed(list(results.items())))
+        table = consolidate_out_of_core(shuffled, str(tmp_path / 'acumulador.dmg'),
+                                        memory_budget=7 * WINDOW_ROW_BYTES)
+
+        assert_same_table(table, expected)
+
+
+class TestDamageAccumulator:
+    """Tests del acumulador en disco."""
+
+    def test_empty_and_summary(self, tmp_path):
+        """Caso: Sin elementos devuelve una tabla vacía; el resumen refleja el disco."""
+        accumulator = DamageAccumulator(str(tmp_path / 'vacio.dmg'))
+        accumulator.add_table(ElementTable.from_columns([], [], [], np.zeros((0, 8))))
+
+        assert len(accumulator.to_table()) == 0
+        assert accumulator.get_summary()['files'] == 1
+
+        accumulator.add_table(ElementTable.from_columns(['1'], ['A'], ['16A'], np.ones((1, 8))))
+        disk = os.path.getsize(accumulator.path) + os.path.getsize(accumulator.compensation_path)
+        assert disk == accumulator.get_summary()['disk_bytes'] == 128
+
+    def test_budget_too_small(self, tmp_path):
+        """Caso: Un presupuesto menor a una fila es un error."""
+        with pytest.raises(ValueError):
+            DamageAccumulator(str(tmp_path / 'x.dmg'), memory_budget=10)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,123 @@
+"""
+Test Suite para Servicio Local de Parsing - Etapa 2
+Procesador de Fatiga SACS v1.0
+
+Tests para parse_service.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from aggregator import consolidate
+from ftg_parser import parse_fatigue_file
+from tables import ElementTable
+from parse_service import ParseClient, ParseService, decode_table, encode_table
+
+
+@pytest.fixture(scope='module')
+def service():
+    """Servicio con un worker en un puerto libre."""
+    with ParseService(port=0, workers=1) as service:
+        service.start()
+        yield service
+
+
+@pytest.fixture
+def client(service):
+    """Cliente conectado al servicio."""
+    with ParseClient(*service.address) as client:
+        yield client
+
+
+class TestBinaryFormat:
+    """Tests del formato binario de respuestas."""
+
+    def test_roundtrip(self):
+        """Caso: encode/decode conserva la tabla y el encabezado."""
+        table = ElementTable.from_columns(
+            ["0003", "0005"], ["802L 0005", "0002-501L"], ["16A", "52A"],
+            np.arange(16, dtype=float).reshape(2, 8))
+
+        decoded, meta = decode_table(encode_table(table, {'source': 'x.txt'}))
+
+        assert meta['source'] == 'x.txt'
+        assert list(decoded.unique_keys) == list(table.unique_keys)
+        np.testing.assert_array_equal(decoded.damages, table.damages)
+
+    def test_invalid_data(self):
+        """Caso: Datos sin el prefijo FTGT se rechazan."""
+        with pytest.raises(ValueError):
+            decode_table(b'{"rows": 0}')
+
+
+class TestParseService:
+    """Tests del servicio y su cliente."""
+
+    def test_parse_and_cache(self, client, ftg_file, ftg_elements):
+        """Caso: El resultado coincide con el parser y la repetición usa el cache."""
+        path = ftg_file('ftglstE1.txt', ftg_elements(15))
+        expected = parse_fatigue_file(path)
+        hits = client.health()['cache_hits']
+
+        for _ in range(2):
+            table, meta = client.parse(path)
+            assert meta['total_elements'] == 15
+            assert list(table.unique_keys) == list(expected.elements)
+            np.testing.assert_array_equal(table.damages, expected.to_table().damages)
+
+        assert client.health()['cache_hits'] == hits + 1
+
+    def test_modified_file_is_reparsed(self, client, ftg_file, ftg_elements):
+        """Caso: Un archivo modificado no se sirve desde el cache."""
+        path = ftg_file('ftglstE1.txt', ftg_elements(4))
+        client.parse(path)
+        ftg_file('ftglstE1.txt', ftg_elements(6))
+
+        table, _ = client.parse(path)
+        assert len(table) == 6
+
+    def test_consolidate(self, client, ftg_file, ftg_elements):
+        """Caso: La consolidación en el servicio coincide con aggregator."""
+        paths = [ftg_file(f'ftglst{i}.txt', ftg_elements(10 + i, seed=i)) for i in range(2)]
+        expected = consolidate({p: parse_fatigue_file(p) for p in paths})
+
+        table, meta = client.consolidate(paths)
+
+        assert meta['sources'] == [os.path.realpath(p) for p in paths]
+        assert list(table.unique_keys) == list(expected.unique_keys)
+        np.testing.assert_array_equal(table.damages, expected.damages)
+
+    def test_without_shared_memory(self, without_shared_memory, ftg_file, ftg_elements):
+        """Caso: El servicio arranca y parsea sin memoria compartida (Windows)."""
+        path = ftg_file('ftglstE1.txt', ftg_elements(6))
+        expected = parse_fatigue_file(path).to_table()
+
+        with ParseService(port=0, workers=1) as service:
+            service.start()
+            with ParseClient(*service.address) as client:
+                table, meta = client.parse(path)
+
+        assert table.unique_keys.tolist() == expected.unique_keys.tolist()
+        np.testing.assert_array_equal(table.damages, expected.damages)
+        assert meta['total_elements'] == 6
+
+    def test_errors(self, client, tmp_path):
+        """Caso: Archivo inexistente y motor desconocido."""
+        with pytest.raises(FileNotFoundError):
+            client.parse(str(tmp_path / 'no_existe.txt'))
+
+        path = tmp_path / 'ftglstE1.txt'
+        path.write_text('')
+        with pytest.raises(ValueError):
+            client.parse(str(path), engine='awk')
+
+        assert client.health()['workers'] == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
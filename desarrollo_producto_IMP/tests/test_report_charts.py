@@ -0,0 +1,89 @@
+"""
+Test Suite para Gráficos del Reporte - Etapa 5
+Procesador de Fatiga SACS v1.0
+
+Tests para report_charts.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tables import ElementTable
+from report_charts import CHART_NAMES, chart_data, render_charts, render_charts_async
+
+
+def random_table(n, n_groups=50, seed=0):
+    """Tabla sintética de n elementos repartidos en n_groups GRUP."""
+    rng = np.random.default_rng(seed)
+    damages = 10.0 ** rng.uniform(-9, 0.5, size=(n, 8))
+    return ElementTable.from_columns(
+        [f"{i % 997:04d}" for i in range(n)],
+        [f"{i:06d} 802L" for i in range(n)],
+        [f"G{i % n_groups:02d}" for i in range(n)],
+        damages)
+
+
+class TestChartData:
+    """Tests de los agregados de los gráficos."""
+
+    def test_aggregates(self):
+        """Caso: Histograma, top-K y máximos por GRUP coinciden con la tabla."""
+        table = random_table(2000)
+        data = chart_data(table, top_k=5, max_groups=10)
+
+        assert data.histogram_counts.sum() == 2000
+        expected_top = np.sort(table.max_damage)[::-1][:5]
+        np.testing.assert_array_equal(data.top_damage, expected_top)
+        assert data.top_keys[0] == table.unique_keys[table.max_damage.argmax()]
+
+        grups = table.grups
+        best = {g: table.max_damage[grups == g].max() for g in set(grups.tolist())}
+        ranked = sorted(best, key=best.get, reverse=True)[:10]
+        assert data.group_names == ranked
+        assert data.other_groups == 40
+        assert chart_data(table, top_k=5, max_groups=10) is data
+
+    def test_size_independent_of_elements(self):
+        """Caso: El tamaño de los agregados no crece con los elementos."""
+        small = chart_data(random_table(500))
+        large = chart_data(random_table(50000, seed=1))
+
+        assert small.n_points == large.n_points
+        assert large.get_summary()['total_elements'] == 50000
+
+    def test_empty_table(self):
+        """Caso: Tabla vacía produce gráficos vacíos."""
+        data = chart_data(random_table(0))
+
+        assert data.top_keys == [] and data.group_names == []
+        assert data.histogram_counts.sum() == 0
+
+
+class TestRenderCharts:
+    """Tests del dibujo offscreen (requieren matplotlib)."""
+
+    def test_render(self, tmp_path):
+        """Caso: Se generan los tres PNG."""
+        pytest.importorskip('matplotlib')
+        paths = render_charts(chart_data(random_table(300)), str(tmp_path))
+
+        assert list(paths) == list(CHART_NAMES)
+        for path in paths.values():
+            with open(path, 'rb') as f:
+                assert f.read(8) == b'\x89PNG\r\n\x1a\n'
+
+    def test_render_async(self, tmp_path):
+        """Caso: El dibujo en otro proceso devuelve las mismas rutas."""
+        pytest.importorskip('matplotlib')
+        future = render_charts_async(chart_data(random_table(300)), str(tmp_path))
+
+        assert sorted(future.result(timeout=120)) == sorted(CHART_NAMES)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
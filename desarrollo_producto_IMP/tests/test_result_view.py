@@ -0,0 +1,110 @@
+"""
+Test Suite para Visor de Resultados - Etapa 4
+Procesador de Fatiga SACS v1.0
+
+Tests para result_view.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tables import ElementTable
+from csv_export import CSV_COLUMNS, row_tuples
+from result_view import ResultView, sort_order
+
+
+@pytest.fixture
+def table():
+    """Tabla de 60 elementos con daños aleatorios y categorías repetidas."""
+    rng = np.random.default_rng(5)
+    n = 60
+    return ElementTable.from_columns(
+        [f"{900 - i // 4}L" for i in range(n)],
+        [f"{i * 37 % 1000:04d} J{i % 7}" for i in range(n)],
+        [('24B', 'DL9', '16A')[i % 3] for i in range(n)],
+        rng.random((n, 8)))
+
+
+def all_rows(view: ResultView) -> list:
+    """Todas las tuplas de la vista, pidiéndolas por páginas de 7."""
+    rows = []
+    for start in range(0, len(view), 7):
+        rows.extend(view.page(start, 7))
+    return rows
+
+
+class TestSortOrder:
+    """Tests de las permutaciones de orden."""
+
+    @pytest.mark.parametrize('column', CSV_COLUMNS)
+    def test_matches_sorted_rows(self, table, column):
+        """Caso: Cada permutación equivale a ordenar las tuplas por esa columna."""
+        i = CSV_COLUMNS.index(column)
+        rows = row_tuples(table, slice(None))
+        if column == 'CRITICAL_LOCATION':
+            expected = sorted(range(len(rows)), key=lambda r: table.critical_index[r])
+        else:
+            expected = sorted(range(len(rows)), key=lambda r: rows[r][i])
+
+        assert sort_order(table, column).tolist() == expected
+
+    def test_cached_and_unknown_column(self, table):
+        """Caso: La permutación se reutiliza; columnas desconocidas son un error."""
+        assert sort_order(table, 'TOP') is sort_order(table, 'TOP')
+        with pytest.raises(ValueError):
+            sort_order(table, 'DAMAGE')
+
+
+class TestResultView:
+    """Tests de la vista paginada."""
+
+    def test_pages_follow_sort(self, table):
+        """Caso: Las páginas concatenadas dan la tabla ordenada descendente."""
+        view = ResultView(table, precompute=True)
+        damages = [row[CSV_COLUMNS.index('MAX_DAMAGE')] for row in all_rows(view)]
+
+        assert len(view) == 60
+        assert damages == sorted(table.max_damage.tolist(), reverse=True)
+
+        view.sort('JOINT')
+        assert [row[0] for row in view.page(0, 60)] == sorted(table.joints.tolist())
+
+    def test_filter(self, table):
+        """Caso: El filtro combina criterios y conserva el orden."""
+        view = ResultView(table)
+        view.set_filter(grups=['24B', 'DL9'], min_damage=0.5, member='J3')
+
+        rows = all_rows(view)
+        expected = [r for r in row_tuples(table, view.order)
+                    if r[2] in ('24B', 'DL9') and r[11] >= 0.5 and 'J3' in r[1]]
+        assert rows == expected
+        assert len(rows) == len(view) == sum(
+            g in ('24B', 'DL9') and d >= 0.5 and 'J3' in m
+            for g, d, m in zip(table.grups, table.max_damage, table.members))
+        assert [r[11] for r in rows] == sorted((r[11] for r in rows), reverse=True)
+
+        view.set_filter()
+        assert len(view) == 60
+
+    def test_page_bounds_and_position(self, table):
+        """Caso: Páginas fuera de rango vacías; posición de un elemento en la vista."""
+        view = ResultView(table)
+        top = view.page(0, 1)[0]
+
+        assert view.page(60, 10) == []
+        assert len(view.page(55, 10)) == 5
+        assert view.position_of(top[-1]) == 0
+        assert view.position_of('no_existe') is None
+
+        view.set_filter(min_damage=2.0)
+        assert view.position_of(top[-1]) is None
+        assert view.get_summary()['view_rows'] == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,122 @@
+"""
+Test Suite para Almacén de Resultados SQLite - Etapa 3
+Procesador de Fatiga SACS v1.0
+
+Tests para results_store.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from aggregator import stack_results
+from ftg_parser import parse_fatigue_file
+from tables import ElementTable
+from results_store import ResultsStore, store_results
+
+
+def one_element(member, damage):
+    """Tabla de un solo elemento 0005/<member>/16A con daño constante."""
+    return ElementTable.from_columns(['0005'], [member], ['16A'], np.full((1, 8), damage))
+
+
+@pytest.fixture
+def run_results(ftg_file, ftg_elements):
+    """Dos periodos con 30 y 20 elementos (20 en común)."""
+    return {
+        'ftglstE1.txt': parse_fatigue_file(ftg_file('ftglstE1.txt', ftg_elements(30, seed=1))),
+        'ftglstE2.txt': parse_fatigue_file(ftg_file('ftglstE2.txt', ftg_elements(20, seed=2))),
+    }
+
+
+class TestResultsStore:
+    """Tests de escritura y consultas del almacén."""
+
+    def test_add_run_roundtrip(self, tmp_path, run_results):
+        """Caso: La corrida guardada reproduce la consolidación."""
+        path = str(tmp_path / 'resultados.db')
+        run_id = store_results(path, run_results, 'Operación', platform='IMP-A')
+
+        with ResultsStore(path) as store:
+            runs = store.runs()
+            assert [(r['name'], r['platform'], r['elements'], r['files']) for r in runs] == \
+                [('Operación', 'IMP-A', 30, 2)]
+
+            expected = stack_results(run_results).elements
+            table = store.to_table(run_id)
+            assert table.unique_keys.tolist() == expected.unique_keys.tolist()
+            np.testing.assert_array_equal(table.damages, expected.damages)
+
+            periods = store.query("SELECT COUNT(*) AS n FROM period_damage")[0]['n']
+            assert periods == 50
+
+    def test_top_elements(self, run_results):
+        """Caso: Top por daño consolidado con filtro de GRUP."""
+        with ResultsStore(':memory:') as store:
+            run_id = store.add_run(run_results, 'Operación')
+            expected = stack_results(run_results).elements
+
+            top = store.top_elements(run_id, k=5)
+            assert [r['max_damage'] for r in top] == sorted(expected.max_damage, reverse=True)[:5]
+
+            grup = expected.grup_names[0]
+            top_grup = store.top_elements(run_id, k=100, grup=grup)
+            assert len(top_grup) == int((expected.grups == grup).sum())
+            assert {r['grup'] for r in top_grup} == {grup}
+
+    def test_history_across_runs(self, run_results):
+        """Caso: Historial de un elemento en varias corridas y borrado de corrida."""
+        with ResultsStore(':memory:') as store:
+            first = store.add_run(run_results, 'A', platform='IMP-A')
+            second = store.add_run({'ftglstE1.txt': run_results['ftglstE1.txt']}, 'B',
+                                   platform='IMP-B')
+            key = next(iter(run_results['ftglstE1.txt'].elements))
+
+            history = store.element_history(key)
+            assert [h['run_id'] for h in history] == [first, second]
+
+            store.delete_run(first)
+            assert [h['run_id'] for h in store.element_history(key)] == [second]
+            assert store.query("SELECT COUNT(*) AS n FROM period_damage")[0]['n'] == 30
+
+    def test_history_member_formats(self):
+        """Caso: El historial encuentra el elemento con cualquier formato de MEMBER."""
+        with ResultsStore(':memory:') as store:
+            first = store.add_run({'ftglstE1.txt': one_element('802L 0005', 0.1)}, 'A')
+            second = store.add_run({'ftglstE1.txt': one_element('0005-802L', 0.2)}, 'B')
+
+            for key in ('0005_802L 0005_16A', '0005_0005-802L_16A'):
+                history = store.element_history(key)
+                assert [(h['run_id'], h['max_damage']) for h in history] == \
+                    [(first, 0.1), (second, 0.2)]
+
+    def test_upgrade_from_version_1(self, tmp_path):
+        """Caso: Un almacén de la versión 1 recibe la clave canónica al abrirse."""
+        path = str(tmp_path / 'resultados.db')
+        with ResultsStore(path) as store:
+            run_id = store.add_run({'ftglstE1.txt': one_element('802L 0005', 0.1)}, 'A')
+            with store.conn:
+                store.conn.executescript(
+                    "DROP INDEX idx_elements_canonical; "
+                    "ALTER TABLE elements DROP COLUMN canonical_key; "
+                    "PRAGMA user_version = 1;")
+
+        with ResultsStore(path) as store:
+            assert store.conn.execute("PRAGMA user_version").fetchone()[0] == 2
+            assert [h['run_id'] for h in store.element_history('0005_0005-802L_16A')] == [run_id]
+
+    def test_indexes_used(self):
+        """Caso: Los filtros por GRUP y JOINT usan índices."""
+        with ResultsStore(':memory:') as store:
+            for column, index in (('grup', 'idx_elements_grup'), ('joint', 'idx_elements_joint')):
+                plan = store.query(f"EXPLAIN QUERY PLAN SELECT * FROM elements WHERE {column} = ?",
+                                   ('24B',))
+                assert index in ' '.join(row['detail'] for row in plan)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
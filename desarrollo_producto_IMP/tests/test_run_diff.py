@@ -0,0 +1,116 @@
+"""
+Test Suite para Comparación de Corridas - Etapa 3
+Procesador de Fatiga SACS v1.0
+
+Tests para run_diff.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tables import ElementTable
+from ftg_parser import parse_fatigue_file
+from run_diff import diff_runs
+
+
+def table(rows):
+    """Tabla a partir de (JOINT, MEMBER, GRUP, daño constante)."""
+    damages = np.repeat(np.array([r[3] for r in rows], dtype=float)[:, None], 8, axis=1)
+    return ElementTable.from_columns([r[0] for r in rows], [r[1] for r in rows],
+                                     [r[2] for r in rows], damages)
+
+
+@pytest.fixture
+def revisions():
+    """Dos revisiones: un cambio grande, uno pequeño, una baja y un alta."""
+    old = table([
+        ('0003', '802L 0005', '16A', 0.10),
+        ('0003', '0003-0005', '16A', 0.40),
+        ('0002', '0002-501L', '52A', 0.20),
+        ('0005', '0005 802L', 'DL9', 0.00),
+    ])
+    new = table([
+        ('0005', '0005 802L', 'DL9', 0.05),
+        ('0002', '0002-501L', '52A', 0.21),
+        ('0003', '802L 0005', '16A', 0.50),
+        ('0007', '0007-0100', '24B', 0.30),
+    ])
+    return old, new
+
+
+class TestDiffRuns:
+    """Tests de alineación y cambios."""
+
+    def test_alignment_added_removed(self, revisions):
+        """Caso: Coincidencias por clave, altas y bajas."""
+        diff = diff_runs(*revisions)
+
+        assert diff.new_rows.tolist() == [0, 1, 2]
+        assert diff.old_rows.tolist() == [3, 2, 0]
+        assert diff.added_keys == ['0007_0007-0100_24B']
+        assert diff.removed_keys == ['0003_0003-0005_16A']
+        assert diff.get_summary()['changed'] == 3
+
+    def test_changes_and_ranking(self, revisions):
+        """Caso: Cambios absolutos y relativos vectorizados; ranking por cambio."""
+        diff = diff_runs(*revisions)
+
+        np.testing.assert_allclose(diff.change[:, 0], [0.05, 0.01, 0.40])
+        assert diff.relative[0, 0] == np.inf
+        np.testing.assert_allclose(diff.relative[1:, 0], [0.05, 4.0])
+
+        top = diff.change_rows(diff.top_changes(2))
+        assert [r['UNIQUE_KEY'] for r in top] == ['0003_802L 0005_16A', '0005_0005 802L_DL9']
+        assert top[0]['OLD_MAX_DAMAGE'] == 0.10
+        assert top[0]['NEW_MAX_DAMAGE'] == 0.50
+        assert diff.top_changes(1, relative=True).tolist() == [0]
+        assert len(diff.changed(tolerance=0.02)) == 2
+
+    def test_member_formats_match(self):
+        """Caso: El mismo MEMBER en otro formato es una coincidencia."""
+        diff = diff_runs(table([('0003', '802L 0005', '16A', 0.10)]),
+                         table([('0003', '0005-802L', '16A', 0.30)]))
+
+        assert (len(diff.old_rows), len(diff.added), len(diff.removed)) == (1, 0, 0)
+        np.testing.assert_allclose(diff.change, 0.20)
+
+    def test_identical_runs(self, ftg_file, ftg_elements):
+        """Caso: El mismo archivo parseado dos veces no tiene diferencias."""
+        path = ftg_file('ftglstE1.txt', ftg_elements(30))
+        diff = diff_runs(parse_fatigue_file(path), parse_fatigue_file(path))
+
+        assert diff.get_summary() == {
+            'old_elements': 30, 'new_elements': 30, 'matched': 30, 'changed': 0,
+            'added': 0, 'removed': 0, 'max_abs_change': 0.0}
+
+    def test_repeated_key_in_a_run(self, caplog):
+        """Caso: Una corrida con la misma clave en dos grafías (gana la última)."""
+        run = table([
+            ('0005', '802L 0005', '16A', 0.10),
+            ('0003', '0003-0005', '16A', 0.40),
+            ('0005', '0005-802L', '16A', 0.20),
+        ])
+        diff = diff_runs(run, run)
+
+        assert repr(diff) == 'RunDiff(matched=2, added=0, removed=0)'
+        assert diff.get_summary()['changed'] == 0
+        assert diff.new.unique_keys.tolist() == ['0003_0003-0005_16A', '0005_0005-802L_16A']
+        assert 'gana la última' in caplog.text
+
+    def test_empty(self, revisions):
+        """Caso: Comparar contra una corrida vacía."""
+        empty = table([])
+        diff = diff_runs(empty, revisions[1])
+
+        assert len(diff.added) == 4
+        assert diff.get_summary()['max_abs_change'] == 0.0
+        assert diff.top_changes(5).tolist() == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
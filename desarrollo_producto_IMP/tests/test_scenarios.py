@@ -0,0 +1,93 @@
+"""
+Test Suite para Motor de Escenarios - Etapa 3
+Procesador de Fatiga SACS v1.0
+
+Tests para scenarios.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tables import ElementTable
+from aggregator import stack_results
+from scenarios import Scenario, evaluate_scenarios
+
+
+def make_stack(n_elements=50, n_files=3, seed=0):
+    """Stack aleatorio con los mismos elementos en todos los archivos."""
+    rng = np.random.default_rng(seed)
+    joints = [f"{i:04d}" for i in range(n_elements)]
+    members = [f"{i:04d} J{i}" for i in range(n_elements)]
+    grups = ['16A'] * n_elements
+    results = {
+        f"ftglstE{f + 1}.txt": ElementTable.from_columns(
+            joints, members, grups, rng.uniform(0, 1e-2, (n_elements, 8)))
+        for f in range(n_files)
+    }
+    return stack_results(results)
+
+
+class TestScenarios:
+    """Tests para la evaluación de escenarios."""
+
+    def test_base_scenario_equals_consolidation(self):
+        """Caso: Pesos unitarios reproducen la suma consolidada."""
+        stack = make_stack()
+        result = evaluate_scenarios(stack, [Scenario('Base')])
+
+        np.testing.assert_allclose(result.max_damage[0], stack.elements.max_damage)
+        np.testing.assert_array_equal(result.critical_index[0], stack.elements.critical_index)
+
+    def test_weighted_scenarios(self):
+        """Caso: Reponderar y excluir archivos."""
+        stack = make_stack()
+        scenarios = [
+            Scenario('Sin E3', {'ftglstE3.txt': 0.0}),
+            Scenario('E2 doble', {'ftglstE2.txt': 2.0}),
+            Scenario('Vida x1.5', default_weight=1.5),
+        ]
+        result = evaluate_scenarios(stack, scenarios)
+
+        d = stack.damages
+        expected = [d[0] + d[1], d[0] + 2 * d[1] + d[2], 1.5 * d.sum(axis=0)]
+        for s, matrix in enumerate(expected):
+            np.testing.assert_allclose(result.max_damage[s], matrix.max(axis=1))
+            np.testing.assert_allclose(result.scenario_damages(s), matrix)
+        assert result.names == ['Sin E3', 'E2 doble', 'Vida x1.5']
+
+    def test_blocked_evaluation_matches(self):
+        """Caso: Bloques pequeños dan el mismo resultado que un solo bloque."""
+        stack = make_stack(n_elements=101)
+        weights = np.random.default_rng(1).uniform(0, 2, (7, 3))
+
+        full = evaluate_scenarios(stack, weights)
+        blocked = evaluate_scenarios(stack, weights, block_bytes=1024)
+
+        np.testing.assert_allclose(blocked.max_damage, full.max_damage)
+        np.testing.assert_array_equal(blocked.critical_index, full.critical_index)
+
+    def test_summary(self):
+        """Caso: Resumen por escenario."""
+        stack = make_stack()
+        result = evaluate_scenarios(stack, [Scenario('Base'), Scenario('x100', default_weight=100.0)])
+        summary = result.get_summary()
+
+        assert summary[0]['critical_element'] == summary[1]['critical_element']
+        assert summary[1]['max_damage_overall'] == pytest.approx(100 * summary[0]['max_damage_overall'])
+
+    def test_invalid_scenarios(self):
+        """Caso: Archivo desconocido o forma de pesos incorrecta."""
+        stack = make_stack()
+        with pytest.raises(KeyError):
+            evaluate_scenarios(stack, [Scenario('X', {'ftglstE9.txt': 1.0})])
+        with pytest.raises(ValueError):
+            evaluate_scenarios(stack, np.ones((2, 5)))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
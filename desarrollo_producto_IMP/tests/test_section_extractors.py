@@ -0,0 +1,166 @@
+"""
+Test Suite para Extractores de Secciones - Etapa 2
+Procesador de Fatiga SACS v1.0
+
+Tests para section_extractors.py y su integración con FTGParser
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ftg_parser import FTGParser, parse_fatigue_file
+from section_extractors import (
+    EXTRACTORS, SectionExtractor, TabularSectionExtractor, create_extractor
+)
+
+
+JOINT_SUMMARY = (
+    "                  * * J O I N T  F A T I G U E  S U M M A R Y * *\n"
+    " JOINT        DAMAGE      SERVICE LIFE\n"
+    "                            (YEARS)\n"
+    " 100L     .48430268-2     .20648E+05\n"
+    "SACS (2024)                                      FTG PAGE  9\n"
+    "                  * * J O I N T  F A T I G U E  S U M M A R Y * *\n"
+    " 101L     0.12500000E-01  8000.0\n"
+)
+
+MEMBER_SUMMARY = (
+    "                      MEMBER FATIGUE REPORT\n"
+    " JOINT  MEMBER      GRUP   DAMAGE      SERVICE LIFE\n"
+    " 100L   0000 J400   16A   .10000000-3   .10000E+07\n"
+    " 100L   0001 J401   24B   .20000000-3   .50000E+06\n"
+    " 101L   0002 J402   DL9   .40000000-3   .25000E+06\n"
+)
+
+
+@pytest.fixture
+def multi_report(tmp_path, ftg_listing, ftg_elements):
+    """Listado con resumen de juntas, reporte de detalle y resumen de miembros."""
+    listing = JOINT_SUMMARY + ftg_listing(ftg_elements(6)) + MEMBER_SUMMARY
+    path = tmp_path / 'ftglstE1.txt'
+    path.write_text(listing, encoding='latin-1')
+    return str(path)
+
+
+class TestTabularSectionExtractor:
+    """Tests del extractor tabular."""
+
+    def test_rows_and_skipped(self):
+        """Caso: Filas con valores finales; encabezados y unidades se descartan."""
+        extractor = create_extractor('joint_summary')
+        for n, line in enumerate(JOINT_SUMMARY.splitlines()[1:], start=1):
+            extractor.feed(line, n)
+        table = extractor.result()
+
+        assert table.labels == ['100L', '101L']
+        np.testing.assert_allclose(table.column('DAMAGE'), [0.48430268e-2, 0.0125])
+        np.testing.assert_allclose(table.column('SERVICE_LIFE'), [20648.0, 8000.0])
+        assert table.skipped == 4
+        with pytest.raises(KeyError):
+            table.column('LIFE')
+
+    def test_registry(self):
+        """Caso: Extractores registrados por nombre; instancias nuevas por parser."""
+        assert {'joint_summary', 'member_summary'} <= set(EXTRACTORS)
+        assert create_extractor('joint_summary') is not create_extractor('joint_summary')
+        with pytest.raises(ValueError):
+            create_extractor('no_existe')
+
+
+class TestSinglePassExtraction:
+    """Tests de la extracción de varios reportes en una lectura."""
+
+    def test_all_reports_one_pass(self, multi_report):
+        """Caso: Detalle y resúmenes salen de la misma lectura."""
+        result = parse_fatigue_file(multi_report,
+                                    extractors=['joint_summary', 'member_summary'])
+
+        assert result.total_elements == 6
+        assert sorted(result.reports) == ['joint_summary', 'member_summary']
+        assert result.reports['joint_summary'].labels == ['100L', '101L']
+        members = result.reports['member_summary']
+        assert members.labels[0] == '100L 0000 J400 16A'
+        np.testing.assert_allclose(members.column('DAMAGE'), [1e-4, 2e-4, 4e-4])
+
+    def test_detail_unchanged(self, multi_report):
+        """Caso: Los elementos del detalle son los mismos con o sin extractores."""
+        plain = FTGParser().parse_file(multi_report)
+        multi = FTGParser(extractors=['joint_summary', 'member_summary']).parse_file(multi_report)
+
+        assert plain.reports is None
+        assert list(multi.elements) == list(plain.elements)
+        for key, element in plain.elements.items():
+            np.testing.assert_array_equal(multi.elements[key].damages, element.damages)
+
+    def test_custom_extractor_and_reuse(self, multi_report):
+        """Caso: Extractor propio; el parser reinicia los extractores por archivo."""
+        class LineCounter(SectionExtractor):
+            name = 'conteo'
+            titles = ('MEMBER FATIGUE REPORT',)
+
+            def reset(self):
+                self.lines = 0
+
+            def feed(self, line, line_number):
+                self.lines += 1
+
+            def result(self):
+                return self.lines
+
+        # El encabezado JOINT MEMBER GRUP lo filtra is_valid_data_line
+        parser = FTGParser(extractors=[LineCounter()])
+        assert parser.parse_file(multi_report).reports == {'conteo': 3}
+        assert parser.parse_file(multi_report).reports == {'conteo': 3}
+
+    def test_incomplete_extractor_rejected(self):
+        """Caso: Un extractor sin feed/result no se puede instanciar."""
+        class NoResult(SectionExtractor):
+            def feed(self, line, line_number):
+                pass
+
+        with pytest.raises(TypeError):
+            NoResult()
+
+    def test_pending_element_reported(self, tmp_path, ftg_listing, ftg_elements):
+        """Caso: Un elemento cortado por el título de otra sección se reporta."""
+        lines = ftg_listing(ftg_elements(3)).splitlines(keepends=True)
+        last_total = max(i for i, line in enumerate(lines) if 'TOTAL DAMAGE' in line)
+        path = tmp_path / 'ftglstE1.txt'
+        path.write_text(''.join(lines[:last_total]) + MEMBER_SUMMARY, encoding='latin-1')
+
+        result = FTGParser(extractors=['member_summary']).parse_file(str(path))
+
+        assert result.total_elements == 2
+        assert len(result.reports['member_summary']) == 3
+        (entry,) = result.diagnostics.entries('ELEMENTO_SIN_TOTAL')
+        assert entry[1] == last_total + 1
+        assert entry[3] is not None and entry[3] not in result.elements
+
+    def test_regex_engine_rejected(self):
+        """Caso: El motor regex no admite extractores."""
+        with pytest.raises(ValueError):
+            FTGParser(engine='regex', extractors=['joint_summary'])
+
+    def test_custom_tabular_extractor(self, tmp_path, ftg_listing, ftg_elements):
+        """Caso: Instancia de TabularSectionExtractor con títulos propios."""
+        listing = (ftg_listing(ftg_elements(2)) +
+                   " STRESS CONCENTRATION FACTORS\n 0003 802L 0005  2.50  1.75\n")
+        path = tmp_path / 'ftglstE1.txt'
+        path.write_text(listing, encoding='latin-1')
+        extractor = TabularSectionExtractor('scf', ('STRESS CONCENTRATION FACTORS',),
+                                            ('SCF_AX', 'SCF_IP'))
+
+        result = parse_fatigue_file(str(path), extractors=[extractor])
+
+        assert result.total_elements == 2
+        assert result.reports['scf'].labels == ['0003 802L 0005']
+        assert result.reports['scf'].values.tolist() == [[2.5, 1.75]]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
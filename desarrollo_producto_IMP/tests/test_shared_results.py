@@ -0,0 +1,130 @@
+"""
+Test Suite para Resultados en Memoria Compartida - Etapa 2
+Procesador de Fatiga SACS v1.0
+
+Tests para shared_results.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from multiprocessing import shared_memory
+
+from ftg_parser import parse_fatigue_file
+from aggregator import stack_results
+from shared_results import (
+    SharedParseResult, export_result, parse_files_shared
+)
+
+
+class TestSharedParseResult:
+    """Tests de exportación y adjunción de un resultado."""
+
+    def test_roundtrip(self, ftg_file, ftg_elements, assert_same_table):
+        """Caso: La tabla adjunta es idéntica a la del parser."""
+        result = parse_fatigue_file(ftg_file('ftglstE1.txt', ftg_elements(12)))
+        handle = export_result(result, source='ftglstE1.txt')
+
+        with SharedParseResult(handle) as shared:
+            assert_same_table(shared.table, result.to_table())
+            assert shared.total_elements == 12
+            assert shared.table.damages.base is not None   # vista, no copia
+            # Digests de clave calculados en el parser, sin recalcular
+            assert 'key_hashes' in shared.table.cache
+            np.testing.assert_array_equal(shared.table.key_hashes,
+                                          result.to_table().key_hashes)
+
+        assert shared.released
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=handle.name)
+
+    def test_copy_survives_release(self, ftg_file, ftg_elements, assert_same_table):
+        """Caso: copy_table conserva los datos tras liberar el segmento."""
+        result = parse_fatigue_file(ftg_file('ftglstE1.txt', ftg_elements(5)))
+        shared = SharedParseResult(export_result(result))
+
+        copy = shared.copy_table()
+        view = shared.table.damages     # vista viva fuera del objeto
+        shared.release()
+        shared.release()                # idempotente
+        del view
+
+        assert_same_table(copy, result.to_table())
+        with pytest.raises(RuntimeError):
+            shared.copy_table()
+
+    def test_empty_result(self):
+        """Caso: Un resultado sin elementos se transporta sin error."""
+        from models import ParseResult
+
+        with SharedParseResult(export_result(ParseResult({}, 0, [], []))) as shared:
+            assert len(shared.table) == 0
+
+
+@pytest.mark.skipif(not os.path.isdir('/dev/shm'), reason="Requiere /dev/shm")
+class TestParseFilesShared:
+    """Tests del parsing multiproceso."""
+
+    def test_matches_serial_parse(self, ftg_file, ftg_elements, shm_segments, assert_same_table):
+        """Caso: Resultados iguales al parsing secuencial y consolidables."""
+        paths = [ftg_file(f'ftglst{i}.txt', ftg_elements(20, seed=i)) for i in range(3)]
+        before = shm_segments()
+
+        with parse_files_shared(paths, max_workers=2) as results:
+            assert list(results) == paths
+            for path in paths:
+                assert_same_table(results[path].table, parse_fatigue_file(path).to_table())
+            stack = stack_results(results.tables)
+            assert stack.damages.shape[0] == 3
+
+        assert shm_segments() == before
+
+    def test_worker_error_releases_segments(self, ftg_file, ftg_elements, shm_segments):
+        """Caso: Un error en los workers no deja segmentos huérfanos."""
+        paths = [ftg_file(f'ftglst{i}.txt', ftg_elements(5)) for i in range(2)]
+        before = shm_segments()
+
+        with pytest.raises(ValueError):
+            parse_files_shared(paths, max_workers=2, engine='awk')
+
+        assert shm_segments() == before
+
+    def test_duplicate_paths(self, ftg_file, ftg_elements):
+        """Caso: Rutas repetidas se rechazan."""
+        path = ftg_file('ftglstE1.txt', ftg_elements(2))
+        with pytest.raises(ValueError):
+            parse_files_shared([path, path])
+
+
+
+class TestWithoutSharedMemory:
+    """Tests del transporte por pickle (plataformas no POSIX)."""
+
+    def test_export_roundtrip(self, without_shared_memory, ftg_file, ftg_elements,
+                              assert_same_table):
+        """Caso: El handle lleva la tabla y no hay segmento que liberar."""
+        result = parse_fatigue_file(ftg_file('ftglstE1.txt', ftg_elements(6)))
+        handle = export_result(result, source='ftglstE1.txt')
+
+        assert handle.name == '' and handle.table is not None
+        with SharedParseResult(handle) as shared:
+            assert_same_table(shared.table, result.to_table())
+        assert shared.released
+
+    def test_parse_files(self, without_shared_memory, ftg_file, ftg_elements,
+                         assert_same_table):
+        """Caso: El pool y el parsing multiproceso funcionan sin memoria compartida."""
+        paths = [ftg_file(f'ftglst{i}.txt', ftg_elements(8, seed=i)) for i in range(2)]
+
+        with parse_files_shared(paths, max_workers=1) as results:
+            for path in paths:
+                assert_same_table(results[path].table, parse_fatigue_file(path).to_table())
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
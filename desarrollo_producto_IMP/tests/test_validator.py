@@ -0,0 +1,117 @@
+"""
+Test Suite para Validación de Integridad - Etapa 3
+Procesador de Fatiga SACS v1.0
+
+Tests para validator.py
+"""
+
+import pytest
+import os
+import sys
+import numpy as np
+
+# Agregar src/ al path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from validator import validate_consistency, encode_keys, build_presence
+from ftg_parser import parse_fatigue_file
+from tables import ElementTable
+
+
+FILES = {
+    'E1': ['A', 'B', 'C', 'D'],
+    'E2': ['B', 'C', 'D', 'E'],
+    'E3': ['C', 'D', 'B', 'F'],
+}
+
+
+class TestValidateConsistency:
+    """Tests para el reporte de consistencia entre archivos."""
+
+    def test_consistent_missing_orphan(self):
+        """Caso: Clasificación de claves entre 3 archivos."""
+        report = validate_consistency(FILES)
+
+        assert report.total_elements == 6
+        assert sorted(report.consistent_elements) == ['B', 'C', 'D']
+        assert report.inconsistent_elements['E1'] == ['E', 'F']
+        assert report.inconsistent_elements['E2'] == ['A', 'F']
+        assert report.orphan_elements == {'E1': ['A'], 'E2': ['E'], 'E3': ['F']}
+        assert not report.is_consistent
+
+    def test_coverage_matrix(self):
+        """Caso: Matriz de claves compartidas por par de archivos."""
+        report = validate_consistency(FILES)
+
+        np.testing.assert_array_equal(report.coverage_matrix,
+                                      [[4, 3, 3], [3, 4, 3], [3, 3, 4]])
+
+    def test_summary_and_duplicates(self):
+        """Caso: Resumen por archivo con conteo de claves repetidas."""
+        report = validate_consistency({'E1': ['A', 'B', 'B'], 'E2': ['A', 'B']})
+        summary = report.get_summary()
+
+        assert report.is_consistent
+        assert summary['consistent_elements'] == 2
+        assert summary['files']['E1'] == {'elements': 2, 'missing': 0,
+                                          'orphan': 0, 'duplicates': 1}
+
+    def test_integer_keys(self):
+        """Caso: Claves enteras (ej: hashes) sin pasar por strings."""
+        report = validate_consistency({
+            'E1': np.array([30, 10, 20], dtype=np.int64),
+            'E2': np.array([20, 40], dtype=np.uint32),
+        })
+
+        assert report.keys.tolist() == [10, 20, 30, 40]
+        assert report.consistent_elements == [20]
+
+    def test_mixed_keys_rejected(self):
+        """Caso: No se pueden mezclar claves string y enteras."""
+        with pytest.raises(TypeError):
+            encode_keys({'E1': ['A'], 'E2': np.array([1])})
+
+    def test_build_presence(self):
+        """Caso: Mapa de presencia desde códigos ordenados."""
+        universe, presence = build_presence({'E1': np.array([1, 5]), 'E2': np.array([5, 9])})
+
+        assert universe.tolist() == [1, 5, 9]
+        assert presence.tolist() == [[True, True, False], [False, True, True]]
+
+    def test_from_parsed_files(self, ftg_file, ftg_elements):
+        """Caso: Validar ParseResult de archivos sintéticos."""
+        elements = ftg_elements(6)
+        r1 = parse_fatigue_file(ftg_file('ftglstE1.txt', elements))
+        r2 = parse_fatigue_file(ftg_file('ftglstE2.txt', elements[1:]))
+
+        report = validate_consistency({'E1': r1, 'E2': r2})
+
+        assert len(report.consistent_elements) == 5
+        assert len(report.orphan_elements['E1']) == 1
+
+
+    def test_member_formats_align(self):
+        """Caso: El mismo MEMBER en otro formato no es faltante ni huérfano."""
+        damages = np.ones((2, 8))
+        e1 = ElementTable.from_columns(['0003', '0004'], ['802L 0005', '0001 J400'],
+                                       ['16A', '24B'], damages)
+        e2 = ElementTable.from_columns(['0003', '0004'], ['0005-802L', '0001 J400'],
+                                       ['16A', '24B'], damages)
+
+        report = validate_consistency({'E1': e1, 'E2': e2})
+
+        assert report.is_consistent
+        assert sorted(report.consistent_elements) == ['0003_802L 0005_16A', '0004_0001 J400_24B']
+
+    def test_same_file_formats_counted_as_duplicates(self):
+        """Caso: Un archivo con el mismo elemento en dos formatos cuenta en duplicates."""
+        table = ElementTable.from_columns(['0003', '0003'], ['802L 0005', '0005-802L'],
+                                          ['16A', '16A'], np.ones((2, 8)))
+
+        report = validate_consistency({'E1': table})
+
+        assert report.total_elements == 1
+        assert report.duplicates == {'E1': 1}
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])